@@ -3,24 +3,31 @@ Logging utility for backup/restore operations
 Similar to importer/logger.py but for backup operations
 """
 
+from core.buffered_log import BufferedLogWriter
 from .models import BackupLog
 
 
 class BackupLogger:
-    """Logger for backup and restore operations"""
+    """Logger for backup and restore operations (buffered; call flush() when done)"""
 
     def __init__(self, backup_record):
         self.backup_record = backup_record
+        self.writer = BufferedLogWriter(BackupLog)
 
     def _log(self, level, message, details=None):
-        """Create a log entry"""
-        BackupLog.objects.create(
+        """Queue a log entry"""
+        self.writer.add(
+            immediate=(level == 'ERROR'),
             backup=self.backup_record,
             level=level,
             message=message,
             details=details
         )
 
+    def flush(self):
+        """Write any buffered entries"""
+        self.writer.flush()
+
     def debug(self, message, details=None):
         """Log debug message"""
         self._log('DEBUG', message, details)
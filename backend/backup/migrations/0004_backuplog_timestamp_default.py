@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:18
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backup', '0003_backupconfiguration_auto_backup_frequency_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='backuplog',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
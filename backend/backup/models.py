@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 import json
@@ -201,7 +202,7 @@ class BackupLog(models.Model):
         on_delete=models.CASCADE,
         related_name='logs'
     )
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)  # not auto_now_add: buffered entries keep their log time
     level = models.CharField(max_length=10, choices=LOG_LEVELS, default='INFO')
     message = models.TextField()
     details = models.JSONField(
@@ -64,6 +64,8 @@ class BackupService:
             backup_path = backup_dir / backup_filename
 
             self.logger.info(f"Creating backup file: {backup_path}")
+            # pg_dump can run for a long time; make the progress so far visible
+            self.logger.flush()
 
             # Create database dump using pg_dump
             success = self._create_pg_dump(backup_path)
@@ -123,6 +125,9 @@ class BackupService:
             self.backup_record.save()
             return (False, error_msg)
 
+        finally:
+            self.logger.flush()
+
     def _create_pg_dump(self, backup_path):
         """Execute pg_dump to create database backup"""
         try:
@@ -394,6 +399,9 @@ class BackupService:
             self.backup_record.save()
             return (False, error_msg)
 
+        finally:
+            self.logger.flush()
+
 
 class RestoreLogger:
     """Logger for restore operations - logs to Python logging instead of database"""
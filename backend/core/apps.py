@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """Connect the dashboard summary, search index, customer visibility and project view cache signals"""
+        import core.customer_visibility  # noqa
+        import core.dashboard_summary  # noqa
+        import core.project_view_cache  # noqa
+        import core.search_index  # noqa
@@ -3,12 +3,370 @@ Audit Logging Utility
 
 Provides helper functions for creating audit log entries throughout the application.
 Logs user actions at the operation level, not per-object granularity.
+
+Entries are written according to settings.AUDIT_LOG_MODE:
+
+- 'buffered': inside an audit_log_buffer() scope (opened per request by
+  AuditLogMiddleware and per Celery task) entries are queued in memory once
+  the surrounding transaction commits, then written with one bulk_create
+  when the scope ends. Entries from a rolled-back transaction are dropped.
+- 'celery': as 'buffered', but the batch is handed to core.write_audit_logs.
+- 'sync': every entry is saved immediately in the caller's transaction.
+
+Outside a scope, buffered entries are saved individually after commit so
+they still do not add writes or lock time to the caller's transaction.
+
+Bulk operations (imports, project commit/close, grid bulk saves) run inside
+an AuditBatch, which replaces the per-row signal entries with one summary
+entry holding entity counts and compacted ID ranges.
 """
 
-from .models import AuditLog
+import functools
+import json
+import logging
+from contextlib import contextmanager
+from threading import local
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import AuditLog, Project
 from django.contrib.auth.models import User
 from customers.models import Customer
 
+logger = logging.getLogger(__name__)
+
+# Fields copied between AuditLog instances and the rows sent to Celery
+AUDIT_LOG_FIELDS = [
+    'user_id', 'timestamp', 'action_type', 'entity_type', 'entity_name', 'customer_id',
+    'summary', 'details', 'status', 'duration_seconds', 'ip_address',
+]
+
+# Flush early once this many entries are queued, to bound memory in long tasks
+AUDIT_BUFFER_MAX_SIZE = 1000
+
+_buffer_state = local()
+
+
+def _current_buffer():
+    return getattr(_buffer_state, 'entries', None)
+
+
+@contextmanager
+def audit_log_buffer():
+    """
+    Collect audit log entries for the duration of a request or task.
+
+    Nested scopes share the outermost buffer, which is flushed when the
+    outermost scope exits (also on error: only committed entries are queued).
+    """
+    if _current_buffer() is not None:
+        yield
+        return
+
+    _buffer_state.entries = []
+    try:
+        yield
+    finally:
+        try:
+            flush_audit_logs()
+        finally:
+            del _buffer_state.entries
+
+
+def flush_audit_logs():
+    """Write all queued audit log entries for the current thread"""
+    entries = _current_buffer()
+    if not entries:
+        return
+    batch = entries[:]
+    entries.clear()
+    write_audit_logs(batch)
+
+
+def write_audit_logs(entries):
+    """
+    Persist a batch of unsaved AuditLog instances.
+
+    In 'celery' mode the batch is serialized and written by a worker; if the
+    task cannot be queued it is written here instead. Failures are logged
+    rather than raised so a broken audit write never fails the caller.
+    """
+    if settings.AUDIT_LOG_MODE == 'celery':
+        from .tasks import write_audit_logs_task
+        rows = [{field: getattr(entry, field) for field in AUDIT_LOG_FIELDS} for entry in entries]
+        for row in rows:
+            row['timestamp'] = row['timestamp'].isoformat()
+        try:
+            write_audit_logs_task.delay(rows)
+            return
+        except Exception as e:
+            logger.warning(f"Could not queue audit log batch ({len(rows)} entries): {e}, writing inline")
+
+    try:
+        AuditLog.objects.bulk_create(entries, batch_size=500)
+    except Exception:
+        logger.exception(f"Failed to write {len(entries)} audit log entries")
+
+
+def _enqueue(entry):
+    entries = _current_buffer()
+    if entries is None:
+        # No request/task scope (shell, management command): write on its own
+        entry.save()
+        return
+    entries.append(entry)
+    if len(entries) >= AUDIT_BUFFER_MAX_SIZE:
+        flush_audit_logs()
+
+
+def _emit(audit_log):
+    """Hand an unsaved AuditLog to the configured writer"""
+    if settings.AUDIT_LOG_MODE == 'sync':
+        audit_log.save()
+        return
+    # Runs immediately in autocommit mode, after the outermost commit otherwise,
+    # and never if the transaction is rolled back
+    transaction.on_commit(lambda: _enqueue(audit_log))
+
+
+# Per-type cap on the compacted ID ranges stored in a batch summary
+AUDIT_BATCH_MAX_ID_RANGES = 200
+
+_batch_state = local()
+
+
+def current_audit_batch():
+    """Return the innermost active AuditBatch for this thread, or None"""
+    stack = getattr(_batch_state, 'stack', None)
+    return stack[-1] if stack else None
+
+
+def compact_ids(ids, max_ranges=AUDIT_BATCH_MAX_ID_RANGES):
+    """
+    Collapse IDs into sorted range strings, e.g. [1, 2, 3, 7] -> ['1-3', '7'].
+
+    Returns:
+        (ranges, truncated) - truncated is True if ranges were cut at max_ranges
+    """
+    ranges = []
+    start = prev = None
+    for value in sorted(ids):
+        if prev is not None and value == prev + 1:
+            prev = value
+            continue
+        if start is not None:
+            ranges.append(f"{start}-{prev}" if prev != start else str(start))
+        start = prev = value
+    if start is not None:
+        ranges.append(f"{start}-{prev}" if prev != start else str(start))
+    return ranges[:max_ranges], len(ranges) > max_ranges
+
+
+class AuditBatch:
+    """
+    Coalesce per-row audit logging for a bulk operation.
+
+    While active, signal receivers decorated with @audit_batchable record
+    (action, entity type, id) here instead of writing one AuditLog each.
+    On exit one summary entry is written with per-type counts and compacted
+    ID ranges. Without an action_type the batch only collects; the caller
+    adds as_details() to its own log entry (the importer does this).
+
+    Usage:
+        with AuditBatch(user, 'UPDATE', "Committed project 'X'", customer=c):
+            ...
+    """
+
+    def __init__(self, user=None, action_type=None, summary=None, entity_type=None,
+                 customer=None, details=None, enabled=True):
+        self.user = user
+        self.action_type = action_type
+        self.summary = summary
+        self.entity_type = entity_type
+        self.customer = customer
+        self.details = details or {}
+        self.status = 'SUCCESS'
+        self.enabled = enabled
+        self.counts = {}
+        self.ids = {}
+
+    def record(self, action_type, entity_type, entity_id):
+        counts = self.counts.setdefault(entity_type, {})
+        counts[action_type] = counts.get(action_type, 0) + 1
+        if entity_id is not None:
+            self.ids.setdefault(entity_type, set()).add(entity_id)
+
+    def is_empty(self):
+        return not self.counts
+
+    def as_details(self):
+        """Counts and compacted IDs, for inclusion in an audit entry's details"""
+        details = {'entity_counts': self.counts, 'affected_ids': {}}
+        for entity_type, ids in self.ids.items():
+            ranges, truncated = compact_ids(ids)
+            details['affected_ids'][entity_type] = ranges
+            if truncated:
+                details.setdefault('affected_ids_truncated', []).append(entity_type)
+        return details
+
+    def _count_text(self):
+        parts = []
+        for entity_type, counts in self.counts.items():
+            actions = ', '.join(f"{count} {action.lower()}" for action, count in counts.items())
+            parts.append(f"{entity_type.lower()}: {actions}")
+        return '; '.join(parts)
+
+    def __enter__(self):
+        if self.enabled:
+            if not hasattr(_batch_state, 'stack'):
+                _batch_state.stack = []
+            _batch_state.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.enabled:
+            return False
+        _batch_state.stack.remove(self)
+
+        if self.action_type:
+            if exc_type is not None:
+                self.status = 'FAILED'
+            summary = self.summary or f"Bulk {self.action_type.lower()}"
+            if self.counts:
+                summary = f"{summary} ({self._count_text()})"
+            log_audit_event(
+                user=self.user,
+                action_type=self.action_type,
+                entity_type=self.entity_type,
+                customer=self.customer,
+                summary=summary,
+                details={**self.details, **self.as_details()},
+                status=self.status
+            )
+        return False
+
+
+def audit_batchable(entity_type):
+    """
+    Decorator for post_save/pre_delete audit receivers.
+
+    Inside an AuditBatch the receiver is skipped (along with any queries it
+    makes for details) and the row is only counted in the batch.
+    """
+    def decorator(receiver_func):
+        @functools.wraps(receiver_func)
+        def wrapper(sender, instance, **kwargs):
+            batch = current_audit_batch()
+            if batch is None:
+                return receiver_func(sender, instance, **kwargs)
+            if 'created' in kwargs:
+                action_type = 'CREATE' if kwargs['created'] else 'UPDATE'
+            else:
+                action_type = 'DELETE'
+            batch.record(action_type, entity_type, instance.pk)
+        return wrapper
+    return decorator
+
+
+def audit_batched_view(entity_type, summary, rows_key=None, action_type='UPDATE'):
+    """
+    View decorator that runs the view inside an AuditBatch.
+
+    Args:
+        entity_type: Entity type for the summary entry
+        summary: Summary prefix; entity counts are appended
+        rows_key: Request body key holding the row list. If given, requests
+            with a single row keep per-row logging (interactive edits).
+        action_type: Action type for the summary entry
+
+    Requests that touched no audited rows produce no summary entry unless
+    the view described the batch itself (current_audit_batch().details).
+    The entry's customer is the one the view set, else the first customer of
+    the request's project_id.
+    """
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            enabled = True
+            if rows_key:
+                try:
+                    enabled = len(json.loads(request.body).get(rows_key) or []) > 1
+                except (ValueError, AttributeError):
+                    enabled = False
+
+            user = request.user if request.user.is_authenticated else None
+            with AuditBatch(user, action_type, summary, entity_type=entity_type, enabled=enabled) as batch:
+                response = view_func(request, *args, **kwargs)
+                if batch.is_empty() and not batch.details:
+                    batch.action_type = None
+                elif response.status_code >= 400:
+                    batch.status = 'FAILED'
+                if enabled and batch.action_type and batch.customer is None:
+                    batch.customer = _request_project_customer(request)
+            return response
+        return wrapper
+    return decorator
+
+
+def _request_project_customer(request):
+    """Customer of the project_id in the request body or query string, if any"""
+    try:
+        project_id = json.loads(request.body).get('project_id')
+    except (ValueError, AttributeError):
+        project_id = None
+    project_id = project_id or request.GET.get('project_id')
+    if not project_id:
+        return None
+    project = Project.objects.filter(pk=project_id).first()
+    return project.customers.first() if project else None
+
+
+# Rows deleted per purge transaction; keeps each DELETE short and its WAL small
+AUDIT_PURGE_BATCH_SIZE = 5000
+
+
+def purge_audit_logs(cutoff_date, batch_size=AUDIT_PURGE_BATCH_SIZE, progress_callback=None):
+    """
+    Delete audit logs older than cutoff_date in bounded primary-key ranges.
+
+    Each batch finds the next batch_size candidate IDs in primary-key order,
+    then deletes that ID range (re-checking the cutoff) in its own short
+    transaction, so no single statement touches the whole table and other
+    writers are never blocked for long.
+
+    Args:
+        cutoff_date: Delete entries with timestamp before this datetime
+        batch_size: Maximum rows per delete transaction
+        progress_callback: Optional callable(deleted_so_far, batches_done)
+
+    Returns:
+        Total number of rows deleted
+    """
+    expired = AuditLog.objects.filter(timestamp__lt=cutoff_date)
+    deleted_total = 0
+    batches = 0
+    last_id = 0
+
+    while True:
+        ids = list(
+            expired.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+
+        with transaction.atomic():
+            deleted, _ = expired.filter(id__gte=ids[0], id__lte=ids[-1]).delete()
+
+        last_id = ids[-1]
+        deleted_total += deleted
+        batches += 1
+        if progress_callback:
+            progress_callback(deleted_total, batches)
+
+    return deleted_total
+
 
 def get_client_ip(request):
     """
@@ -52,7 +410,7 @@ def log_audit_event(
         ip_address: IP address of the user (optional)
 
     Returns:
-        AuditLog object
+        AuditLog object (unsaved until the writer flushes it unless mode is 'sync')
     """
     # Handle user parameter
     if isinstance(user, int):
@@ -71,9 +429,11 @@ def log_audit_event(
         except Customer.DoesNotExist:
             customer = None
 
-    # Create audit log entry
-    audit_log = AuditLog.objects.create(
+    # Build the entry; the configured writer decides when it is saved, so the
+    # time is captured here rather than at insert
+    audit_log = AuditLog(
         user=user,
+        timestamp=timezone.now(),
         action_type=action_type,
         entity_type=entity_type,
         entity_name=entity_name,
@@ -84,6 +444,7 @@ def log_audit_event(
         duration_seconds=duration_seconds,
         ip_address=ip_address
     )
+    _emit(audit_log)
 
     return audit_log
 
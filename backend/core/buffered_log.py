@@ -0,0 +1,70 @@
+"""
+Buffered writer for per-operation log tables (ImportLog, BackupLog).
+
+Imports can emit a log line per alias or zone. Writing each one with
+objects.create() costs a round trip and an INSERT per message, so entries
+are collected here and written with bulk_create once FLUSH_EVERY entries are
+queued or FLUSH_INTERVAL seconds have passed since the last write. ERROR
+entries are written straight away so failures show up in the UI at once.
+
+Callers must flush() when the operation ends.
+"""
+
+import logging
+import threading
+import time
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedLogWriter:
+    """Collects unsaved log model instances and writes them in batches"""
+
+    FLUSH_EVERY = 50
+    FLUSH_INTERVAL = 2.0
+
+    def __init__(self, model, flush_every=None, flush_interval=None, clock=time.monotonic):
+        self.model = model
+        self.flush_every = flush_every or self.FLUSH_EVERY
+        self.flush_interval = self.FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._clock = clock
+        self._pending = []
+        self._last_flush = clock()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, immediate=False, **fields):
+        """
+        Queue one log entry.
+
+        Args:
+            immediate: Write this entry (and anything queued) now
+            **fields: Model field values; timestamp defaults to now
+        """
+        fields.setdefault('timestamp', timezone.now())
+        with self._lock:
+            self._pending.append(self.model(**fields))
+            due = (
+                immediate
+                or len(self._pending) >= self.flush_every
+                or self._clock() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write all queued entries; failures are logged, never raised"""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._last_flush = self._clock()
+        if not batch:
+            return
+        try:
+            self.model.objects.bulk_create(batch)
+        except Exception as e:
+            # If logging fails, don't let it break the operation being logged
+            logger.error(f"Failed to write {len(batch)} {self.model.__name__} entries: {e}")
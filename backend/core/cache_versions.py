@@ -0,0 +1,141 @@
+"""
+Versioned per-customer cache namespaces.
+
+Dashboard and widget caches put the customer's current generation number in
+their keys (see customer_cache_key). Invalidating everything cached for a
+customer is then a single cache.incr() of that number: old entries are never
+read again and age out on their own TTL. Previously each key had to be
+deleted individually, one per project.
+
+The generation is bumped after commit by the inventory signals (through
+core.dashboard_summary), by clear_dashboard_cache_for_customer (imports and
+bulk edits) and by project commit.
+
+Caches that change with fewer models also carry a scope generation (for
+example the filter facets of one table), which their own signals bump
+without touching the rest of the customer's entries.
+
+Projects have a generation of their own (project_cache_version), bumped by
+writes to the project's junction rows (see core.project_view_cache).
+
+A generation that is missing from the cache (first use, eviction, cache
+restart) starts from the current time in milliseconds, so it can never
+repeat a number an old entry was stored under.
+"""
+
+import logging
+import time
+from threading import local
+
+from django.core.cache import cache
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+_pending_state = local()
+
+
+def _version_key(customer_id, scope=None):
+    if scope:
+        return f"customer_cache_version_{customer_id}_{scope}"
+    return f"customer_cache_version_{customer_id}"
+
+
+def _project_version_key(project_id):
+    return f"project_cache_version_{project_id}"
+
+
+def _initial_version():
+    return int(time.time() * 1000)
+
+
+def _read(key):
+    version = cache.get(key)
+    if version is None:
+        version = _initial_version()
+        if not cache.add(key, version, None):
+            # Another process created it first
+            version = cache.get(key) or version
+    return version
+
+
+def customer_cache_version(customer_id, scope=None):
+    """Current cache generation of a customer, or of one scope of it (0 if the cache is down)"""
+    try:
+        return _read(_version_key(customer_id, scope))
+    except Exception as e:
+        logger.warning(f"Could not read cache version for customer {customer_id}: {e}")
+        return 0
+
+
+def project_cache_version(project_id):
+    """Current cache generation of a project (0 if the cache is down)"""
+    try:
+        return _read(_project_version_key(project_id))
+    except Exception as e:
+        logger.warning(f"Could not read cache version for project {project_id}: {e}")
+        return 0
+
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Not created yet: any fresh value is already newer than all entries
+        cache.add(key, _initial_version(), None)
+    except Exception as e:
+        logger.warning(f"Could not bump cache version {key}: {e}")
+
+
+def _queued(key):
+    """True if a bump of `key` is already waiting for the current transaction"""
+    callback = getattr(_pending_state, 'callbacks', {}).get(key)
+    # A rolled-back transaction or savepoint drops its callbacks from the list
+    return callback is not None and any(entry[1] is callback for entry in connection.run_on_commit)
+
+
+def _bump_after_commit(key, defer):
+    if not defer or not connection.in_atomic_block:
+        _bump(key)
+        return
+    if _queued(key):
+        return
+
+    def bump():
+        _pending_state.callbacks.pop(key, None)
+        _bump(key)
+    if not hasattr(_pending_state, 'callbacks'):
+        _pending_state.callbacks = {}
+    _pending_state.callbacks[key] = bump
+    transaction.on_commit(bump)
+
+
+def bump_customer_cache_version(customer_id, defer=True, scope=None):
+    """
+    Invalidate every versioned cache entry of a customer (or of one scope).
+
+    Deferred until the surrounding transaction commits, so a concurrent read
+    cannot re-cache pre-commit data under the new generation; repeated bumps
+    in one transaction are queued once. Callers that already run after
+    commit pass defer=False.
+    """
+    if customer_id:
+        _bump_after_commit(_version_key(customer_id, scope), defer)
+
+
+def bump_project_cache_version(project_id, defer=True):
+    """Invalidate every entry cached under a project's generation; deferred like customer bumps"""
+    if project_id:
+        _bump_after_commit(_project_version_key(project_id), defer)
+
+
+def customer_cache_key(customer_id, name, *parts, scope=None):
+    """
+    Cache key for `name` inside the customer's current generation. With a
+    scope, the key also carries that scope's generation, so it is dropped by
+    bumping either one.
+    """
+    versions = [f"v{customer_cache_version(customer_id)}"]
+    if scope:
+        versions.append(f"s{customer_cache_version(customer_id, scope)}")
+    return '_'.join([name, f"c{customer_id}", *versions, *map(str, parts)])
@@ -0,0 +1,88 @@
+"""
+Customer View visibility flag.
+
+Customer View lists the entities that are committed or that no project
+references. The list views used to compute that on every request with
+annotate(Count('project_memberships')) and Q(committed=True) |
+Q(project_count=0), a GROUP BY over the whole table. Alias, Zone, Storage,
+Host, Volume and Port now have an indexed customer_visible column holding the
+condition, and Customer View filters on customer_visible=True.
+
+The column is maintained by signals (connected in CoreConfig.ready):
+
+- Saving an entity recomputes it from committed and the entity's project
+  memberships (an EXISTS query, skipped for committed and new rows).
+- Adding or removing a junction row (ProjectAlias, ...) recomputes it for
+  the entity with one UPDATE.
+
+Queryset .update(committed=True) calls bypass signals, so the project commit
+views set customer_visible=True along with committed: committed rows are
+always visible. refresh_customer_visible() recomputes rows from scratch.
+"""
+
+from django.apps import apps as global_apps
+from django.db.models import Case, Exists, OuterRef, Value, When
+from django.db.models.signals import post_delete, post_save, pre_save
+
+# Entity model -> junction model; the junction FK is named after the entity
+VISIBILITY_MODELS = {
+    'san.Alias': 'core.ProjectAlias',
+    'san.Zone': 'core.ProjectZone',
+    'storage.Storage': 'core.ProjectStorage',
+    'storage.Host': 'core.ProjectHost',
+    'storage.Volume': 'core.ProjectVolume',
+    'storage.Port': 'core.ProjectPort',
+}
+
+_ENTITIES = {junction: label for label, junction in VISIBILITY_MODELS.items()}
+
+
+def _memberships(label, apps=global_apps):
+    model = apps.get_model(label)
+    junction = apps.get_model(VISIBILITY_MODELS[label])
+    return junction.objects, model._meta.model_name
+
+
+def refresh_customer_visible(label, ids=None, apps=global_apps):
+    """Recompute customer_visible of some rows (all with ids=None); returns the row count"""
+    rows = apps.get_model(label).objects.all()
+    if ids is not None:
+        rows = rows.filter(pk__in=ids)
+    memberships, field = _memberships(label, apps)
+    return rows.update(customer_visible=Case(
+        When(committed=True, then=Value(True)),
+        When(Exists(memberships.filter(**{field: OuterRef('pk')})), then=Value(False)),
+        default=Value(True),
+    ))
+
+
+def _entity_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Computed before the save so it is written with the row
+    if raw or update_fields is not None:
+        return
+    if instance.committed or instance._state.adding:
+        instance.customer_visible = True
+    else:
+        memberships, field = _memberships(sender._meta.label)
+        instance.customer_visible = not memberships.filter(**{f'{field}_id': instance.pk}).exists()
+
+
+def _entity_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    # save(update_fields=[...]) does not write the value set in _entity_saving
+    if not raw and update_fields is not None and 'committed' in update_fields:
+        refresh_customer_visible(sender._meta.label, [instance.pk])
+
+
+def _membership_changed(sender, instance, raw=False, created=True, **kwargs):
+    if raw or not created:
+        return
+    label = _ENTITIES[sender._meta.label]
+    field = global_apps.get_model(label)._meta.model_name
+    refresh_customer_visible(label, [getattr(instance, f'{field}_id')])
+
+
+for _label, _junction in VISIBILITY_MODELS.items():
+    pre_save.connect(_entity_saving, sender=_label, dispatch_uid=f'customer_visible_pre_save_{_label}')
+    post_save.connect(_entity_saved, sender=_label, dispatch_uid=f'customer_visible_save_{_label}')
+    post_save.connect(_membership_changed, sender=_junction, dispatch_uid=f'customer_visible_join_{_junction}')
+    post_delete.connect(_membership_changed, sender=_junction, dispatch_uid=f'customer_visible_leave_{_junction}')
@@ -0,0 +1,304 @@
+"""
+Dashboard summary table.
+
+Dashboard endpoints and widgets read their counts from DashboardSummary rows
+instead of running COUNT(*) queries across the inventory on every request.
+Each customer has one row with customer-wide counts (project=None) and one
+row per project with project membership counts.
+
+Rows are kept fresh in three ways:
+
+- Saves and deletes of inventory models mark the customer's rows stale
+  (one UPDATE per customer per transaction, after commit) and bump the
+  customer's cache generation (core.cache_versions). The next read
+  recomputes them.
+- The importer recomputes the rows when an import finishes.
+- The core.refresh_dashboard_summaries beat job recomputes stale rows in
+  the background, and any row older than DASHBOARD_SUMMARY_MAX_AGE.
+"""
+
+import logging
+from datetime import timedelta
+from threading import local
+
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from customers.models import Customer
+from .cache_versions import bump_customer_cache_version
+from .models import DashboardSummary, Project, ProjectAlias, ProjectHost, ProjectZone
+
+logger = logging.getLogger(__name__)
+
+# Rows older than this are recomputed even if nothing marked them stale
+DASHBOARD_SUMMARY_MAX_AGE = timedelta(minutes=15)
+
+# Models whose rows count towards a summary, and the FK that leads from
+# each one to a model with a customer_id
+_CUSTOMER_PATHS = {
+    'san.Fabric': None,
+    'san.Switch': None,
+    'storage.Storage': None,
+    'san.Zone': 'fabric',
+    'san.Alias': 'fabric',
+    'san.AliasWWPN': 'alias',
+    'storage.Host': 'storage',
+    'storage.Volume': 'storage',
+    'storage.HostWwpn': 'host',
+    'core.ProjectZone': 'zone',
+    'core.ProjectAlias': 'alias',
+    'core.ProjectHost': 'host',
+}
+
+_stale_state = local()
+
+
+def _pending():
+    """
+    Customers already marked in the current transaction, and a memo of
+    parent row -> customer_id lookups. Reset once no on_commit callbacks are
+    pending, i.e. the transaction that filled them has finished.
+    """
+    if not getattr(_stale_state, 'customers', None) or not connection.run_on_commit:
+        _stale_state.customers = set()
+        _stale_state.parents = {}
+    return _stale_state.customers, _stale_state.parents
+
+
+def _customer_id_for(instance, parents):
+    parent_field = _CUSTOMER_PATHS.get(instance._meta.label)
+    if parent_field is None:
+        return getattr(instance, 'customer_id', None)
+
+    parent_id = getattr(instance, f'{parent_field}_id', None)
+    if parent_id is None:
+        return None
+    parent_model = instance._meta.get_field(parent_field).related_model
+    key = (parent_model._meta.label, parent_id)
+    if key not in parents:
+        parent = instance._state.fields_cache.get(parent_field)
+        if parent is None:
+            # The parent may already be gone in a cascade delete
+            parent = parent_model._base_manager.filter(pk=parent_id).first()
+        parents[key] = _customer_id_for(parent, parents) if parent is not None else None
+    return parents[key]
+
+
+def _mark_stale(customer_id):
+    DashboardSummary.objects.filter(customer_id=customer_id, is_stale=False).update(is_stale=True)
+    bump_customer_cache_version(customer_id, defer=False)
+
+
+def mark_dashboard_summary_stale(customer_id):
+    """Flag a customer's summary rows for recomputation once the caller commits"""
+    if not customer_id:
+        return
+    if not connection.in_atomic_block:
+        _mark_stale(customer_id)
+        return
+
+    customers, _ = _pending()
+    if customer_id in customers:
+        return
+    customers.add(customer_id)
+
+    def mark():
+        customers.discard(customer_id)
+        _mark_stale(customer_id)
+    transaction.on_commit(mark)
+
+
+def _inventory_changed(sender, instance, **kwargs):
+    if kwargs.get('raw'):
+        return
+    try:
+        _, parents = _pending() if connection.in_atomic_block else (None, {})
+        mark_dashboard_summary_stale(_customer_id_for(instance, parents))
+    except Exception as e:
+        # A missed mark only delays the refresh until the beat job runs
+        logger.warning(f"Could not mark dashboard summary stale for {sender.__name__}: {e}")
+
+
+for _label in _CUSTOMER_PATHS:
+    post_save.connect(_inventory_changed, sender=_label, dispatch_uid=f'dashboard_summary_save_{_label}')
+    post_delete.connect(_inventory_changed, sender=_label, dispatch_uid=f'dashboard_summary_delete_{_label}')
+
+
+@receiver(m2m_changed, sender=Customer.projects.through)
+def customer_projects_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Adding or removing a project changes which project rows a customer has"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        mark_dashboard_summary_stale(instance.pk)
+    else:
+        for customer_id in (pk_set or instance.customers.values_list('id', flat=True)):
+            mark_dashboard_summary_stale(customer_id)
+
+
+def compute_customer_stats(customer_id):
+    """Customer-wide counts, a handful of grouped queries"""
+    from san.models import Alias, AliasWWPN, Fabric, Switch, Zone
+    from storage.models import Host, HostWwpn, Storage, Volume
+
+    vendors = dict(
+        Fabric.objects.filter(customer_id=customer_id)
+        .values_list('san_vendor').annotate(count=Count('id')).order_by()
+    )
+    storage_by_type = {
+        (storage_type or 'Unknown'): count
+        for storage_type, count in Storage.objects.filter(customer_id=customer_id)
+        .values_list('storage_type').annotate(count=Count('id')).order_by()
+    }
+    hosts = Host.objects.filter(storage__customer_id=customer_id).aggregate(
+        total=Count('id', distinct=True),
+        with_wwpns=Count('id', filter=Q(host_wwpns__isnull=False), distinct=True)
+    )
+    host_wwpns = dict(
+        HostWwpn.objects.filter(host__storage__customer_id=customer_id)
+        .values_list('source_type').annotate(count=Count('id')).order_by()
+    )
+
+    return {
+        'fabric_count': sum(vendors.values()),
+        'brocade_fabrics': vendors.get('BR', 0),
+        'cisco_fabrics': vendors.get('CI', 0),
+        'switch_count': Switch.objects.filter(customer_id=customer_id).count(),
+        'zone_count': Zone.objects.filter(fabric__customer_id=customer_id).count(),
+        'alias_count': Alias.objects.filter(fabric__customer_id=customer_id).count(),
+        'storage_count': sum(storage_by_type.values()),
+        'storage_by_type': storage_by_type,
+        'host_count': hosts['total'],
+        'hosts_with_wwpns': hosts['with_wwpns'],
+        'volume_count': Volume.objects.filter(storage__customer_id=customer_id).count(),
+        'alias_wwpn_count': AliasWWPN.objects.filter(alias__fabric__customer_id=customer_id).count(),
+        'host_wwpn_count': sum(host_wwpns.values()),
+        'manual_host_wwpns': host_wwpns.get('manual', 0),
+        'alias_host_wwpns': host_wwpns.get('alias', 0),
+    }
+
+
+def compute_project_stats(project_ids):
+    """Per-project membership counts for several projects at once"""
+    stats = {
+        project_id: {
+            'zone_count': 0, 'deployed_zones': 0,
+            'alias_count': 0, 'init_aliases': 0, 'target_aliases': 0, 'both_aliases': 0,
+            'host_count': 0,
+        }
+        for project_id in project_ids
+    }
+
+    zones = ProjectZone.objects.filter(project_id__in=project_ids).values('project_id').annotate(
+        total=Count('id'),
+        deployed=Count('id', filter=Q(zone__exists=True))
+    ).order_by()
+    for row in zones:
+        stats[row['project_id']].update(zone_count=row['total'], deployed_zones=row['deployed'])
+
+    aliases = ProjectAlias.objects.filter(project_id__in=project_ids).values('project_id').annotate(
+        total=Count('id'),
+        init=Count('id', filter=Q(alias__use='init')),
+        target=Count('id', filter=Q(alias__use='target')),
+        both=Count('id', filter=Q(alias__use='both'))
+    ).order_by()
+    for row in aliases:
+        stats[row['project_id']].update(
+            alias_count=row['total'], init_aliases=row['init'],
+            target_aliases=row['target'], both_aliases=row['both']
+        )
+
+    hosts = ProjectHost.objects.filter(project_id__in=project_ids).values('project_id').annotate(
+        total=Count('id')
+    ).order_by()
+    for row in hosts:
+        stats[row['project_id']]['host_count'] = row['total']
+
+    return stats
+
+
+def refresh_dashboard_summary(customer_id):
+    """
+    Recompute every summary row of a customer.
+
+    The stale flag is cleared before counting, so a change committed while
+    the counts run marks the rows stale again instead of being lost.
+
+    Returns:
+        dict: {project_id or None: stats}
+    """
+    DashboardSummary.objects.filter(customer_id=customer_id, is_stale=True).update(is_stale=False)
+
+    project_ids = list(Project.objects.filter(customers__id=customer_id).values_list('id', flat=True))
+    results = {None: compute_customer_stats(customer_id)}
+    results.update(compute_project_stats(project_ids))
+
+    for project_id, stats in results.items():
+        DashboardSummary.objects.update_or_create(
+            customer_id=customer_id, project_id=project_id,
+            defaults={'stats': stats}
+        )
+    # Drop rows for projects the customer no longer has
+    DashboardSummary.objects.filter(customer_id=customer_id, project__isnull=False).exclude(
+        project_id__in=project_ids
+    ).delete()
+    return results
+
+
+def _is_fresh(row):
+    return (
+        row is not None
+        and not row.is_stale
+        and row.refreshed_at >= timezone.now() - DASHBOARD_SUMMARY_MAX_AGE
+    )
+
+
+def get_dashboard_summary(customer_id, project_id=None):
+    """
+    Summary stats for a customer, or for one of its projects.
+
+    One query when the row is fresh; otherwise the customer's rows are
+    recomputed first. A project that is not linked to the customer has no
+    row, so its counts are computed directly.
+    """
+    customer_id = int(customer_id)
+    project_id = int(project_id) if project_id else None
+
+    row = DashboardSummary.objects.filter(customer_id=customer_id, project_id=project_id).first()
+    if _is_fresh(row):
+        return row.stats
+    results = refresh_dashboard_summary(customer_id)
+    if project_id in results:
+        return results[project_id]
+    return compute_project_stats([project_id])[project_id]
+
+
+def get_all_customer_summaries():
+    """Customer-wide stats for every customer, as {customer_id: stats}"""
+    rows = {
+        row.customer_id: row
+        for row in DashboardSummary.objects.filter(project__isnull=True)
+    }
+    summaries = {}
+    for customer_id in Customer.objects.values_list('id', flat=True):
+        row = rows.get(customer_id)
+        summaries[customer_id] = row.stats if _is_fresh(row) else refresh_dashboard_summary(customer_id)[None]
+    return summaries
+
+
+def refresh_stale_dashboard_summaries():
+    """Recompute the rows of every customer with a stale or expired row"""
+    cutoff = timezone.now() - DASHBOARD_SUMMARY_MAX_AGE
+    customer_ids = set(
+        DashboardSummary.objects.filter(Q(is_stale=True) | Q(refreshed_at__lt=cutoff))
+        .values_list('customer_id', flat=True)
+    )
+    for customer_id in customer_ids:
+        try:
+            refresh_dashboard_summary(customer_id)
+        except Exception as e:
+            logger.error(f"Dashboard summary refresh failed for customer {customer_id}: {e}")
+    return len(customer_ids)
@@ -8,25 +8,22 @@ from core.models import Project
 from san.models import Fabric, Zone, Alias
 from storage.models import Storage
 from importer.models import StorageImport
+from .cache_versions import customer_cache_key
+from .dashboard_summary import compute_project_stats, get_dashboard_summary, mark_dashboard_summary_stale
+from storage.capacity import (
+    bytes_to_tb, storage_capacity_totals, utilization_percent, volume_capacity_by_pool,
+    volume_capacity_by_tier
+)
 import json
 
 
 def clear_dashboard_cache_for_customer(customer_id):
-    """Helper function to clear dashboard cache for a customer across all their projects"""
-    try:
-        customer = Customer.objects.get(id=customer_id)
-        projects = customer.projects.all()
-
-        for project in projects:
-            cache_key = f"dashboard_stats_{customer_id}_{project.id}"
-            try:
-                cache.delete(cache_key)
-            except Exception as cache_error:
-                # Silently fail if cache is unavailable
-                print(f"Warning: Could not clear cache for {cache_key}: {cache_error}")
-
-    except Customer.DoesNotExist:
-        pass
+    """
+    Invalidate every dashboard and widget cache entry of a customer (O(1)) and
+    flag its summary rows for recomputation. Bulk .update() writes send no
+    signals, so they rely on this.
+    """
+    mark_dashboard_summary_stale(customer_id)
 
 
 @csrf_exempt
@@ -39,8 +36,8 @@ def dashboard_stats(request):
     if not customer_id or not project_id:
         return JsonResponse({"error": "customer_id and project_id are required"}, status=400)
     
-    # Create cache key
-    cache_key = f"dashboard_stats_{customer_id}_{project_id}"
+    # Create cache key (inside the customer's cache generation)
+    cache_key = customer_cache_key(customer_id, 'dashboard_stats', project_id)
     
     # Try to get from cache first (5 minute cache)
     cached_stats = cache.get(cache_key)
@@ -52,11 +49,9 @@ def dashboard_stats(request):
         customer = Customer.objects.get(id=customer_id)
         project = Project.objects.get(id=project_id)
         
-        # Get counts efficiently with single queries
-        fabric_count = Fabric.objects.filter(customer_id=customer_id).count()
-        zone_count = Zone.objects.filter(project_memberships__project=project).count()
-        alias_count = Alias.objects.filter(project_memberships__project=project).count()
-        storage_count = Storage.objects.filter(customer_id=customer_id).count()
+        # Counts come from the precomputed summary rows
+        customer_summary = get_dashboard_summary(customer.id)
+        project_summary = get_dashboard_summary(customer.id, project.id)
         
         # Get last import info
         last_import = None
@@ -89,10 +84,10 @@ def dashboard_stats(request):
                 'name': project.name,
             },
             'stats': {
-                'total_fabrics': fabric_count,
-                'total_zones': zone_count,
-                'total_aliases': alias_count,
-                'total_storage': storage_count,
+                'total_fabrics': customer_summary['fabric_count'],
+                'total_zones': project_summary['zone_count'],
+                'total_aliases': project_summary['alias_count'],
+                'total_storage': customer_summary['storage_count'],
             },
             'last_import': last_import,
         }
@@ -119,12 +114,12 @@ def clear_dashboard_cache(request):
         customer_id = data.get('customer_id')
         project_id = data.get('project_id')
         
-        if customer_id and project_id:
-            cache_key = f"dashboard_stats_{customer_id}_{project_id}"
-            cache.delete(cache_key)
+        if customer_id:
+            # Clears every cached dashboard and widget entry of the customer
+            clear_dashboard_cache_for_customer(customer_id)
             return JsonResponse({"message": "Cache cleared successfully"})
         else:
-            return JsonResponse({"error": "customer_id and project_id required"}, status=400)
+            return JsonResponse({"error": "customer_id required"}, status=400)
             
     except json.JSONDecodeError:
         return JsonResponse({"error": "Invalid JSON"}, status=400)
@@ -684,412 +679,465 @@ class DashboardTemplateSaveView(View):
 
 # ========== WIDGET DATA ENDPOINTS ==========
 
-from san.models import Switch, AliasWWPN
-from storage.models import Host, HostWwpn
 from backup.models import BackupRecord
-from django.db.models import Sum, Count, Q, Max
 
+# Cache lifetime for widgets without a WidgetDataSource row (seconds)
+WIDGET_DEFAULT_CACHE_TTL = 60
+
+
+class WidgetParameterError(Exception):
+    """A widget was requested without the parameters it needs"""
+    pass
+
+
+class WidgetDataContext:
+    """
+    Inputs for the widget data functions, plus the sub-queries several
+    widgets share (project lookup, summary rows, capacity totals). Each is
+    computed at most once per context, so a batched request pays for it
+    once no matter how many widgets use it.
+    """
+
+    def __init__(self, customer_id=None, project_id=None, params=None):
+        self.customer_id = customer_id
+        self.project_id = project_id
+        self.params = params or {}
+        self._memo = {}
+
+    def _memoized(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def require(self, customer=False, project=False):
+        """Raise WidgetParameterError naming the missing parameters"""
+        missing = []
+        if customer and not self.customer_id:
+            missing.append('customer_id')
+        if project and not self.project_id:
+            missing.append('project_id')
+        if missing:
+            raise WidgetParameterError(f"{' and '.join(missing)} required")
+
+    @property
+    def project(self):
+        return self._memoized('project', lambda: Project.objects.get(id=self.project_id))
+
+    @property
+    def customer_summary(self):
+        return self._memoized('customer_summary', lambda: get_dashboard_summary(self.customer_id))
+
+    @property
+    def project_summary(self):
+        def load():
+            # Scope to the requested customer, or the first one linked to the project
+            customer_id = self.customer_id or self.project.customers.values_list('id', flat=True).first()
+            if not customer_id:
+                return compute_project_stats([self.project.id])[self.project.id]
+            return get_dashboard_summary(customer_id, self.project.id)
+        return self._memoized('project_summary', load)
+
+
+def _san_overview_data(ctx):
+    ctx.require(customer=True, project=True)
+    return {
+        'total_fabrics': ctx.customer_summary['fabric_count'],
+        'total_zones': ctx.project_summary['zone_count'],
+        'total_aliases': ctx.project_summary['alias_count'],
+        'total_switches': ctx.customer_summary['switch_count'],
+        'cisco_fabrics': ctx.customer_summary['cisco_fabrics'],
+        'brocade_fabrics': ctx.customer_summary['brocade_fabrics']
+    }
+
+
+def _zone_deployment_data(ctx):
+    ctx.require(project=True)
+    summary = ctx.project_summary
+    total_zones = summary['zone_count']
+    deployed_zones = summary['deployed_zones']
+    return {
+        'total_zones': total_zones,
+        'deployed': deployed_zones,
+        'designed': total_zones - deployed_zones,
+        'deployment_percentage': round((deployed_zones / total_zones * 100) if total_zones > 0 else 0, 1)
+    }
+
+
+def _alias_distribution_data(ctx):
+    ctx.require(project=True)
+    summary = ctx.project_summary
+    initiators = summary['init_aliases']
+    targets = summary['target_aliases']
+    both = summary['both_aliases']
+    return {
+        'total_aliases': initiators + targets + both,
+        'initiators': initiators,
+        'targets': targets,
+        'both': both
+    }
+
+
+def _storage_inventory_data(ctx):
+    ctx.require(customer=True)
+    return {
+        'total_systems': ctx.customer_summary['storage_count'],
+        'by_type': ctx.customer_summary['storage_by_type']
+    }
+
+
+def _host_connectivity_data(ctx):
+    ctx.require(customer=True)
+    summary = ctx.customer_summary
+    return {
+        'total_hosts': summary['host_count'],
+        'hosts_with_wwpns': summary['hosts_with_wwpns'],
+        'hosts_without_wwpns': summary['host_count'] - summary['hosts_with_wwpns'],
+        'total_wwpns': summary['host_wwpn_count']
+    }
+
+
+def _import_activity_data(ctx):
+    ctx.require(customer=True)
+    latest_import = StorageImport.objects.filter(
+        customer_id=ctx.customer_id
+    ).order_by('-started_at').first()
+
+    if not latest_import:
+        return {
+            'has_imports': False,
+            'message': 'No imports found'
+        }
 
-@login_required
-def widget_san_overview(request):
-    """SAN Configuration Overview Widget Data"""
-    try:
-        customer_id = request.GET.get('customer_id')
-        project_id = request.GET.get('project_id')
+    return {
+        'has_imports': True,
+        'import_id': latest_import.id,
+        'status': latest_import.status,
+        'started_at': latest_import.started_at.isoformat() if latest_import.started_at else None,
+        'completed_at': latest_import.completed_at.isoformat() if latest_import.completed_at else None,
+        'storage_systems_imported': latest_import.storage_systems_imported or 0,
+        'volumes_imported': latest_import.volumes_imported or 0,
+        'hosts_imported': latest_import.hosts_imported or 0,
+        'error_message': latest_import.error_message
+    }
+
+
+def _backup_health_data(ctx):
+    # Latest backup is global, not customer-specific
+    latest_backup = BackupRecord.objects.order_by('-started_at').first()
+
+    if not latest_backup:
+        return {
+            'has_backups': False,
+            'message': 'No backups found'
+        }
 
-        if not customer_id or not project_id:
-            return JsonResponse({'error': 'customer_id and project_id required'}, status=400)
+    # Calculate time since last backup
+    if latest_backup.completed_at:
+        time_since = timezone.now() - latest_backup.completed_at
+        hours_since = int(time_since.total_seconds() / 3600)
 
-        project = Project.objects.get(id=project_id)
+        if hours_since < 1:
+            time_since_str = f"{int(time_since.total_seconds() / 60)} minutes ago"
+        elif hours_since < 24:
+            time_since_str = f"{hours_since} hours ago"
+        else:
+            days_since = int(hours_since / 24)
+            time_since_str = f"{days_since} days ago"
+    else:
+        time_since_str = "In progress"
+
+    return {
+        'has_backups': True,
+        'backup_id': latest_backup.id,
+        'status': latest_backup.status,
+        'started_at': latest_backup.started_at.isoformat() if latest_backup.started_at else None,
+        'completed_at': latest_backup.completed_at.isoformat() if latest_backup.completed_at else None,
+        'file_size_mb': latest_backup.size_mb,
+        'duration': latest_backup.duration,
+        'time_since': time_since_str,
+        'backup_type': latest_backup.backup_type,
+        'description': latest_backup.description
+    }
+
+
+def _wwpn_inventory_data(ctx):
+    ctx.require(customer=True)
+    summary = ctx.customer_summary
+
+    # Aliases (SAN side), hosts (Storage side), and manual vs alias-derived host WWPNs
+    alias_wwpns = summary['alias_wwpn_count']
+    host_wwpns = summary['host_wwpn_count']
+    return {
+        'alias_wwpns': alias_wwpns,
+        'host_wwpns': host_wwpns,
+        'manual_wwpns': summary['manual_host_wwpns'],
+        'alias_derived_wwpns': summary['alias_host_wwpns'],
+        'total_wwpns': alias_wwpns + host_wwpns
+    }
+
+
+def _project_activity_data(ctx):
+    ctx.require(project=True)
+    limit = int(ctx.params.get('limit', 10))
+    project = ctx.project
+
+    # Get recently modified zones and aliases
+    recent_zones = Zone.objects.filter(
+        project_memberships__project=project,
+        last_modified_at__isnull=False
+    ).select_related('last_modified_by').order_by('-last_modified_at')[:limit]
+
+    recent_aliases = Alias.objects.filter(
+        project_memberships__project=project,
+        last_modified_at__isnull=False
+    ).select_related('last_modified_by').order_by('-last_modified_at')[:limit]
+
+    # Combine and sort by timestamp
+    activities = []
+
+    for zone in recent_zones:
+        activities.append({
+            'type': 'zone',
+            'name': zone.name,
+            'action': 'modified',
+            'timestamp': zone.last_modified_at.isoformat(),
+            'user': zone.last_modified_by.username if zone.last_modified_by else 'Unknown'
+        })
 
-        # Get counts
-        fabric_count = Fabric.objects.filter(customer_id=customer_id).count()
-        zone_count = Zone.objects.filter(project_memberships__project=project).count()
-        alias_count = Alias.objects.filter(project_memberships__project=project).count()
-        switch_count = Switch.objects.filter(customer_id=customer_id).count()
+    for alias in recent_aliases:
+        activities.append({
+            'type': 'alias',
+            'name': alias.name,
+            'action': 'modified',
+            'timestamp': alias.last_modified_at.isoformat(),
+            'user': alias.last_modified_by.username if alias.last_modified_by else 'Unknown'
+        })
 
-        # Get vendor breakdown
-        cisco_fabrics = Fabric.objects.filter(customer_id=customer_id, san_vendor='cisco').count()
-        brocade_fabrics = Fabric.objects.filter(customer_id=customer_id, san_vendor='brocade').count()
+    # Sort by timestamp descending
+    activities.sort(key=lambda x: x['timestamp'], reverse=True)
 
-        return JsonResponse({
-            'total_fabrics': fabric_count,
-            'total_zones': zone_count,
-            'total_aliases': alias_count,
-            'total_switches': switch_count,
-            'cisco_fabrics': cisco_fabrics,
-            'brocade_fabrics': brocade_fabrics
-        })
+    return {
+        'activities': activities[:limit]
+    }
 
-    except Project.DoesNotExist:
-        return JsonResponse({'error': 'Project not found'}, status=404)
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
 
+def _storage_capacity_data(ctx):
+    ctx.require(customer=True)
 
-@login_required
-def widget_zone_deployment(request):
-    """Zone Deployment Status Widget Data"""
+    # Fleet totals and rollups are summed by the database
+    totals = storage_capacity_totals(ctx.customer_id)
+    total_capacity_bytes = totals['capacity_bytes']
+    total_used_bytes = totals['used_bytes']
+    total_available_bytes = total_capacity_bytes - total_used_bytes
+
+    pools = [
+        {
+            'storage_name': pool['storage_name'],
+            'pool_name': pool['pool_name'],
+            'volume_count': pool['volume_count'],
+            'capacity_tb': bytes_to_tb(pool['capacity_bytes']),
+            'used_tb': bytes_to_tb(pool['used_bytes']),
+        }
+        for pool in volume_capacity_by_pool(ctx.customer_id, limit=10)
+    ]
+    tiers = {tier: bytes_to_tb(value) for tier, value in volume_capacity_by_tier(ctx.customer_id).items()}
+
+    return {
+        'system_count': totals['system_count'],
+        'total_capacity_tb': bytes_to_tb(total_capacity_bytes),
+        'used_capacity_tb': bytes_to_tb(total_used_bytes),
+        'available_capacity_tb': bytes_to_tb(total_available_bytes),
+        'used_percentage': utilization_percent(total_used_bytes, total_capacity_bytes),
+        'compression_savings_tb': bytes_to_tb(totals['savings_bytes']),
+        'total_capacity_bytes': total_capacity_bytes,
+        'used_capacity_bytes': total_used_bytes,
+        'available_capacity_bytes': total_available_bytes,
+        'top_pools': pools,
+        'capacity_by_tier_tb': tiers
+    }
+
+
+# WidgetType.name -> data function
+WIDGET_DATA_FUNCTIONS = {
+    'san_overview': _san_overview_data,
+    'zone_deployment': _zone_deployment_data,
+    'alias_distribution': _alias_distribution_data,
+    'storage_inventory': _storage_inventory_data,
+    'host_connectivity': _host_connectivity_data,
+    'import_activity': _import_activity_data,
+    'backup_health': _backup_health_data,
+    'wwpn_inventory': _wwpn_inventory_data,
+    'project_activity': _project_activity_data,
+    'storage_capacity': _storage_capacity_data,
+}
+
+
+def _widget_context(request):
+    return WidgetDataContext(
+        customer_id=request.GET.get('customer_id'),
+        project_id=request.GET.get('project_id'),
+        params=request.GET
+    )
+
+
+def _widget_payload(name, ctx):
+    """Run one widget data function; returns (payload, HTTP status)"""
     try:
-        project_id = request.GET.get('project_id')
+        return WIDGET_DATA_FUNCTIONS[name](ctx), 200
+    except WidgetParameterError as e:
+        return {'error': str(e)}, 400
+    except Project.DoesNotExist:
+        return {'error': 'Project not found'}, 404
+    except Exception as e:
+        return {'error': str(e)}, 500
 
-        if not project_id:
-            return JsonResponse({'error': 'project_id required'}, status=400)
 
-        project = Project.objects.get(id=project_id)
+def _widget_response(request, name):
+    payload, status = _widget_payload(name, _widget_context(request))
+    return JsonResponse(payload, status=status)
 
-        # Get deployment status
-        total_zones = Zone.objects.filter(project_memberships__project=project).count()
-        deployed_zones = Zone.objects.filter(project_memberships__project=project, exists=True).count()
-        designed_zones = total_zones - deployed_zones
 
-        deployment_percentage = round((deployed_zones / total_zones * 100) if total_zones > 0 else 0, 1)
+@login_required
+def widget_san_overview(request):
+    """SAN Configuration Overview Widget Data"""
+    return _widget_response(request, 'san_overview')
 
-        return JsonResponse({
-            'total_zones': total_zones,
-            'deployed': deployed_zones,
-            'designed': designed_zones,
-            'deployment_percentage': deployment_percentage
-        })
 
-    except Project.DoesNotExist:
-        return JsonResponse({'error': 'Project not found'}, status=404)
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+@login_required
+def widget_zone_deployment(request):
+    """Zone Deployment Status Widget Data"""
+    return _widget_response(request, 'zone_deployment')
 
 
 @login_required
 def widget_alias_distribution(request):
     """Alias Distribution Widget Data"""
-    try:
-        project_id = request.GET.get('project_id')
-
-        if not project_id:
-            return JsonResponse({'error': 'project_id required'}, status=400)
-
-        project = Project.objects.get(id=project_id)
-
-        # Get alias distribution by use type
-        initiators = Alias.objects.filter(project_memberships__project=project, use='init').count()
-        targets = Alias.objects.filter(project_memberships__project=project, use='target').count()
-        both = Alias.objects.filter(project_memberships__project=project, use='both').count()
-        total = initiators + targets + both
-
-        return JsonResponse({
-            'total_aliases': total,
-            'initiators': initiators,
-            'targets': targets,
-            'both': both
-        })
-
-    except Project.DoesNotExist:
-        return JsonResponse({'error': 'Project not found'}, status=404)
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+    return _widget_response(request, 'alias_distribution')
 
 
 @login_required
 def widget_storage_inventory(request):
     """Storage Systems Inventory Widget Data"""
-    try:
-        customer_id = request.GET.get('customer_id')
-
-        if not customer_id:
-            return JsonResponse({'error': 'customer_id required'}, status=400)
-
-        # Get storage counts by type
-        storage_types = Storage.objects.filter(
-            customer_id=customer_id
-        ).values('storage_type').annotate(count=Count('id'))
-
-        total_storage = Storage.objects.filter(customer_id=customer_id).count()
-
-        # Format by type
-        type_breakdown = {item['storage_type'] or 'Unknown': item['count'] for item in storage_types}
-
-        return JsonResponse({
-            'total_systems': total_storage,
-            'by_type': type_breakdown
-        })
-
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+    return _widget_response(request, 'storage_inventory')
 
 
 @login_required
 def widget_host_connectivity(request):
     """Host Connectivity Widget Data"""
-    try:
-        customer_id = request.GET.get('customer_id')
-
-        if not customer_id:
-            return JsonResponse({'error': 'customer_id required'}, status=400)
-
-        # Get host counts
-        total_hosts = Host.objects.filter(storage__customer_id=customer_id).distinct().count()
-
-        # Hosts with WWPNs
-        hosts_with_wwpns = Host.objects.filter(
-            storage__customer_id=customer_id
-        ).annotate(
-            wwpn_count=Count('host_wwpns')
-        ).filter(wwpn_count__gt=0).count()
-
-        hosts_without_wwpns = total_hosts - hosts_with_wwpns
-
-        # Total WWPNs
-        total_wwpns = HostWwpn.objects.filter(
-            host__storage__customer_id=customer_id
-        ).count()
-
-        return JsonResponse({
-            'total_hosts': total_hosts,
-            'hosts_with_wwpns': hosts_with_wwpns,
-            'hosts_without_wwpns': hosts_without_wwpns,
-            'total_wwpns': total_wwpns
-        })
-
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+    return _widget_response(request, 'host_connectivity')
 
 
 @login_required
 def widget_import_activity(request):
     """Recent Import Activity Widget Data"""
-    try:
-        customer_id = request.GET.get('customer_id')
-
-        if not customer_id:
-            return JsonResponse({'error': 'customer_id required'}, status=400)
-
-        # Get latest import
-        latest_import = StorageImport.objects.filter(
-            customer_id=customer_id
-        ).order_by('-started_at').first()
-
-        if not latest_import:
-            return JsonResponse({
-                'has_imports': False,
-                'message': 'No imports found'
-            })
-
-        return JsonResponse({
-            'has_imports': True,
-            'import_id': latest_import.id,
-            'status': latest_import.status,
-            'started_at': latest_import.started_at.isoformat() if latest_import.started_at else None,
-            'completed_at': latest_import.completed_at.isoformat() if latest_import.completed_at else None,
-            'storage_systems_imported': latest_import.storage_systems_imported or 0,
-            'volumes_imported': latest_import.volumes_imported or 0,
-            'hosts_imported': latest_import.hosts_imported or 0,
-            'error_message': latest_import.error_message
-        })
-
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+    return _widget_response(request, 'import_activity')
 
 
 @login_required
 def widget_backup_health(request):
     """Backup Health Widget Data"""
-    try:
-        # Get latest backup (global, not customer-specific)
-        latest_backup = BackupRecord.objects.order_by('-started_at').first()
-
-        if not latest_backup:
-            return JsonResponse({
-                'has_backups': False,
-                'message': 'No backups found'
-            })
-
-        # Calculate time since last backup
-        from django.utils import timezone
-        if latest_backup.completed_at:
-            time_since = timezone.now() - latest_backup.completed_at
-            hours_since = int(time_since.total_seconds() / 3600)
-
-            if hours_since < 1:
-                time_since_str = f"{int(time_since.total_seconds() / 60)} minutes ago"
-            elif hours_since < 24:
-                time_since_str = f"{hours_since} hours ago"
-            else:
-                days_since = int(hours_since / 24)
-                time_since_str = f"{days_since} days ago"
-        else:
-            time_since_str = "In progress"
-
-        return JsonResponse({
-            'has_backups': True,
-            'backup_id': latest_backup.id,
-            'status': latest_backup.status,
-            'started_at': latest_backup.started_at.isoformat() if latest_backup.started_at else None,
-            'completed_at': latest_backup.completed_at.isoformat() if latest_backup.completed_at else None,
-            'file_size_mb': latest_backup.size_mb,
-            'duration': latest_backup.duration,
-            'time_since': time_since_str,
-            'backup_type': latest_backup.backup_type,
-            'description': latest_backup.description
-        })
-
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+    return _widget_response(request, 'backup_health')
 
 
 @login_required
 def widget_wwpn_inventory(request):
     """WWPN Inventory Widget Data"""
-    try:
-        customer_id = request.GET.get('customer_id')
-        project_id = request.GET.get('project_id')
-
-        if not customer_id:
-            return JsonResponse({'error': 'customer_id required'}, status=400)
-
-        # Total WWPNs in aliases (SAN side)
-        alias_wwpns = AliasWWPN.objects.filter(
-            alias__fabric__customer_id=customer_id
-        ).count()
-
-        # Total WWPNs on hosts (Storage side)
-        host_wwpns = HostWwpn.objects.filter(
-            host__storage__customer_id=customer_id
-        ).count()
-
-        # Manual vs alias-derived (from HostWwpn)
-        manual_wwpns = HostWwpn.objects.filter(
-            host__storage__customer_id=customer_id,
-            source_type='manual'
-        ).count()
-
-        alias_derived_wwpns = HostWwpn.objects.filter(
-            host__storage__customer_id=customer_id,
-            source_type='alias'
-        ).count()
-
-        return JsonResponse({
-            'alias_wwpns': alias_wwpns,
-            'host_wwpns': host_wwpns,
-            'manual_wwpns': manual_wwpns,
-            'alias_derived_wwpns': alias_derived_wwpns,
-            'total_wwpns': alias_wwpns + host_wwpns
-        })
-
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+    return _widget_response(request, 'wwpn_inventory')
 
 
 @login_required
 def widget_project_activity(request):
     """Project Activity Log Widget Data"""
-    try:
-        project_id = request.GET.get('project_id')
-        limit = int(request.GET.get('limit', 10))
-
-        if not project_id:
-            return JsonResponse({'error': 'project_id required'}, status=400)
-
-        project = Project.objects.get(id=project_id)
-
-        # Get recently modified zones
-        recent_zones = Zone.objects.filter(
-            project_memberships__project=project,
-            last_modified_at__isnull=False
-        ).order_by('-last_modified_at')[:limit]
-
-        # Get recently modified aliases
-        recent_aliases = Alias.objects.filter(
-            project_memberships__project=project,
-            last_modified_at__isnull=False
-        ).order_by('-last_modified_at')[:limit]
-
-        # Combine and sort by timestamp
-        activities = []
-
-        for zone in recent_zones:
-            activities.append({
-                'type': 'zone',
-                'name': zone.name,
-                'action': 'modified',
-                'timestamp': zone.last_modified_at.isoformat(),
-                'user': zone.last_modified_by.username if zone.last_modified_by else 'Unknown'
-            })
-
-        for alias in recent_aliases:
-            activities.append({
-                'type': 'alias',
-                'name': alias.name,
-                'action': 'modified',
-                'timestamp': alias.last_modified_at.isoformat(),
-                'user': alias.last_modified_by.username if alias.last_modified_by else 'Unknown'
-            })
-
-        # Sort by timestamp descending
-        activities.sort(key=lambda x: x['timestamp'], reverse=True)
-
-        return JsonResponse({
-            'activities': activities[:limit]
-        })
-
-    except Project.DoesNotExist:
-        return JsonResponse({'error': 'Project not found'}, status=404)
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+    return _widget_response(request, 'project_activity')
 
 
 @login_required
 def widget_storage_capacity(request):
     """Storage Capacity Summary Widget Data"""
-    try:
-        customer_id = request.GET.get('customer_id')
-
-        if not customer_id:
-            return JsonResponse({'error': 'customer_id required'}, status=400)
-
-        # Get all storage systems for customer
-        storage_systems = Storage.objects.filter(customer_id=customer_id)
-
-        # Calculate totals
-        total_capacity_bytes = 0
-        total_used_bytes = 0
-        total_compression_savings = 0
-        system_count = 0
-
-        for system in storage_systems:
-            # Total capacity
-            if system.capacity_bytes:
-                total_capacity_bytes += system.capacity_bytes
+    return _widget_response(request, 'storage_capacity')
 
-            # Used capacity
-            if system.used_capacity_bytes:
-                total_used_bytes += system.used_capacity_bytes
 
-            # Compression savings
-            if system.capacity_savings_bytes:
-                total_compression_savings += system.capacity_savings_bytes
+def widget_cache_ttls(names):
+    """
+    Cache lifetime per widget, from the WidgetDataSource row of the same
+    name (one query). Real-time sources are never cached; widgets without
+    a row use WIDGET_DEFAULT_CACHE_TTL.
+    """
+    ttls = {name: WIDGET_DEFAULT_CACHE_TTL for name in names}
+    for source in WidgetDataSource.objects.filter(name__in=names, is_active=True):
+        ttls[source.name] = 0 if source.is_real_time else source.cache_duration
+    return ttls
 
-            system_count += 1
 
-        # Calculate available
-        total_available_bytes = total_capacity_bytes - total_used_bytes
+def _widget_cache_key(name, ctx):
+    limit = ctx.params.get('limit', '') if name == 'project_activity' else ''
+    if ctx.customer_id:
+        # Dropped as a whole when the customer's cache generation is bumped
+        return customer_cache_key(ctx.customer_id, f'widget_data_{name}', ctx.project_id or '', limit)
+    return f"widget_data_{name}_{ctx.project_id or ''}_{limit}"
 
-        # Calculate percentages
-        used_percentage = round((total_used_bytes / total_capacity_bytes * 100) if total_capacity_bytes > 0 else 0, 1)
 
-        # Convert to readable units (TB)
-        def bytes_to_tb(bytes_val):
-            return round(bytes_val / (1024**4), 2) if bytes_val else 0
+@login_required
+@require_http_methods(["GET"])
+def widget_batch_data(request):
+    """
+    Data for several widgets in one request.
+
+    GET /api/core/widgets/batch/?customer_id=<id>&project_id=<id>&widgets=san_overview,zone_deployment
+    GET /api/core/widgets/batch/?customer_id=<id>&project_id=<id>&layout_id=<id>
+
+    Without widgets or layout_id, the visible widgets of the user's layout
+    for the customer are used. Shared sub-queries (summary rows, project
+    lookup) run once for the whole batch, and each payload is cached for
+    its WidgetDataSource.cache_duration.
+    """
+    ctx = _widget_context(request)
+
+    names = [name for name in request.GET.get('widgets', '').split(',') if name]
+    if not names:
+        layout_id = request.GET.get('layout_id')
+        layouts = DashboardLayout.objects.filter(user=request.user)
+        if layout_id:
+            layouts = layouts.filter(id=layout_id)
+        elif ctx.customer_id:
+            layouts = layouts.filter(customer_id=ctx.customer_id)
+        else:
+            return JsonResponse({'error': 'widgets, layout_id or customer_id required'}, status=400)
+        names = list(
+            DashboardWidget.objects.filter(layout__in=layouts, is_visible=True)
+            .values_list('widget_type__name', flat=True).distinct()
+        )
+
+    # Keep request order, drop duplicates
+    names = list(dict.fromkeys(names))
+    unknown = [name for name in names if name not in WIDGET_DATA_FUNCTIONS]
+    names = [name for name in names if name in WIDGET_DATA_FUNCTIONS]
+
+    ttls = widget_cache_ttls(names)
+    keys = {name: _widget_cache_key(name, ctx) for name in names}
+    try:
+        cached = cache.get_many([keys[name] for name in names if ttls[name]])
+    except Exception as cache_error:
+        print(f"⚠️  Widget cache unavailable: {cache_error}")
+        cached = {}
+
+    widgets = {}
+    for name in names:
+        if keys[name] in cached:
+            widgets[name] = cached[keys[name]]
+            continue
+        payload, status = _widget_payload(name, ctx)
+        widgets[name] = payload
+        if status == 200 and ttls[name]:
+            try:
+                cache.set(keys[name], payload, ttls[name])
+            except Exception as cache_error:
+                print(f"⚠️  Could not cache widget {name}: {cache_error}")
 
-        return JsonResponse({
-            'system_count': system_count,
-            'total_capacity_tb': bytes_to_tb(total_capacity_bytes),
-            'used_capacity_tb': bytes_to_tb(total_used_bytes),
-            'available_capacity_tb': bytes_to_tb(total_available_bytes),
-            'used_percentage': used_percentage,
-            'compression_savings_tb': bytes_to_tb(total_compression_savings),
-            'total_capacity_bytes': total_capacity_bytes,
-            'used_capacity_bytes': total_used_bytes,
-            'available_capacity_bytes': total_available_bytes
-        })
+    for name in unknown:
+        widgets[name] = {'error': f'Unknown widget: {name}'}
 
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
\ No newline at end of file
+    return JsonResponse({
+        'widgets': widgets,
+        'cache_ttls': ttls
+    })
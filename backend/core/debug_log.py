@@ -0,0 +1,49 @@
+"""
+Structured debug logging for the view modules.
+
+The list views used to print() progress lines, many with a queryset.count()
+inside the f-string, so every request paid for extra COUNT queries whether
+or not anyone read the output. view_logger() returns a logger whose debug()
+takes an event name and keyword fields. Fields that are callables
+(queryset.count, a lambda) are only called when DEBUG is enabled for the
+module's logger, so in production a debug line costs one level check:
+
+    debug_log = view_logger(__name__)
+    debug_log.debug('aliases filtered', filters=filter_params, count=aliases.count)
+
+Lines are written as "<event> <fields as JSON>", and the evaluated fields are
+also passed as the record's `fields` attribute for structured handlers.
+Enable them with the logger of the module ('san.views', ...) at DEBUG; in
+development, set VIEW_DEBUG_LOG_LEVEL=DEBUG.
+"""
+
+import json
+import logging
+
+
+class ViewLogger:
+    """Wraps a module logger; see the module docstring"""
+
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+
+    def enabled(self):
+        """True if debug lines are emitted, for work that cannot be deferred with a callable"""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def debug(self, event, **fields):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        try:
+            values = {name: value() if callable(value) else value for name, value in fields.items()}
+        except Exception as e:
+            # A failing debug field must not fail the request
+            values = {'error': f"{type(e).__name__}: {e}"}
+        self.logger.debug(
+            '%s %s', event, json.dumps(values, default=str), extra={'event': event, 'fields': values}
+        )
+
+
+def view_logger(name):
+    """ViewLogger for a module, named after it"""
+    return ViewLogger(name)
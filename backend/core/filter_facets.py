@@ -0,0 +1,234 @@
+"""
+Distinct-value facets for table filter dropdowns.
+
+Opening a column filter used to run a DISTINCT query (and for calculated
+columns a Count() annotation) over every row of the table. Facets compute the
+value set of one (customer, table, field) once, with the number of rows per
+value, and keep it in the cache until the table changes.
+
+Invalidation uses the cache generations of core.cache_versions: the
+post_save/post_delete signals that drive audit logging (san.signals,
+storage.signals) call invalidate_filter_facets() for the tables a change
+affects, and bulk writes that clear the customer's dashboard cache drop the
+facets with it. FILTER_FACET_TTL bounds how long a write that bypassed both
+can go unnoticed.
+
+Values are stored sorted, with a lowercase index for prefix search, so
+typing in a filter menu only filters the cached list.
+"""
+
+import logging
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import FieldError, ObjectDoesNotExist
+from django.db.models import Count
+
+from .cache_versions import bump_customer_cache_version, customer_cache_key
+
+logger = logging.getLogger(__name__)
+
+FILTER_FACET_TTL = 60 * 60
+
+# Values returned per request when no limit is given
+DEFAULT_FACET_LIMIT = 1000
+
+
+class FacetError(ValueError):
+    """Unknown facet table or field"""
+
+
+def _grouped(lookup):
+    """Facet of a plain column or FK path: one GROUP BY query"""
+    def compute(queryset, customer_id):
+        return queryset.values_list(lookup).annotate(count=Count('id')).order_by()
+    return compute
+
+
+def _annotated(expression):
+    """Facet of a calculated column: the per-row values are counted in Python"""
+    def compute(queryset, customer_id):
+        return Counter(queryset.annotate(_facet_value=expression).values_list('_facet_value', flat=True)).items()
+    return compute
+
+
+def _host_storage_system(queryset, customer_id):
+    # Hosts are listed under their storage system name and/or the
+    # storage_system column; rows with neither are listed as 'Blank'
+    counts = Counter()
+    rows = queryset.values_list('storage__name', 'storage_system').annotate(count=Count('id')).order_by()
+    for storage_name, storage_system, count in rows:
+        names = {name for name in (storage_name, storage_system) if name}
+        for name in names or ['Blank']:
+            counts[name] += count
+    return counts.items()
+
+
+def _alias_storage_name(queryset, customer_id):
+    # Storage systems whose port WWPNs appear on an alias, counted per alias
+    from san.models import AliasWWPN
+    from san.san_tools import wwpn_key_expression
+    from storage.models import Port
+
+    ports = Port.objects.filter(storage__customer_id=customer_id, wwpn__isnull=False).annotate(
+        wwpn_key=wwpn_key_expression()
+    )
+    storage_by_key = dict(ports.values_list('wwpn_key', 'storage__name'))
+    matched = (
+        AliasWWPN.objects.filter(alias__in=queryset)
+        .annotate(wwpn_key=wwpn_key_expression())
+        .filter(wwpn_key__in=ports.values('wwpn_key'))
+        .values_list('alias_id', 'wwpn_key')
+    )
+    aliases_by_storage = defaultdict(set)
+    for alias_id, key in matched:
+        aliases_by_storage[storage_by_key.get(key)].add(alias_id)
+    return [(name, len(alias_ids)) for name, alias_ids in aliases_by_storage.items()]
+
+
+# table -> model, path from a row to its customer id, and calculated fields.
+# Any other field name is grouped as a column or lookup path.
+FACET_TABLES = {
+    'zones': {
+        'model': 'san.Zone',
+        'customer_field': 'fabric__customer_id',
+        'fields': {
+            'member_count': _annotated(Count('members', distinct=True)),
+        },
+    },
+    'aliases': {
+        'model': 'san.Alias',
+        'customer_field': 'fabric__customer_id',
+        'fields': {
+            'zoned_count': _annotated(Count('zone', distinct=True)),
+            'storage_details.name': _alias_storage_name,
+            'storage__name': _alias_storage_name,
+        },
+    },
+    'hosts': {
+        'model': 'storage.Host',
+        'customer_field': 'storage__customer_id',
+        'fields': {
+            'aliases_count': _annotated(Count('alias_host', distinct=True)),
+            'storage_system': _host_storage_system,
+        },
+    },
+}
+
+
+def _facet_scope(table):
+    return f"facets_{table}"
+
+
+def invalidate_filter_facets(customer_id, *tables):
+    """Drop the cached facets of some tables (all tables if none given) after commit"""
+    for table in tables or FACET_TABLES:
+        bump_customer_cache_version(customer_id, scope=_facet_scope(table))
+
+
+def invalidate_filter_facets_for(instance, path, *tables):
+    """
+    invalidate_filter_facets() for the customer of a model instance.
+
+    Args:
+        instance: Saved or deleted row
+        path: Dotted attribute path to the object holding customer_id
+            ('' for the instance itself)
+    """
+    try:
+        owner = instance
+        for attribute in filter(None, path.split('.')):
+            owner = getattr(owner, attribute)
+        customer_id = owner.customer_id if owner is not None else None
+    except ObjectDoesNotExist:
+        # Parent already gone in a cascade delete; its own signal covers it
+        return
+    invalidate_filter_facets(customer_id, *tables)
+
+
+def _display_value(value):
+    # Booleans are filtered as strings, like the table filters send them
+    if isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _sort_key(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value, '')
+    return (1, 0, str(value).lower())
+
+
+def compute_filter_facet(customer_id, table, field):
+    """
+    Value counts of one field over a customer's rows.
+
+    Returns:
+        dict: 'values' ([[value, count], ...] sorted for display) and
+        'index' ([[lowercase value, position], ...] sorted for prefix search)
+    """
+    config = FACET_TABLES.get(table)
+    if config is None:
+        raise FacetError(f"Unknown facet table '{table}'")
+
+    model = apps.get_model(config['model'])
+    queryset = model.objects.filter(**{config['customer_field']: customer_id})
+    compute = config['fields'].get(field) or _grouped(field.replace('.', '__'))
+
+    counts = Counter()
+    try:
+        for value, count in compute(queryset, customer_id):
+            if value is None or str(value).strip() == '':
+                continue
+            counts[_display_value(value)] += count
+    except FieldError as e:
+        raise FacetError(f"Unknown facet field '{field}' for {table}: {e}")
+
+    values = sorted(([value, count] for value, count in counts.items()), key=lambda item: _sort_key(item[0]))
+    index = sorted([str(value).lower(), position] for position, (value, _) in enumerate(values))
+    return {'values': values, 'index': index}
+
+
+def get_filter_facet(customer_id, table, field, prefix=None, limit=DEFAULT_FACET_LIMIT):
+    """
+    Cached value counts of one field, optionally only values starting with
+    `prefix` (case-insensitive).
+
+    Returns:
+        list of {'value', 'count'}
+    """
+    if not customer_id:
+        return []
+    if table not in FACET_TABLES:
+        raise FacetError(f"Unknown facet table '{table}'")
+
+    facet = None
+    key = customer_cache_key(customer_id, 'filter_facet', table, field, scope=_facet_scope(table))
+    try:
+        facet = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Could not read filter facet {table}.{field}: {e}")
+
+    if facet is None:
+        facet = compute_filter_facet(customer_id, table, field)
+        try:
+            cache.set(key, facet, FILTER_FACET_TTL)
+        except Exception as e:
+            logger.warning(f"Could not cache filter facet {table}.{field}: {e}")
+
+    values = facet['values']
+    if prefix:
+        prefix = prefix.lower()
+        index = facet['index']
+        positions = []
+        i = bisect_left(index, [prefix])
+        while i < len(index) and index[i][0].startswith(prefix):
+            positions.append(index[i][1])
+            i += 1
+        values = [values[position] for position in sorted(positions)]
+
+    if limit:
+        values = values[:limit]
+    return [{'value': value, 'count': count} for value, count in values]
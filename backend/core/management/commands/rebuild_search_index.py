@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from core.search_index import INDEXED_MODELS, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the search_text column of the alias, zone, host, volume and storage tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model', action='append', choices=INDEXED_MODELS, dest='models',
+            help='Only rebuild this model (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        counts = rebuild_search_index(options['models'] or INDEXED_MODELS)
+        for label, count in counts.items():
+            self.stdout.write(f'{label}: {count} rows')
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
@@ -1,9 +1,20 @@
 """
-Middleware for audit logging
+Middleware for audit logging and request metrics
 """
 
+import logging
 from threading import local
 
+from django.conf import settings
+
+from .audit import audit_log_buffer
+from .request_metrics import (
+    endpoint_name, install_serializer_timing, log_request_metrics, measure_request, record_sample,
+    response_size, server_timing_header,
+)
+
+logger = logging.getLogger(__name__)
+
 _thread_locals = local()
 
 
@@ -15,7 +26,8 @@ def get_current_user():
 class AuditLogMiddleware:
     """
     Middleware to store the current user in thread-local storage
-    for use by Django signals
+    for use by Django signals, and to batch the request's audit log
+    entries into a single write at the end of the request
     """
 
     def __init__(self, get_response):
@@ -25,10 +37,42 @@ class AuditLogMiddleware:
         # Store the user in thread-local storage
         _thread_locals.user = getattr(request, 'user', None)
 
-        response = self.get_response(request)
+        with audit_log_buffer():
+            response = self.get_response(request)
 
         # Clean up
         if hasattr(_thread_locals, 'user'):
             del _thread_locals.user
 
         return response
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure SQL, Python and serializer time and response size of each
+    request (see core.request_metrics). Placed before AuditLogMiddleware so
+    the audit log flush is part of the measured time.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install_serializer_timing()
+
+    def __call__(self, request):
+        with measure_request() as metrics:
+            response = self.get_response(request)
+
+        try:
+            values = {**metrics.as_dict(), 'bytes': response_size(response)}
+            if getattr(settings, 'REQUEST_METRICS_SERVER_TIMING', True):
+                response['Server-Timing'] = server_timing_header(values)
+
+            endpoint = endpoint_name(request)
+            if endpoint:
+                log_request_metrics(endpoint, {'status': response.status_code, **values})
+                record_sample(endpoint, response.status_code, values)
+        except Exception as e:
+            # Metrics must never fail the request
+            logger.warning(f"Could not record request metrics: {e}")
+
+        return response
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_appsettings_hide_mode_banners'),
+        ('customers', '0004_customer_is_implementation_company'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stats', models.JSONField(default=dict)),
+                ('is_stale', models.BooleanField(default=False)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_summaries', to='customers.customer')),
+                ('project', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_summaries', to='core.project')),
+            ],
+            options={
+                'verbose_name_plural': 'Dashboard Summaries',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('project__isnull', True)), fields=('customer',), name='unique_customer_dashboard_summary')],
+                'unique_together': {('customer', 'project')},
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 23:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_dashboardsummary'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='timestamp',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, help_text='When the action was initiated'),
+        ),
+    ]
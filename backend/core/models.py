@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import User
 from customers.models import Customer
 from .constants import PROJECT_ACTION_CHOICES
@@ -477,9 +478,9 @@ class AuditLog(models.Model):
         help_text="User who performed the action"
     )
 
-    # When the action occurred
+    # When the action occurred (not auto_now_add: buffered entries keep their log time)
     timestamp = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
         db_index=True,
         help_text="When the action was initiated"
     )
@@ -882,6 +883,42 @@ class DashboardPreset(models.Model):
         return self.display_name
 
 
+class DashboardSummary(models.Model):
+    """
+    Precomputed dashboard counts for one customer (project=None) or for one
+    of the customer's projects. Maintained by core.dashboard_summary; marked
+    stale by inventory signals and recomputed on the next read, after an
+    import, or by the Celery beat job.
+    """
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='dashboard_summaries')
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='dashboard_summaries'
+    )
+    stats = models.JSONField(default=dict)
+    is_stale = models.BooleanField(default=False)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['customer', 'project']
+        constraints = [
+            # unique_together does not cover the customer row (NULL project)
+            models.UniqueConstraint(
+                fields=['customer'],
+                condition=models.Q(project__isnull=True),
+                name='unique_customer_dashboard_summary'
+            ),
+        ]
+        verbose_name_plural = "Dashboard Summaries"
+
+    def __str__(self):
+        scope = self.project.name if self.project_id else 'all projects'
+        return f"{self.customer.name} ({scope})"
+
+
 # ========== WORKSHEET GENERATOR MODELS ==========
 
 class EquipmentType(models.Model):
@@ -0,0 +1,194 @@
+"""
+Response cache for the project table views.
+
+The merged project views (alias_project_view ... port_project_view) rebuild
+their page from the junction rows and field_overrides on every request,
+while users mostly flip between tabs without changing anything.
+cached_project_view(table) caches their responses under the project, the
+table, the normalized query parameters and the project's data version:
+
+- The data version is the project's cache generation plus those of its
+  customers (core.cache_versions). The project's is bumped after commit by
+  writes to its junction rows, ports and zone memberships (signals below)
+  and by the project write endpoints (invalidates_project_views). The
+  customers' are bumped by the inventory signals of core.dashboard_summary
+  and by bulk edits. A new version makes the next request a miss.
+- Pages older than PROJECT_VIEW_CACHE_FRESH_SECONDS are returned at once
+  and recomputed in a background thread for the next request, which also
+  picks up writes no signal sees. Entries expire after
+  PROJECT_VIEW_CACHE_TTL.
+
+The calculated columns a response includes follow its 'columns' parameter,
+so the query parameters cover them. Responses carry an X-Project-View-Cache
+header (miss, hit or stale).
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse
+
+from customers.models import Customer
+from .cache_versions import bump_project_cache_version, customer_cache_version, project_cache_version
+
+logger = logging.getLogger(__name__)
+
+CACHE_HEADER = 'X-Project-View-Cache'
+
+# Junction models holding the rows of the project tables
+PROJECT_JUNCTIONS = (
+    'core.ProjectAlias', 'core.ProjectZone', 'core.ProjectFabric', 'core.ProjectSwitch',
+    'core.ProjectStorage', 'core.ProjectHost', 'core.ProjectVolume', 'core.ProjectPort',
+)
+
+# Query parameters that do not change the response (cache busters)
+_IGNORED_PARAMS = {'_'}
+
+# A page being refreshed is not refreshed again by other requests for this long
+REFRESH_LOCK_SECONDS = 60
+
+
+def _cache_key(request, project_id, table):
+    customer_ids = sorted(Customer.objects.filter(projects=project_id).values_list('id', flat=True))
+    parts = [('project', project_cache_version(project_id))]
+    parts += [(f'customer_{customer_id}', customer_cache_version(customer_id)) for customer_id in customer_ids]
+    parts += sorted(
+        (param, value) for param, values in request.GET.lists() if param not in _IGNORED_PARAMS
+        for value in values
+    )
+    digest = hashlib.md5(urlencode(parts).encode()).hexdigest()
+    return f"project_view_{table}_p{project_id}_{digest}"
+
+
+def _store(key, response):
+    if response.status_code != 200 or getattr(response, 'streaming', False):
+        return
+    entry = {
+        'content': response.content,
+        'content_type': response['Content-Type'],
+        'stored_at': time.time(),
+    }
+    try:
+        cache.set(key, entry, getattr(settings, 'PROJECT_VIEW_CACHE_TTL', 600))
+    except Exception as e:
+        logger.warning(f"Could not cache project view {key}: {e}")
+
+
+def _run_in_thread(refresh):
+    def run():
+        try:
+            refresh()
+        finally:
+            # The thread's own connection
+            connection.close()
+    threading.Thread(target=run, name='project-view-refresh', daemon=True).start()
+
+
+def _refresh_in_background(key, compute):
+    lock = f"{key}_refreshing"
+    if not cache.add(lock, True, REFRESH_LOCK_SECONDS):
+        return
+
+    def refresh():
+        try:
+            _store(key, compute())
+        except Exception as e:
+            logger.warning(f"Could not refresh project view {key}: {e}")
+        finally:
+            cache.delete(lock)
+    _run_in_thread(refresh)
+
+
+def cached_project_view(table):
+    """Cache the GET responses of a project table view; see the module docstring"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, project_id, *args, **kwargs):
+            if request.method != 'GET':
+                return view(request, project_id, *args, **kwargs)
+            try:
+                key = _cache_key(request, project_id, table)
+                entry = cache.get(key)
+            except Exception as e:
+                logger.warning(f"Could not read cached project view: {e}")
+                return view(request, project_id, *args, **kwargs)
+
+            if entry is None:
+                response = view(request, project_id, *args, **kwargs)
+                _store(key, response)
+                response[CACHE_HEADER] = 'miss'
+                return response
+
+            fresh_seconds = getattr(settings, 'PROJECT_VIEW_CACHE_FRESH_SECONDS', 30)
+            state = 'hit'
+            if time.time() - entry['stored_at'] >= fresh_seconds:
+                state = 'stale'
+                _refresh_in_background(key, lambda: view(request, project_id, *args, **kwargs))
+            response = HttpResponse(entry['content'], content_type=entry['content_type'])
+            response[CACHE_HEADER] = state
+            return response
+        return wrapper
+    return decorator
+
+
+def invalidates_project_views(view):
+    """Bump the project's data version after a successful write through `view`"""
+    @wraps(view)
+    def wrapper(request, project_id, *args, **kwargs):
+        response = view(request, project_id, *args, **kwargs)
+        if response.status_code < 400:
+            bump_project_cache_version(project_id)
+        return response
+    return wrapper
+
+
+# Invalidation
+
+def _bump_projects_of(junction, field, ids):
+    project_ids = global_apps.get_model(junction).objects.filter(
+        **{f'{field}_id__in': ids}
+    ).values_list('project_id', flat=True).distinct()
+    for project_id in project_ids:
+        bump_project_cache_version(project_id)
+
+
+def _junction_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        bump_project_cache_version(instance.project_id)
+
+
+def _port_changed(sender, instance, raw=False, **kwargs):
+    # Ports are not among the inventory models that bump their customer's generation
+    if not raw:
+        _bump_projects_of('core.ProjectPort', 'port', [instance.pk])
+
+
+def _zone_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        _bump_projects_of('core.ProjectZone', 'zone', [instance.pk])
+    elif action == 'post_clear':
+        # The cleared zones are no longer known; the alias's projects show them
+        _bump_projects_of('core.ProjectAlias', 'alias', [instance.pk])
+    else:
+        _bump_projects_of('core.ProjectZone', 'zone', pk_set or [])
+
+
+for _label in PROJECT_JUNCTIONS:
+    post_save.connect(_junction_changed, sender=_label, dispatch_uid=f'project_view_cache_save_{_label}')
+    post_delete.connect(_junction_changed, sender=_label, dispatch_uid=f'project_view_cache_delete_{_label}')
+post_save.connect(_port_changed, sender='storage.Port', dispatch_uid='project_view_cache_save_storage.Port')
+m2m_changed.connect(
+    _zone_members_changed, sender=global_apps.get_model('san', 'Zone').members.through,
+    dispatch_uid='project_view_cache_zone_members'
+)
@@ -17,10 +17,12 @@ from .models import (
 from san.models import Alias, Zone, Fabric, Switch
 from storage.models import Storage, Host, Volume, Port
 from san.serializers import ProjectAliasSerializer, ProjectZoneSerializer
+from .project_view_cache import invalidates_project_views
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_alias(request, project_id):
     """Add an alias to a project with specified action"""
     try:
@@ -66,6 +68,7 @@ def project_add_alias(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_alias_deletion(request, project_id):
     """Mark an alias for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -100,6 +103,7 @@ def mark_alias_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_zone_deletion(request, project_id):
     """Mark a zone for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -133,6 +137,7 @@ def mark_zone_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_fabric_deletion(request, project_id):
     """Mark a fabric for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -166,6 +171,7 @@ def mark_fabric_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_switch_deletion(request, project_id):
     """Mark a switch for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -199,6 +205,7 @@ def mark_switch_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_storage_deletion(request, project_id):
     """Mark a storage system for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -232,6 +239,7 @@ def mark_storage_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_volume_deletion(request, project_id):
     """Mark a volume for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -265,6 +273,7 @@ def mark_volume_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_host_deletion(request, project_id):
     """Mark a host for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -298,6 +307,7 @@ def mark_host_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def mark_port_deletion(request, project_id):
     """Mark a port for deletion by setting delete_me=True (action field remains unchanged)"""
     try:
@@ -331,6 +341,7 @@ def mark_port_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_alias_deletion(request, project_id):
     """Unmark an alias for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -364,6 +375,7 @@ def unmark_alias_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_zone_deletion(request, project_id):
     """Unmark a zone for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -397,6 +409,7 @@ def unmark_zone_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_fabric_deletion(request, project_id):
     """Unmark a fabric for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -430,6 +443,7 @@ def unmark_fabric_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_switch_deletion(request, project_id):
     """Unmark a switch for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -463,6 +477,7 @@ def unmark_switch_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_storage_deletion(request, project_id):
     """Unmark a storage system for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -496,6 +511,7 @@ def unmark_storage_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_volume_deletion(request, project_id):
     """Unmark a volume for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -529,6 +545,7 @@ def unmark_volume_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_host_deletion(request, project_id):
     """Unmark a host for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -562,6 +579,7 @@ def unmark_host_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def unmark_port_deletion(request, project_id):
     """Unmark a port for deletion by setting delete_me=False (action field remains unchanged)"""
     try:
@@ -595,6 +613,7 @@ def unmark_port_deletion(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_alias(request, project_id, alias_id):
     """Remove an alias from a project"""
     try:
@@ -614,6 +633,7 @@ def project_remove_alias(request, project_id, alias_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_zone(request, project_id):
     """Add a zone to a project with specified action"""
     try:
@@ -657,6 +677,7 @@ def project_add_zone(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_zone(request, project_id, zone_id):
     """Remove a zone from a project"""
     try:
@@ -676,6 +697,7 @@ def project_remove_zone(request, project_id, zone_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_switch(request, project_id):
     """Add a switch to a project with specified action"""
     try:
@@ -723,6 +745,7 @@ def project_add_switch(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_switch(request, project_id, switch_id):
     """Remove a switch from a project"""
     try:
@@ -742,6 +765,7 @@ def project_remove_switch(request, project_id, switch_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_fabric(request, project_id):
     """Add a fabric to a project with specified action"""
     try:
@@ -789,6 +813,7 @@ def project_add_fabric(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_fabric(request, project_id, fabric_id):
     """Remove a fabric from a project"""
     try:
@@ -808,6 +833,7 @@ def project_remove_fabric(request, project_id, fabric_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_storage(request, project_id):
     """Add a storage system to a project with specified action"""
     try:
@@ -855,6 +881,7 @@ def project_add_storage(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_storage(request, project_id, storage_id):
     """Remove a storage system from a project"""
     try:
@@ -874,6 +901,7 @@ def project_remove_storage(request, project_id, storage_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_volume(request, project_id):
     """Add a volume to a project with specified action"""
     try:
@@ -921,6 +949,7 @@ def project_add_volume(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_volume(request, project_id, volume_id):
     """Remove a volume from a project"""
     try:
@@ -940,6 +969,7 @@ def project_remove_volume(request, project_id, volume_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_host(request, project_id):
     """Add a host to a project with specified action"""
     try:
@@ -987,6 +1017,7 @@ def project_add_host(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_host(request, project_id, host_id):
     """Remove a host from a project"""
     try:
@@ -1006,6 +1037,7 @@ def project_remove_host(request, project_id, host_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_add_port(request, project_id):
     """Add a port to a project with specified action"""
     try:
@@ -1053,6 +1085,7 @@ def project_add_port(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["DELETE"])
+@invalidates_project_views
 def project_remove_port(request, project_id, port_id):
     """Remove a port from a project"""
     try:
@@ -1072,6 +1105,7 @@ def project_remove_port(request, project_id, port_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_finalize(request, project_id):
     """
     Finalize a project - sets committed=True on all entities in the project
@@ -1094,14 +1128,14 @@ def project_finalize(request, project_id):
         updated_counts['aliases'] = Alias.objects.filter(
             id__in=alias_ids,
             committed=False
-        ).update(committed=True)
+        ).update(committed=True, customer_visible=True)
 
         # Zones
         zone_ids = ProjectZone.objects.filter(project=project).values_list('zone_id', flat=True)
         updated_counts['zones'] = Zone.objects.filter(
             id__in=zone_ids,
             committed=False
-        ).update(committed=True)
+        ).update(committed=True, customer_visible=True)
 
         # Fabrics
         fabric_ids = ProjectFabric.objects.filter(project=project).values_list('fabric_id', flat=True)
@@ -1122,28 +1156,28 @@ def project_finalize(request, project_id):
         updated_counts['storage_systems'] = Storage.objects.filter(
             id__in=storage_ids,
             committed=False
-        ).update(committed=True)
+        ).update(committed=True, customer_visible=True)
 
         # Hosts
         host_ids = ProjectHost.objects.filter(project=project).values_list('host_id', flat=True)
         updated_counts['hosts'] = Host.objects.filter(
             id__in=host_ids,
             committed=False
-        ).update(committed=True)
+        ).update(committed=True, customer_visible=True)
 
         # Volumes
         volume_ids = ProjectVolume.objects.filter(project=project).values_list('volume_id', flat=True)
         updated_counts['volumes'] = Volume.objects.filter(
             id__in=volume_ids,
             committed=False
-        ).update(committed=True)
+        ).update(committed=True, customer_visible=True)
 
         # Ports
         port_ids = ProjectPort.objects.filter(project=project).values_list('port_id', flat=True)
         updated_counts['ports'] = Port.objects.filter(
             id__in=port_ids,
             committed=False
-        ).update(committed=True)
+        ).update(committed=True, customer_visible=True)
 
         return JsonResponse({
             "success": True,
@@ -1157,6 +1191,7 @@ def project_finalize(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_close(request, project_id):
     """
     Close a project - removes all junction table entries and sets status to closed
@@ -1195,6 +1230,7 @@ def project_close(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_commit(request, project_id):
     """
     Commit project changes:
@@ -1331,10 +1367,10 @@ def project_commit(request, project_id):
                         'storage_systems': 0, 'hosts': 0, 'volumes': 0, 'ports': 0}
 
         alias_ids = ProjectAlias.objects.filter(project=project, action='new').values_list('alias_id', flat=True)
-        commit_counts['aliases'] = Alias.objects.filter(id__in=alias_ids, committed=False).update(committed=True)
+        commit_counts['aliases'] = Alias.objects.filter(id__in=alias_ids, committed=False).update(committed=True, customer_visible=True)
 
         zone_ids = ProjectZone.objects.filter(project=project, action='new').values_list('zone_id', flat=True)
-        commit_counts['zones'] = Zone.objects.filter(id__in=zone_ids, committed=False).update(committed=True)
+        commit_counts['zones'] = Zone.objects.filter(id__in=zone_ids, committed=False).update(committed=True, customer_visible=True)
 
         fabric_ids = ProjectFabric.objects.filter(project=project, action='new').values_list('fabric_id', flat=True)
         commit_counts['fabrics'] = Fabric.objects.filter(id__in=fabric_ids, committed=False).update(committed=True)
@@ -1343,16 +1379,16 @@ def project_commit(request, project_id):
         commit_counts['switches'] = Switch.objects.filter(id__in=switch_ids, committed=False).update(committed=True)
 
         storage_ids = ProjectStorage.objects.filter(project=project, action='new').values_list('storage_id', flat=True)
-        commit_counts['storage_systems'] = Storage.objects.filter(id__in=storage_ids, committed=False).update(committed=True)
+        commit_counts['storage_systems'] = Storage.objects.filter(id__in=storage_ids, committed=False).update(committed=True, customer_visible=True)
 
         host_ids = ProjectHost.objects.filter(project=project, action='new').values_list('host_id', flat=True)
-        commit_counts['hosts'] = Host.objects.filter(id__in=host_ids, committed=False).update(committed=True)
+        commit_counts['hosts'] = Host.objects.filter(id__in=host_ids, committed=False).update(committed=True, customer_visible=True)
 
         volume_ids = ProjectVolume.objects.filter(project=project, action='new').values_list('volume_id', flat=True)
-        commit_counts['volumes'] = Volume.objects.filter(id__in=volume_ids, committed=False).update(committed=True)
+        commit_counts['volumes'] = Volume.objects.filter(id__in=volume_ids, committed=False).update(committed=True, customer_visible=True)
 
         port_ids = ProjectPort.objects.filter(project=project, action='new').values_list('port_id', flat=True)
-        commit_counts['ports'] = Port.objects.filter(id__in=port_ids, committed=False).update(committed=True)
+        commit_counts['ports'] = Port.objects.filter(id__in=port_ids, committed=False).update(committed=True, customer_visible=True)
 
         # 4. Collect entities marked for deletion (for confirmation)
         deletion_list = {
@@ -1402,6 +1438,7 @@ def project_commit(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_commit_deletions(request, project_id):
     """
     Execute confirmed deletions for entities marked with action='delete'
@@ -1470,6 +1507,7 @@ def project_commit_deletions(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_commit_and_close(request, project_id):
     """
     Commit all changes AND close the project (remove junction tables and delete project)
@@ -1540,10 +1578,10 @@ def project_commit_and_close(request, project_id):
 
         # Mark create entities as committed
         alias_ids = ProjectAlias.objects.filter(project=project, action='new').values_list('alias_id', flat=True)
-        Alias.objects.filter(id__in=alias_ids).update(committed=True)
+        Alias.objects.filter(id__in=alias_ids).update(committed=True, customer_visible=True)
 
         zone_ids = ProjectZone.objects.filter(project=project, action='new').values_list('zone_id', flat=True)
-        Zone.objects.filter(id__in=zone_ids).update(committed=True)
+        Zone.objects.filter(id__in=zone_ids).update(committed=True, customer_visible=True)
 
         # 2. Execute deletions if confirmed
         if deletions_confirmed:
@@ -1781,6 +1819,7 @@ def project_commit_preview(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_commit_execute(request, project_id):
     """
     Execute project commit:
@@ -2028,7 +2067,7 @@ def project_commit_execute(request, project_id):
             ProjectAlias.objects.filter(project=project, action='new', delete_me=False),
             'aliases', 'newly_created', 'alias_id'
         ).values_list('alias_id', flat=True)
-        update_fields = {'committed': True}
+        update_fields = {'committed': True, 'customer_visible': True}
         if mark_as_deployed:
             update_fields['deployed'] = True
         new_counts['aliases'] = Alias.objects.filter(id__in=alias_ids, committed=False).update(**update_fields)
@@ -2037,7 +2076,7 @@ def project_commit_execute(request, project_id):
             ProjectZone.objects.filter(project=project, action='new', delete_me=False),
             'zones', 'newly_created', 'zone_id'
         ).values_list('zone_id', flat=True)
-        update_fields = {'committed': True}
+        update_fields = {'committed': True, 'customer_visible': True}
         if mark_as_deployed:
             update_fields['deployed'] = True
         new_counts['zones'] = Zone.objects.filter(id__in=zone_ids, committed=False).update(**update_fields)
@@ -2046,25 +2085,25 @@ def project_commit_execute(request, project_id):
             ProjectStorage.objects.filter(project=project, action='new', delete_me=False),
             'storage', 'newly_created', 'storage_id'
         ).values_list('storage_id', flat=True)
-        new_counts['storage'] = Storage.objects.filter(id__in=storage_ids, committed=False).update(committed=True)
+        new_counts['storage'] = Storage.objects.filter(id__in=storage_ids, committed=False).update(committed=True, customer_visible=True)
 
         volume_ids = filter_by_selection(
             ProjectVolume.objects.filter(project=project, action='new', delete_me=False),
             'volumes', 'newly_created', 'volume_id'
         ).values_list('volume_id', flat=True)
-        new_counts['volumes'] = Volume.objects.filter(id__in=volume_ids, committed=False).update(committed=True)
+        new_counts['volumes'] = Volume.objects.filter(id__in=volume_ids, committed=False).update(committed=True, customer_visible=True)
 
         host_ids = filter_by_selection(
             ProjectHost.objects.filter(project=project, action='new', delete_me=False),
             'hosts', 'newly_created', 'host_id'
         ).values_list('host_id', flat=True)
-        new_counts['hosts'] = Host.objects.filter(id__in=host_ids, committed=False).update(committed=True)
+        new_counts['hosts'] = Host.objects.filter(id__in=host_ids, committed=False).update(committed=True, customer_visible=True)
 
         port_ids = filter_by_selection(
             ProjectPort.objects.filter(project=project, action='new', delete_me=False),
             'ports', 'newly_created', 'port_id'
         ).values_list('port_id', flat=True)
-        new_counts['ports'] = Port.objects.filter(id__in=port_ids, committed=False).update(committed=True)
+        new_counts['ports'] = Port.objects.filter(id__in=port_ids, committed=False).update(committed=True, customer_visible=True)
 
         # Clear field_overrides and reset action to 'unmodified' for newly committed entities
         # (they are now part of the base, so project and base are in sync)
@@ -2217,37 +2256,37 @@ def project_commit_execute(request, project_id):
             ProjectAlias.objects.filter(project=project, action='unmodified', delete_me=False),
             'aliases', 'unmodified', 'alias_id'
         ).values_list('alias_id', flat=True)
-        unmodified_counts['aliases'] = Alias.objects.filter(id__in=alias_unmod_ids).update(committed=True)
+        unmodified_counts['aliases'] = Alias.objects.filter(id__in=alias_unmod_ids).update(committed=True, customer_visible=True)
 
         zone_unmod_ids = filter_by_selection(
             ProjectZone.objects.filter(project=project, action='unmodified', delete_me=False),
             'zones', 'unmodified', 'zone_id'
         ).values_list('zone_id', flat=True)
-        unmodified_counts['zones'] = Zone.objects.filter(id__in=zone_unmod_ids).update(committed=True)
+        unmodified_counts['zones'] = Zone.objects.filter(id__in=zone_unmod_ids).update(committed=True, customer_visible=True)
 
         storage_unmod_ids = filter_by_selection(
             ProjectStorage.objects.filter(project=project, action='unmodified', delete_me=False),
             'storage', 'unmodified', 'storage_id'
         ).values_list('storage_id', flat=True)
-        unmodified_counts['storage'] = Storage.objects.filter(id__in=storage_unmod_ids).update(committed=True)
+        unmodified_counts['storage'] = Storage.objects.filter(id__in=storage_unmod_ids).update(committed=True, customer_visible=True)
 
         volume_unmod_ids = filter_by_selection(
             ProjectVolume.objects.filter(project=project, action='unmodified', delete_me=False),
             'volumes', 'unmodified', 'volume_id'
         ).values_list('volume_id', flat=True)
-        unmodified_counts['volumes'] = Volume.objects.filter(id__in=volume_unmod_ids).update(committed=True)
+        unmodified_counts['volumes'] = Volume.objects.filter(id__in=volume_unmod_ids).update(committed=True, customer_visible=True)
 
         host_unmod_ids = filter_by_selection(
             ProjectHost.objects.filter(project=project, action='unmodified', delete_me=False),
             'hosts', 'unmodified', 'host_id'
         ).values_list('host_id', flat=True)
-        unmodified_counts['hosts'] = Host.objects.filter(id__in=host_unmod_ids).update(committed=True)
+        unmodified_counts['hosts'] = Host.objects.filter(id__in=host_unmod_ids).update(committed=True, customer_visible=True)
 
         port_unmod_ids = filter_by_selection(
             ProjectPort.objects.filter(project=project, action='unmodified', delete_me=False),
             'ports', 'unmodified', 'port_id'
         ).values_list('port_id', flat=True)
-        unmodified_counts['ports'] = Port.objects.filter(id__in=port_unmod_ids).update(committed=True)
+        unmodified_counts['ports'] = Port.objects.filter(id__in=port_unmod_ids).update(committed=True, customer_visible=True)
 
         # 5. Optionally close project
         project_closed = False
@@ -2456,6 +2495,7 @@ def project_summary(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@invalidates_project_views
 def project_discard_execute(request, project_id):
     """
     Execute project discard:
@@ -0,0 +1,300 @@
+"""
+Per-request performance metrics.
+
+RequestMetricsMiddleware (core.middleware) measures every request:
+
+- SQL query count and time, through a connection execute wrapper, so it
+  works with DEBUG off
+- serializer time: time spent in the top-level .data of DRF serializers
+  (queries run while serializing count towards both)
+- Python time: total time minus SQL time
+- response size in bytes
+
+The numbers are returned in a Server-Timing header (visible in the browser
+dev tools network panel) and logged as one JSON line on the
+'core.request_metrics' logger: DEBUG normally, WARNING for requests slower
+than REQUEST_METRICS_SLOW_MS.
+
+A REQUEST_METRICS_SAMPLE_RATE share of requests is kept for the slow
+endpoint report. Samples are buffered per process and merged into the cache
+every FLUSH_EVERY samples or FLUSH_INTERVAL seconds, where each endpoint
+keeps its last SAMPLES_PER_ENDPOINT samples. Processes merging at the same
+moment can drop each other's samples; the report is a sample anyway.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from threading import local
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per endpoint in the rolling store
+SAMPLES_PER_ENDPOINT = 200
+
+# Buffered samples are merged into the cache this often
+FLUSH_EVERY = 50
+FLUSH_INTERVAL = 30.0
+
+# How long an endpoint stays in the report after its last sample
+STORE_TTL = 60 * 60 * 24
+
+_ENDPOINTS_KEY = 'request_metrics_endpoints'
+
+# Sample fields, in stored order
+SAMPLE_FIELDS = ('timestamp', 'status', 'total_ms', 'sql_ms', 'queries', 'python_ms', 'serializer_ms', 'bytes')
+
+# Fields the slow endpoint report can be sorted by
+REPORT_SORT_FIELDS = (
+    'p95_ms', 'avg_ms', 'p50_ms', 'max_ms', 'avg_queries', 'max_queries', 'avg_sql_ms',
+    'avg_python_ms', 'avg_serializer_ms', 'avg_bytes', 'samples', 'errors',
+)
+
+_request_state = local()
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+class RequestMetrics:
+    """Counters of one request"""
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self._serializer_depth = 0
+        self._started = time.perf_counter()
+        self.total_time = None
+
+    def __call__(self, execute, sql, params, many, context):
+        # Execute wrapper: time every statement run on the connection
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql_time += time.perf_counter() - started
+
+    def finish(self):
+        self.total_time = time.perf_counter() - self._started
+
+    def as_dict(self):
+        return {
+            'total_ms': _ms(self.total_time),
+            'sql_ms': _ms(self.sql_time),
+            'queries': self.queries,
+            'python_ms': _ms(max(self.total_time - self.sql_time, 0)),
+            'serializer_ms': _ms(self.serializer_time),
+        }
+
+
+def current_request_metrics():
+    """Metrics of the request being handled on this thread, if any"""
+    return getattr(_request_state, 'metrics', None)
+
+
+@contextmanager
+def measure_request():
+    """Collect RequestMetrics for the enclosed code"""
+    metrics = RequestMetrics()
+    previous = current_request_metrics()
+    _request_state.metrics = metrics
+    try:
+        with connection.execute_wrapper(metrics):
+            yield metrics
+    finally:
+        metrics.finish()
+        _request_state.metrics = previous
+
+
+@contextmanager
+def serializer_timer():
+    """Add the enclosed time to the request's serializer time (outermost call only)"""
+    metrics = current_request_metrics()
+    if metrics is None:
+        yield
+        return
+    metrics._serializer_depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics._serializer_depth -= 1
+        if metrics._serializer_depth == 0:
+            metrics.serializer_time += time.perf_counter() - started
+
+
+_serializer_timing_installed = False
+
+
+def install_serializer_timing():
+    """Time BaseSerializer.data, which both Serializer and ListSerializer.data go through"""
+    global _serializer_timing_installed
+    if _serializer_timing_installed:
+        return
+    from rest_framework.serializers import BaseSerializer
+
+    data = BaseSerializer.data
+
+    def timed_data(self):
+        with serializer_timer():
+            return data.fget(self)
+    BaseSerializer.data = property(timed_data)
+    _serializer_timing_installed = True
+
+
+def response_size(response):
+    """Body size in bytes, or None for streaming responses"""
+    if getattr(response, 'streaming', False):
+        return None
+    return len(response.content)
+
+
+def server_timing_header(values):
+    """Server-Timing value for the metrics of a request"""
+    return ', '.join([
+        f'total;dur={values["total_ms"]}',
+        f'db;dur={values["sql_ms"]};desc="{values["queries"]} queries"',
+        f'app;dur={values["python_ms"]}',
+        f'serializer;dur={values["serializer_ms"]}',
+    ])
+
+
+def endpoint_name(request):
+    """Route pattern of the request, so /hosts/1/ and /hosts/2/ share an endpoint"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None
+    return f'{request.method} /{match.route}'
+
+
+def log_request_metrics(endpoint, values):
+    """One structured log line per request; WARNING when it was slow"""
+    slow_ms = getattr(settings, 'REQUEST_METRICS_SLOW_MS', 1000)
+    level = logging.WARNING if values['total_ms'] >= slow_ms else logging.DEBUG
+    if logger.isEnabledFor(level):
+        logger.log(level, json.dumps({'endpoint': endpoint, **values}), extra={'request_metrics': values})
+
+
+# Rolling store
+
+def _endpoint_key(endpoint):
+    # Route patterns contain spaces and angle brackets, which not every cache backend accepts
+    return f"request_metrics_{hashlib.md5(endpoint.encode()).hexdigest()}"
+
+
+class _SampleBuffer:
+    """Samples of this process waiting to be merged into the cache"""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._pending = []
+        self._last_flush = clock()
+        self._lock = threading.Lock()
+
+    def add(self, endpoint, sample):
+        with self._lock:
+            self._pending.append((endpoint, sample))
+            due = len(self._pending) >= FLUSH_EVERY or self._clock() - self._last_flush >= FLUSH_INTERVAL
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._last_flush = self._clock()
+        if not batch:
+            return
+        by_endpoint = {}
+        for endpoint, sample in batch:
+            by_endpoint.setdefault(endpoint, []).append(sample)
+        try:
+            endpoints = cache.get(_ENDPOINTS_KEY) or {}
+            stored = cache.get_many([_endpoint_key(endpoint) for endpoint in by_endpoint])
+            updates = {}
+            for endpoint, samples in by_endpoint.items():
+                key = _endpoint_key(endpoint)
+                updates[key] = (stored.get(key, []) + samples)[-SAMPLES_PER_ENDPOINT:]
+                endpoints[endpoint] = samples[-1][0]
+            updates[_ENDPOINTS_KEY] = endpoints
+            cache.set_many(updates, STORE_TTL)
+        except Exception as e:
+            # Metrics must never break the request that produced them
+            logger.warning(f"Could not store {len(batch)} request metric samples: {e}")
+
+
+_sample_buffer = _SampleBuffer()
+
+
+def record_sample(endpoint, status, values):
+    """Keep a REQUEST_METRICS_SAMPLE_RATE share of requests for the report"""
+    rate = getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 1.0)
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return
+    sample = [time.time(), status] + [values[field] for field in SAMPLE_FIELDS[2:]]
+    _sample_buffer.add(endpoint, sample)
+
+
+def flush_samples():
+    """Merge this process's buffered samples into the cache now"""
+    _sample_buffer.flush()
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def _average(values):
+    return round(sum(values) / len(values), 1) if values else None
+
+
+def slow_endpoint_report(min_samples=1, sort='p95_ms', limit=50):
+    """
+    Per-endpoint timing summary of the stored samples, slowest first.
+
+    Args:
+        min_samples: Leave out endpoints with fewer samples
+        sort: Summary field to sort by (descending)
+        limit: Endpoints returned
+    """
+    flush_samples()
+    endpoints = cache.get(_ENDPOINTS_KEY) or {}
+    stored = cache.get_many([_endpoint_key(endpoint) for endpoint in endpoints])
+
+    report = []
+    for endpoint in endpoints:
+        samples = [dict(zip(SAMPLE_FIELDS, sample)) for sample in stored.get(_endpoint_key(endpoint), [])]
+        if not samples or len(samples) < min_samples:
+            continue
+        totals = [sample['total_ms'] for sample in samples]
+        sizes = [sample['bytes'] for sample in samples if sample['bytes'] is not None]
+        report.append({
+            'endpoint': endpoint,
+            'samples': len(samples),
+            'avg_ms': _average(totals),
+            'p50_ms': _percentile(totals, 0.5),
+            'p95_ms': _percentile(totals, 0.95),
+            'max_ms': max(totals),
+            'avg_queries': _average([sample['queries'] for sample in samples]),
+            'max_queries': max(sample['queries'] for sample in samples),
+            'avg_sql_ms': _average([sample['sql_ms'] for sample in samples]),
+            'avg_python_ms': _average([sample['python_ms'] for sample in samples]),
+            'avg_serializer_ms': _average([sample['serializer_ms'] for sample in samples]),
+            'avg_bytes': _average(sizes),
+            'errors': sum(1 for sample in samples if sample['status'] >= 500),
+            'last_seen': max(sample['timestamp'] for sample in samples),
+        })
+
+    report.sort(key=lambda row: row[sort] or 0, reverse=True)
+    return report[:limit]
@@ -0,0 +1,305 @@
+"""
+Denormalized search column for the alias, zone, host, volume and storage tables.
+
+The table views used to search with a chain of icontains ORs across joins
+(WWPNs, fabric name, zone members, ...) followed by .distinct(), which means
+a sequential scan and a sort on every keystroke. Each of these models now has
+a search_text column holding the lowercased searchable fields of the row and
+of the related rows it was searched through, one per line. Searching is a
+single LIKE on that column (search_filter()); on PostgreSQL the column has a
+pg_trgm GIN index, which serves '%term%' patterns, and elsewhere it is a scan
+of one column without joins.
+
+WWPNs are also stored as bare hex digits, and a search term that looks like a
+(partial) WWPN is matched with its separators removed as well, so
+"50:05:07:68", "5005-0768" and "50050768" find the same rows.
+
+The column is maintained by signals (connected in CoreConfig.ready):
+
+- A save of an indexed row, or of a row it is searched through (AliasWWPN,
+  HostWwpn, zone membership), queues the affected rows.
+- Renaming a fabric or storage system queues the aliases, zones, hosts and
+  volumes that show its name.
+- Queued rows are rebuilt in batches after the transaction commits.
+
+Queryset .update() and bulk_create/bulk_update calls bypass signals; code that
+writes searchable fields that way (the WWPN reconciliation links aliases to
+hosts in bulk) queues the rows itself with queue_search_refresh().
+rebuild_search_index() (manage.py rebuild_search_index) rebuilds every row.
+"""
+
+import logging
+import re
+from collections import defaultdict
+from threading import local
+
+from django.apps import apps as global_apps
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+
+logger = logging.getLogger(__name__)
+
+# Rows rebuilt per query batch
+SEARCH_BATCH_SIZE = 500
+
+# Models with a search_text column
+INDEXED_MODELS = ('san.Alias', 'san.Zone', 'storage.Host', 'storage.Volume', 'storage.Storage')
+
+_WWPN_FRAGMENT = re.compile(r'^[0-9a-f]{2,}(?:[:\- ]?[0-9a-f]{1,2})*$')
+_WWPN_SEPARATORS = re.compile(r'[:\- ]')
+
+_queue_state = local()
+
+
+def _document(*values):
+    return '\n'.join(str(value).lower() for value in values if value not in (None, ''))
+
+
+def _bare_wwpn(wwpn):
+    return _WWPN_SEPARATORS.sub('', wwpn or '')
+
+
+def _alias_texts(apps, ids):
+    Alias = apps.get_model('san', 'Alias')
+    AliasWWPN = apps.get_model('san', 'AliasWWPN')
+    wwpns = defaultdict(list)
+    for alias_id, wwpn in AliasWWPN.objects.filter(alias_id__in=ids).values_list('alias_id', 'wwpn'):
+        wwpns[alias_id] += [wwpn, _bare_wwpn(wwpn)]
+    rows = Alias.objects.filter(id__in=ids).values_list('id', 'name', 'notes', 'fabric__name', 'use', 'cisco_alias')
+    return {row[0]: _document(*row[1:], *wwpns[row[0]]) for row in rows}
+
+
+def _zone_texts(apps, ids):
+    Zone = apps.get_model('san', 'Zone')
+    members = defaultdict(list)
+    for zone_id, alias_name in Zone.members.through.objects.filter(zone_id__in=ids).values_list('zone_id', 'alias__name'):
+        members[zone_id].append(alias_name)
+    rows = Zone.objects.filter(id__in=ids).values_list('id', 'name', 'fabric__name', 'zone_type', 'notes')
+    return {row[0]: _document(*row[1:], *members[row[0]]) for row in rows}
+
+
+def _host_texts(apps, ids):
+    Host = apps.get_model('storage', 'Host')
+    HostWwpn = apps.get_model('storage', 'HostWwpn')
+    wwpns = defaultdict(list)
+    for host_id, wwpn in HostWwpn.objects.filter(host_id__in=ids).values_list('host_id', 'wwpn'):
+        wwpns[host_id] += [wwpn, _bare_wwpn(wwpn)]
+    rows = Host.objects.filter(id__in=ids).values_list(
+        'id', 'name', 'storage__name', 'wwpns', 'status', 'associated_resource', 'host_type',
+        'volume_group', 'natural_key', 'storage_system'
+    )
+    return {row[0]: _document(*row[1:], *wwpns[row[0]]) for row in rows}
+
+
+def _volume_texts(apps, ids):
+    Volume = apps.get_model('storage', 'Volume')
+    rows = Volume.objects.filter(id__in=ids).values_list(
+        'id', 'name', 'storage__name', 'volume_id', 'volser', 'format', 'natural_key', 'pool_name',
+        'unique_id', 'status_label'
+    )
+    return {row[0]: _document(*row[1:]) for row in rows}
+
+
+def _storage_texts(apps, ids):
+    Storage = apps.get_model('storage', 'Storage')
+    rows = Storage.objects.filter(id__in=ids).values_list(
+        'id', 'name', 'storage_type', 'location', 'model', 'serial_number', 'system_id', 'primary_ip',
+        'vendor'
+    )
+    return {row[0]: _document(*row[1:]) for row in rows}
+
+
+_TEXT_BUILDERS = {
+    'san.Alias': _alias_texts,
+    'san.Zone': _zone_texts,
+    'storage.Host': _host_texts,
+    'storage.Volume': _volume_texts,
+    'storage.Storage': _storage_texts,
+}
+
+
+def refresh_search_text(label, ids, apps=global_apps):
+    """Rebuild search_text of some rows of an indexed model, in batches"""
+    app_label, model_name = label.split('.')
+    model = apps.get_model(app_label, model_name)
+    ids = list(ids)
+    for start in range(0, len(ids), SEARCH_BATCH_SIZE):
+        texts = _TEXT_BUILDERS[label](apps, ids[start:start + SEARCH_BATCH_SIZE])
+        model.objects.bulk_update(
+            [model(pk=pk, search_text=text) for pk, text in texts.items()], ['search_text']
+        )
+
+
+def rebuild_search_index(labels=INDEXED_MODELS, apps=global_apps):
+    """Rebuild search_text of every row; returns {label: row count}"""
+    counts = {}
+    for label in labels:
+        app_label, model_name = label.split('.')
+        ids = list(apps.get_model(app_label, model_name).objects.values_list('id', flat=True))
+        refresh_search_text(label, ids, apps=apps)
+        counts[label] = len(ids)
+    return counts
+
+
+def search_filter(term, prefix=''):
+    """
+    Q matching rows whose search text contains `term`.
+
+    Args:
+        term: Search input as typed
+        prefix: Lookup path to the indexed model ('volume__' from ProjectVolume)
+    """
+    term = term.strip().lower()
+    lookup = f'{prefix}search_text__contains'
+    condition = Q(**{lookup: term})
+    if _WWPN_FRAGMENT.match(term):
+        bare = _bare_wwpn(term)
+        if bare != term:
+            condition |= Q(**{lookup: bare})
+    return condition
+
+
+# Maintenance
+
+def _resolve_dependents(queued):
+    """Expand queued parents ('fabric', 'storage', 'alias_zones') into indexed rows"""
+    Alias = global_apps.get_model('san', 'Alias')
+    Zone = global_apps.get_model('san', 'Zone')
+    Host = global_apps.get_model('storage', 'Host')
+    Volume = global_apps.get_model('storage', 'Volume')
+
+    fabric_ids = queued.pop('fabric', None)
+    if fabric_ids:
+        queued['san.Alias'].update(Alias.objects.filter(fabric_id__in=fabric_ids).values_list('id', flat=True))
+        queued['san.Zone'].update(Zone.objects.filter(fabric_id__in=fabric_ids).values_list('id', flat=True))
+    storage_ids = queued.pop('storage', None)
+    if storage_ids:
+        queued['storage.Host'].update(Host.objects.filter(storage_id__in=storage_ids).values_list('id', flat=True))
+        queued['storage.Volume'].update(Volume.objects.filter(storage_id__in=storage_ids).values_list('id', flat=True))
+    alias_ids = queued.pop('alias_zones', None)
+    if alias_ids:
+        queued['san.Zone'].update(
+            Zone.members.through.objects.filter(alias_id__in=alias_ids).values_list('zone_id', flat=True)
+        )
+
+
+def _refresh_queued(queued):
+    try:
+        _resolve_dependents(queued)
+        for label in INDEXED_MODELS:
+            if queued.get(label):
+                refresh_search_text(label, queued[label])
+    except Exception as e:
+        # Rows keep their previous text until their next change or a rebuild
+        logger.warning(f"Could not refresh search text: {e}")
+
+
+def _pending_rows():
+    """Rows queued for the current transaction, or None if no flush is waiting"""
+    flush = getattr(_queue_state, 'flush', None)
+    # A rolled-back transaction or savepoint drops its callbacks from the list
+    if flush is None or not any(entry[1] is flush for entry in connection.run_on_commit):
+        return None
+    return _queue_state.rows
+
+
+def queue_search_refresh(label, ids):
+    """
+    Rebuild rows of an indexed model after commit, batched per transaction.
+
+    `label` is an INDEXED_MODELS label, or a parent whose dependents are
+    rebuilt: 'fabric' and 'storage' (ids of renamed parents) or
+    'alias_zones' (zones containing the aliases).
+    """
+    ids = {pk for pk in ids if pk}
+    if not ids:
+        return
+    if not connection.in_atomic_block:
+        _refresh_queued(defaultdict(set, {label: ids}))
+        return
+
+    rows = _pending_rows()
+    if rows is None:
+        # One flush per transaction
+        rows = defaultdict(set)
+
+        def flush():
+            if _queue_state.flush is flush:
+                _queue_state.flush = None
+            _refresh_queued(rows)
+        _queue_state.flush, _queue_state.rows = flush, rows
+        transaction.on_commit(flush)
+    rows[label].update(ids)
+
+
+def _skip(kwargs):
+    return kwargs.get('raw') or kwargs.get('update_fields') == frozenset(['search_text'])
+
+
+def _row_saved(sender, instance, **kwargs):
+    if not _skip(kwargs):
+        queue_search_refresh(sender._meta.label, [instance.pk])
+
+
+def _alias_saved(sender, instance, **kwargs):
+    if not _skip(kwargs):
+        queue_search_refresh('san.Alias', [instance.pk])
+        # Zones are searched by member name
+        queue_search_refresh('alias_zones', [instance.pk])
+
+
+def _alias_deleted(sender, instance, **kwargs):
+    # Membership rows go with the alias without an m2m_changed signal
+    queue_search_refresh('san.Zone', instance.zone_set.values_list('id', flat=True))
+
+
+def _wwpn_changed(sender, instance, **kwargs):
+    if kwargs.get('raw'):
+        return
+    if sender._meta.label == 'san.AliasWWPN':
+        queue_search_refresh('san.Alias', [instance.alias_id])
+    else:
+        queue_search_refresh('storage.Host', [instance.host_id])
+
+
+def _zone_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        queue_search_refresh('san.Zone', [instance.pk])
+    elif action == 'post_clear':
+        queue_search_refresh('alias_zones', [instance.pk])
+    else:
+        queue_search_refresh('san.Zone', pk_set or [])
+
+
+def _remember_name(sender, instance, **kwargs):
+    # Renaming a parent changes the text of every row that shows its name
+    instance._search_old_name = None
+    if instance.pk and not kwargs.get('raw'):
+        instance._search_old_name = sender.objects.filter(pk=instance.pk).values_list('name', flat=True).first()
+
+
+def _parent_saved(sender, instance, created, **kwargs):
+    if kwargs.get('raw') or created:
+        return
+    if getattr(instance, '_search_old_name', None) != instance.name:
+        queue_search_refresh('fabric' if sender._meta.label == 'san.Fabric' else 'storage', [instance.pk])
+
+
+for _label in INDEXED_MODELS:
+    if _label != 'san.Alias':
+        post_save.connect(_row_saved, sender=_label, dispatch_uid=f'search_index_save_{_label}')
+post_save.connect(_alias_saved, sender='san.Alias', dispatch_uid='search_index_save_san.Alias')
+pre_delete.connect(_alias_deleted, sender='san.Alias', dispatch_uid='search_index_delete_san.Alias')
+for _label in ('san.AliasWWPN', 'storage.HostWwpn'):
+    post_save.connect(_wwpn_changed, sender=_label, dispatch_uid=f'search_index_save_{_label}')
+    post_delete.connect(_wwpn_changed, sender=_label, dispatch_uid=f'search_index_delete_{_label}')
+for _label in ('san.Fabric', 'storage.Storage'):
+    pre_save.connect(_remember_name, sender=_label, dispatch_uid=f'search_index_pre_save_{_label}')
+    post_save.connect(_parent_saved, sender=_label, dispatch_uid=f'search_index_parent_save_{_label}')
+m2m_changed.connect(
+    _zone_members_changed, sender=global_apps.get_model('san', 'Zone').members.through,
+    dispatch_uid='search_index_zone_members'
+)
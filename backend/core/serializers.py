@@ -378,6 +378,33 @@ class AuditLogSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields  # All fields are read-only
 
+    # Model columns each serializer field reads, for QuerySet.only()
+    FIELD_COLUMNS = {
+        'user': ['user'],
+        'user_username': ['user', 'user__username'],
+        'user_full_name': ['user', 'user__username', 'user__first_name', 'user__last_name'],
+        'customer': ['customer'],
+        'customer_name': ['customer', 'customer__name'],
+    }
+
+    def __init__(self, *args, fields=None, **kwargs):
+        """
+        Args:
+            fields: Optional iterable of field names to include; others are dropped
+        """
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def columns_for(cls, fields):
+        """Model columns needed to serialize the given fields"""
+        columns = {'id', 'timestamp'}
+        for name in fields:
+            columns.update(cls.FIELD_COLUMNS.get(name, [name]))
+        return sorted(columns)
+
     def get_user_full_name(self, obj):
         """Get user's full name or username"""
         if not obj.user:
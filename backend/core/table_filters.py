@@ -0,0 +1,425 @@
+"""
+Column filters of the table views.
+
+The table views used to turn query parameters into .filter() kwargs each in
+its own way: prefix whitelists passed raw strings to the ORM (so '__in' with
+a comma-separated value and the 'not_icontains' operator the tables send
+failed with a 500), booleans were converted in some views and not others,
+and calculated columns were annotated on every request whether or not they
+were filtered on.
+
+Each table now has a TableFilters spec. Its columns are the model's own
+fields, plus declared columns for names the frontend uses that are not model
+fields (fabric_details.name, zoned_count, project_action, ...). compile()
+turns the request parameters into one Q, the annotations that Q and the
+ordering need, and an order_by list:
+
+    compiled = table_filters('aliases').compile(request.GET, ordering='name')
+    aliases = compiled.apply(aliases)
+
+- Only parameters of the form <column>__<operator> are filters, so control
+  parameters (page, customer, storage_id, ...) never reach the ORM.
+- Values are converted to the column type; a value that does not convert,
+  or an operator the column does not support, raises FilterError, which the
+  views answer with a 400.
+- Unknown columns are ignored, like any other parameter a view does not use.
+- The project views filter ProjectAlias/ProjectZone/... rows through the
+  entity: compile(..., prefix='alias__'). Junction columns (project_action)
+  are only available there, and are not prefixed.
+
+Calculated columns (zoned_count, aliases_count, ...) are correlated COUNT
+subqueries, so filtering or sorting on them needs no GROUP BY over the
+table. For display they are computed for the rows of the current page only
+(annotate_page()), unless a 'columns' parameter leaves them out
+(shown_calculated()).
+"""
+
+from django.apps import apps
+from django.db import models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.functional import cached_property
+
+
+class FilterError(ValueError):
+    """Invalid filter parameter"""
+
+
+# Operators that negate the lookup they are named after
+NEGATED_OPERATORS = {'not_icontains': 'icontains', 'not_iexact': 'iexact'}
+
+TEXT_OPERATORS = (
+    'exact', 'iexact', 'contains', 'icontains', 'startswith', 'istartswith', 'endswith', 'iendswith',
+    'in', 'isnull', 'gt', 'gte', 'lt', 'lte',
+) + tuple(NEGATED_OPERATORS)
+
+# Operators each column kind accepts
+OPERATORS = {
+    'text': TEXT_OPERATORS,
+    'int': TEXT_OPERATORS,
+    'float': TEXT_OPERATORS,
+    'date': TEXT_OPERATORS + ('date', 'date__gt', 'date__gte', 'date__lt', 'date__lte'),
+    'bool': ('exact', 'iexact', 'in', 'isnull'),
+}
+
+# Longest first, so 'date__gt' wins over 'gt'
+_ALL_OPERATORS = sorted({op for ops in OPERATORS.values() for op in ops}, key=len, reverse=True)
+
+# Operators whose value is converted to the column type
+_TYPED_OPERATORS = ('exact', 'iexact', 'in', 'gt', 'gte', 'lt', 'lte')
+
+# Value of a dropdown filter that selects rows with an empty column
+BLANK = 'Blank'
+
+
+def _kind(field):
+    if isinstance(field, models.BooleanField):
+        return 'bool'
+    if isinstance(field, (models.IntegerField, models.AutoField)):
+        return 'int'
+    if isinstance(field, (models.FloatField, models.DecimalField)):
+        return 'float'
+    if isinstance(field, (models.DateTimeField, models.DateField)):
+        return 'date'
+    return 'text'
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text == 'true':
+        return True
+    if text == 'false':
+        return False
+    raise FilterError(f"'{value}' is not true or false")
+
+
+_CONVERTERS = {'bool': _parse_bool, 'int': int, 'float': float}
+
+
+class Column:
+    """
+    A filterable column.
+
+    Args:
+        lookup: ORM path of the column, or the annotation name if `annotation` is set
+        kind: 'text', 'int', 'float', 'date' or 'bool'
+        annotation: Callable (prefix, context) -> expression annotated as `lookup`
+            when a filter or the ordering uses the column
+        many: The lookup crosses a to-many relation; matched through a
+            subquery so rows are not duplicated
+        blank: Callable (prefix) -> Q of the rows listed as 'Blank' in the
+            column's filter dropdown
+        junction: Column of the project junction row; only available with a prefix
+    """
+
+    def __init__(self, lookup, kind='text', annotation=None, many=False, blank=None, junction=False):
+        self.lookup = lookup
+        self.kind = kind
+        self.annotation = annotation
+        self.many = many
+        self.blank = blank
+        self.junction = junction
+
+    def path(self, prefix):
+        if self.annotation or self.junction:
+            return self.lookup
+        return f'{prefix}{self.lookup}'
+
+    def describe(self):
+        return {'kind': self.kind, 'operators': list(OPERATORS[self.kind]), 'calculated': bool(self.annotation)}
+
+
+class CompiledFilters:
+    """Filters of one request, ready to apply to a queryset"""
+
+    def __init__(self, condition, annotations, ordering):
+        self.condition = condition
+        self.annotations = annotations
+        self.ordering = ordering
+
+    def apply(self, queryset):
+        if self.annotations:
+            queryset = queryset.annotate(**self.annotations)
+        if self.condition:
+            queryset = queryset.filter(self.condition)
+        if self.ordering:
+            queryset = queryset.order_by(*self.ordering)
+        return queryset
+
+
+class TableFilters:
+    """
+    Filter spec of a table.
+
+    Args:
+        model: Model label of the table rows ('san.Alias')
+        columns: Declared columns by name, in addition to the model fields
+        exclude: Model fields that are not filterable
+    """
+
+    def __init__(self, model, columns=None, exclude=()):
+        self.model_label = model
+        self.declared = columns or {}
+        self.exclude = set(exclude) | {'search_text', 'customer_visible'}
+
+    @cached_property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    @cached_property
+    def columns(self):
+        columns = {}
+        for field in self.model._meta.concrete_fields:
+            if field.name in self.exclude or isinstance(field, models.JSONField):
+                continue
+            if field.many_to_one:
+                # Related rows are shown and filtered by name
+                if any(f.name == 'name' for f in field.related_model._meta.concrete_fields):
+                    for name in (field.name, f'{field.name}__name', f'{field.name}_name', f'{field.name}_details.name'):
+                        columns[name] = Column(f'{field.name}__name')
+                continue
+            columns[field.name] = Column(field.name, _kind(field))
+        columns.update(self.declared)
+        return columns
+
+    @cached_property
+    def calculated(self):
+        """Names of the calculated columns"""
+        return [name for name, column in self.columns.items() if column.annotation]
+
+    def available(self, prefix=''):
+        """Columns usable with `prefix` (junction columns need one)"""
+        return {name: column for name, column in self.columns.items() if prefix or not column.junction}
+
+    def describe(self):
+        """Filter metadata of the customer view columns, for the frontend"""
+        return {name: column.describe() for name, column in sorted(self.available().items())}
+
+    def _parse(self, param, columns):
+        """(column name, operator) of a filter parameter, or None if it is not one"""
+        if param in columns:
+            # Bare names are control parameters of some views (storage=<id>)
+            return None
+        for operator in _ALL_OPERATORS:
+            suffix = f'__{operator}'
+            if param.endswith(suffix) and param[:-len(suffix)] in columns:
+                return param[:-len(suffix)], operator
+        name, _, operator = param.rpartition('__')
+        if name in columns:
+            raise FilterError(f"Unsupported filter operator '{operator}' for column '{name}'")
+        return None
+
+    def _convert(self, column, value):
+        value = value.strip() if isinstance(value, str) else value
+        converter = _CONVERTERS.get(column.kind)
+        if converter is None:
+            return value
+        try:
+            return converter(value)
+        except (TypeError, ValueError):
+            raise FilterError(f"'{value}' is not a valid {column.kind} value")
+
+    def _condition(self, name, column, operator, value, prefix):
+        if operator not in OPERATORS[column.kind]:
+            raise FilterError(f"Operator '{operator}' is not supported for column '{name}'")
+        path = column.path(prefix)
+
+        if operator == 'isnull':
+            empty = _parse_bool(value)
+            condition = Q(**{f'{path}__isnull': True})
+            if column.kind == 'text':
+                # Empty text is shown like a missing value
+                condition |= Q(**{path: ''})
+            return condition if empty else ~condition
+
+        negated = operator in NEGATED_OPERATORS
+        lookup = NEGATED_OPERATORS.get(operator, operator)
+        if lookup == 'iexact' and column.kind != 'text':
+            lookup = 'exact'
+
+        blank = False
+        if lookup == 'in':
+            values = [v for v in str(value).split(',') if v.strip()] if isinstance(value, str) else list(value)
+            if column.blank and BLANK in values:
+                values = [v for v in values if v != BLANK]
+                blank = True
+            value = [self._convert(column, v) for v in values]
+        elif column.blank and value == BLANK and lookup in ('exact', 'iexact'):
+            return column.blank(prefix)
+        elif lookup in _TYPED_OPERATORS:
+            value = self._convert(column, value)
+
+        condition = Q(**{f'{path}__{lookup}': value})
+        if blank:
+            condition = column.blank(prefix) | condition if value else column.blank(prefix)
+        if column.many:
+            # Match through a subquery so rows with several matching children appear once
+            matches = self.model.objects.filter(Q(**{f'{column.lookup}__{lookup}': value}))
+            pk_path = f'{prefix}pk__in' if prefix else 'pk__in'
+            condition = Q(**{pk_path: matches.values('pk')})
+        return ~condition if negated else condition
+
+    def _annotate(self, annotations, column, prefix, context):
+        if column.annotation and column.lookup not in annotations:
+            annotations[column.lookup] = column.annotation(prefix, context)
+
+    def compile(self, params, prefix='', context=None, ordering=None, skip=()):
+        """
+        Compile filter parameters.
+
+        Args:
+            params: Query parameters (request.GET)
+            prefix: Path from the queryset rows to the table model ('alias__')
+            context: Values the column annotations need (zone_ids, ...)
+            ordering: Comma-separated column names, '-' for descending
+            skip: Columns the view filters itself
+        """
+        context = context or {}
+        columns = self.available(prefix)
+        condition = Q()
+        annotations = {}
+
+        for param, value in params.items():
+            parsed = self._parse(param, columns)
+            if parsed is None or parsed[0] in skip:
+                continue
+            name, operator = parsed
+            column = columns[name]
+            self._annotate(annotations, column, prefix, context)
+            condition &= self._condition(name, column, operator, value, prefix)
+
+        order_by = []
+        for field in (ordering or '').split(','):
+            field = field.strip()
+            if not field:
+                continue
+            descending = field.startswith('-')
+            name = field.lstrip('-')
+            column = columns.get(name)
+            if column is None or column.many:
+                raise FilterError(f"Cannot sort by '{name}'")
+            self._annotate(annotations, column, prefix, context)
+            order_by.append(('-' if descending else '') + column.path(prefix))
+
+        return CompiledFilters(condition, annotations, order_by)
+
+    def annotate_page(self, objects, names, context=None):
+        """
+        Set calculated column values on the rows of a page, in one query.
+
+        Columns in `names` are computed for rows that do not have them yet
+        (from a filter or the ordering); the other calculated columns are
+        set to None so serializers do not compute them row by row.
+        """
+        objects = list(objects)
+        missing = {}
+        for name in self.calculated:
+            column = self.columns[name]
+            for obj in objects:
+                if not hasattr(obj, column.lookup):
+                    if name in names:
+                        missing[name] = column
+                    else:
+                        setattr(obj, column.lookup, None)
+        if not missing or not objects:
+            return objects
+
+        rows = self.model.objects.filter(pk__in=[obj.pk for obj in objects]).annotate(**{
+            column.lookup: column.annotation('', context or {}) for column in missing.values()
+        })
+        values = {row['pk']: row for row in rows.values('pk', *[column.lookup for column in missing.values()])}
+        for obj in objects:
+            row = values.get(obj.pk, {})
+            for column in missing.values():
+                if not hasattr(obj, column.lookup):
+                    setattr(obj, column.lookup, row.get(column.lookup))
+        return objects
+
+
+def shown_calculated(request, table):
+    """
+    Calculated columns of a table that the request displays.
+
+    A 'columns' parameter (comma-separated) lists them explicitly. Without
+    it all calculated columns are computed: callers such as dropdowns read
+    them whatever the user's saved table layout shows.
+    """
+    filters = table_filters(table)
+    requested = request.GET.get('columns')
+    if requested is None:
+        return list(filters.calculated)
+    visible = {name.strip() for name in requested.split(',')}
+    return [name for name in filters.calculated if name in visible]
+
+
+def _count(rows, group_by):
+    # Correlated COUNT(*) of `rows`, 0 when there are none
+    counts = rows.order_by().values(group_by).annotate(count=Count('pk')).values('count')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _zoned_count(prefix, context):
+    # Zones of the current project (or customer) containing the alias
+    memberships = apps.get_model('san', 'Zone').members.through.objects.filter(alias_id=OuterRef(f'{prefix}pk'))
+    zone_ids = context.get('zone_ids')
+    if zone_ids is not None:
+        memberships = memberships.filter(zone_id__in=zone_ids)
+    return _count(memberships, 'alias_id')
+
+
+def _member_count(prefix, context):
+    memberships = apps.get_model('san', 'Zone').members.through.objects.filter(zone_id=OuterRef(f'{prefix}pk'))
+    return _count(memberships, 'zone_id')
+
+
+def _aliases_count(prefix, context):
+    return _count(apps.get_model('san', 'Alias').objects.filter(host_id=OuterRef(f'{prefix}pk')), 'host_id')
+
+
+def _host_storage_blank(prefix):
+    # Hosts listed as 'Blank': no storage system name on the FK or the column
+    return (
+        (Q(**{f'{prefix}storage__isnull': True}) | Q(**{f'{prefix}storage__name': ''}))
+        & (Q(**{f'{prefix}storage_system__isnull': True}) | Q(**{f'{prefix}storage_system': ''}))
+    )
+
+
+_PROJECT_ACTION = Column('action', junction=True)
+
+TABLE_FILTERS = {
+    'aliases': TableFilters('san.Alias', columns={
+        'wwpn': Column('alias_wwpns__wwpn', many=True),
+        'zoned_count': Column('_zoned_count', 'int', annotation=_zoned_count),
+        'project_action': _PROJECT_ACTION,
+        'include_in_zoning': Column('include_in_zoning', 'bool', junction=True),
+        'do_not_include_in_zoning': Column('do_not_include_in_zoning', 'bool', junction=True),
+    }),
+    'zones': TableFilters('san.Zone', columns={
+        'member_count': Column('_member_count', 'int', annotation=_member_count),
+        'project_action': _PROJECT_ACTION,
+    }),
+    'hosts': TableFilters('storage.Host', columns={
+        'storage_system': Column('storage__name', blank=_host_storage_blank),
+        'aliases_count': Column('_aliases_count', 'int', annotation=_aliases_count),
+        'project_action': _PROJECT_ACTION,
+    }),
+    'storage': TableFilters('storage.Storage', columns={
+        'project_action': _PROJECT_ACTION,
+    }),
+    'volumes': TableFilters('storage.Volume', columns={
+        'project_action': _PROJECT_ACTION,
+    }),
+    'ports': TableFilters('storage.Port', columns={
+        'project_action': _PROJECT_ACTION,
+    }),
+}
+
+
+def table_filters(table):
+    """TableFilters of a table"""
+    try:
+        return TABLE_FILTERS[table]
+    except KeyError:
+        raise FilterError(f"Unknown table '{table}'")
@@ -3,18 +3,61 @@ Celery tasks for core app
 """
 
 from celery import shared_task
+from celery.signals import task_prerun, task_postrun
 from datetime import timedelta
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from .models import AuditLog, AppSettings
-from .audit import log_audit_event
+from .audit import AUDIT_LOG_FIELDS, audit_log_buffer, log_audit_event, purge_audit_logs
 
+# Open audit_log_buffer() scopes per Celery task, keyed by task id
+_task_audit_scopes = {}
 
-@shared_task(name='core.auto_purge_audit_logs')
-def auto_purge_audit_logs_task():
+
+@task_prerun.connect
+def open_task_audit_buffer(task_id=None, **kwargs):
+    """Batch the audit log entries a task produces into one write"""
+    scope = audit_log_buffer()
+    scope.__enter__()
+    _task_audit_scopes[task_id] = scope
+
+
+@task_postrun.connect
+def flush_task_audit_buffer(task_id=None, **kwargs):
+    scope = _task_audit_scopes.pop(task_id, None)
+    if scope is not None:
+        scope.__exit__(None, None, None)
+
+
+@shared_task(name='core.write_audit_logs')
+def write_audit_logs_task(rows):
+    """
+    Write a batch of audit log entries queued by core.audit in 'celery' mode.
+
+    Args:
+        rows: List of dicts with the AUDIT_LOG_FIELDS of each entry (ISO timestamp)
+
+    Returns:
+        dict: Number of entries written
+    """
+    entries = []
+    for row in rows:
+        values = {field: row.get(field) for field in AUDIT_LOG_FIELDS}
+        values['timestamp'] = parse_datetime(values['timestamp']) if values['timestamp'] else timezone.now()
+        entries.append(AuditLog(**values))
+    AuditLog.objects.bulk_create(entries, batch_size=500)
+    return {'written': len(entries)}
+
+
+@shared_task(bind=True, name='core.auto_purge_audit_logs')
+def auto_purge_audit_logs_task(self):
     """
     Automatically purge old audit logs based on retention policy.
     This task runs daily at 2 AM (configured in Celery beat schedule).
 
+    Rows are deleted in short primary-key range batches (see
+    purge_audit_logs); progress is published through the task state.
+
     Returns:
         dict: Summary of purge operation
     """
@@ -26,13 +69,22 @@ def auto_purge_audit_logs_task():
         # Calculate cutoff date
         cutoff_date = timezone.now() - timedelta(days=retention_days)
 
-        # Delete old logs
-        old_logs = AuditLog.objects.filter(timestamp__lt=cutoff_date)
-        deleted_count = old_logs.count()
+        def progress_callback(deleted, batches):
+            if not self.request.id:
+                return
+            try:
+                self.update_state(
+                    state='PROGRESS',
+                    meta={'deleted_count': deleted, 'batches': batches, 'cutoff_date': cutoff_date.isoformat()}
+                )
+            except Exception as e:
+                # Progress is informational; never abort the purge over it
+                print(f"⚠️  Could not report purge progress: {e}")
 
-        if deleted_count > 0:
-            old_logs.delete()
+        # Delete old logs in bounded batches
+        deleted_count = purge_audit_logs(cutoff_date, progress_callback=progress_callback)
 
+        if deleted_count > 0:
             # Log the purge action (using system/None user for automatic tasks)
             log_audit_event(
                 user=None,
@@ -66,3 +118,16 @@ def auto_purge_audit_logs_task():
             'success': False,
             'error': str(e)
         }
+
+
+@shared_task(name='core.refresh_dashboard_summaries')
+def refresh_dashboard_summaries_task():
+    """
+    Recompute stale or expired DashboardSummary rows in the background so
+    dashboard reads rarely have to. Runs every few minutes (Celery beat).
+
+    Returns:
+        dict: Number of customers refreshed
+    """
+    from .dashboard_summary import refresh_stale_dashboard_summaries
+    return {'customers_refreshed': refresh_stale_dashboard_summaries()}
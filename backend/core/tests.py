@@ -1,3 +1,764 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.http import JsonResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from customers.models import Customer
+from san.models import Alias, AliasWWPN, Fabric, Zone
+from storage.models import Host, Storage
+from .audit import (
+    AuditBatch, audit_batched_view, audit_log_buffer, compact_ids, log_create, log_delete,
+    purge_audit_logs
+)
+from .cache_versions import bump_customer_cache_version, customer_cache_key
+from .customer_visibility import refresh_customer_visible
+from .dashboard_summary import get_dashboard_summary
+from .dashboard_views import clear_dashboard_cache_for_customer
+from .debug_log import view_logger
+from .filter_facets import get_filter_facet
+from .request_metrics import RequestMetrics, flush_samples, measure_request
+from .search_index import rebuild_search_index, search_filter
+from .table_filters import table_filters
+from .models import (
+    AuditLog, DashboardLayout, DashboardSummary, DashboardWidget, Project, ProjectAlias, ProjectZone,
+    TableConfiguration, WidgetDataSource, WidgetType
+)
+from .tasks import auto_purge_audit_logs_task, write_audit_logs_task
+
+
+@override_settings(AUDIT_LOG_MODE='sync')
+class SyncAuditLogTests(TestCase):
+    """The synchronous fallback writes every entry immediately"""
+
+    def test_entry_is_saved_in_callers_transaction(self):
+        customer = Customer.objects.create(name='Audit Customer')
+        audit_log = log_create(None, 'FABRIC', 'fab-a', customer=customer)
+
+        self.assertIsNotNone(audit_log.pk)
+        self.assertEqual(AuditLog.objects.get().summary, 'Created fabric: fab-a')
+
+
+@override_settings(AUDIT_LOG_MODE='buffered')
+class BufferedAuditLogTests(TestCase):
+    """Buffered writer: queue on commit, one bulk_create per scope"""
+
+    def test_scope_writes_committed_entries_in_one_insert(self):
+        with audit_log_buffer():
+            with self.captureOnCommitCallbacks(execute=True):
+                for i in range(3):
+                    log_create(None, 'ZONE', f'zone_{i}')
+            # Queued, not yet written
+            self.assertEqual(AuditLog.objects.count(), 0)
+
+        self.assertEqual(AuditLog.objects.count(), 3)
+
+    def test_flush_is_a_single_bulk_insert(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            for i in range(5):
+                log_create(None, 'ALIAS', f'alias_{i}')
+
+        with self.assertNumQueries(1):
+            with audit_log_buffer():
+                for callback in callbacks:
+                    callback()
+
+        self.assertEqual(
+            sorted(AuditLog.objects.values_list('entity_name', flat=True)),
+            [f'alias_{i}' for i in range(5)]
+        )
+
+    def test_rolled_back_entries_are_dropped(self):
+        with audit_log_buffer():
+            with self.captureOnCommitCallbacks(execute=True):
+                log_create(None, 'HOST', 'kept')
+                try:
+                    with transaction.atomic():
+                        log_delete(None, 'HOST', 'rolled-back')
+                        raise ValueError('abort')
+                except ValueError:
+                    pass
+
+        self.assertEqual(list(AuditLog.objects.values_list('entity_name', flat=True)), ['kept'])
+
+    def test_entry_keeps_the_time_it_was_logged(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            log_create(None, 'ZONE', 'zone_late')
+        logged_before = timezone.now()
+
+        with audit_log_buffer():
+            for callback in callbacks:
+                callback()
+
+        self.assertLess(AuditLog.objects.get().timestamp, logged_before)
+
+    def test_entry_outside_scope_is_written_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            log_create(None, 'SWITCH', 'sw1')
+            self.assertEqual(AuditLog.objects.count(), 0)
+
+        self.assertEqual(AuditLog.objects.count(), 1)
+
+
+@override_settings(AUDIT_LOG_MODE='celery')
+class CeleryAuditLogTests(TestCase):
+    """Celery mode ships each batch to core.write_audit_logs"""
+
+    def test_batch_is_queued_and_written_by_task(self):
+        customer = Customer.objects.create(name='Celery Customer')
+        with mock.patch.object(write_audit_logs_task, 'delay') as delay:
+            with audit_log_buffer():
+                with self.captureOnCommitCallbacks(execute=True):
+                    log_create(None, 'VOLUME', 'vol1', customer=customer)
+                    log_create(None, 'VOLUME', 'vol2', customer=customer)
+
+        self.assertEqual(AuditLog.objects.count(), 0)
+        rows = delay.call_args[0][0]
+        self.assertEqual([row['entity_name'] for row in rows], ['vol1', 'vol2'])
+        self.assertEqual(rows[0]['customer_id'], customer.id)
+        json.dumps(rows)  # must survive the JSON task serializer
+
+        self.assertEqual(write_audit_logs_task(rows), {'written': 2})
+        self.assertEqual(AuditLog.objects.filter(customer=customer).count(), 2)
+        self.assertEqual(
+            AuditLog.objects.get(entity_name='vol1').timestamp.isoformat(), rows[0]['timestamp']
+        )
+
+    def test_falls_back_to_inline_write_when_broker_is_down(self):
+        with mock.patch.object(write_audit_logs_task, 'delay', side_effect=ConnectionError('no broker')):
+            with audit_log_buffer():
+                with self.captureOnCommitCallbacks(execute=True):
+                    log_create(None, 'FABRIC', 'fab-b')
+
+        self.assertEqual(AuditLog.objects.count(), 1)
+
+
+@override_settings(AUDIT_LOG_MODE='sync')
+class AuditBatchTests(TestCase):
+    """Per-row signal logging is coalesced into one summary inside a batch"""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(name='Batch Customer')
+
+    def test_signals_log_per_row_outside_a_batch(self):
+        Fabric.objects.create(customer=self.customer, name='fab-solo')
+        self.assertEqual(AuditLog.objects.filter(action_type='CREATE', entity_type='FABRIC').count(), 1)
+
+    def test_batch_writes_one_summary_with_counts_and_ids(self):
+        with AuditBatch(None, 'IMPORT', 'Imported fabrics', entity_type='FABRIC', customer=self.customer):
+            fabrics = [Fabric.objects.create(customer=self.customer, name=f'fab-{i}') for i in range(4)]
+            first, last = fabrics[0].pk, fabrics[-1].pk
+            fabrics[0].delete()
+
+        entry = AuditLog.objects.get()
+        self.assertEqual(entry.action_type, 'IMPORT')
+        self.assertEqual(entry.details['entity_counts'], {'FABRIC': {'CREATE': 4, 'DELETE': 1}})
+        self.assertEqual(entry.details['affected_ids']['FABRIC'], [f'{first}-{last}'])
+        self.assertIn('fabric: 4 create, 1 delete', entry.summary)
+
+    def test_collect_only_batch_writes_nothing_itself(self):
+        batch = AuditBatch()
+        with batch:
+            Fabric.objects.create(customer=self.customer, name='fab-x')
+
+        self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertEqual(batch.as_details()['entity_counts'], {'FABRIC': {'CREATE': 1}})
+
+    def test_compact_ids(self):
+        self.assertEqual(compact_ids([7, 1, 2, 3, 9, 10]), (['1-3', '7', '9-10'], False))
+        self.assertEqual(compact_ids([1, 3, 5], max_ranges=2), (['1', '3'], True))
+
+    def test_batched_view_keeps_per_row_logging_for_single_row(self):
+        @audit_batched_view('FABRIC', 'Bulk saved fabrics', rows_key='fabrics')
+        def save_fabrics(request):
+            for row in json.loads(request.body)['fabrics']:
+                Fabric.objects.create(customer=self.customer, name=row['name'])
+            return JsonResponse({'ok': True})
+
+        def post(names):
+            request = RequestFactory().post(
+                '/fabrics/', json.dumps({'fabrics': [{'name': n} for n in names]}),
+                content_type='application/json'
+            )
+            request.user = AnonymousUser()
+            return save_fabrics(request)
+
+        post(['single'])
+        self.assertEqual(AuditLog.objects.filter(action_type='CREATE').count(), 1)
+
+        post(['a', 'b', 'c'])
+        self.assertEqual(AuditLog.objects.filter(action_type='CREATE').count(), 1)
+        summary = AuditLog.objects.get(action_type='UPDATE')
+        self.assertEqual(summary.details['entity_counts'], {'FABRIC': {'CREATE': 3}})
+
+    def test_batched_view_summary_takes_the_project_customer(self):
+        project = Project.objects.create(name='Batch Project')
+        self.customer.projects.add(project)
+
+        @audit_batched_view('FABRIC', 'Bulk saved fabrics', rows_key='fabrics')
+        def save_fabrics(request):
+            for row in json.loads(request.body)['fabrics']:
+                Fabric.objects.create(customer=self.customer, name=row['name'])
+            return JsonResponse({'ok': True})
+
+        request = RequestFactory().post(
+            '/fabrics/', json.dumps({'project_id': project.id, 'fabrics': [{'name': 'a'}, {'name': 'b'}]}),
+            content_type='application/json'
+        )
+        request.user = AnonymousUser()
+        save_fabrics(request)
+
+        self.assertEqual(AuditLog.objects.get(action_type='UPDATE').customer_id, self.customer.id)
+
+    def test_bulk_host_update_summary_takes_the_storage_customer(self):
+        storage = Storage.objects.create(customer=self.customer, name='fs1', storage_type='FlashSystem')
+        hosts = [Host.objects.create(storage=storage, name=f'host-{i}') for i in range(2)]
+        AuditLog.objects.all().delete()
+
+        response = self.client.post(
+            '/api/san/hosts/bulk-update-create/',
+            json.dumps({'hosts': [{'id': host.id, 'create': True} for host in hosts]}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(AuditLog.objects.get().customer_id, self.customer.id)
+
+    def test_junction_only_bulk_update_writes_no_summary(self):
+        project = Project.objects.create(name='Junction Project')
+        fabric = Fabric.objects.create(customer=self.customer, name='fab-j')
+        aliases = [Alias.objects.create(fabric=fabric, name=f'alias_{i}') for i in range(2)]
+        AuditLog.objects.all().delete()
+
+        response = self.client.post(
+            '/api/san/aliases/bulk-update-create/',
+            json.dumps({'project_id': project.id, 'aliases': [{'id': a.id, 'create': True} for a in aliases]}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(ProjectAlias.objects.filter(project=project).count(), 2)
+        self.assertEqual(AuditLog.objects.count(), 0)
+
+
+@override_settings(AUDIT_LOG_MODE='sync')
+class AuditLogPurgeTests(TestCase):
+    """Chunked retention purge"""
+
+    def setUp(self):
+        for i in range(12):
+            log_create(None, 'ZONE', f'zone_{i}')
+        self.cutoff = timezone.now() - timedelta(days=30)
+        old_ids = list(AuditLog.objects.order_by('id').values_list('id', flat=True)[:9])
+        # Leave a recent entry in the middle of the old ID range
+        AuditLog.objects.filter(id__in=old_ids).exclude(id=old_ids[4]).update(
+            timestamp=timezone.now() - timedelta(days=365)
+        )
+
+    def test_purge_deletes_expired_rows_in_batches(self):
+        progress = []
+        deleted = purge_audit_logs(self.cutoff, batch_size=3, progress_callback=lambda d, b: progress.append((d, b)))
+
+        self.assertEqual(deleted, 8)
+        self.assertEqual(progress, [(3, 1), (6, 2), (8, 3)])
+        self.assertEqual(AuditLog.objects.count(), 4)
+        self.assertFalse(AuditLog.objects.filter(timestamp__lt=self.cutoff).exists())
+
+    def test_auto_purge_task_reports_deleted_count(self):
+        result = auto_purge_audit_logs_task()
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['deleted_count'], 8)
+        self.assertTrue(AuditLog.objects.filter(summary__startswith='Automatic purge').exists())
+
+
+@override_settings(AUDIT_LOG_MODE='sync', DEFAULT_PAGE_SIZE=50, MAX_PAGE_SIZE=500)
+class AuditLogListCursorTests(TestCase):
+    """Keyset pagination, approximate count and field selection"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('auditor', password='pw')
+        self.client.force_login(user)
+        for i in range(7):
+            log_create(None, 'ZONE', f'zone_{i}')
+        # Several entries sharing a timestamp must still page without gaps
+        same = timezone.now()
+        AuditLog.objects.filter(entity_name__in=['zone_2', 'zone_3', 'zone_4']).update(timestamp=same)
+
+    def _get(self, **params):
+        return self.client.get('/api/core/audit-log/', {'page_size': 3, **params})
+
+    def test_cursor_pages_cover_every_entry_once(self):
+        expected = list(AuditLog.objects.order_by('-timestamp', '-id').values_list('id', flat=True))
+
+        seen, cursor, pages = [], '', 0
+        while cursor is not None:
+            body = self._get(cursor=cursor).json()
+            seen.extend(row['id'] for row in body['results'])
+            cursor = body['next_cursor']
+            pages += 1
+
+        self.assertEqual(seen, expected)
+        self.assertEqual(pages, 3)
+        self.assertTrue(body['count_is_estimate'])
+        self.assertEqual(body['count'], 7)
+
+    def test_count_is_cached_between_requests(self):
+        self._get(cursor='')
+        log_create(None, 'ZONE', 'late_zone')
+        self.assertEqual(self._get(cursor='').json()['count'], 7)
+
+    def test_fields_limits_returned_keys(self):
+        body = self._get(cursor='', fields='id,summary,user_full_name').json()
+        self.assertEqual(set(body['results'][0]), {'id', 'summary', 'user_full_name'})
+
+        body = self._get(page=1, fields='timestamp,action_type').json()
+        self.assertEqual(set(body['results'][0]), {'timestamp', 'action_type'})
+
+    def test_invalid_cursor_and_fields_are_rejected(self):
+        self.assertEqual(self._get(cursor='not-a-cursor').status_code, 400)
+        self.assertEqual(self._get(cursor='', fields='id,password').status_code, 400)
+
+
+@override_settings(AUDIT_LOG_MODE='sync')
+class DashboardSummaryTests(TestCase):
+    """Dashboard counts are read from one precomputed row"""
+
+    def setUp(self):
+        # Run the stale-marking callbacks so each test starts from a committed state
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer = Customer.objects.create(name='Summary Customer')
+            self.project = Project.objects.create(name='Summary Project')
+            self.customer.projects.add(self.project)
+            self.fabric = Fabric.objects.create(customer=self.customer, name='fab-a', san_vendor='BR')
+            Fabric.objects.create(customer=self.customer, name='fab-b', san_vendor='CI')
+            Storage.objects.create(customer=self.customer, name='fs1', storage_type='FlashSystem')
+            for i, exists in enumerate([True, False]):
+                zone = Zone.objects.create(fabric=self.fabric, name=f'zone_{i}', exists=exists)
+                ProjectZone.objects.create(project=self.project, zone=zone)
+
+    def test_counts_and_fresh_read_is_one_query(self):
+        customer_stats = get_dashboard_summary(self.customer.id)
+        self.assertEqual(
+            (customer_stats['fabric_count'], customer_stats['brocade_fabrics'], customer_stats['cisco_fabrics']),
+            (2, 1, 1)
+        )
+        self.assertEqual(customer_stats['storage_by_type'], {'FlashSystem': 1})
+
+        with self.assertNumQueries(1):
+            project_stats = get_dashboard_summary(self.customer.id, self.project.id)
+        self.assertEqual((project_stats['zone_count'], project_stats['deployed_zones']), (2, 1))
+
+    def test_changes_mark_rows_stale_once_per_transaction(self):
+        get_dashboard_summary(self.customer.id)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for i in range(3):
+                Zone.objects.create(fabric=self.fabric, name=f'new_zone_{i}')
+        # One stale mark, one filter facet bump each for zones and aliases,
+        # and one search index flush
+        self.assertEqual(len(callbacks), 4)
+        self.assertTrue(DashboardSummary.objects.filter(customer=self.customer, is_stale=True).exists())
+
+        self.assertEqual(get_dashboard_summary(self.customer.id)['zone_count'], 5)
+        self.assertFalse(DashboardSummary.objects.filter(is_stale=True).exists())
+
+    def test_bulk_update_helper_marks_rows_stale(self):
+        get_dashboard_summary(self.customer.id, self.project.id)
+        Zone.objects.filter(fabric=self.fabric).update(exists=True)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            clear_dashboard_cache_for_customer(self.customer.id)
+        self.assertEqual(get_dashboard_summary(self.customer.id, self.project.id)['deployed_zones'], 2)
+
+    def test_widget_reads_summary(self):
+        self.client.force_login(User.objects.create_user('viewer', password='pw'))
+        response = self.client.get('/api/core/widgets/san-overview/', {
+            'customer_id': self.customer.id, 'project_id': self.project.id
+        })
+        body = response.json()
+        self.assertEqual((body['total_fabrics'], body['total_zones'], body['cisco_fabrics']), (2, 2, 1))
+
+
+@override_settings(AUDIT_LOG_MODE='sync')
+class WidgetBatchDataTests(TestCase):
+    """One request returns every widget of a layout"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('dash', password='pw')
+        self.client.force_login(self.user)
+        self.customer = Customer.objects.create(name='Widget Customer')
+        self.project = Project.objects.create(name='Widget Project')
+        self.customer.projects.add(self.project)
+        Fabric.objects.create(customer=self.customer, name='fab-a', san_vendor='CI')
+
+    def _get(self, **params):
+        return self.client.get('/api/core/widgets/batch/', {
+            'customer_id': self.customer.id, 'project_id': self.project.id, **params
+        })
+
+    def test_batch_matches_single_endpoints(self):
+        names = 'san_overview,zone_deployment,storage_inventory,wwpn_inventory,nope'
+        widgets = self._get(widgets=names).json()['widgets']
+
+        single = self.client.get('/api/core/widgets/san-overview/', {
+            'customer_id': self.customer.id, 'project_id': self.project.id
+        }).json()
+        self.assertEqual(widgets['san_overview'], single)
+        self.assertEqual(widgets['zone_deployment']['total_zones'], 0)
+        self.assertIn('error', widgets['nope'])
+
+    def test_layout_widgets_and_source_ttls(self):
+        layout = DashboardLayout.objects.create(user=self.user, customer=self.customer)
+        for name in ('san_overview', 'backup_health'):
+            widget_type = WidgetType.objects.get_or_create(name=name, defaults={
+                'display_name': name, 'description': '', 'component_name': name,
+                'category': 'metrics', 'icon': 'x'
+            })[0]
+            DashboardWidget.objects.create(layout=layout, widget_type=widget_type, title=name)
+        WidgetDataSource.objects.create(
+            name='backup_health', display_name='Backups', description='', endpoint_pattern='', is_real_time=True
+        )
+        WidgetDataSource.objects.create(
+            name='san_overview', display_name='SAN', description='', endpoint_pattern='', cache_duration=120
+        )
+
+        body = self._get().json()
+        self.assertEqual(set(body['widgets']), {'san_overview', 'backup_health'})
+        self.assertEqual(body['cache_ttls'], {'san_overview': 120, 'backup_health': 0})
+
+        # Cached payload is served until its TTL runs out
+        Fabric.objects.create(customer=self.customer, name='fab-b', san_vendor='BR')
+        self.assertEqual(self._get().json()['widgets']['san_overview']['total_fabrics'], 1)
+
+    def test_missing_parameters_are_reported_per_widget(self):
+        body = self.client.get('/api/core/widgets/batch/', {'widgets': 'storage_inventory,backup_health'}).json()
+        self.assertEqual(body['widgets']['storage_inventory'], {'error': 'customer_id required'})
+        self.assertFalse(body['widgets']['backup_health']['has_backups'])
+
+
+@override_settings(AUDIT_LOG_MODE='sync')
+class CustomerCacheVersionTests(TestCase):
+    """Dashboard caches are dropped by bumping one per-customer generation"""
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(User.objects.create_user('versions', password='pw'))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer = Customer.objects.create(name='Version Customer')
+            self.project = Project.objects.create(name='Version Project')
+            self.customer.projects.add(self.project)
+
+    def _fabric_count(self):
+        return self.client.get('/api/core/dashboard/stats/', {
+            'customer_id': self.customer.id, 'project_id': self.project.id
+        }).json()['stats']['total_fabrics']
+
+    def test_bump_is_deferred_until_commit(self):
+        key = customer_cache_key(self.customer.id, 'dashboard_stats', self.project.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_customer_cache_version(self.customer.id)
+            self.assertEqual(customer_cache_key(self.customer.id, 'dashboard_stats', self.project.id), key)
+        self.assertNotEqual(customer_cache_key(self.customer.id, 'dashboard_stats', self.project.id), key)
+
+    def test_inventory_change_invalidates_cached_stats(self):
+        self.assertEqual(self._fabric_count(), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Fabric.objects.create(customer=self.customer, name='fab-a', san_vendor='BR')
+        self.assertEqual(self._fabric_count(), 1)
+
+
+@override_settings(AUDIT_LOG_MODE='sync')
+class FilterFacetTests(TestCase):
+    """Filter dropdown values come from a cached per-customer facet"""
+
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer = Customer.objects.create(name='Facet Customer')
+            self.project = Project.objects.create(name='Facet Project')
+            self.customer.projects.add(self.project)
+            self.fabric = Fabric.objects.create(customer=self.customer, name='fab-a', san_vendor='BR')
+            for name, exists in [('zone_a', True), ('zone_b', True), ('Zone_c', False)]:
+                Zone.objects.create(fabric=self.fabric, name=name, exists=exists)
+
+    def _values(self, field, **params):
+        return self.client.get(f'/api/san/zones/project/{self.project.id}/', {'unique_values': field, **params}).json()
+
+    def test_counts_prefix_and_cache(self):
+        body = self._values('exists')
+        self.assertEqual(body['value_counts'], [{'value': 'False', 'count': 1}, {'value': 'True', 'count': 2}])
+
+        self.assertEqual(self._values('name', prefix='ZONE_')['unique_values'], ['zone_a', 'zone_b', 'Zone_c'])
+        self.assertEqual(self._values('fabric__name')['value_counts'], [{'value': 'fab-a', 'count': 3}])
+
+        with self.assertNumQueries(0):
+            get_filter_facet(self.customer.id, 'zones', 'name', prefix='zone_b')
+        self.assertEqual(self._values('bogus__field').get('error')[:20], "Unknown facet field ")
+
+    def test_signals_invalidate_after_commit(self):
+        self.assertEqual(len(get_filter_facet(self.customer.id, 'zones', 'name')), 3)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            zone = Zone.objects.create(fabric=self.fabric, name='zone_d')
+            zone.members.add(Alias.objects.create(fabric=self.fabric, name='alias_a'))
+            # Still the cached value set until the transaction commits
+            self.assertEqual(len(get_filter_facet(self.customer.id, 'zones', 'name')), 3)
+
+        self.assertEqual(get_filter_facet(self.customer.id, 'zones', 'member_count'), [
+            {'value': 0, 'count': 3}, {'value': 1, 'count': 1}
+        ])
+        self.assertEqual(len(get_filter_facet(self.customer.id, 'zones', 'name')), 4)
+        # One bump per (customer, table), the dashboard summary mark and
+        # the search index flush
+        self.assertEqual(len(callbacks), 5)
+
+
+class SearchIndexTests(TestCase):
+    """Table search reads one denormalized column, whatever the WWPN format"""
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer = Customer.objects.create(name='Search Customer')
+            self.fabric = Fabric.objects.create(customer=self.customer, name='fab-a', san_vendor='BR')
+            self.alias = Alias.objects.create(fabric=self.fabric, name='host1_p1')
+            AliasWWPN.objects.create(alias=self.alias, wwpn='10:00:00:00:C9:AB:CD:01')
+            self.zone = Zone.objects.create(fabric=self.fabric, name='zone_host1')
+            self.zone.members.add(self.alias)
+
+    def _aliases(self, term):
+        return list(Alias.objects.filter(search_filter(term)).values_list('name', flat=True))
+
+    def test_wwpn_formats_and_related_names(self):
+        for term in ('10:00:00:00:c9:ab', '10000000C9AB', '00-c9-ab-cd', 'FAB-A'):
+            self.assertEqual(self._aliases(term), ['host1_p1'], term)
+        self.assertEqual(self._aliases('zone_host1'), [])
+        self.assertEqual(list(Zone.objects.filter(search_filter('HOST1_P1'))), [self.zone])
+
+    def test_changes_refresh_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fabric.name = 'fab-renamed'
+            self.fabric.save()
+            self.alias.name = 'host2_p1'
+            self.alias.save()
+            self.assertEqual(self._aliases('fab-renamed'), [])
+
+        self.assertEqual(self._aliases('fab-renamed'), ['host2_p1'])
+        self.assertTrue(Zone.objects.filter(search_filter('host2_p1'), fabric__name='fab-renamed').exists())
+
+        Alias.objects.update(search_text='')
+        self.assertEqual(rebuild_search_index(('san.Alias',))['san.Alias'], 1)
+        self.assertEqual(self._aliases('c9abcd01'), ['host2_p1'])
+
+
+@override_settings(REQUEST_METRICS_SAMPLE_RATE=1.0)
+class RequestMetricsTests(TestCase):
+    """Requests report their query count and timings"""
+
+    def setUp(self):
+        # Drop samples buffered by earlier tests along with the stored ones
+        flush_samples()
+        cache.clear()
+        Customer.objects.create(name='Metrics Customer')
+        self.staff = User.objects.create_user('ops', password='pw', is_staff=True)
+
+    def test_query_count_and_server_timing(self):
+        with measure_request() as metrics:
+            list(Customer.objects.all())
+            Customer.objects.count()
+        self.assertEqual(metrics.queries, 2)
+        self.assertIsInstance(metrics, RequestMetrics)
+
+        response = self.client.get('/api/core/customers/')
+        self.assertRegex(response['Server-Timing'], r'^total;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries", app;dur=')
+
+    def test_slow_endpoint_report(self):
+        for _ in range(3):
+            self.client.get('/api/core/customers/')
+
+        self.client.force_login(User.objects.create_user('viewer', password='pw'))
+        self.assertEqual(self.client.get('/api/core/request-metrics/').status_code, 403)
+
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get('/api/core/request-metrics/', {'sort': 'bogus'}).status_code, 400)
+        endpoints = self.client.get('/api/core/request-metrics/', {'sort': 'avg_queries'}).json()['endpoints']
+        customers = next(row for row in endpoints if row['endpoint'] == 'GET /api/core/customers/')
+        self.assertEqual(customers['samples'], 3)
+        self.assertGreater(customers['avg_queries'], 0)
+        self.assertGreater(customers['avg_bytes'], 0)
+
+
+class ViewDebugLogTests(TestCase):
+    """Debug fields are only evaluated when the module logs at DEBUG"""
+
+    def test_fields_are_lazy(self):
+        Customer.objects.create(name='Debug Customer')
+        debug_log = view_logger('core.tests.debug_log')
+        debug_log.logger.setLevel('INFO')
+        with self.assertNumQueries(0):
+            debug_log.debug('customers', count=Customer.objects.count)
+
+        debug_log.logger.setLevel('DEBUG')
+        with self.assertLogs('core.tests.debug_log', 'DEBUG') as logs, self.assertNumQueries(1):
+            debug_log.debug('customers', count=Customer.objects.count, name='x')
+        self.assertEqual(logs.records[0].getMessage(), 'customers {"count": 1, "name": "x"}')
+        self.assertEqual(logs.records[0].fields, {'count': 1, 'name': 'x'})
+
+
+@override_settings(DEFAULT_PAGE_SIZE=50, MAX_PAGE_SIZE=500)
+class TableFilterTests(TestCase):
+    """Table filter parameters are compiled from the column specs"""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(name='Filter Customer')
+        self.project = Project.objects.create(name='Filter Project')
+        self.customer.projects.add(self.project)
+        self.fabric = Fabric.objects.create(customer=self.customer, name='fab-a', san_vendor='BR')
+        alias = Alias.objects.create(fabric=self.fabric, name='alias_a')
+        for name, exists in [('zone_a', True), ('zone_b', False), ('other', True)]:
+            zone = Zone.objects.create(fabric=self.fabric, name=name, exists=exists)
+            if name == 'zone_a':
+                zone.members.add(alias)
+
+    def _zones(self, **params):
+        response = self.client.get(f'/api/san/zones/project/{self.project.id}/', params)
+        if response.status_code != 200:
+            return response.status_code
+        return sorted(row['name'] for row in response.json()['results'])
+
+    def test_operators_and_types(self):
+        self.assertEqual(self._zones(name__not_icontains='ZONE'), ['other'])
+        self.assertEqual(self._zones(exists__in='True', fabric__name__in='fab-a,fab-b'), ['other', 'zone_a'])
+        self.assertEqual(self._zones(member_count__gte='1'), ['zone_a'])
+        self.assertEqual(self._zones(notes__isnull='true', ordering='-name'), ['other', 'zone_a', 'zone_b'])
+        self.assertEqual(self._zones(exists__in='maybe'), 400)
+        self.assertEqual(self._zones(name__regex='^z'), 400)
+        self.assertEqual(self._zones(ordering='bogus'), 400)
+
+    def test_annotations_only_when_referenced(self):
+        filters = table_filters('zones')
+        self.assertEqual(filters.compile({'name__icontains': 'a'}, ordering='name').annotations, {})
+        compiled = filters.compile({'page': '2'}, ordering='-member_count')
+        self.assertEqual(list(compiled.annotations), ['_member_count'])
+        self.assertEqual(compiled.ordering, ['-_member_count'])
+
+        compiled = filters.compile({'project_action__in': 'new,unmodified'}, prefix='zone__')
+        self.assertEqual(compiled.condition, Q(action__in=['new', 'unmodified']))
+        # Junction columns only exist in the project views
+        self.assertEqual(filters.compile({'project_action__in': 'new'}).condition, Q())
+
+    def test_calculated_columns_only_when_shown(self):
+        ProjectZone.objects.create(project=self.project, zone=Zone.objects.get(name='zone_a'))
+
+        def zoned_count(**params):
+            response = self.client.get(f'/api/san/aliases/project/{self.project.id}/', params)
+            return response.json()['results'][0]['zoned_count']
+
+        self.assertEqual(zoned_count(), 1)
+        self.assertIsNone(zoned_count(columns='name,fabric'))
+        self.assertEqual(zoned_count(columns='name,zoned_count'), 1)
+
+        # Filtering on a hidden column still works, and shows its value
+        self.assertEqual(zoned_count(columns='name', zoned_count__gte='1'), 1)
+
+    def test_saved_layout_does_not_hide_calculated_columns(self):
+        # The zone table's alias dropdowns read zoned_count from these views
+        ProjectZone.objects.create(project=self.project, zone=Zone.objects.get(name='zone_a'))
+        user = User.objects.create_user('tables', password='pw')
+        self.client.force_login(user)
+        TableConfiguration.objects.create(
+            customer=self.customer, user=user, table_name='aliases', visible_columns=['name', 'fabric']
+        )
+
+        response = self.client.get(f'/api/san/aliases/project/{self.project.id}/')
+        self.assertEqual(response.json()['results'][0]['zoned_count'], 1)
+        response = self.client.get('/api/san/aliases/', {'customer_id': self.customer.id})
+        self.assertEqual(response.json()['results'][0]['zoned_count'], 1)
+
+
+class CustomerVisibilityTests(TestCase):
+    """customer_visible follows committed and the project memberships"""
+
+    def setUp(self):
+        customer = Customer.objects.create(name='Visible Customer')
+        self.project = Project.objects.create(name='Visible Project')
+        fabric = Fabric.objects.create(customer=customer, name='fab-v', san_vendor='BR')
+        self.alias = Alias.objects.create(fabric=fabric, name='alias_v')
+
+    def _visible(self):
+        return Alias.objects.get(pk=self.alias.pk).customer_visible
+
+    def test_memberships_and_commit(self):
+        self.assertTrue(self._visible())
+        membership = ProjectAlias.objects.create(project=self.project, alias=self.alias)
+        self.assertFalse(self._visible())
+
+        # A stale instance saved later keeps the value
+        self.alias.notes = 'edited'
+        self.alias.save()
+        self.assertFalse(self._visible())
+
+        self.alias.committed = True
+        self.alias.save(update_fields=['committed'])
+        self.assertTrue(self._visible())
+
+        Alias.objects.filter(pk=self.alias.pk).update(committed=False)
+        self.assertEqual(refresh_customer_visible('san.Alias'), 1)
+        self.assertFalse(self._visible())
+        membership.delete()
+        self.assertTrue(self._visible())
+
+
+@override_settings(DEFAULT_PAGE_SIZE=50, MAX_PAGE_SIZE=500)
+class ProjectViewCacheTests(TestCase):
+    """Project table views are cached per data version and refreshed when stale"""
+
+    def setUp(self):
+        cache.clear()
+        customer = Customer.objects.create(name='Cached Customer')
+        self.project = Project.objects.create(name='Cached Project')
+        customer.projects.add(self.project)
+        self.fabric = Fabric.objects.create(customer=customer, name='fab-c', san_vendor='BR')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.zone = Zone.objects.create(fabric=self.fabric, name='zone_c')
+            ProjectZone.objects.create(project=self.project, zone=self.zone)
+
+    def _get(self):
+        response = self.client.get(f'/api/san/zones/project/{self.project.id}/view/', {'page_size': '50'})
+        names = sorted(row['name'] for row in response.json()['results'])
+        return response['X-Project-View-Cache'], names
+
+    def test_hit_until_project_data_changes(self):
+        self.assertEqual(self._get(), ('miss', ['zone_c']))
+        self.assertEqual(self._get(), ('hit', ['zone_c']))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            zone = Zone.objects.create(fabric=self.fabric, name='zone_d')
+            ProjectZone.objects.create(project=self.project, zone=zone)
+        self.assertEqual(self._get(), ('miss', ['zone_c', 'zone_d']))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f'/api/core/projects/{self.project.id}/mark-zone-deletion/',
+                json.dumps({'zone_id': zone.id}), content_type='application/json'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get()[0], 'miss')
+
+    @override_settings(PROJECT_VIEW_CACHE_FRESH_SECONDS=0)
+    def test_stale_page_is_served_then_refreshed(self):
+        self._get()
+        # Queryset updates send no signals
+        Zone.objects.filter(pk=self.zone.pk).update(name='zone_renamed')
+        with mock.patch('core.project_view_cache._run_in_thread', lambda refresh: refresh()):
+            self.assertEqual(self._get(), ('stale', ['zone_c']))
+            self.assertEqual(self._get(), ('stale', ['zone_renamed']))
@@ -36,6 +36,7 @@ from .views import (
     heartbeat_view,
     audit_log_list,
     audit_log_purge,
+    request_metrics_report,
     project_summary_view,
     commit_project_view,
     close_project_view,
@@ -53,7 +54,7 @@ from .dashboard_views import (
     widget_san_overview, widget_zone_deployment, widget_alias_distribution,
     widget_storage_inventory, widget_host_connectivity, widget_import_activity,
     widget_backup_health, widget_wwpn_inventory, widget_project_activity,
-    widget_storage_capacity
+    widget_storage_capacity, widget_batch_data
 )
 
 # Import worksheet views
@@ -142,6 +143,9 @@ urlpatterns = [
     path("audit-log/", audit_log_list, name="audit-log-list"),
     path("audit-log/purge/", audit_log_purge, name="audit-log-purge"),
 
+    # Sampled per-endpoint timings (core.request_metrics)
+    path("request-metrics/", request_metrics_report, name="request-metrics-report"),
+
     # ========== PROJECT MANAGEMENT ENDPOINTS ==========
     path("projects/<int:project_id>/add-alias/", project_add_alias, name="project-add-alias"),
     path("projects/<int:project_id>/mark-alias-deletion/", mark_alias_deletion, name="mark-alias-deletion"),
@@ -214,6 +218,7 @@ urlpatterns = [
     path("widgets/wwpn-inventory/", widget_wwpn_inventory, name="widget-wwpn-inventory"),
     path("widgets/project-activity/", widget_project_activity, name="widget-project-activity"),
     path("widgets/storage-capacity/", widget_storage_capacity, name="widget-storage-capacity"),
+    path("widgets/batch/", widget_batch_data, name="widget-batch-data"),
 
     # Include router URLs for worksheet generator
     path('', include(router.urls)),
@@ -1,6 +1,12 @@
+import base64
+import hashlib
 import json
+import logging
 import os
 from datetime import datetime
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -9,6 +15,17 @@ from django.contrib.auth.models import User
 from django.contrib.auth.hashers import check_password
 from django.conf import settings
 from .models import Config, Project, TableConfiguration, AppSettings, CustomNamingRule, CustomVariable, UserConfig, AuditLog
+from .audit import audit_batched_view, current_audit_batch
+from .cache_versions import bump_customer_cache_version
+from .dashboard_summary import get_all_customer_summaries, get_dashboard_summary
+from .request_metrics import REPORT_SORT_FIELDS, slow_endpoint_report
+from .table_filters import TABLE_FILTERS
+from .debug_log import view_logger
+from storage.capacity import (
+    VOLUME_TIER_FIELDS, bytes_to_tb, storage_capacity_by_system, storage_capacity_by_type,
+    storage_capacity_totals, top_volumes_by_capacity, utilization_percent, volume_capacity_by_pool,
+    volume_capacity_by_tier
+)
 from customers.models import Customer
 from .serializers import (
     ConfigSerializer, ProjectSerializer, ActiveConfigSerializer,
@@ -18,6 +35,9 @@ from .serializers import (
 )
 from customers.serializers import CustomerSerializer 
 
+logger = logging.getLogger(__name__)
+debug_log = view_logger(__name__)
+
 
 @csrf_exempt
 @require_http_methods(["GET", "POST", "PUT", "DELETE"])
@@ -30,7 +50,7 @@ def config_viewset(request, pk=None):
     PUT /configs/{pk}/          -> Update an existing config
     DELETE /configs/{pk}/       -> Delete a config
     """
-    print(f"🔥 Config ViewSet - Method: {request.method}, PK: {pk}")
+    debug_log.debug('config viewset request', method=request.method, pk=pk)
     
     if request.method == "GET":
         is_active = request.GET.get("is_active")
@@ -103,7 +123,7 @@ def active_config_view(request):
     DEPRECATED: View to return the active config. Use user_config_view instead.
     Kept for backward compatibility.
     """
-    print(f"🔥 Active Config View - Method: {request.method} (DEPRECATED)")
+    debug_log.debug('active config view request', method=request.method, deprecated=True)
 
     try:
         customer_id = request.GET.get('customer')
@@ -135,7 +155,7 @@ def user_config_view(request):
         "active_project_id": <project_id>      # optional
     }
     """
-    print(f"🔥 User Config View - Method: {request.method}")
+    debug_log.debug('user config view request', method=request.method)
 
     # Require authentication
     user = request.user if request.user.is_authenticated else None
@@ -181,7 +201,7 @@ def user_config_view(request):
 @require_http_methods(["PUT", "GET"])
 def config_detail(request):
     """Get or update Config object filtered by customer if provided"""
-    print(f"🔥 Config Detail - Method: {request.method}")
+    debug_log.debug('config detail request', method=request.method)
     
     try:
         customer_id = request.GET.get('customer')
@@ -222,7 +242,7 @@ def config_detail(request):
 @require_http_methods(["GET"])
 def customer_list(request):
     """Fetch all customers"""
-    print(f"🔥 Customer List - Method: {request.method}")
+    debug_log.debug('customer list request', method=request.method)
     
     try:
         customers = Customer.objects.all().order_by('name')
@@ -250,7 +270,7 @@ def customer_list(request):
 @require_http_methods(["GET"])
 def projects_for_customer(request, customer_id):
     """Fetch projects for a selected customer - all authenticated users can see all projects"""
-    print(f"🔥 Projects for Customer - Customer ID: {customer_id}")
+    debug_log.debug('projects for customer request', customer_id=customer_id)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -280,7 +300,7 @@ def projects_for_customer(request, customer_id):
 @require_http_methods(["GET"])
 def config_for_customer(request, customer_id):
     """Return the active config for the specified customer ID"""
-    print(f"🔥 Config for Customer - Customer ID: {customer_id}")
+    debug_log.debug('config for customer request', customer_id=customer_id)
     
     try:
         config = Config.objects.get(customer_id=customer_id)
@@ -296,7 +316,7 @@ def config_for_customer(request, customer_id):
 @require_http_methods(["PUT"])
 def update_config_view(request, customer_id):
     """Update config for a specific customer"""
-    print(f"🔥 Update Config - Customer ID: {customer_id}")
+    debug_log.debug('update config request', customer_id=customer_id)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -328,7 +348,7 @@ def create_project_for_customer(request):
     """
     Handle projects endpoint - GET for listing all projects, POST for creating new project.
     """
-    print(f"🔥 Projects API - Method: {request.method}")
+    debug_log.debug('projects api request', method=request.method)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -386,7 +406,7 @@ def create_project_for_customer(request):
         try:
             print(f"📝 Parsing request body...")
             data = json.loads(request.body)
-            print(f"📝 Request data: {data}")
+            debug_log.debug('create project data', data=data)
 
             name = data.get('name')
             customer_id = data.get('customer')
@@ -428,7 +448,7 @@ def create_project_for_customer(request):
 
             print(f"📝 Serializing project...")
             serializer = ProjectSerializer(project)
-            print(f"📝 Serialized data: {serializer.data}")
+            debug_log.debug('project created', project_id=project.id)
 
             return JsonResponse(serializer.data, status=201)
 
@@ -446,7 +466,7 @@ def update_project(request, project_id):
     Update a project by ID.
     PUT /api/core/projects/<id>/
     """
-    print(f"🔥 Update Project - Method: {request.method}, Project ID: {project_id}")
+    debug_log.debug('update project request', method=request.method, project_id=project_id)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -462,7 +482,7 @@ def update_project(request, project_id):
         # All authenticated users can update projects
         print(f"📝 Parsing request body...")
         data = json.loads(request.body)
-        print(f"📝 Update data: {data}")
+        debug_log.debug('update project data', project_id=project_id, data=data)
 
         # Update project fields
         if 'name' in data:
@@ -498,7 +518,7 @@ def update_project(request, project_id):
                 return JsonResponse({"error": "Customer not found."}, status=404)
 
         serializer = ProjectSerializer(project)
-        print(f"📝 Serialized updated project: {serializer.data}")
+        debug_log.debug('project updated', project_id=project.id)
         
         return JsonResponse(serializer.data, status=200)
     
@@ -516,7 +536,7 @@ def delete_project(request, project_id):
     Delete a project by ID.
     DELETE /api/core/projects/<id>/
     """
-    print(f"🔥 Delete Project - Method: {request.method}, Project ID: {project_id}")
+    debug_log.debug('delete project request', method=request.method, project_id=project_id)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -575,57 +595,32 @@ def dashboard_overview(request):
     Get overall dashboard statistics
     GET /api/core/dashboard/overview/
     """
-    print(f"🔥 Dashboard Overview - Method: {request.method}")
+    debug_log.debug('dashboard overview request', method=request.method)
     
     try:
         # Calculate overall statistics
         total_customers = Customer.objects.count()
         total_projects = Project.objects.count()
         
-        # Initialize variables for models that might not exist
-        total_fabrics = 0
-        total_zones = 0
-        total_aliases = 0
-        total_storage = 0
-        brocade_fabrics = 0
-        cisco_fabrics = 0
-        ds8000_count = 0
-        flashsystem_count = 0
-        other_storage_count = 0
-        
-        # Try to import and count SAN models
-        try:
-            from san.models import Fabric
-            total_fabrics = Fabric.objects.count()
-            brocade_fabrics = Fabric.objects.filter(san_vendor='BR').count()
-            cisco_fabrics = Fabric.objects.filter(san_vendor='CI').count()
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  SAN Fabric model not available: {e}")
-        
-        try:
-            from san.models import Zone
-            total_zones = Zone.objects.count()
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  SAN Zone model not available: {e}")
-        
-        try:
-            from san.models import Alias
-            total_aliases = Alias.objects.count()
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  SAN Alias model not available: {e}")
-        
-        # Try to import and count Storage models
-        try:
-            from storage.models import Storage
-            total_storage = Storage.objects.count()
-            ds8000_count = Storage.objects.filter(storage_type='DS8000').count()
-            flashsystem_count = Storage.objects.filter(storage_type='FlashSystem').count()
-            other_storage_count = Storage.objects.exclude(
-                storage_type__in=['DS8000', 'FlashSystem']
-            ).count()
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  Storage model not available: {e}")
-        
+        # Inventory counts are summed from the per-customer summary rows
+        summaries = list(get_all_customer_summaries().values())
+
+        def summed(key):
+            return sum(summary.get(key, 0) for summary in summaries)
+
+        def storage_of_type(storage_type):
+            return sum(summary['storage_by_type'].get(storage_type, 0) for summary in summaries)
+
+        total_fabrics = summed('fabric_count')
+        brocade_fabrics = summed('brocade_fabrics')
+        cisco_fabrics = summed('cisco_fabrics')
+        total_zones = summed('zone_count')
+        total_aliases = summed('alias_count')
+        total_storage = summed('storage_count')
+        ds8000_count = storage_of_type('DS8000')
+        flashsystem_count = storage_of_type('FlashSystem')
+        other_storage_count = total_storage - ds8000_count - flashsystem_count
+
         # Count customers with Storage Insights configured
         connected_insights = 0
         try:
@@ -654,7 +649,7 @@ def dashboard_overview(request):
             }
         }
         
-        print(f"📊 Dashboard overview calculated: {overview}")
+        debug_log.debug('dashboard overview calculated', overview=overview)
         return JsonResponse(overview)
         
     except Exception as e:
@@ -669,7 +664,7 @@ def dashboard_stats(request):
     Enhanced dashboard statistics for current customer/project with caching support
     GET /api/core/dashboard/stats/?customer_id=<id>&project_id=<id>
     """
-    print(f"🔥 Dashboard Stats - Method: {request.method}")
+    debug_log.debug('dashboard stats request', method=request.method)
     
     try:
         customer_id = request.GET.get('customer_id')
@@ -693,47 +688,17 @@ def dashboard_stats(request):
             'total_volumes': 0
         }
         
-        # Try to get SAN data
-        try:
-            from san.models import Fabric, Zone, Alias
-            stats['total_fabrics'] = Fabric.objects.filter(customer=customer).count()
-            
-            if project:
-                stats['total_zones'] = Zone.objects.filter(
-                    fabric__customer=customer,
-                    projects=project
-                ).count()
-                stats['total_aliases'] = Alias.objects.filter(
-                    fabric__customer=customer,
-                    projects=project
-                ).count()
-            else:
-                stats['total_zones'] = Zone.objects.filter(fabric__customer=customer).count()
-                stats['total_aliases'] = Alias.objects.filter(fabric__customer=customer).count()
-                
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  SAN models not available: {e}")
-        
-        # Try to get Storage data
-        try:
-            from storage.models import Storage, Host, Volume
-            stats['total_storage'] = Storage.objects.filter(customer=customer).count()
-            
-            if project:
-                stats['total_hosts'] = Host.objects.filter(project=project).count()
-                # Get volumes from storage systems of this customer
-                storage_systems = Storage.objects.filter(customer=customer)
-                stats['total_volumes'] = Volume.objects.filter(storage__in=storage_systems).count()
-            else:
-                # Get all hosts for all projects of this customer
-                projects = customer.projects.all()
-                stats['total_hosts'] = Host.objects.filter(project__in=projects).count()
-                storage_systems = Storage.objects.filter(customer=customer)
-                stats['total_volumes'] = Volume.objects.filter(storage__in=storage_systems).count()
-                
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  Storage models not available: {e}")
-        
+        # Counts come from the precomputed summary rows; zones, aliases and
+        # hosts are scoped to the project when one is given
+        customer_summary = get_dashboard_summary(customer.id)
+        scoped_summary = get_dashboard_summary(customer.id, project.id) if project else customer_summary
+        stats['total_fabrics'] = customer_summary['fabric_count']
+        stats['total_zones'] = scoped_summary['zone_count']
+        stats['total_aliases'] = scoped_summary['alias_count']
+        stats['total_storage'] = customer_summary['storage_count']
+        stats['total_hosts'] = scoped_summary['host_count']
+        stats['total_volumes'] = customer_summary['volume_count']
+
         # Get customer info with insights status
         customer_data = {
             'id': customer.id,
@@ -770,7 +735,7 @@ def dashboard_stats(request):
             'timestamp': datetime.now().isoformat()
         }
         
-        print(f"📊 Dashboard stats calculated: {response_data}")
+        debug_log.debug('dashboard stats calculated', stats=response_data)
         return JsonResponse(response_data)
         
     except Exception as e:
@@ -785,7 +750,7 @@ def capacity_analytics(request):
     Get storage capacity analytics and trends
     GET /api/core/dashboard/capacity/?customer_id=<id>
     """
-    print(f"🔥 Capacity Analytics - Method: {request.method}")
+    debug_log.debug('capacity analytics request', method=request.method)
     
     try:
         customer_id = request.GET.get('customer_id')
@@ -806,97 +771,75 @@ def capacity_analytics(request):
             'alerts': []
         }
         
-        try:
-            from storage.models import Storage, Volume
-            storage_systems = Storage.objects.filter(customer=customer)
-            
-            total_capacity_bytes = 0
-            total_used_bytes = 0
-            
-            for storage in storage_systems:
-                capacity_bytes = storage.capacity_bytes or 0
-                used_bytes = storage.used_capacity_bytes or 0
-                
-                total_capacity_bytes += capacity_bytes
-                total_used_bytes += used_bytes
-                
-                # Convert to TB
-                capacity_tb = capacity_bytes / (1024 ** 4) if capacity_bytes else 0
-                used_tb = used_bytes / (1024 ** 4) if used_bytes else 0
-                available_tb = capacity_tb - used_tb
-                
-                utilization = (used_tb / capacity_tb * 100) if capacity_tb > 0 else 0
-                
-                storage_info = {
-                    'id': storage.id,
-                    'name': storage.name,
-                    'storage_type': storage.storage_type,
-                    'capacity_tb': round(capacity_tb, 2),
-                    'used_tb': round(used_tb, 2),
-                    'available_tb': round(available_tb, 2),
-                    'utilization_percent': round(utilization, 1),
-                    'status': 'healthy' if utilization < 80 else 'warning' if utilization < 90 else 'critical'
-                }
-                
-                analytics['storage_systems'].append(storage_info)
-                
-                # Track capacity by storage type
-                storage_type = storage.storage_type or 'Unknown'
-                if storage_type not in analytics['capacity_by_type']:
-                    analytics['capacity_by_type'][storage_type] = {
-                        'capacity_tb': 0,
-                        'used_tb': 0,
-                        'count': 0
-                    }
-                
-                analytics['capacity_by_type'][storage_type]['capacity_tb'] += capacity_tb
-                analytics['capacity_by_type'][storage_type]['used_tb'] += used_tb
-                analytics['capacity_by_type'][storage_type]['count'] += 1
-                
-                # Generate alerts for high utilization
-                if utilization > 90:
-                    analytics['alerts'].append({
-                        'type': 'critical',
-                        'message': f'{storage.name} is {utilization:.1f}% full',
-                        'storage_id': storage.id
-                    })
-                elif utilization > 80:
-                    analytics['alerts'].append({
-                        'type': 'warning',
-                        'message': f'{storage.name} is {utilization:.1f}% full',
-                        'storage_id': storage.id
-                    })
-            
-            # Calculate totals
-            analytics['total_capacity_tb'] = round(total_capacity_bytes / (1024 ** 4), 2)
-            analytics['used_capacity_tb'] = round(total_used_bytes / (1024 ** 4), 2)
-            analytics['available_capacity_tb'] = round(analytics['total_capacity_tb'] - analytics['used_capacity_tb'], 2)
-            
-            if analytics['total_capacity_tb'] > 0:
-                analytics['utilization_percent'] = round(
-                    (analytics['used_capacity_tb'] / analytics['total_capacity_tb']) * 100, 1
-                )
-            
-            # Find top volume consumers
-            volumes = Volume.objects.filter(
-                storage__customer=customer
-            ).exclude(
-                capacity_bytes__isnull=True
-            ).order_by('-capacity_bytes')[:10]
-            
-            for volume in volumes:
-                capacity_tb = (volume.capacity_bytes or 0) / (1024 ** 4)
-                analytics['top_consumers'].append({
-                    'id': volume.id,
-                    'name': volume.name,
-                    'storage_name': volume.storage.name,
-                    'capacity_tb': round(capacity_tb, 2)
+        # Sums and groupings run in the database and fetch only capacity columns
+        totals = storage_capacity_totals(customer.id)
+        analytics['total_capacity_tb'] = bytes_to_tb(totals['capacity_bytes'])
+        analytics['used_capacity_tb'] = bytes_to_tb(totals['used_bytes'])
+        analytics['available_capacity_tb'] = round(analytics['total_capacity_tb'] - analytics['used_capacity_tb'], 2)
+        analytics['utilization_percent'] = utilization_percent(totals['used_bytes'], totals['capacity_bytes'])
+
+        for storage in storage_capacity_by_system(customer.id):
+            capacity_bytes = storage['capacity_bytes'] or 0
+            used_bytes = storage['used_capacity_bytes'] or 0
+            utilization = used_bytes / capacity_bytes * 100 if capacity_bytes else 0
+
+            analytics['storage_systems'].append({
+                'id': storage['id'],
+                'name': storage['name'],
+                'storage_type': storage['storage_type'],
+                'capacity_tb': bytes_to_tb(capacity_bytes),
+                'used_tb': bytes_to_tb(used_bytes),
+                'available_tb': bytes_to_tb(capacity_bytes - used_bytes),
+                'utilization_percent': round(utilization, 1),
+                'status': 'healthy' if utilization < 80 else 'warning' if utilization < 90 else 'critical'
+            })
+
+            # Generate alerts for high utilization
+            if utilization > 80:
+                analytics['alerts'].append({
+                    'type': 'critical' if utilization > 90 else 'warning',
+                    'message': f"{storage['name']} is {utilization:.1f}% full",
+                    'storage_id': storage['id']
                 })
-                
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  Storage models not available: {e}")
-        
-        print(f"📊 Capacity analytics calculated: {analytics}")
+
+        analytics['capacity_by_type'] = {
+            storage_type: {
+                'capacity_tb': bytes_to_tb(group['capacity_bytes']),
+                'used_tb': bytes_to_tb(group['used_bytes']),
+                'count': group['count']
+            }
+            for storage_type, group in storage_capacity_by_type(customer.id).items()
+        }
+
+        analytics['capacity_by_pool'] = [
+            {
+                'storage_id': pool['storage_id'],
+                'storage_name': pool['storage_name'],
+                'pool_name': pool['pool_name'],
+                'volume_count': pool['volume_count'],
+                'capacity_tb': bytes_to_tb(pool['capacity_bytes']),
+                'used_tb': bytes_to_tb(pool['used_bytes']),
+                'utilization_percent': utilization_percent(pool['used_bytes'], pool['capacity_bytes']),
+                'tiers_tb': {tier: bytes_to_tb(pool[f'{tier}_bytes']) for tier in VOLUME_TIER_FIELDS},
+            }
+            for pool in volume_capacity_by_pool(customer.id)
+        ]
+        analytics['capacity_by_tier'] = {
+            tier: bytes_to_tb(value) for tier, value in volume_capacity_by_tier(customer.id).items()
+        }
+
+        # Find top volume consumers
+        analytics['top_consumers'] = [
+            {
+                'id': volume['id'],
+                'name': volume['name'],
+                'storage_name': volume['storage_name'],
+                'capacity_tb': bytes_to_tb(volume['capacity_bytes'])
+            }
+            for volume in top_volumes_by_capacity(customer.id)
+        ]
+
+        debug_log.debug('capacity analytics calculated', analytics=analytics)
         return JsonResponse(analytics)
         
     except Exception as e:
@@ -911,7 +854,7 @@ def system_health(request):
     Get system health status and recent activity
     GET /api/core/dashboard/health/?customer_id=<id>
     """
-    print(f"🔥 System Health - Method: {request.method}")
+    debug_log.debug('system health request', method=request.method)
     
     try:
         customer_id = request.GET.get('customer_id')
@@ -1031,7 +974,7 @@ def system_health(request):
         except (ImportError, AttributeError) as e:
             print(f"⚠️  Storage models not available: {e}")
         
-        print(f"📊 System health calculated: {health}")
+        debug_log.debug('system health calculated', health=health)
         return JsonResponse(health)
         
     except Exception as e:
@@ -1046,16 +989,16 @@ def clear_dashboard_cache(request):
     Clear dashboard cache for a customer/project
     POST /api/core/dashboard/cache/clear/
     """
-    print(f"🔥 Clear Dashboard Cache - Method: {request.method}")
+    debug_log.debug('clear dashboard cache request', method=request.method)
     
     try:
         data = json.loads(request.body)
         customer_id = data.get('customer_id')
         project_id = data.get('project_id')
         
-        # For now, just return success since we're not implementing actual caching
-        # In a real implementation, you'd clear Redis cache keys here
-        
+        # Project-level entries live in the customer's cache generation too
+        bump_customer_cache_version(customer_id)
+
         return JsonResponse({
             'status': 'success',
             'message': 'Dashboard cache cleared',
@@ -1075,7 +1018,7 @@ def activity_feed(request):
     Get recent activity feed for dashboard
     GET /api/core/dashboard/activity/?customer_id=<id>&limit=<num>
     """
-    print(f"🔥 Activity Feed - Method: {request.method}")
+    debug_log.debug('activity feed request', method=request.method)
     
     try:
         customer_id = request.GET.get('customer_id')
@@ -1117,7 +1060,7 @@ def activity_feed(request):
         # Limit results
         activities = activities[:limit]
         
-        print(f"📊 Activity feed calculated: {len(activities)} activities")
+        debug_log.debug('activity feed calculated', count=len(activities))
         return JsonResponse(activities, safe=False)
         
     except Exception as e:
@@ -1132,92 +1075,31 @@ def customer_statistics(request, customer_id):
     Get statistics for a specific customer
     GET /api/core/customers/{customer_id}/statistics/
     """
-    print(f"🔥 Customer Statistics - Customer ID: {customer_id}")
+    debug_log.debug('customer statistics request', customer_id=customer_id)
     
     try:
         customer = get_object_or_404(Customer, id=customer_id)
         
-        # Get projects for this customer
-        projects = customer.projects.all()
-        
-        # Initialize variables
-        fabrics = None
-        storage_systems = None
-        
-        # Try to get fabrics for this customer
-        try:
-            from san.models import Fabric
-            fabrics = Fabric.objects.filter(customer=customer)
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  Fabric model not available: {e}")
-            fabrics = []
-        
-        # Try to get storage systems for this customer
-        try:
-            from storage.models import StorageSystem
-            storage_systems = StorageSystem.objects.filter(customer=customer)
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  StorageSystem model not available: {e}")
-            storage_systems = []
-        
-        # Calculate basic statistics
+        summary = get_dashboard_summary(customer.id)
+
         stats = {
             'customer_id': customer_id,
             'customer_name': customer.name,
-            'project_count': projects.count(),
-            'fabric_count': len(fabrics) if fabrics else 0,
-            'storage_count': len(storage_systems) if storage_systems else 0,
+            'project_count': customer.projects.count(),
+            'fabric_count': summary['fabric_count'],
+            'storage_count': summary['storage_count'],
             'has_insights_key': bool(getattr(customer, 'insights_api_key', None)),
             'has_insights_tenant': bool(getattr(customer, 'insights_tenant', None)),
+            'brocade_fabrics': summary['brocade_fabrics'],
+            'cisco_fabrics': summary['cisco_fabrics'],
+            'ds8000_count': summary['storage_by_type'].get('DS8000', 0),
+            'flashsystem_count': summary['storage_by_type'].get('FlashSystem', 0),
+            'zone_count': summary['zone_count'],
+            'alias_count': summary['alias_count'],
         }
-        
-        # Calculate fabric distribution
-        if fabrics:
-            try:
-                stats['brocade_fabrics'] = fabrics.filter(san_vendor='BR').count()
-                stats['cisco_fabrics'] = fabrics.filter(san_vendor='CI').count()
-            except AttributeError:
-                stats['brocade_fabrics'] = 0
-                stats['cisco_fabrics'] = 0
-        else:
-            stats['brocade_fabrics'] = 0
-            stats['cisco_fabrics'] = 0
-        
-        # Calculate storage distribution
-        if storage_systems:
-            try:
-                stats['ds8000_count'] = storage_systems.filter(storage_type='DS8000').count()
-                stats['flashsystem_count'] = storage_systems.filter(storage_type='FlashSystem').count()
-                stats['other_storage_count'] = storage_systems.exclude(
-                    storage_type__in=['DS8000', 'FlashSystem']
-                ).count()
-            except AttributeError:
-                stats['ds8000_count'] = 0
-                stats['flashsystem_count'] = 0
-                stats['other_storage_count'] = 0
-        else:
-            stats['ds8000_count'] = 0
-            stats['flashsystem_count'] = 0
-            stats['other_storage_count'] = 0
-        
-        # Get zone and alias counts across all projects
-        total_zones = 0
-        total_aliases = 0
-        
-        for project in projects:
-            try:
-                from san.models import Zone, Alias
-                zones = Zone.objects.filter(project=project)
-                aliases = Alias.objects.filter(project=project)
-                total_zones += zones.count()
-                total_aliases += aliases.count()
-            except (ImportError, AttributeError):
-                pass  # Models don't exist, skip
-        
-        stats['zone_count'] = total_zones
-        stats['alias_count'] = total_aliases
-        
-        print(f"📊 Customer {customer.name} statistics: {stats}")
+        stats['other_storage_count'] = stats['storage_count'] - stats['ds8000_count'] - stats['flashsystem_count']
+
+        debug_log.debug('customer statistics calculated', customer=customer.name, stats=stats)
         return JsonResponse(stats)
         
     except Exception as e:
@@ -1237,7 +1119,7 @@ def table_configuration_list(request):
     GET /api/core/table-config/?customer=<id>&table_name=<name>&user=<id>
     POST /api/core/table-config/ (create new configuration)
     """
-    print(f"🔥 Table Configuration List - Method: {request.method}")
+    debug_log.debug('table configuration list request', method=request.method)
     
     if request.method == "GET":
         try:
@@ -1336,7 +1218,7 @@ def table_configuration_detail(request, pk):
     PUT /api/core/table-config/<id>/
     DELETE /api/core/table-config/<id>/
     """
-    print(f"🔥 Table Configuration Detail - Method: {request.method}, PK: {pk}")
+    debug_log.debug('table configuration detail request', method=request.method, pk=pk)
     
     try:
         config = get_object_or_404(TableConfiguration, pk=pk)
@@ -1383,7 +1265,7 @@ def reset_table_configuration(request):
     POST /api/core/table-config/reset/
     Body: {"customer": <id>, "table_name": <name>, "user": <id>}
     """
-    print(f"🔥 Reset Table Configuration - Method: {request.method}")
+    debug_log.debug('reset table configuration request', method=request.method)
     
     try:
         data = json.loads(request.body)
@@ -1434,7 +1316,7 @@ def app_settings_view(request):
     GET /api/core/settings/ - Get current settings
     PUT /api/core/settings/ - Update settings
     """
-    print(f"🔥 App Settings - Method: {request.method}")
+    debug_log.debug('app settings request', method=request.method)
     
     # Get authenticated user for per-user settings
     user = request.user if request.user.is_authenticated else None
@@ -1527,7 +1409,7 @@ def custom_naming_rules_list(request):
     GET /api/core/custom-naming-rules/?customer=<id>&table_name=<name>&user=<id>
     POST /api/core/custom-naming-rules/ (create new rule)
     """
-    print(f"🔥 Custom Naming Rules List - Method: {request.method}")
+    debug_log.debug('custom naming rules list request', method=request.method)
     
     if request.method == "GET":
         try:
@@ -1595,7 +1477,7 @@ def custom_naming_rule_detail(request, pk):
     PUT /api/core/custom-naming-rules/<id>/
     DELETE /api/core/custom-naming-rules/<id>/
     """
-    print(f"🔥 Custom Naming Rule Detail - Method: {request.method}, PK: {pk}")
+    debug_log.debug('custom naming rule detail request', method=request.method, pk=pk)
     
     try:
         rule = get_object_or_404(CustomNamingRule, pk=pk)
@@ -1642,7 +1524,7 @@ def custom_variables_list(request):
     GET /api/core/custom-variables/?customer=<id>&user=<id>
     POST /api/core/custom-variables/ (create new variable)
     """
-    print(f"🔥 Custom Variables List - Method: {request.method}")
+    debug_log.debug('custom variables list request', method=request.method)
     
     if request.method == "GET":
         try:
@@ -1706,7 +1588,7 @@ def custom_variable_detail(request, pk):
     PUT /api/core/custom-variables/<id>/
     DELETE /api/core/custom-variables/<id>/
     """
-    print(f"🔥 Custom Variable Detail - Method: {request.method}, PK: {pk}")
+    debug_log.debug('custom variable detail request', method=request.method, pk=pk)
     
     try:
         variable = get_object_or_404(CustomVariable, pk=pk)
@@ -1752,7 +1634,7 @@ def table_columns_list(request):
     Get available columns for a specific table
     GET /api/core/table-columns/?table_name=<name>
     """
-    print(f"🔥 Table Columns List - Method: {request.method}")
+    debug_log.debug('table columns list request', method=request.method)
     
     try:
         table_name = request.GET.get('table_name')
@@ -1770,6 +1652,7 @@ def table_columns_list(request):
             'storage': 'storage.models.Storage',
             'hosts': 'storage.models.Host',
             'volumes': 'storage.models.Volume',
+            'ports': 'storage.models.Port',
             'customers': 'customers.models.Customer',
             'projects': 'core.models.Project'
         }
@@ -1814,10 +1697,15 @@ def table_columns_list(request):
                     'required': False
                 })
         
-        return JsonResponse({
+        response = {
             'table_name': table_name,
             'columns': columns
-        })
+        }
+        # Filterable columns of the table view, with their type and operators
+        if table_name in TABLE_FILTERS:
+            response['filters'] = TABLE_FILTERS[table_name].describe()
+
+        return JsonResponse(response)
         
     except Exception as e:
         print(f"❌ Error in table_columns_list: {e}")
@@ -1836,7 +1724,7 @@ def user_detail(request, user_id):
     GET /api/core/users/<id>/
     PATCH /api/core/users/<id>/
     """
-    print(f"🔥 User Detail - Method: {request.method}, User ID: {user_id}")
+    debug_log.debug('user detail request', method=request.method, user_id=user_id)
 
     try:
         user = get_object_or_404(User, id=user_id)
@@ -1878,7 +1766,7 @@ def user_change_password(request, user_id):
     POST /api/core/users/<id>/change-password/
     Body: {"current_password": "...", "new_password": "..."}
     """
-    print(f"🔥 User Change Password - User ID: {user_id}")
+    debug_log.debug('user change password request', user_id=user_id)
 
     try:
         user = get_object_or_404(User, id=user_id)
@@ -1955,7 +1843,7 @@ def customer_add_member(request, customer_id):
     POST /api/core/customers/<id>/add-member/
     Body: {"user_id": 123, "role": "member"}
     """
-    print(f"🔥 Customer Add Member - Customer ID: {customer_id}")
+    debug_log.debug('customer add member request', customer_id=customer_id)
 
     user = request.user if request.user.is_authenticated else None
     
@@ -2108,6 +1996,57 @@ def heartbeat_view(request):
 
 # ========== AUDIT LOG VIEWS ==========
 
+# How long a filtered audit log count is reused by cursor-mode requests (seconds)
+AUDIT_LOG_COUNT_CACHE_TTL = 60
+
+AUDIT_LOG_FILTER_PARAMS = ['user_id', 'customer_id', 'action_type', 'status', 'start_date', 'end_date']
+
+
+def encode_audit_log_cursor(log):
+    """Opaque cursor pointing just past the given entry in (-timestamp, -id) order"""
+    raw = f"{log.timestamp.isoformat()}|{log.id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_audit_log_cursor(cursor):
+    """Return (timestamp, id) from a cursor; raises ValueError if malformed"""
+    raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    timestamp, log_id = raw.rsplit('|', 1)
+    return datetime.fromisoformat(timestamp), int(log_id)
+
+
+def approximate_audit_log_count(request, queryset):
+    """
+    Cheap total for the audit log list.
+
+    Unfiltered lists on PostgreSQL use the planner's row estimate from
+    pg_class; anything else is counted once and cached briefly per filter set.
+    """
+    filters = {name: request.GET[name] for name in AUDIT_LOG_FILTER_PARAMS if request.GET.get(name)}
+
+    if not filters and connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [AuditLog._meta.db_table])
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been analyzed
+        if row and row[0] >= 0:
+            return row[0]
+
+    cache_key = 'audit_log_count_' + hashlib.md5(json.dumps(filters, sort_keys=True).encode('utf-8')).hexdigest()
+    try:
+        count = cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"Audit log count cache get failed: {e}")
+        count = None
+    if count is None:
+        count = queryset.count()
+        try:
+            cache.set(cache_key, count, AUDIT_LOG_COUNT_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Audit log count cache set failed: {e}")
+    return count
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 def audit_log_list(request):
@@ -2125,6 +2064,9 @@ def audit_log_list(request):
     - end_date: Filter by end date (ISO format)
     - page: Page number (default: 1)
     - page_size: Items per page (default: 50)
+    - cursor: Switch to keyset pagination on (timestamp, id). Pass an empty
+      value for the first page, then the returned next_cursor.
+    - fields: Comma-separated serializer fields to return (default: all)
 
     Response:
     {
@@ -2133,6 +2075,15 @@ def audit_log_list(request):
         "previous": null,
         "results": [...audit logs...]
     }
+
+    Cursor mode response:
+    {
+        "count": 100,              # approximate
+        "count_is_estimate": true,
+        "next_cursor": "..." or null,
+        "page_size": 50,
+        "results": [...audit logs...]
+    }
     """
     user = request.user if request.user.is_authenticated else None
     if not user or not user.is_authenticated:
@@ -2140,7 +2091,7 @@ def audit_log_list(request):
 
     try:
         # Start with all audit logs, ordered by most recent first
-        queryset = AuditLog.objects.all().order_by('-timestamp')
+        queryset = AuditLog.objects.all().order_by('-timestamp', '-id')
 
         # Apply filters
         user_id = request.GET.get('user_id')
@@ -2185,16 +2136,54 @@ def audit_log_list(request):
         if page_size > settings.MAX_PAGE_SIZE:
             return JsonResponse({'error': f'Maximum page size is {settings.MAX_PAGE_SIZE}. Requested: {page_size}'}, status=400)
 
+        # Field selection - only load the columns the requested fields need
+        fields = None
+        related = ['user', 'customer']
+        fields_param = request.GET.get('fields')
+        if fields_param:
+            fields = [f.strip() for f in fields_param.split(',') if f.strip()]
+            unknown = set(fields) - set(AuditLogSerializer.Meta.fields)
+            if unknown:
+                return JsonResponse({'error': f"Unknown fields: {', '.join(sorted(unknown))}"}, status=400)
+            columns = AuditLogSerializer.columns_for(fields)
+            related = [name for name in related if any(c.startswith(f'{name}__') for c in columns)]
+            queryset = queryset.only(*columns)
+        if related:
+            queryset = queryset.select_related(*related)
+
+        if 'cursor' in request.GET:
+            total_count = approximate_audit_log_count(request, queryset)
+
+            cursor = request.GET.get('cursor')
+            if cursor:
+                cursor_timestamp, cursor_id = decode_audit_log_cursor(cursor)
+                queryset = queryset.filter(
+                    Q(timestamp__lt=cursor_timestamp) | Q(timestamp=cursor_timestamp, id__lt=cursor_id)
+                )
+
+            # One extra row tells us whether there is a next page without counting
+            logs = list(queryset[:page_size + 1])
+            has_more = len(logs) > page_size
+            logs = logs[:page_size]
+
+            return JsonResponse({
+                'count': total_count,
+                'count_is_estimate': True,
+                'next_cursor': encode_audit_log_cursor(logs[-1]) if has_more else None,
+                'page_size': page_size,
+                'results': AuditLogSerializer(logs, many=True, fields=fields).data
+            })
+
         # Calculate pagination
         total_count = queryset.count()
         start_index = (page - 1) * page_size
         end_index = start_index + page_size
 
         # Get page of results
-        logs = queryset.select_related('user', 'customer')[start_index:end_index]
+        logs = queryset[start_index:end_index]
 
         # Serialize
-        serializer = AuditLogSerializer(logs, many=True)
+        serializer = AuditLogSerializer(logs, many=True, fields=fields)
 
         # Build response
         response = {
@@ -2225,7 +2214,8 @@ def audit_log_purge(request):
 
     POST /api/core/audit-log/purge/
 
-    Deletes logs older than the retention period configured in AppSettings.
+    Deletes logs older than the retention period configured in AppSettings,
+    in short primary-key range batches so the table is never locked for long.
 
     Response:
     {
@@ -2254,13 +2244,14 @@ def audit_log_purge(request):
         # Calculate cutoff date
         cutoff_date = timezone.now() - timedelta(days=retention_days)
 
-        # Delete old logs
-        old_logs = AuditLog.objects.filter(timestamp__lt=cutoff_date)
-        deleted_count = old_logs.count()
-        old_logs.delete()
+        # Delete old logs in bounded batches
+        from .audit import log_audit_event, purge_audit_logs
+        deleted_count = purge_audit_logs(
+            cutoff_date,
+            progress_callback=lambda deleted, batches: logger.info(f"Audit purge: {deleted} deleted ({batches} batches)")
+        )
 
         # Log the purge action
-        from .audit import log_audit_event
         log_audit_event(
             user=user,
             action_type='DELETE',
@@ -2286,6 +2277,50 @@ def audit_log_purge(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@csrf_exempt
+@require_http_methods(["GET"])
+def request_metrics_report(request):
+    """
+    Slowest endpoints from the sampled request metrics (core.request_metrics).
+
+    GET /api/core/request-metrics/
+
+    Query params:
+    - sort: Field to sort by, descending (default: p95_ms)
+    - min_samples: Leave out endpoints with fewer samples (default: 1)
+    - limit: Endpoints returned (default: 50)
+
+    Response:
+    {
+        "sample_rate": 0.2,
+        "endpoints": [
+            {"endpoint": "GET /api/san/aliases/project/<int:project_id>/",
+             "samples": 40, "p95_ms": 812.4, "avg_queries": 23.5, ...}
+        ]
+    }
+    """
+    user = request.user if request.user.is_authenticated else None
+    if not user or not user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required'}, status=401)
+
+    if not (user.is_staff or user.is_superuser):
+        return JsonResponse({'error': 'Staff or superuser permission required'}, status=403)
+
+    sort = request.GET.get('sort', 'p95_ms')
+    if sort not in REPORT_SORT_FIELDS:
+        return JsonResponse({'error': f"Invalid sort field, expected one of {', '.join(REPORT_SORT_FIELDS)}"}, status=400)
+    try:
+        min_samples = int(request.GET.get('min_samples', 1))
+        limit = int(request.GET.get('limit', 50))
+    except ValueError:
+        return JsonResponse({'error': 'min_samples and limit must be integers'}, status=400)
+
+    return JsonResponse({
+        'sample_rate': getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 1.0),
+        'endpoints': slow_endpoint_report(min_samples=min_samples, sort=sort, limit=limit),
+    })
+
+
 # ========== PROJECT SUMMARY AND COMMIT VIEWS ==========
 
 @csrf_exempt
@@ -2320,7 +2355,7 @@ def project_summary_view(request, project_id):
         }
     }
     """
-    print(f"🔥 Project Summary - Project ID: {project_id}")
+    debug_log.debug('project summary request', project_id=project_id)
 
     user = request.user if request.user.is_authenticated else None
     if not user or not user.is_authenticated:
@@ -2413,6 +2448,7 @@ def project_summary_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@audit_batched_view('PROJECT', "Committed project")
 def commit_project_view(request, project_id):
     """
     Commit a project - applies all changes to customer data and locks the project.
@@ -2437,7 +2473,7 @@ def commit_project_view(request, project_id):
         }
     }
     """
-    print(f"🔥 Commit Project - Project ID: {project_id}")
+    debug_log.debug('commit project request', project_id=project_id)
 
     user = request.user if request.user.is_authenticated else None
     if not user or not user.is_authenticated:
@@ -2546,19 +2582,16 @@ def commit_project_view(request, project_id):
         project.status = 'finalized'
         project.save()
 
-        # Log audit event
-        try:
-            from .audit import log_audit_event
-            log_audit_event(
-                user=user,
-                action_type='UPDATE',
-                entity_type='PROJECT',
-                entity_id=project.id,
-                summary=f"Committed project '{project.name}'",
-                details=stats
-            )
-        except Exception as audit_error:
-            print(f"⚠️  Failed to log audit event: {audit_error}")
+        # Describe the commit in the single audit entry written for this request
+        audit_batch = current_audit_batch()
+        if audit_batch:
+            audit_batch.summary = f"Committed project '{project.name}'"
+            audit_batch.customer = project.customers.first()
+            audit_batch.details.update(project_id=project.id, **stats)
+
+        # Bulk updates above skip the model signals, so drop cached dashboards here
+        for customer_id in project.customers.values_list('id', flat=True):
+            bump_customer_cache_version(customer_id)
 
         return JsonResponse({
             'success': True,
@@ -2575,6 +2608,7 @@ def commit_project_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@audit_batched_view('PROJECT', "Deleted project", action_type='DELETE')
 def close_project_view(request, project_id):
     """
     Close and delete a project.
@@ -2590,7 +2624,7 @@ def close_project_view(request, project_id):
         "message": "Project deleted successfully"
     }
     """
-    print(f"🔥 Close/Delete Project - Project ID: {project_id}")
+    debug_log.debug('close/delete project request', project_id=project_id)
 
     user = request.user if request.user.is_authenticated else None
     if not user or not user.is_authenticated:
@@ -2616,27 +2650,21 @@ def close_project_view(request, project_id):
 
         print(f"🗑️  Deleted {aliases_count} aliases, {zones_count} zones, {fabrics_count} fabrics created by project '{project_name}'")
 
-        # Log audit event before deleting
-        try:
-            from .audit import log_audit_event
-            log_audit_event(
-                user=user,
-                action_type='DELETE',
-                entity_type='PROJECT',
-                entity_id=project.id,
-                summary=f"Deleted project '{project_name}'",
-                details={
-                    'was_committed': was_finalized,
-                    'project_name': project_name,
-                    'deleted_entities': {
-                        'aliases': aliases_count,
-                        'zones': zones_count,
-                        'fabrics': fabrics_count
-                    }
+        # Describe the deletion in the single audit entry written for this request
+        audit_batch = current_audit_batch()
+        if audit_batch:
+            audit_batch.summary = f"Deleted project '{project_name}'"
+            audit_batch.customer = project.customers.first()
+            audit_batch.details.update({
+                'project_id': project.id,
+                'was_committed': was_finalized,
+                'project_name': project_name,
+                'deleted_entities': {
+                    'aliases': aliases_count,
+                    'zones': zones_count,
+                    'fabrics': fabrics_count
                 }
-            )
-        except Exception as audit_error:
-            print(f"⚠️  Failed to log audit event: {audit_error}")
+            })
 
         # Delete the project (cascade will delete all ProjectAlias, ProjectZone, etc.)
         project.delete()
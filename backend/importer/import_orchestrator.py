@@ -17,11 +17,13 @@ from customers.models import Customer
 from core.models import ProjectAlias, ProjectZone, ProjectHost, ProjectFabric, ProjectSwitch, ProjectStorage, ProjectVolume
 from .parsers.base_parser import (
     ParseResult, ParsedFabric, ParsedAlias, ParsedZone, ParsedSwitch,
-    ParsedStorageSystem, ParsedVolume, ParsedHost, ParsedPort
+    ParsedStorageSystem, ParsedVolume, ParsedHost, ParsedPort, ParserFactory
 )
+# Parser modules register themselves with ParserFactory on import
 from .parsers.cisco_parser import CiscoParser
 from .parsers.brocade_parser import BrocadeParser
 from .parsers.insights_parser import InsightsParser
+from .parse_cache import load_parse_result, store_parse_result
 import logging
 
 logger = logging.getLogger(__name__)
@@ -112,24 +114,32 @@ class ImportOrchestrator:
         Returns:
             Dict with import statistics
         """
-        self._report_progress(0, 100, "Detecting data format...")
+        # Reuse the preview's parse result if the same payload was just previewed
+        cached = load_parse_result(data)
+        if cached:
+            parser_name, parse_result = cached
+            logger.info(f"Using cached {parser_name} parse result from preview")
+            self._report_progress(10, 100, f"Using previewed data ({parser_name})...")
+        else:
+            self._report_progress(0, 100, "Detecting data format...")
 
-        # Auto-detect parser (now includes InsightsParser)
-        parser = None
-        for parser_class in [InsightsParser, CiscoParser, BrocadeParser]:
-            test_parser = parser_class()
-            if test_parser.detect_format(data):
-                parser = test_parser
-                break
+            # Auto-detect parser from a bounded sample of the data
+            detected = ParserFactory.detect(data)
+            if not detected:
+                raise ValueError("Could not detect data format. Unsupported format.")
 
-        if not parser:
-            raise ValueError("Could not detect data format. Unsupported format.")
+            parser, confidence = detected
+            parser_name = parser.__class__.__name__
+            logger.info(f"Detected {parser_name} (confidence {confidence:.2f})")
 
-        parser_name = parser.__class__.__name__
-        self._report_progress(10, 100, f"Parsing data with {parser_name}...")
+            # Without a previewed result, stream Storage Insights pages straight
+            # into the database instead of fetching everything up front
+            if isinstance(parser, InsightsParser):
+                return self._import_storage_stream(parser, data)
+            self._report_progress(10, 100, f"Parsing data with {parser_name}...")
 
-        # Parse the data
-        parse_result = parser.parse(data)
+            # Parse the data
+            parse_result = parser.parse(data)
 
         # Store parse errors/warnings
         self.stats['errors'].extend(parse_result.errors)
@@ -169,24 +179,23 @@ class ImportOrchestrator:
         Returns:
             Dict with preview information
         """
-        # Auto-detect parser (including InsightsParser)
-        parser = None
-        for parser_class in [InsightsParser, CiscoParser, BrocadeParser]:
-            test_parser = parser_class()
-            if test_parser.detect_format(data):
-                parser = test_parser
-                break
-
-        if not parser:
+        # Auto-detect parser from a bounded sample of the data
+        detected = ParserFactory.detect(data)
+        if not detected:
             return {
                 'success': False,
                 'error': 'Could not detect data format. Unsupported format.',
                 'parser': None
             }
 
+        parser, confidence = detected
+
         # Parse the data
         parse_result = parser.parse(data)
 
+        # Cache before the preview mutates warnings so the import sees the raw result
+        store_parse_result(data, parser.__class__.__name__, parse_result)
+
         # Handle storage import preview differently
         if parse_result.import_type == 'storage':
             return self._preview_storage_import(parse_result)
@@ -314,6 +323,7 @@ class ImportOrchestrator:
         return {
             'success': True,
             'parser': parser.__class__.__name__,
+            'detection_confidence': confidence,
             'metadata': parse_result.metadata,
             'fabrics': [
                 {
@@ -1409,6 +1419,75 @@ class ImportOrchestrator:
             logger.error(error_msg)
             raise
 
+    def _import_storage_stream(self, parser: InsightsParser, data: str) -> Dict:
+        """
+        Import IBM Storage Insights data page by page as it is fetched.
+
+        Each page from InsightsParser.iter_parse() is written with the same
+        per-type import methods as _import_storage_data(), so memory stays
+        bounded by a few API pages and DB writes overlap with network fetches.
+
+        Args:
+            parser: InsightsParser chosen by format detection
+            data: JSON string with credentials and options
+
+        Returns:
+            Dict with import statistics. If some pages could not be fetched,
+            success is False, partial is True when anything was imported, and
+            the failures are listed in stats['errors'].
+        """
+        self._report_progress(20, 100, "Streaming storage data from IBM Storage Insights...")
+
+        importers = {
+            'storage_systems': self._import_storage_systems,
+            'volumes': self._import_volumes,
+            'hosts': self._import_hosts,
+            'ports': self._import_ports,
+        }
+        counts = {kind: 0 for kind in importers}
+
+        # Systems report their own volume and host counts, which gives a
+        # progress total before the pages arrive
+        expected = 0
+
+        try:
+            for kind, items in parser.iter_parse(data):
+                importers[kind](items)
+                counts[kind] += len(items)
+
+                if kind == 'storage_systems':
+                    expected = sum(
+                        (s.volumes_count or 0) + (s.host_connections_count or 0)
+                        for s in items
+                    )
+                    message = f"Imported {len(items)} storage systems"
+                else:
+                    message = f"Imported {counts['volumes']} volumes, {counts['hosts']} hosts"
+
+                done = counts['volumes'] + counts['hosts']
+                percent = 25 + int(70 * min(done / expected, 1)) if expected else 50
+                self._report_progress(percent, 100, message)
+
+        finally:
+            self.stats['errors'].extend(parser.errors)
+            self.stats['warnings'].extend(parser.warnings)
+
+        self._report_progress(100, 100, "Storage import complete!")
+
+        # Clear dashboard cache when import completes
+        try:
+            from core.dashboard_views import clear_dashboard_cache_for_customer
+            clear_dashboard_cache_for_customer(self.customer.id)
+        except Exception as e:
+            logger.warning(f"Failed to clear dashboard cache: {e}")
+
+        return {
+            'success': not parser.errors,
+            'partial': bool(parser.errors) and any(counts.values()),
+            'stats': self.stats,
+            'metadata': parser.metadata
+        }
+
     @transaction.atomic
     def _import_storage_systems(self, parsed_systems: List[ParsedStorageSystem]):
         """Import storage systems into database"""
@@ -1,38 +1,52 @@
 """
 Import logging utilities
 """
+from django.utils import timezone
+
+from core.buffered_log import BufferedLogWriter
 from .models import ImportLog
+from .progress_events import publish_import_log
 
 
 class ImportLogger:
-    """Helper class for logging import progress"""
-    
-    def __init__(self, import_record):
+    """
+    Helper class for logging import progress.
+
+    Entries are buffered and written in batches (see BufferedLogWriter);
+    call flush() when the import finishes. Non-debug lines are also
+    published to the import's progress stream straight away.
+    """
+
+    def __init__(self, import_record, flush_every=None, flush_interval=None):
         self.import_record = import_record
-    
+        self.writer = BufferedLogWriter(ImportLog, flush_every, flush_interval)
+
     def log(self, message, level='INFO', details=None):
         """Add a log entry for this import"""
-        try:
-            ImportLog.objects.create(
-                import_record=self.import_record,
-                level=level,
-                message=message,
-                details=details
-            )
-        except Exception as e:
-            # If logging fails, don't let it break the import
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to write import log: {e}. Original message: {message}")
-    
+        timestamp = timezone.now()
+        self.writer.add(
+            immediate=(level == 'ERROR'),
+            import_record=self.import_record,
+            level=level,
+            message=message,
+            details=details,
+            timestamp=timestamp
+        )
+        if level != 'DEBUG':
+            publish_import_log(self.import_record.id, level, message, timestamp)
+
+    def flush(self):
+        """Write any buffered entries"""
+        self.writer.flush()
+
     def debug(self, message, details=None):
         self.log(message, 'DEBUG', details)
-    
+
     def info(self, message, details=None):
         self.log(message, 'INFO', details)
-    
+
     def warning(self, message, details=None):
         self.log(message, 'WARNING', details)
-    
+
     def error(self, message, details=None):
         self.log(message, 'ERROR', details)
\ No newline at end of file
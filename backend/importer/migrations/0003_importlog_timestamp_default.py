@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:18
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('importer', '0002_storageimport_cancelled_storageimport_cancelled_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='importlog',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from customers.models import Customer
@@ -99,7 +100,7 @@ class ImportLog(models.Model):
     ]
     
     import_record = models.ForeignKey(StorageImport, on_delete=models.CASCADE, related_name='logs')
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)  # not auto_now_add: buffered entries keep their log time
     level = models.CharField(max_length=10, choices=LOG_LEVELS, default='INFO')
     message = models.TextField()
     details = models.JSONField(null=True, blank=True, help_text="Additional structured data")
@@ -0,0 +1,147 @@
+"""
+Parse result cache shared between preview and import.
+
+The universal importer parses the same payload twice: once in
+ImportOrchestrator.preview_import() and again in import_from_text() inside
+the Celery task. The preview stores its ParseResult here, keyed by a hash of
+the raw input, so the import can reuse it instead of re-running detection and
+parsing (and, for Storage Insights, re-fetching from the API).
+
+Results are stored as zlib-compressed JSON (None fields omitted) in the
+Django cache. Any cache failure is treated as a miss so the import still
+works without a cache.
+"""
+
+import hashlib
+import json
+import logging
+import zlib
+from dataclasses import MISSING, asdict, fields
+from typing import Optional, Tuple
+
+from django.core.cache import cache
+
+from .parsers.base_parser import (
+    ParseResult, ParsedFabric, ParsedAlias, ParsedZone, ParsedSwitch,
+    ParsedStorageSystem, ParsedVolume, ParsedHost, ParsedPort
+)
+
+logger = logging.getLogger(__name__)
+
+# How long a preview stays reusable by the subsequent import (seconds)
+PARSE_CACHE_TTL = 60 * 60
+
+# Bump when the serialized layout changes so stale entries are ignored
+PARSE_CACHE_VERSION = 1
+
+# ParseResult list fields and the dataclass each item is rebuilt into
+_ITEM_TYPES = {
+    'fabrics': ParsedFabric,
+    'aliases': ParsedAlias,
+    'zones': ParsedZone,
+    'switches': ParsedSwitch,
+    'storage_systems': ParsedStorageSystem,
+    'volumes': ParsedVolume,
+    'hosts': ParsedHost,
+    'ports': ParsedPort,
+}
+
+
+def content_hash(data: str) -> str:
+    """Return a stable hash of the raw import payload"""
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _cache_key(data: str) -> str:
+    return f"import_parse_v{PARSE_CACHE_VERSION}_{content_hash(data)}"
+
+
+def _compact(item) -> dict:
+    """Dataclass to dict, dropping None values the dataclass defaults restore"""
+    required = {f.name for f in fields(item) if f.default is MISSING and f.default_factory is MISSING}
+    return {k: v for k, v in asdict(item).items() if v is not None or k in required}
+
+
+def serialize_parse_result(parser_name: str, parse_result: ParseResult) -> bytes:
+    """Serialize a ParseResult to compressed JSON bytes"""
+    payload = {
+        'parser': parser_name,
+        'import_type': parse_result.import_type,
+        'errors': list(parse_result.errors),
+        'warnings': list(parse_result.warnings),
+        'metadata': parse_result.metadata,
+    }
+    for field_name in _ITEM_TYPES:
+        payload[field_name] = [_compact(item) for item in getattr(parse_result, field_name)]
+
+    raw = json.dumps(payload, separators=(',', ':'), default=str)
+    return zlib.compress(raw.encode('utf-8'))
+
+
+def deserialize_parse_result(blob: bytes) -> Tuple[str, ParseResult]:
+    """Rebuild (parser_name, ParseResult) from serialize_parse_result() output"""
+    payload = json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    items = {}
+    for field_name, item_class in _ITEM_TYPES.items():
+        # Ignore keys that are no longer fields on the dataclass
+        allowed = {f.name for f in fields(item_class)}
+        items[field_name] = [
+            item_class(**{k: v for k, v in item.items() if k in allowed})
+            for item in payload.get(field_name, [])
+        ]
+
+    parse_result = ParseResult(
+        errors=payload.get('errors', []),
+        warnings=payload.get('warnings', []),
+        metadata=payload.get('metadata', {}),
+        import_type=payload.get('import_type', 'san'),
+        **items
+    )
+    return payload['parser'], parse_result
+
+
+def store_parse_result(data: str, parser_name: str, parse_result: ParseResult) -> Optional[str]:
+    """
+    Cache a preview ParseResult for the given raw payload.
+
+    Results with parse errors are not cached so the import gets a fresh attempt.
+
+    Returns:
+        The content hash on success, None if nothing was stored
+    """
+    if parse_result.errors:
+        return None
+
+    try:
+        blob = serialize_parse_result(parser_name, parse_result)
+        cache.set(_cache_key(data), blob, PARSE_CACHE_TTL)
+        logger.info(f"Cached {parser_name} parse result ({len(blob)} bytes compressed)")
+        return content_hash(data)
+    except Exception as e:
+        logger.warning(f"Parse cache set failed: {e}, import will re-parse")
+        return None
+
+
+def load_parse_result(data: str, consume: bool = True) -> Optional[Tuple[str, ParseResult]]:
+    """
+    Look up a cached ParseResult for the given raw payload.
+
+    Args:
+        data: Raw payload exactly as previewed
+        consume: If True, remove the entry so a later import re-parses fresh data
+
+    Returns:
+        (parser_name, ParseResult) on a hit, None on a miss or cache failure
+    """
+    key = _cache_key(data)
+    try:
+        blob = cache.get(key)
+        if blob is None:
+            return None
+        if consume:
+            cache.delete(key)
+        return deserialize_parse_result(blob)
+    except Exception as e:
+        logger.warning(f"Parse cache get failed: {e}, proceeding without cache")
+        return None
@@ -13,6 +13,7 @@ from .base_parser import (
     ParsedVolume,
     ParsedHost,
     ParsedPort,
+    ParserFactory,
 )
 from .cisco_parser import CiscoParser
 from .brocade_parser import BrocadeParser
@@ -29,6 +30,7 @@ __all__ = [
     'ParsedVolume',
     'ParsedHost',
     'ParsedPort',
+    'ParserFactory',
     'CiscoParser',
     'BrocadeParser',
     'InsightsParser',
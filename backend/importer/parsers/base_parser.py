@@ -10,8 +10,12 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import re
 
+# Parsed* types use slots=True: a large Storage Insights import holds
+# hundreds of thousands of them at once, and slotted instances avoid a
+# per-object __dict__ (ParsedStorageSystem alone has ~100 fields).
 
-@dataclass
+
+@dataclass(slots=True)
 class ParsedFabric:
     """Represents a parsed SAN fabric"""
     name: str
@@ -22,7 +26,7 @@ class ParsedFabric:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedAlias:
     """Represents a parsed SAN alias"""
     name: str
@@ -37,7 +41,7 @@ class ParsedAlias:
         return self.wwpns[0] if self.wwpns else None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedZone:
     """Represents a parsed SAN zone"""
     name: str
@@ -47,7 +51,7 @@ class ParsedZone:
     fabric_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSwitch:
     """Represents a parsed SAN switch"""
     name: str
@@ -64,7 +68,7 @@ class ParsedSwitch:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedStorageSystem:
     """Represents a parsed storage system from IBM Storage Insights"""
     storage_system_id: str
@@ -193,7 +197,7 @@ class ParsedStorageSystem:
     cluster_id_alias: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedVolume:
     """Represents a parsed volume from IBM Storage Insights"""
     volume_id: str
@@ -251,7 +255,7 @@ class ParsedVolume:
     safeguarded_allocation_capacity_bytes: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedHost:
     """Represents a parsed host from IBM Storage Insights"""
     name: str
@@ -277,7 +281,7 @@ class ParsedHost:
     last_data_collection: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedPort:
     """Represents a SAN port from IBM Storage Insights"""
     port_id: str
@@ -367,6 +371,22 @@ class BaseParser(ABC):
         """
         pass
 
+    def detect_confidence(self, sample: str) -> float:
+        """
+        Score how likely this parser handles the data, from a bounded sample.
+
+        Called by ParserFactory with only the first DETECTION_SAMPLE_SIZE
+        characters of the input, so implementations must not assume the
+        sample is complete. The default runs detect_format() on the sample.
+
+        Args:
+            sample: Prefix of the raw input data
+
+        Returns:
+            Confidence between 0.0 (cannot handle) and 1.0 (certain)
+        """
+        return 1.0 if self.detect_format(sample) else 0.0
+
     def normalize_wwpn(self, wwpn: str) -> str:
         """
         Normalize WWPN to standard format (lowercase with colons).
@@ -439,33 +459,98 @@ class BaseParser(ABC):
 
 
 class ParserFactory:
-    """Factory for creating appropriate parsers based on input data"""
+    """
+    Factory for creating appropriate parsers based on input data.
+
+    Parsers register themselves with @ParserFactory.register_parser. Detection
+    scores every registered parser against a bounded prefix of the input and
+    picks the most confident one, so adding a format does not add another
+    full-text scan. Only when no parser recognises the sample does it fall
+    back to full-text detect_format() calls.
+    """
 
-    _parsers = []  # Will be populated with available parser classes
+    _parsers = []  # Populated by register_parser, in registration order
+
+    # Characters of input examined during detection
+    DETECTION_SAMPLE_SIZE = 64 * 1024
 
     @classmethod
     def register_parser(cls, parser_class):
-        """Register a parser class"""
-        cls._parsers.append(parser_class)
+        """Register a parser class (usable as a class decorator)"""
+        if parser_class not in cls._parsers:
+            cls._parsers.append(parser_class)
         return parser_class
 
     @classmethod
-    def get_parser(cls, data: str) -> Optional[BaseParser]:
+    def unregister_parser(cls, parser_class):
+        """Remove a previously registered parser class"""
+        if parser_class in cls._parsers:
+            cls._parsers.remove(parser_class)
+
+    @classmethod
+    def rank_parsers(cls, data: str) -> List[Tuple[BaseParser, float]]:
         """
-        Get appropriate parser for the given data.
+        Rank registered parsers by detection confidence on a sample of the data.
 
         Args:
             data: Raw input data
 
         Returns:
-            Parser instance that can handle the data, or None if no parser found
+            List of (parser instance, confidence) with confidence > 0, best
+            first. Ties keep registration order.
         """
+        sample = data[:cls.DETECTION_SAMPLE_SIZE]
+        ranked = []
         for parser_class in cls._parsers:
             parser = parser_class()
-            if parser.detect_format(data):
-                return parser
+            try:
+                confidence = parser.detect_confidence(sample)
+            except Exception:
+                confidence = 0.0
+            if confidence > 0:
+                ranked.append((parser, confidence))
+
+        # sort() is stable, so equal scores stay in registration order
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
+
+    @classmethod
+    def detect(cls, data: str) -> Optional[Tuple[BaseParser, float]]:
+        """
+        Choose the best parser for the data.
+
+        Args:
+            data: Raw input data
+
+        Returns:
+            (parser instance, confidence), or None if no parser can handle the data
+        """
+        ranked = cls.rank_parsers(data)
+        if ranked:
+            return ranked[0]
+
+        # Nothing recognised in the sample - the markers may sit further in
+        if len(data) > cls.DETECTION_SAMPLE_SIZE:
+            for parser_class in cls._parsers:
+                parser = parser_class()
+                if parser.detect_format(data):
+                    return parser, 0.5
         return None
 
+    @classmethod
+    def get_parser(cls, data: str) -> Optional[BaseParser]:
+        """
+        Get appropriate parser for the given data.
+
+        Args:
+            data: Raw input data
+
+        Returns:
+            Parser instance that can handle the data, or None if no parser found
+        """
+        detected = cls.detect(data)
+        return detected[0] if detected else None
+
     @classmethod
     def list_parsers(cls) -> List[str]:
         """List all registered parsers"""
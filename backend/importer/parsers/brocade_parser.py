@@ -24,6 +24,17 @@ logger = logging.getLogger(__name__)
 class BrocadeParser(BaseParser):
     """Parser for Brocade switch configurations"""
 
+    # Brocade-specific CSV headers or CLI output, with the detection
+    # confidence each one carries on its own
+    DETECTION_PATTERNS = [
+        (re.compile(r'Fabric Name,Fabric Principal Switch', re.IGNORECASE), 1.0),  # FabricSummary.csv
+        (re.compile(r'Fabric Name,Active Zone Config,Alias Name', re.IGNORECASE), 1.0),  # AliasInfo.csv
+        (re.compile(r'Fabric Name,Active Zone Config,Active Zones', re.IGNORECASE), 1.0),  # ZoneInfo.csv
+        (re.compile(r'Switch Name,Switch WWN,Model Number', re.IGNORECASE), 1.0),  # SwitchSummary.csv
+        (re.compile(r'Defined configuration:', re.IGNORECASE), 0.9),  # cfgshow output
+        (re.compile(r'Effective configuration:', re.IGNORECASE), 0.9),  # cfgshow output
+    ]
+
     def __init__(self):
         super().__init__()
         self.csv_type = None
@@ -34,19 +45,14 @@ class BrocadeParser(BaseParser):
 
         Look for Brocade-specific CSV headers or CLI output.
         """
-        brocade_indicators = [
-            r'Fabric Name,Fabric Principal Switch',  # FabricSummary.csv
-            r'Fabric Name,Active Zone Config,Alias Name',  # AliasInfo.csv
-            r'Fabric Name,Active Zone Config,Active Zones',  # ZoneInfo.csv
-            r'Switch Name,Switch WWN,Model Number',  # SwitchSummary.csv
-            r'Defined configuration:',  # cfgshow output
-            r'Effective configuration:',  # cfgshow output
-        ]
-
-        for pattern in brocade_indicators:
-            if re.search(pattern, data, re.IGNORECASE):
-                return True
-        return False
+        return any(pattern.search(data) for pattern, _ in self.DETECTION_PATTERNS)
+
+    def detect_confidence(self, sample: str) -> float:
+        """Confidence of the strongest Brocade indicator found in the sample"""
+        return max(
+            (confidence for pattern, confidence in self.DETECTION_PATTERNS if pattern.search(sample)),
+            default=0.0
+        )
 
     def parse(self, data: str) -> ParseResult:
         """Parse Brocade configuration data"""
@@ -24,6 +24,20 @@ from .base_parser import (
 class CiscoParser(BaseParser):
     """Parser for Cisco MDS switch configurations"""
 
+    # Characteristic Cisco commands or output patterns, with the detection
+    # confidence each one carries on its own
+    DETECTION_PATTERNS = [
+        (re.compile(r'`show tech-support', re.IGNORECASE), 1.0),
+        (re.compile(r'show device-alias database', re.IGNORECASE), 0.95),
+        (re.compile(r'show fcalias vsan', re.IGNORECASE), 0.95),
+        (re.compile(r'show zone vsan', re.IGNORECASE), 0.95),
+        (re.compile(r'show running-config', re.IGNORECASE), 0.8),
+        (re.compile(r'device-alias database', re.IGNORECASE), 0.9),
+        (re.compile(r'fcalias name \S+ vsan \d+\s*;', re.IGNORECASE), 0.9),  # Single-line fcalias format
+        (re.compile(r'fcalias name', re.IGNORECASE), 0.8),
+        (re.compile(r'zone name .* vsan', re.IGNORECASE), 0.8),
+    ]
+
     def __init__(self):
         super().__init__()
         self.current_section = None
@@ -35,22 +49,14 @@ class CiscoParser(BaseParser):
 
         Look for characteristic Cisco commands or output patterns.
         """
-        cisco_indicators = [
-            r'`show tech-support',
-            r'show device-alias database',
-            r'show fcalias vsan',
-            r'show zone vsan',
-            r'show running-config',
-            r'device-alias database',
-            r'fcalias name',
-            r'fcalias name \S+ vsan \d+\s*;',  # Single-line fcalias format
-            r'zone name .* vsan',
-        ]
-
-        for pattern in cisco_indicators:
-            if re.search(pattern, data, re.IGNORECASE):
-                return True
-        return False
+        return any(pattern.search(data) for pattern, _ in self.DETECTION_PATTERNS)
+
+    def detect_confidence(self, sample: str) -> float:
+        """Confidence of the strongest Cisco indicator found in the sample"""
+        return max(
+            (confidence for pattern, confidence in self.DETECTION_PATTERNS if pattern.search(sample)),
+            default=0.0
+        )
 
     def parse(self, data: str) -> ParseResult:
         """
@@ -6,27 +6,38 @@ Improvements over original:
 - Granular filtering options for selective imports
 - Better error handling and retry logic
 - Rate limiting with exponential backoff
+- Shared token-bucket pacing and adaptive (AIMD) concurrency
+- Per-endpoint latency and retry statistics
 - Smart caching for reference data
 - Detailed progress tracking
 """
 
 import requests
 import time
-from typing import Dict, List, Optional, Tuple, Callable
+from requests.adapters import HTTPAdapter
+import queue
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Callable
+from django.conf import settings
 from django.core.cache import cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+from .rate_control import AdaptiveConcurrencyLimit, RequestStats, TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
 class StorageInsightsClientV2:
     """Enhanced API client for IBM Storage Insights with parallel request support"""
 
+    API_ROOT = "https://insights.ibm.com/restapi/v1"
+    PAGE_SIZE = 500
+
     def __init__(self, tenant_id: str, api_key: str, max_workers: int = 5):
         self.tenant_id = tenant_id
         self.api_key = api_key
-        self.base_url = f"https://insights.ibm.com/restapi/v1/tenants/{tenant_id}"
+        self.base_url = f"{self.API_ROOT}/tenants/{tenant_id}"
         self.max_workers = max_workers
         self.session = requests.Session()
         self.session.headers.update({
@@ -34,6 +45,24 @@ class StorageInsightsClientV2:
             'Accept': 'application/json'
         })
 
+        # One pooled connection per worker so parallel fetches don't churn sockets
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # max_workers is the ceiling; the in-flight limit adapts below it
+        # Shared request budget across all worker threads
+        self.rate_limiter = TokenBucket(
+            getattr(settings, 'INSIGHTS_REQUESTS_PER_SECOND', 10),
+            getattr(settings, 'INSIGHTS_REQUEST_BURST', 10),
+        )
+        self.max_retry_after = getattr(settings, 'INSIGHTS_MAX_RETRY_AFTER', 60)
+        self.concurrency = AdaptiveConcurrencyLimit(initial=max_workers, maximum=max_workers)
+        self.stats = RequestStats()
+
+        # Sources iter_all_data() could not fetch completely, one message each
+        self.fetch_errors = []
+
     def _get_auth_token(self) -> str:
         """Get authentication token with caching"""
         cache_key = f"insights_token_{self.tenant_id}"
@@ -74,19 +103,38 @@ class StorageInsightsClientV2:
         params: Optional[Dict] = None,
         max_retries: int = 3
     ) -> Dict:
-        """Make authenticated API request with retry logic and exponential backoff"""
+        """
+        Make authenticated API request with retry logic and exponential backoff.
+
+        Requests are paced by the shared token bucket and the adaptive
+        concurrency limit. A 429 pauses the bucket for all threads (honouring
+        Retry-After, capped at INSIGHTS_MAX_RETRY_AFTER) and, like a 5xx,
+        halves the concurrency limit.
+        """
         token = self._get_auth_token()
         headers = {'x-api-token': token, 'Accept': 'application/json'}
         url = f"{self.base_url}/{endpoint}"
 
         for attempt in range(max_retries):
+            if attempt:
+                self.stats.record_retry(endpoint)
+
             try:
-                response = self.session.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    timeout=60
-                )
+                with self.concurrency.slot():
+                    self.rate_limiter.acquire()
+                    started = time.monotonic()
+                    try:
+                        response = self.session.get(
+                            url,
+                            headers=headers,
+                            params=params,
+                            timeout=60
+                        )
+                    except requests.exceptions.RequestException:
+                        self.stats.record(endpoint, time.monotonic() - started)
+                        self.concurrency.on_congestion()
+                        raise
+                    self.stats.record(endpoint, time.monotonic() - started, response.status_code)
 
                 if response.status_code == 401:
                     # Token expired, clear cache and retry once
@@ -102,24 +150,43 @@ class StorageInsightsClientV2:
                         raise Exception("Authentication failed after token refresh")
 
                 if response.status_code == 429:
-                    # Rate limited, exponential backoff
-                    wait_time = (2 ** attempt) * 1
-                    logger.warning(f"Rate limited, waiting {wait_time}s before retry")
-                    time.sleep(wait_time)
+                    # Rate limited - pause every thread, not just this one
+                    wait_time = min(
+                        self._retry_after(response, default=(2 ** attempt) * 1),
+                        self.max_retry_after
+                    )
+                    logger.warning(f"Rate limited, pausing requests for {wait_time}s before retry")
+                    self.concurrency.on_congestion()
+                    self.rate_limiter.pause(wait_time)
                     continue
 
+                if response.status_code >= 500:
+                    self.concurrency.on_congestion()
+                else:
+                    self.concurrency.on_success()
+
                 response.raise_for_status()
                 return response.json()
 
             except requests.exceptions.RequestException as e:
                 if attempt == max_retries - 1:
+                    self.stats.record_failure(endpoint)
                     raise
                 wait_time = (2 ** attempt) * 0.5
                 logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {wait_time}s: {e}")
                 time.sleep(wait_time)
 
+        self.stats.record_failure(endpoint)
         raise Exception(f"Max retries exceeded for {endpoint}")
 
+    @staticmethod
+    def _retry_after(response, default: float) -> float:
+        """Seconds to wait from a Retry-After header, or the default"""
+        try:
+            return max(0.0, float(response.headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            return default
+
     def get_storage_systems(
         self,
         filters: Optional[Dict] = None,
@@ -223,8 +290,18 @@ class StorageInsightsClientV2:
     ) -> List[Dict]:
         """Get all volumes for a storage system with pagination"""
         all_volumes = []
+        for volumes in self.iter_volume_pages(storage_system_id, filters):
+            all_volumes.extend(volumes)
+        return all_volumes
+
+    def iter_volume_pages(
+        self,
+        storage_system_id: str,
+        filters: Optional[Dict] = None
+    ) -> Iterator[List[Dict]]:
+        """Yield volumes for a storage system one API page at a time"""
         offset = 1
-        limit = 500
+        limit = self.PAGE_SIZE
 
         while True:
             endpoint = f"storage-systems/{storage_system_id}/volumes"
@@ -236,6 +313,9 @@ class StorageInsightsClientV2:
             if not volumes:
                 break
 
+            # Check if there are more pages before filtering shrinks the list
+            last_page = len(volumes) < limit
+
             # Apply filters
             if filters:
                 if 'pool' in filters and filters['pool']:
@@ -245,16 +325,14 @@ class StorageInsightsClientV2:
                 if 'type' in filters and filters['type']:
                     volumes = [v for v in volumes if v.get('type', '').lower() == filters['type'].lower()]
 
-            all_volumes.extend(volumes)
+            if volumes:
+                yield volumes
 
-            # Check if there are more pages
-            if len(volumes) < limit:
+            if last_page:
                 break
 
             offset += limit
 
-        return all_volumes
-
     def get_hosts_parallel(
         self,
         storage_system_ids: List[str],
@@ -314,8 +392,18 @@ class StorageInsightsClientV2:
     ) -> List[Dict]:
         """Get all hosts for a storage system with pagination"""
         all_hosts = []
+        for hosts in self.iter_host_pages(storage_system_id, filters):
+            all_hosts.extend(hosts)
+        return all_hosts
+
+    def iter_host_pages(
+        self,
+        storage_system_id: str,
+        filters: Optional[Dict] = None
+    ) -> Iterator[List[Dict]]:
+        """Yield host connections for a storage system one API page at a time"""
         offset = 1
-        limit = 500
+        limit = self.PAGE_SIZE
 
         while True:
             endpoint = f"storage-systems/{storage_system_id}/host-connections"
@@ -327,6 +415,8 @@ class StorageInsightsClientV2:
             if not hosts:
                 break
 
+            last_page = len(hosts) < limit
+
             # Apply filters
             if filters:
                 if 'os_type' in filters and filters['os_type']:
@@ -334,14 +424,21 @@ class StorageInsightsClientV2:
                 if 'status' in filters and filters['status']:
                     hosts = [h for h in hosts if h.get('status', '').lower() == filters['status'].lower()]
 
-            all_hosts.extend(hosts)
+            if hosts:
+                yield hosts
 
-            if len(hosts) < limit:
+            if last_page:
                 break
 
             offset += limit
 
-        return all_hosts
+    def iter_port_pages(self, storage_system_id: str) -> Iterator[List[Dict]]:
+        """Yield ports for a storage system (the endpoint is not paginated)"""
+        # Note: Adjust endpoint based on actual API documentation
+        data = self._make_request(f"storage-systems/{storage_system_id}/ports")
+        ports = data.get('data', [])
+        if ports:
+            yield ports
 
     def get_ports_parallel(
         self,
@@ -365,10 +462,7 @@ class StorageInsightsClientV2:
         def fetch_ports_for_system(system_id: str) -> Tuple[str, List[Dict]]:
             """Fetch ports for a single system"""
             try:
-                # Note: Adjust endpoint based on actual API documentation
-                endpoint = f"storage-systems/{system_id}/ports"
-                data = self._make_request(endpoint)
-                ports = data.get('data', [])
+                ports = [p for page in self.iter_port_pages(system_id) for p in page]
                 return (system_id, ports)
             except Exception as e:
                 logger.warning(f"Error fetching ports for {system_id}: {e}")
@@ -394,6 +488,20 @@ class StorageInsightsClientV2:
 
         return ports_by_system
 
+    def _get_selected_systems(self, storage_system_ids: Optional[List[str]] = None) -> List[Dict]:
+        """Fetch the given storage systems, or all systems if none are given"""
+        if not storage_system_ids:
+            return self.get_storage_systems()
+
+        # Fetch specific systems - extract 'data' from response (which is a list)
+        systems_list = []
+        for sys_id in storage_system_ids:
+            response = self._make_request(f"storage-systems/{sys_id}")
+            data_list = response.get('data', [])
+            # data is a list, even for single system - extend our list
+            systems_list.extend(data_list)
+        return systems_list
+
     def get_all_data_optimized(
         self,
         storage_system_ids: Optional[List[str]] = None,
@@ -435,18 +543,7 @@ class StorageInsightsClientV2:
             if progress_callback:
                 progress_callback(0, 100, "Fetching storage systems...")
 
-            if storage_system_ids:
-                # Fetch specific systems - extract 'data' from response (which is a list)
-                systems_list = []
-                for sys_id in storage_system_ids:
-                    response = self._make_request(f"storage-systems/{sys_id}")
-                    data_list = response.get('data', [])
-                    # data is a list, even for single system - extend our list
-                    systems_list.extend(data_list)
-                result['storage_systems'] = systems_list
-            else:
-                # Fetch all systems
-                result['storage_systems'] = self.get_storage_systems()
+            result['storage_systems'] = self._get_selected_systems(storage_system_ids)
 
         system_ids = storage_system_ids or [
             s.get('storage_system_id') or s.get('serial')
@@ -493,3 +590,102 @@ class StorageInsightsClientV2:
             progress_callback(100, 100, "Data fetch complete!")
 
         return result
+
+    def iter_all_data(
+        self,
+        storage_system_ids: Optional[List[str]] = None,
+        import_options: Optional[Dict] = None,
+        max_buffered_pages: int = 8
+    ) -> Iterator[Tuple[str, Optional[str], List[Dict]]]:
+        """
+        Stream storage data one API page at a time.
+
+        Storage systems are yielded first, as a single batch. Volume, host and
+        port pages are then fetched by up to max_workers threads and yielded as
+        they arrive, so the caller can write each page to the database while
+        the next ones download. At most max_buffered_pages pages are held in
+        memory; fetch threads block until the caller catches up.
+
+        Args:
+            storage_system_ids: Optional list of specific system IDs to fetch
+            import_options: Same flags as get_all_data_optimized()
+            max_buffered_pages: Bound on pages fetched but not yet consumed
+
+        Yields:
+            (kind, storage_system_id, records) where kind is one of
+            'storage_systems', 'volumes', 'hosts', 'ports'. storage_system_id
+            is None for the storage_systems batch.
+
+        A system whose volume, host or port pages fail is skipped for that
+        kind and recorded in self.fetch_errors; the other sources continue.
+        """
+        if import_options is None:
+            import_options = {
+                'storage_systems': True,
+                'volumes': True,
+                'hosts': True,
+                'ports': False
+            }
+
+        systems = []
+        if import_options.get('storage_systems', True):
+            systems = self._get_selected_systems(storage_system_ids)
+            yield ('storage_systems', None, systems)
+
+        system_ids = storage_system_ids or [
+            s.get('storage_system_id') or s.get('serial')
+            for s in systems
+        ]
+
+        page_sources = []
+        if import_options.get('volumes', True):
+            page_sources += [('volumes', sys_id, self.iter_volume_pages) for sys_id in system_ids]
+        if import_options.get('hosts', True):
+            page_sources += [('hosts', sys_id, self.iter_host_pages) for sys_id in system_ids]
+        if import_options.get('ports', False):
+            page_sources += [('ports', sys_id, self.iter_port_pages) for sys_id in system_ids]
+
+        if not page_sources:
+            return
+
+        pages = queue.Queue(maxsize=max_buffered_pages)
+        stop = threading.Event()
+        source_done = object()
+
+        def put(item) -> bool:
+            # Block while the buffer is full, but give up if the consumer went away
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch_source(kind: str, system_id: str, page_iter: Callable):
+            try:
+                for records in page_iter(system_id):
+                    if not put((kind, system_id, records)):
+                        return
+            except Exception as e:
+                error_msg = f"Failed to fetch {kind} for storage system {system_id}: {e}"
+                logger.error(error_msg)
+                self.fetch_errors.append(error_msg)
+            finally:
+                put(source_done)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for kind, system_id, page_iter in page_sources:
+                executor.submit(fetch_source, kind, system_id, page_iter)
+
+            remaining = len(page_sources)
+            while remaining:
+                item = pages.get()
+                if item is source_done:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -7,10 +7,10 @@ It treats API credentials as a "parseable source" just like Cisco/Brocade CLI te
 
 from .base_parser import (
     BaseParser, ParseResult,
-    ParsedStorageSystem, ParsedVolume, ParsedHost, ParsedPort
+    ParsedStorageSystem, ParsedVolume, ParsedHost, ParsedPort, ParserFactory
 )
 from .insights_api_client_v2 import StorageInsightsClientV2
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 import json
 import logging
 import re
@@ -18,6 +18,7 @@ import re
 logger = logging.getLogger(__name__)
 
 
+@ParserFactory.register_parser
 class InsightsParser(BaseParser):
     """Parser for IBM Storage Insights API data"""
 
@@ -44,6 +45,20 @@ class InsightsParser(BaseParser):
         except:
             return False
 
+    def detect_confidence(self, sample: str) -> float:
+        """
+        Credentials are a small JSON object, so avoid json.loads() on anything
+        that does not start like one (e.g. multi-MB CLI text).
+        """
+        if not sample.lstrip().startswith('{'):
+            return 0.0
+        if self.detect_format(sample):
+            return 1.0
+        # Sample may be a truncated prefix of a larger JSON document
+        if '"tenant_id"' in sample and '"api_key"' in sample:
+            return 0.6
+        return 0.0
+
     def parse(self, data: str) -> ParseResult:
         """
         Parse IBM Storage Insights API credentials and fetch data.
@@ -91,6 +106,7 @@ class InsightsParser(BaseParser):
             )
 
             logger.info(f"InsightsParser: Received {len(api_data['storage_systems'])} storage systems")
+            self._add_api_stats()
 
             # Transform API data to ParseResult
             storage_systems = self._parse_storage_systems(
@@ -135,6 +151,7 @@ class InsightsParser(BaseParser):
             error_msg = f"Failed to fetch from IBM Storage Insights: {str(e)}"
             logger.error(f"InsightsParser: {error_msg}")
             self.add_error(error_msg)
+            self._add_api_stats()
             return ParseResult(
                 fabrics=[], aliases=[], zones=[], switches=[],
                 storage_systems=[], volumes=[], hosts=[], ports=[],
@@ -143,6 +160,85 @@ class InsightsParser(BaseParser):
                 import_type='storage'
             )
 
+    def iter_parse(self, data: str) -> Iterator[Tuple[str, List]]:
+        """
+        Streaming variant of parse().
+
+        Fetches from IBM Storage Insights page by page and yields each page as
+        soon as it has been transformed, instead of building the full
+        ParseResult. Storage systems always come first so callers can create
+        them before any of their volumes or hosts arrive.
+
+        Args:
+            data: JSON string with credentials and options
+
+        Yields:
+            (kind, items) where kind is 'storage_systems', 'volumes', 'hosts'
+            or 'ports' and items is a list of the matching Parsed* objects.
+            Fetch failures are recorded in self.errors: a failed storage
+            systems request ends the stream, a failed page of one system
+            leaves that system's volumes, hosts or ports out.
+        """
+        config = json.loads(data)
+
+        tenant_id = config['tenant_id']
+        api_key = config['api_key']
+        selected_systems = config.get('selected_systems', None)
+        import_options = config.get('import_options', {
+            'storage_systems': True,
+            'volumes': True,
+            'hosts': True,
+            'ports': False
+        })
+
+        self.client = StorageInsightsClientV2(
+            tenant_id=tenant_id,
+            api_key=api_key,
+            max_workers=5
+        )
+
+        self.add_metadata('tenant_id', tenant_id)
+        self.add_metadata('import_options', import_options)
+        self.add_metadata('selected_systems', selected_systems)
+        self.add_metadata('parser', 'InsightsParser')
+        self.add_metadata('streaming', True)
+
+        logger.info(f"InsightsParser: Streaming data from IBM Storage Insights for tenant {tenant_id}")
+
+        transforms = {
+            'storage_systems': lambda system_id, records: self._parse_storage_systems(records),
+            'volumes': lambda system_id, records: self._parse_volumes({system_id: records}),
+            'hosts': lambda system_id, records: self._parse_hosts({system_id: records}),
+            'ports': lambda system_id, records: self._parse_ports({system_id: records}),
+        }
+
+        try:
+            for kind, system_id, records in self.client.iter_all_data(
+                storage_system_ids=selected_systems,
+                import_options=import_options
+            ):
+                items = transforms[kind](system_id, records)
+                if items:
+                    yield kind, items
+        except Exception as e:
+            error_msg = f"Failed to fetch from IBM Storage Insights: {str(e)}"
+            logger.error(f"InsightsParser: {error_msg}")
+            self.add_error(error_msg)
+        finally:
+            if self.client:
+                for error_msg in self.client.fetch_errors:
+                    self.add_error(error_msg)
+            self._add_api_stats()
+
+    def _add_api_stats(self):
+        """Record per-endpoint latency/retry stats and the final concurrency limit"""
+        if self.client:
+            self.add_metadata('api_stats', {
+                'endpoints': self.client.stats.summary(),
+                'concurrency_limit': self.client.concurrency.limit,
+                'max_workers': self.client.max_workers,
+            })
+
     def _parse_storage_systems(self, systems_data: List[Dict]) -> List[ParsedStorageSystem]:
         """Transform API storage systems to ParsedStorageSystem objects"""
         parsed_systems = []
@@ -293,10 +389,16 @@ class InsightsParser(BaseParser):
         return parsed_systems
 
     def _parse_volumes(self, volumes_by_system: Dict[str, List[Dict]]) -> List[ParsedVolume]:
-        """Transform API volumes to ParsedVolume objects"""
+        """
+        Transform API volumes to ParsedVolume objects.
+
+        Consumes volumes_by_system so each system's raw API dicts are freed
+        as soon as they have been converted.
+        """
         parsed_volumes = []
 
-        for system_id, volumes in volumes_by_system.items():
+        for system_id in list(volumes_by_system):
+            volumes = volumes_by_system.pop(system_id)
             for volume in volumes:
                 try:
                     volume_id = volume.get('volume_id')
@@ -366,10 +468,16 @@ class InsightsParser(BaseParser):
         return parsed_volumes
 
     def _parse_hosts(self, hosts_by_system: Dict[str, List[Dict]]) -> List[ParsedHost]:
-        """Transform API hosts to ParsedHost objects"""
+        """
+        Transform API hosts to ParsedHost objects.
+
+        Consumes hosts_by_system so each system's raw API dicts are freed
+        as soon as they have been converted.
+        """
         parsed_hosts = []
 
-        for system_id, hosts in hosts_by_system.items():
+        for system_id in list(hosts_by_system):
+            hosts = hosts_by_system.pop(system_id)
             for host in hosts:
                 try:
                     name = host.get('name', '')
@@ -410,10 +518,16 @@ class InsightsParser(BaseParser):
         return parsed_hosts
 
     def _parse_ports(self, ports_by_system: Dict[str, List[Dict]]) -> List[ParsedPort]:
-        """Transform API ports to ParsedPort objects"""
+        """
+        Transform API ports to ParsedPort objects.
+
+        Consumes ports_by_system so each system's raw API dicts are freed
+        as soon as they have been converted.
+        """
         parsed_ports = []
 
-        for system_id, ports in ports_by_system.items():
+        for system_id in list(ports_by_system):
+            ports = ports_by_system.pop(system_id)
             for port in ports:
                 try:
                     port_id = port.get('port_id') or port.get('id')
@@ -0,0 +1,203 @@
+"""
+Request pacing helpers for the IBM Storage Insights API client.
+
+- TokenBucket: shared request-rate limiter. A 429 pauses the bucket for
+  every thread at once instead of each thread sleeping on its own.
+- AdaptiveConcurrencyLimit: AIMD cap on in-flight requests. It grows by
+  about one slot per window of successes and halves on 429/5xx.
+- RequestStats: per-endpoint latency and retry counters, included in
+  import results.
+"""
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all worker threads of a client"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    # Tolerate float rounding so a refill that lands a hair
+                    # under one token does not spin on sub-ulp sleeps
+                    if self._tokens >= 1 - 1e-9:
+                        self._tokens = max(0.0, self._tokens - 1)
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stop all callers for the given time (e.g. honouring Retry-After)"""
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            # Start the post-pause period empty so threads do not burst back in
+            self._tokens = 0
+            self._updated = self._paused_until
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    Additive-increase / multiplicative-decrease limit on in-flight requests.
+
+    Each success adds 1/limit, so the limit grows by about one per full
+    window of successful requests. Congestion (429 or 5xx) halves it, at most
+    once per cooldown so a burst of failures from the same window counts once.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = None,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.minimum = minimum
+        self.maximum = maximum or initial
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._limit = float(min(max(initial, minimum), self.maximum))
+        self._in_flight = 0
+        self._clock = clock
+        self._last_decrease = None
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """Hold one in-flight slot for the duration of a request"""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def on_success(self):
+        with self._cond:
+            self._limit = min(self.maximum, self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def on_congestion(self):
+        with self._cond:
+            now = self._clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(self.minimum, self._limit * self.decrease_factor)
+
+
+class RequestStats:
+    """Per-endpoint request counters, safe to update from worker threads"""
+
+    # Storage system IDs and similar path segments collapse to a placeholder
+    _ID_SEGMENT = re.compile(r'^(storage-systems)/[^/]+')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict] = {}
+
+    @classmethod
+    def endpoint_key(cls, endpoint: str) -> str:
+        return cls._ID_SEGMENT.sub(r'\1/{id}', endpoint)
+
+    def _entry(self, endpoint: str) -> Dict:
+        key = self.endpoint_key(endpoint)
+        if key not in self._endpoints:
+            self._endpoints[key] = {
+                'requests': 0,
+                'retries': 0,
+                'rate_limited': 0,
+                'server_errors': 0,
+                'failures': 0,
+                'total_seconds': 0.0,
+                'max_seconds': 0.0,
+            }
+        return self._endpoints[key]
+
+    def record(self, endpoint: str, seconds: float, status_code: int = None):
+        """Record one HTTP round trip"""
+        with self._lock:
+            entry = self._entry(endpoint)
+            entry['requests'] += 1
+            entry['total_seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            if status_code == 429:
+                entry['rate_limited'] += 1
+            elif status_code is not None and status_code >= 500:
+                entry['server_errors'] += 1
+
+    def record_retry(self, endpoint: str):
+        with self._lock:
+            self._entry(endpoint)['retries'] += 1
+
+    def record_failure(self, endpoint: str):
+        with self._lock:
+            self._entry(endpoint)['failures'] += 1
+
+    def summary(self) -> Dict[str, Dict]:
+        """JSON-serializable snapshot with average and max latency in ms"""
+        with self._lock:
+            result = {}
+            for key, entry in self._endpoints.items():
+                requests = entry['requests']
+                result[key] = {
+                    'requests': requests,
+                    'retries': entry['retries'],
+                    'rate_limited': entry['rate_limited'],
+                    'server_errors': entry['server_errors'],
+                    'failures': entry['failures'],
+                    'avg_ms': round(1000 * entry['total_seconds'] / requests, 1) if requests else 0.0,
+                    'max_ms': round(1000 * entry['max_seconds'], 1),
+                }
+            return result
@@ -0,0 +1,229 @@
+"""
+Push-based import progress.
+
+The import task publishes progress ticks, log lines and status changes here,
+and import_events() streams them to the browser as Server-Sent Events. Each
+watcher then reads a few cache keys per poll interval instead of hitting the
+database and the Celery result backend on every poll of import_progress.
+
+Events live in the Django cache (Redis in production) as a numbered log per
+import:
+
+    import_events_<id>_seq      last event number
+    import_events_<id>_<n>      event n: {'id', 'event', 'data'}
+    import_events_<id>_state    latest progress/status snapshot for new watchers
+
+import_events() is a short long-poll with Server-Sent Events framing: it
+answers at once with the events after Last-Event-ID, or waits at most
+LONG_POLL_MAX_WAIT seconds for new ones, then ends the response. A watcher
+therefore never holds a sync gunicorn worker for long. EventSource reconnects
+after STREAM_RETRY_MS by itself and resumes from Last-Event-ID. The
+Universal Importer page follows imports this way and only falls back to
+polling import_progress when EventSource is unavailable.
+
+The local-memory cache used in development is not shared with the Celery
+worker, so a poll that found no events also reads the import status from the
+database and sends 'done' when the import has finished. Publishing
+never raises: a cache failure only costs the live view, not the import.
+"""
+
+import json
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# How long published events stay readable (seconds)
+IMPORT_EVENT_TTL = 60 * 60
+
+# Long-poll tuning (seconds)
+LONG_POLL_INTERVAL = 0.5
+LONG_POLL_MAX_WAIT = 2.0
+
+# A watcher further behind than this skips to the latest snapshot
+MAX_EVENTS_PER_READ = 200
+
+# Browser reconnect delay sent with each response (milliseconds)
+STREAM_RETRY_MS = 1000
+
+TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+# Shared by every active_imports_count poll; cleared on each status change
+ACTIVE_IMPORTS_CACHE_KEY = 'importer_active_imports_count'
+ACTIVE_IMPORTS_CACHE_TTL = 10
+
+
+def _seq_key(import_id):
+    return f"import_events_{import_id}_seq"
+
+
+def _event_key(import_id, seq):
+    return f"import_events_{import_id}_{seq}"
+
+
+def _state_key(import_id):
+    return f"import_events_{import_id}_state"
+
+
+def publish_import_event(import_id, event, data):
+    """
+    Append one event to an import's event log.
+
+    Returns:
+        The event number, or None if the cache is unavailable
+    """
+    try:
+        cache.add(_seq_key(import_id), 0, IMPORT_EVENT_TTL)
+        seq = cache.incr(_seq_key(import_id))
+        cache.set(_event_key(import_id, seq), {'id': seq, 'event': event, 'data': data}, IMPORT_EVENT_TTL)
+        return seq
+    except Exception as e:
+        logger.warning(f"Could not publish {event} event for import {import_id}: {e}")
+        return None
+
+
+def _update_state(import_id, **changes):
+    try:
+        state = cache.get(_state_key(import_id)) or {'import_id': import_id}
+        state.update(changes)
+        cache.set(_state_key(import_id), state, IMPORT_EVENT_TTL)
+        return state
+    except Exception as e:
+        logger.warning(f"Could not store progress state for import {import_id}: {e}")
+        return None
+
+
+def publish_import_progress(import_id, current, total, message):
+    """Publish an orchestrator progress tick"""
+    progress = {'current': current, 'total': total, 'message': message}
+    _update_state(import_id, status='running', progress=progress)
+    publish_import_event(import_id, 'progress', progress)
+
+
+def publish_import_log(import_id, level, message, timestamp=None):
+    """Publish one import log line"""
+    publish_import_event(import_id, 'log', {
+        'level': level,
+        'message': message,
+        'timestamp': timestamp.isoformat() if timestamp else None,
+    })
+
+
+def publish_import_status(import_id, status, **data):
+    """
+    Publish a status change. A terminal status is sent as a 'done' event,
+    which ends every open stream for the import.
+    """
+    _update_state(import_id, status=status, **data)
+    event = 'done' if status in TERMINAL_STATUSES else 'status'
+    publish_import_event(import_id, event, {'status': status, **data})
+    try:
+        cache.delete(ACTIVE_IMPORTS_CACHE_KEY)
+    except Exception:
+        pass
+
+
+def get_import_state(import_id):
+    """Latest published snapshot, or None"""
+    try:
+        return cache.get(_state_key(import_id))
+    except Exception:
+        return None
+
+
+def last_event_id(import_id):
+    """Number of the newest published event (0 if none)"""
+    try:
+        return cache.get(_seq_key(import_id)) or 0
+    except Exception:
+        return 0
+
+
+def read_import_events(import_id, after=0):
+    """
+    Return (events, last_seq) for events numbered above `after`.
+
+    If more than MAX_EVENTS_PER_READ are pending, only the newest batch is
+    returned; the caller should resend the snapshot so nothing is lost.
+    """
+    last_seq = last_event_id(import_id)
+    if last_seq <= after:
+        return [], after
+
+    start = max(after + 1, last_seq - MAX_EVENTS_PER_READ + 1)
+    keys = [_event_key(import_id, seq) for seq in range(start, last_seq + 1)]
+    try:
+        found = cache.get_many(keys)
+    except Exception:
+        return [], after
+    # Expired entries are skipped rather than waited for
+    return [found[key] for key in keys if key in found], last_seq
+
+
+def format_sse(event, data, event_id=None):
+    """Encode one Server-Sent Events message"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return '\n'.join(lines) + '\n\n'
+
+
+def import_event_stream(
+    import_id,
+    snapshot,
+    resume_from=None,
+    load_status=None,
+    poll_interval=LONG_POLL_INTERVAL,
+    max_wait=LONG_POLL_MAX_WAIT,
+    clock=time.monotonic,
+    sleep=time.sleep
+):
+    """
+    Generate the SSE body of one long-poll response.
+
+    A first request gets the snapshot right away. A resuming one gets the
+    events after `resume_from` as soon as there are any, waiting at most
+    `max_wait` seconds for them.
+
+    Args:
+        import_id: StorageImport id
+        snapshot: Current state, sent to a first request
+        resume_from: Last-Event-ID sent by a reconnecting browser (None
+            on a first request)
+        load_status: Callable returning (status, extra_data) from the DB,
+            read once when no events arrived
+    """
+    yield f"retry: {STREAM_RETRY_MS}\n\n"
+
+    if resume_from is None:
+        # Start from the current position; the snapshot covers earlier events
+        seq = last_event_id(import_id)
+        if snapshot.get('status') in TERMINAL_STATUSES:
+            yield format_sse('snapshot', snapshot)
+            yield format_sse('done', snapshot, seq)
+        else:
+            yield format_sse('snapshot', snapshot, seq)
+        return
+
+    seq = resume_from
+    started = clock()
+    while True:
+        pending, last_seq = read_import_events(import_id, after=seq)
+        if last_seq - seq > len(pending):
+            yield format_sse('snapshot', get_import_state(import_id) or snapshot)
+        for item in pending:
+            yield format_sse(item['event'], item['data'], item['id'])
+        if pending or last_seq > seq:
+            return
+        if clock() - started >= max_wait:
+            break
+        sleep(poll_interval)
+
+    if load_status:
+        status, extra = load_status()
+        if status in TERMINAL_STATUSES:
+            yield format_sse('done', {'status': status, **extra}, seq)
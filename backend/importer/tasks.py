@@ -1,21 +1,73 @@
 from celery import shared_task
+from django.core.cache import cache
 from django.utils import timezone
 from .models import StorageImport
 # Legacy SimpleStorageImporter removed - now using unified ImportOrchestrator
 from .logger import ImportLogger
+from .progress_events import publish_import_progress, publish_import_status
 from customers.models import Customer
-from core.audit import log_import
+from core.audit import AuditBatch, log_import
+from core.dashboard_summary import refresh_dashboard_summary
 import logging
+import time
 import traceback
 
 logger = logging.getLogger(__name__)
 
+# How long the cancellation flag set by cancel_import stays in the cache (seconds)
+IMPORT_CANCEL_FLAG_TTL = 24 * 60 * 60
+
+# The cache may not be shared with the web process (e.g. the local-memory
+# cache in development), so the DB flag is still read, but at most this often
+CANCEL_DB_CHECK_INTERVAL = 5.0
+
 
 class CancelledException(Exception):
     """Exception raised when an import is cancelled by user"""
     pass
 
 
+def import_cancel_cache_key(import_id):
+    return f"import_cancelled_{import_id}"
+
+
+def flag_import_cancelled(import_id):
+    """Set the cache flag the running task checks on every progress tick"""
+    try:
+        cache.set(import_cancel_cache_key(import_id), True, IMPORT_CANCEL_FLAG_TTL)
+    except Exception as e:
+        logger.warning(f"Could not set cancel flag for import {import_id}: {e}, task will see the DB flag")
+
+
+class CancellationCheck:
+    """
+    Cheap cancellation test for a running import.
+
+    Checks the cache flag on every call and falls back to reading
+    StorageImport.cancelled at most once per db_check_interval seconds,
+    instead of a refresh_from_db() on every progress tick.
+    """
+
+    def __init__(self, import_id, db_check_interval=CANCEL_DB_CHECK_INTERVAL, clock=time.monotonic):
+        self.import_id = import_id
+        self.db_check_interval = db_check_interval
+        self._clock = clock
+        self._last_db_check = clock()
+
+    def __call__(self):
+        try:
+            if cache.get(import_cancel_cache_key(self.import_id)):
+                return True
+        except Exception:
+            pass
+
+        now = self._clock()
+        if now - self._last_db_check < self.db_check_interval:
+            return False
+        self._last_db_check = now
+        return StorageImport.objects.filter(id=self.import_id, cancelled=True).exists()
+
+
 @shared_task
 def test_task():
     """Simple test task to verify Celery is working"""
@@ -29,6 +81,7 @@ def test_task():
         if import_record:
             logger = ImportLogger(import_record)
             logger.info('TEST TASK EXECUTED - Celery is working!')
+            logger.flush()
             return {'status': 'success', 'message': 'Test task completed'}
         else:
             return {'status': 'no_import', 'message': 'No running import found'}
@@ -73,6 +126,11 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
 
     Note: This task name is kept for backward compatibility but now handles all import types.
     """
+    # Per-row audit logging is suppressed during the import; the import's own
+    # audit entry carries the entity counts and affected IDs instead
+    audit_scope = AuditBatch()
+    import_logger = None
+
     try:
         # Get the import record
         import_record = StorageImport.objects.get(id=import_id)
@@ -98,16 +156,19 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
         import_record.celery_task_id = self.request.id
         import_record.status = 'running'
         import_record.save()
+        publish_import_status(import_record.id, 'running')
 
         # Progress callback with cancellation check
+        is_cancelled = CancellationCheck(import_record.id)
+
         def progress_callback(current, total, message):
             # Check for cancellation flag
-            import_record.refresh_from_db()
-            if import_record.cancelled:
+            if is_cancelled():
                 import_logger.info('Import cancellation detected, stopping...')
                 raise CancelledException('Import cancelled by user')
 
             import_logger.info(message)
+            publish_import_progress(import_record.id, current, total, message)
             self.update_state(
                 state='PROGRESS',
                 meta={
@@ -123,16 +184,17 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
         orchestrator = ImportOrchestrator(import_record.customer, progress_callback, project_id=project_id)
 
         import_logger.info('Starting import (auto-detecting type)...')
-        result = orchestrator.import_from_text(
-            config_data,
-            fabric_id,
-            fabric_name,
-            zoneset_name,
-            vsan,
-            create_new_fabric,
-            conflict_resolutions or {},
-            fabric_mapping
-        )
+        with audit_scope:
+            result = orchestrator.import_from_text(
+                config_data,
+                fabric_id,
+                fabric_name,
+                zoneset_name,
+                vsan,
+                create_new_fabric,
+                conflict_resolutions or {},
+                fabric_mapping
+            )
 
         # Determine import type from stats (check for non-zero values, not just key existence)
         # Since orchestrator initializes all stats to 0, we need to check actual values
@@ -165,16 +227,32 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
                 f'{result["stats"]["aliases_created"]} aliases created'
             )
 
+        # Pages that could not be fetched leave parts of the data out
+        if result.get('partial'):
+            import_logger.warning(
+                f"Import incomplete - {len(result['stats']['errors'])} fetch errors: "
+                + '; '.join(result['stats']['errors'])
+            )
+
         # Update import record with results
         import_record.status = 'completed'
         import_record.completed_at = timezone.now()
         import_record.import_type = 'storage_insights' if import_type == 'storage' else 'san_config'
         import_record.api_response_summary = {
             'import_type': import_type,
+            'partial': result.get('partial', False),
             'stats': result['stats'],
             'metadata': result['metadata']
         }
         import_record.save()
+        import_logger.flush()
+        publish_import_status(import_record.id, 'completed', import_type=import_type, stats=result['stats'])
+
+        # Recompute dashboard counts now rather than on the next dashboard load
+        try:
+            refresh_dashboard_summary(import_record.customer_id)
+        except Exception as e:
+            logger.warning(f"Dashboard summary refresh after import {import_record.id} failed: {e}")
 
         # Calculate duration
         duration_seconds = None
@@ -204,7 +282,7 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
             customer=import_record.customer,
             import_type=entity_type,
             summary=summary,
-            details=result['stats'],
+            details={**result['stats'], **audit_scope.as_details()},
             status='SUCCESS',
             duration_seconds=duration_seconds
         )
@@ -221,13 +299,15 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
 
         try:
             import_record = StorageImport.objects.get(id=import_id)
-            import_logger = ImportLogger(import_record)
-            import_logger.info('Import cancelled by user. Partial data may have been imported.')
+            cancel_logger = ImportLogger(import_record)
+            cancel_logger.info('Import cancelled by user. Partial data may have been imported.')
+            cancel_logger.flush()
 
             import_record.status = 'cancelled'
             import_record.error_message = 'Import cancelled by user. Partial data may have been imported.'
             import_record.completed_at = timezone.now()
             import_record.save()
+            publish_import_status(import_record.id, 'cancelled', error_message=import_record.error_message)
 
             # Calculate duration
             duration_seconds = None
@@ -240,7 +320,7 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
                 customer=import_record.customer,
                 import_type='IMPORT',
                 summary=f"Import cancelled by user (partial data may have been imported)",
-                details={'cancelled': True},
+                details={'cancelled': True, **audit_scope.as_details()},
                 status='CANCELLED',
                 duration_seconds=duration_seconds
             )
@@ -265,13 +345,13 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
         # Update import record status
         try:
             import_record = StorageImport.objects.get(id=import_id)
-            import_logger = ImportLogger(import_record)
-            import_logger.error(f'Import failed: {str(e)}', {'error': str(e), 'traceback': traceback.format_exc()})
+            ImportLogger(import_record).error(f'Import failed: {str(e)}', {'error': str(e), 'traceback': traceback.format_exc()})
 
             import_record.status = 'failed'
             import_record.error_message = str(e)
             import_record.completed_at = timezone.now()
             import_record.save()
+            publish_import_status(import_record.id, 'failed', error_message=import_record.error_message)
 
             # Calculate duration
             duration_seconds = None
@@ -284,7 +364,7 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
                 customer=import_record.customer,
                 import_type='IMPORT',
                 summary=f"Import failed: {str(e)}",
-                details={'error': str(e)},
+                details={'error': str(e), **audit_scope.as_details()},
                 status='FAILED',
                 duration_seconds=duration_seconds
             )
@@ -292,4 +372,9 @@ def run_san_import_task(self, import_id, config_data, fabric_id=None, fabric_nam
         except Exception as log_error:
             logger.error(f"Failed to log error: {log_error}")
 
-        raise
\ No newline at end of file
+        raise
+
+    finally:
+        # Write whatever the import logged since the last flush
+        if import_logger:
+            import_logger.flush()
@@ -1,3 +1,620 @@
-from django.test import TestCase
+import json
+import threading
+from dataclasses import asdict
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from customers.models import Customer
+from storage.models import Host, HostWwpn, Storage, Volume
+from .import_orchestrator import ImportOrchestrator
+from .logger import ImportLogger
+from .models import ImportLog, StorageImport
+from .parse_cache import (
+    deserialize_parse_result, load_parse_result, serialize_parse_result, store_parse_result
+)
+from .parsers import BaseParser, BrocadeParser, CiscoParser, InsightsParser, ParseResult, ParserFactory
+from .parsers.base_parser import (
+    ParsedAlias, ParsedFabric, ParsedHost, ParsedPort, ParsedStorageSystem, ParsedSwitch, ParsedVolume, ParsedZone
+)
+from .parsers.insights_api_client_v2 import StorageInsightsClientV2
+from .parsers.rate_control import AdaptiveConcurrencyLimit, TokenBucket
+from .progress_events import (
+    LONG_POLL_MAX_WAIT, import_event_stream, publish_import_progress, publish_import_status, read_import_events
+)
+from .tasks import CancellationCheck, flag_import_cancelled
+
+
+class FakeInsightsAPI:
+    """
+    Local stand-in for the IBM Storage Insights REST API.
+
+    Serves the token, storage-systems, volumes and host-connections endpoints
+    from in-memory data with the same 1-based offset pagination as the real
+    API. Every request path is recorded in self.requests.
+
+    To simulate throttling, the first rate_limited_requests data requests get
+    a 429 with a Retry-After header. delay slows every data response so
+    concurrent requests overlap; the peak overlap is kept in max_in_flight.
+    Data requests whose path contains one of failing_paths get a 500.
+    """
+
+    def __init__(self, systems, volumes_by_system=None, hosts_by_system=None,
+                 rate_limited_requests=0, retry_after='0.1', delay=0.0, failing_paths=()):
+        self.systems = systems
+        self.failing_paths = failing_paths
+        self.volumes_by_system = volumes_by_system or {}
+        self.hosts_by_system = hosts_by_system or {}
+        self.rate_limited_requests = rate_limited_requests
+        self.retry_after = retry_after
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                api._record(self.path)
+                self._send(200, {'result': {'token': 'fake-token'}})
+
+            def do_GET(self):
+                throttled = api._record(self.path, count_in_flight=True)
+                try:
+                    time.sleep(api.delay)
+                    if throttled:
+                        self._send(429, {'error': 'Too Many Requests'}, {'Retry-After': api.retry_after})
+                    else:
+                        status, body = api.handle_get(self.path)
+                        self._send(status, body)
+                finally:
+                    with api._lock:
+                        api.in_flight -= 1
+
+            def _send(self, status, body, headers=None):
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def api_root(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/restapi/v1"
+
+    def _record(self, path, count_in_flight=False):
+        """Record a request; returns True if it should be rate limited"""
+        with self._lock:
+            self.requests.append(path)
+            if not count_in_flight:
+                return False
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self.rate_limited_requests > 0:
+                self.rate_limited_requests -= 1
+                return True
+            return False
+
+    def handle_get(self, path):
+        if any(failing in path for failing in self.failing_paths):
+            return 500, {'error': 'Internal Server Error'}
+        url = urlparse(path)
+        parts = url.path.strip('/').split('/')
+        # restapi/v1/tenants/<tenant>/storage-systems[/<id>[/<collection>]]
+        resource = parts[4:]
+        query = parse_qs(url.query)
+
+        if resource == ['storage-systems']:
+            return 200, {'data': self.systems}
+        if len(resource) == 2:
+            return 200, {'data': [s for s in self.systems if s['storage_system_id'] == resource[1]]}
+
+        collection = {
+            'volumes': self.volumes_by_system,
+            'host-connections': self.hosts_by_system,
+        }.get(resource[2], {})
+        records = collection.get(resource[1], [])
+        offset = int(query.get('offset', ['1'])[0])
+        limit = int(query.get('limit', ['500'])[0])
+        return 200, {'data': records[offset - 1:offset - 1 + limit]}
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class InsightsStreamingImportTests(TestCase):
+    """Streaming Storage Insights import against a local fake API"""
+
+    def setUp(self):
+        cache.clear()
+        self.customer = Customer.objects.create(name='Streaming Customer')
+
+        self.systems = [
+            {'storage_system_id': 'SYS1', 'name': 'FS9500-A', 'type': '2145', 'volumes_count': 7, 'host_connections_count': 2},
+            {'storage_system_id': 'SYS2', 'name': 'FS9500-B', 'type': '2145', 'volumes_count': 3, 'host_connections_count': 1},
+        ]
+        self.volumes = {
+            'SYS1': [{'volume_id': f'v{i}', 'name': f'sys1_vol{i}', 'capacity_bytes': 1024} for i in range(7)],
+            'SYS2': [{'volume_id': f'v{i}', 'name': f'sys2_vol{i}', 'capacity_bytes': 2048} for i in range(3)],
+        }
+        self.hosts = {
+            'SYS1': [
+                {'name': 'host-a', 'wwpns': 'C050760C392D0076,C050760C392D0077'},
+                {'name': 'host-b', 'wwpns': ['10:00:00:05:1e:12:34:56']},
+            ],
+            'SYS2': [{'name': 'host-c', 'wwpns': 'C050760C392D0078'}],
+        }
+        self.credentials = json.dumps({'tenant_id': 'tenant-1', 'api_key': 'key-1'})
+
+    def _fake_api(self):
+        return FakeInsightsAPI(self.systems, self.volumes, self.hosts)
+
+    def test_streaming_import_writes_every_page(self):
+        with self._fake_api() as api, \
+                mock.patch.object(StorageInsightsClientV2, 'API_ROOT', api.api_root), \
+                mock.patch.object(StorageInsightsClientV2, 'PAGE_SIZE', 3):
+            progress = []
+            orchestrator = ImportOrchestrator(self.customer, lambda c, t, m: progress.append((c, m)))
+            result = orchestrator.import_from_text(self.credentials)
+
+        self.assertTrue(result['success'])
+        self.assertTrue(result['metadata']['streaming'])
+        self.assertEqual(result['stats']['storage_systems_created'], 2)
+        self.assertEqual(result['stats']['volumes_created'], 10)
+        self.assertEqual(result['stats']['hosts_created'], 3)
+        self.assertEqual(result['stats']['errors'], [])
+
+        self.assertEqual(Storage.objects.filter(customer=self.customer).count(), 2)
+        self.assertEqual(Volume.objects.filter(storage__storage_system_id='SYS1').count(), 7)
+        self.assertEqual(HostWwpn.objects.filter(host__name='host-a').count(), 2)
+        self.assertTrue(Host.objects.filter(name='host-c', storage__storage_system_id='SYS2').exists())
+
+        # SYS1 has 7 volumes at 3 per page: offsets 1, 4, 7
+        sys1_volume_pages = [p for p in api.requests if '/SYS1/volumes' in p]
+        self.assertEqual(len(sys1_volume_pages), 3)
+        self.assertEqual(progress[-1][0], 100)
+
+    def test_pages_are_yielded_incrementally(self):
+        with self._fake_api() as api, \
+                mock.patch.object(StorageInsightsClientV2, 'API_ROOT', api.api_root), \
+                mock.patch.object(StorageInsightsClientV2, 'PAGE_SIZE', 2):
+            client = StorageInsightsClientV2('tenant-1', 'key-1', max_workers=2)
+            batches = list(client.iter_all_data())
+
+        self.assertEqual(batches[0][0], 'storage_systems')
+        volume_batches = [b for b in batches if b[0] == 'volumes']
+        # 7 volumes -> 4 pages, 3 volumes -> 2 pages, none larger than PAGE_SIZE
+        self.assertEqual(len(volume_batches), 6)
+        self.assertTrue(all(len(records) <= 2 for _, _, records in volume_batches))
+        self.assertEqual(sum(len(r) for _, sid, r in volume_batches if sid == 'SYS1'), 7)
+
+    def test_failed_system_pages_make_the_import_partial(self):
+        api = FakeInsightsAPI(self.systems, self.volumes, self.hosts, failing_paths=('/SYS2/volumes',))
+        with api, mock.patch.object(StorageInsightsClientV2, 'API_ROOT', api.api_root), \
+                mock.patch('importer.parsers.insights_api_client_v2.time.sleep'):
+            result = ImportOrchestrator(self.customer).import_from_text(self.credentials)
+
+        self.assertFalse(result['success'])
+        self.assertTrue(result['partial'])
+        self.assertEqual(len(result['stats']['errors']), 1)
+        self.assertIn('volumes for storage system SYS2', result['stats']['errors'][0])
+        # Everything else was still imported
+        self.assertEqual(result['stats']['volumes_created'], 7)
+        self.assertEqual(result['stats']['hosts_created'], 3)
+
+    def test_fetch_failure_is_reported_not_raised(self):
+        with mock.patch.object(StorageInsightsClientV2, 'API_ROOT', 'http://127.0.0.1:9/restapi/v1'), \
+                mock.patch('importer.parsers.insights_api_client_v2.time.sleep'):
+            result = ImportOrchestrator(self.customer).import_from_text(self.credentials)
+
+        self.assertEqual(result['stats']['storage_systems_created'], 0)
+        self.assertTrue(any('Storage Insights' in e for e in result['stats']['errors']))
+
+
+class FakeClock:
+    """Deterministic clock whose sleep() just advances time"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateControlTests(TestCase):
+    """Token bucket and AIMD concurrency limit"""
+
+    def test_token_bucket_allows_burst_then_paces(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+        bucket.acquire()
+        self.assertAlmostEqual(sum(clock.sleeps), 0.5)
+
+    def test_token_bucket_pause_blocks_all_callers(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100, capacity=100, clock=clock, sleep=clock.sleep)
+
+        bucket.pause(3)
+        bucket.acquire()
+        self.assertGreaterEqual(clock.now, 3)
+
+    def test_concurrency_limit_halves_on_congestion_and_ramps_up(self):
+        clock = FakeClock()
+        limit = AdaptiveConcurrencyLimit(initial=8, maximum=8, cooldown=1.0, clock=clock)
+
+        limit.on_congestion()
+        self.assertEqual(limit.limit, 4)
+
+        # A second failure from the same window does not halve again
+        limit.on_congestion()
+        self.assertEqual(limit.limit, 4)
+
+        clock.now += 2
+        limit.on_congestion()
+        self.assertEqual(limit.limit, 2)
+
+        for _ in range(50):
+            limit.on_success()
+        self.assertEqual(limit.limit, 8)
+
+    def test_concurrency_limit_respects_minimum(self):
+        clock = FakeClock()
+        limit = AdaptiveConcurrencyLimit(initial=2, maximum=4, cooldown=0, clock=clock)
+        for _ in range(5):
+            limit.on_congestion()
+        self.assertEqual(limit.limit, 1)
+
+
+class InsightsClientThrottlingTests(TestCase):
+    """StorageInsightsClientV2 against a fake API that rate limits"""
+
+    def setUp(self):
+        cache.clear()
+        self.systems = [{'storage_system_id': f'SYS{i}', 'name': f'FS-{i}', 'type': '2145'} for i in range(4)]
+        self.volumes = {
+            s['storage_system_id']: [{'volume_id': f'v{n}', 'name': f'vol{n}'} for n in range(5)]
+            for s in self.systems
+        }
+
+    def test_rate_limited_requests_are_retried_and_reported(self):
+        api = FakeInsightsAPI(self.systems, self.volumes, rate_limited_requests=2, retry_after='0.2')
+        with api, mock.patch.object(StorageInsightsClientV2, 'API_ROOT', api.api_root), \
+                mock.patch.object(StorageInsightsClientV2, 'PAGE_SIZE', 2):
+            client = StorageInsightsClientV2('tenant-1', 'key-1', max_workers=4)
+            data = client.get_all_data_optimized(import_options={'storage_systems': True, 'volumes': True})
+
+        self.assertEqual(len(data['storage_systems']), 4)
+        self.assertEqual(sum(len(v) for v in data['volumes_by_system'].values()), 20)
+
+        stats = client.stats.summary()
+        self.assertEqual(sum(e['rate_limited'] for e in stats.values()), 2)
+        self.assertEqual(sum(e['retries'] for e in stats.values()), 2)
+        self.assertIn('storage-systems/{id}/volumes', stats)
+        self.assertGreater(stats['storage-systems/{id}/volumes']['avg_ms'], 0)
+
+    def test_in_flight_requests_stay_within_worker_ceiling(self):
+        api = FakeInsightsAPI(self.systems, self.volumes, delay=0.05)
+        with api, mock.patch.object(StorageInsightsClientV2, 'API_ROOT', api.api_root), \
+                override_settings(INSIGHTS_REQUESTS_PER_SECOND=1000, INSIGHTS_REQUEST_BURST=1000):
+            client = StorageInsightsClientV2('tenant-1', 'key-1', max_workers=2)
+            client.get_volumes_parallel([s['storage_system_id'] for s in self.systems])
+
+        self.assertLessEqual(api.max_in_flight, 2)
+
+    @override_settings(INSIGHTS_MAX_RETRY_AFTER=0.1)
+    def test_retry_after_is_capped(self):
+        api = FakeInsightsAPI(self.systems[:1], self.volumes, rate_limited_requests=1, retry_after='86400')
+        with api, mock.patch.object(StorageInsightsClientV2, 'API_ROOT', api.api_root):
+            client = StorageInsightsClientV2('tenant-1', 'key-1', max_workers=1)
+            with mock.patch.object(client.rate_limiter, 'pause', wraps=client.rate_limiter.pause) as pause:
+                client.get_volumes_parallel(['SYS0'])
+
+        pause.assert_called_once_with(0.1)
+
+    def test_connection_pool_sized_to_workers(self):
+        client = StorageInsightsClientV2('tenant-1', 'key-1', max_workers=7)
+        adapter = client.session.get_adapter('https://insights.ibm.com/')
+        self.assertEqual(adapter._pool_maxsize, 7)
+
+    def test_import_results_include_api_stats(self):
+        customer = Customer.objects.create(name='Stats Customer')
+        api = FakeInsightsAPI(self.systems[:1], self.volumes, rate_limited_requests=1, retry_after='0')
+        credentials = json.dumps({'tenant_id': 'tenant-1', 'api_key': 'key-1'})
+        with api, mock.patch.object(StorageInsightsClientV2, 'API_ROOT', api.api_root):
+            result = ImportOrchestrator(customer).import_from_text(credentials)
+
+        api_stats = result['metadata']['api_stats']
+        self.assertEqual(api_stats['max_workers'], 5)
+        self.assertEqual(sum(e['rate_limited'] for e in api_stats['endpoints'].values()), 1)
+        self.assertEqual(result['stats']['volumes_created'], 5)
+
+
+class ImportLoggerBufferingTests(TestCase):
+    """ImportLogger batches entries and writes them with bulk_create"""
+
+    def setUp(self):
+        customer = Customer.objects.create(name='Log Customer')
+        self.import_record = StorageImport.objects.create(customer=customer, status='running')
+
+    def test_entries_are_written_in_batches(self):
+        import_logger = ImportLogger(self.import_record, flush_every=3, flush_interval=3600)
+        import_logger.info('first')
+        import_logger.debug('second')
+        self.assertEqual(ImportLog.objects.count(), 0)
+
+        with self.assertNumQueries(1):
+            import_logger.info('third')
+        self.assertEqual(
+            list(ImportLog.objects.values_list('message', flat=True)),
+            ['first', 'second', 'third']
+        )
+
+    def test_errors_and_flush_write_immediately(self):
+        import_logger = ImportLogger(self.import_record, flush_every=100, flush_interval=3600)
+        import_logger.info('before failure')
+        import_logger.error('failure')
+        self.assertEqual(ImportLog.objects.count(), 2)
+
+        import_logger.warning('after failure')
+        import_logger.flush()
+        self.assertEqual(ImportLog.objects.filter(level='WARNING').count(), 1)
+
+    def test_entries_keep_the_time_they_were_logged(self):
+        import_logger = ImportLogger(self.import_record, flush_every=100, flush_interval=3600)
+        import_logger.info('early')
+        time.sleep(0.01)
+        import_logger.info('late')
+        import_logger.flush()
+
+        early, late = ImportLog.objects.order_by('timestamp')
+        self.assertEqual((early.message, late.message), ('early', 'late'))
+        self.assertLess(early.timestamp, late.timestamp)
+
+
+class CancellationCheckTests(TestCase):
+    """Import cancellation is detected from the cache flag without DB reads"""
+
+    def setUp(self):
+        cache.clear()
+        customer = Customer.objects.create(name='Cancel Customer')
+        self.import_record = StorageImport.objects.create(customer=customer, status='running')
+
+    def test_cache_flag_needs_no_query(self):
+        clock = FakeClock()
+        is_cancelled = CancellationCheck(self.import_record.id, db_check_interval=5, clock=clock)
+        with self.assertNumQueries(0):
+            self.assertFalse(is_cancelled())
+            flag_import_cancelled(self.import_record.id)
+            self.assertTrue(is_cancelled())
+
+    def test_db_flag_is_read_at_most_once_per_interval(self):
+        clock = FakeClock()
+        is_cancelled = CancellationCheck(self.import_record.id, db_check_interval=5, clock=clock)
+        StorageImport.objects.filter(id=self.import_record.id).update(cancelled=True)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(is_cancelled())
+
+        clock.now += 5
+        with self.assertNumQueries(1):
+            self.assertTrue(is_cancelled())
+
+
+class ImportEventStreamTests(TestCase):
+    """Progress and log lines are pushed to watchers from the cache"""
+
+    def setUp(self):
+        cache.clear()
+        customer = Customer.objects.create(name='Stream Customer')
+        self.import_record = StorageImport.objects.create(customer=customer, status='running')
+
+    def _events(self, chunks):
+        return [line.split(': ', 1)[1] for chunk in chunks for line in chunk.splitlines() if line.startswith('event: ')]
+
+    def test_progress_and_log_lines_are_published_in_order(self):
+        import_id = self.import_record.id
+        ImportLogger(self.import_record).info('Parsing zones')
+        publish_import_progress(import_id, 40, 100, 'Importing zones')
+
+        events, last_seq = read_import_events(import_id)
+        self.assertEqual([e['event'] for e in events], ['log', 'progress'])
+        self.assertEqual(events[0]['data']['message'], 'Parsing zones')
+        self.assertEqual(read_import_events(import_id, after=last_seq), ([], last_seq))
+
+    def test_poll_relays_new_events_without_queries(self):
+        import_id = self.import_record.id
+        publish_import_progress(import_id, 10, 100, 'already sent')
+        clock = FakeClock()
+
+        first = list(import_event_stream(import_id, {'status': 'running'}, clock=clock, sleep=clock.sleep))
+        self.assertEqual(self._events(first), ['snapshot'])
+        self.assertEqual(clock.sleeps, [])
+
+        def sleep(seconds):
+            clock.sleep(seconds)
+            publish_import_progress(import_id, 50, 100, 'halfway')
+            publish_import_status(import_id, 'completed', stats={'zones_created': 3})
+
+        stream = import_event_stream(import_id, {'status': 'running'}, resume_from=1, clock=clock, sleep=sleep)
+        with self.assertNumQueries(0):
+            chunks = list(stream)
+
+        self.assertEqual(self._events(chunks), ['progress', 'done'])
+        self.assertIn('halfway', chunks[1])
+        self.assertNotIn('already sent', ''.join(chunks))
+
+    def test_poll_waits_briefly_then_falls_back_to_db_status(self):
+        clock = FakeClock()
+        stream = import_event_stream(
+            self.import_record.id, {'status': 'running'}, resume_from=0,
+            load_status=lambda: ('failed', {'error_message': 'boom'}),
+            clock=clock, sleep=clock.sleep
+        )
+
+        chunks = list(stream)
+        self.assertEqual(self._events(chunks), ['done'])
+        self.assertIn('boom', chunks[-1])
+        self.assertLessEqual(sum(clock.sleeps), LONG_POLL_MAX_WAIT)
+
+    def test_view_ends_stream_for_finished_import(self):
+        StorageImport.objects.filter(id=self.import_record.id).update(status='completed')
+
+        response = self.client.get(f'/api/importer/import-events/{self.import_record.id}/')
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = response.content.decode()
+        self.assertEqual(self._events([body]), ['snapshot', 'done'])
+
+
+CISCO_SAMPLE = """fcalias name host1_p1 vsan 10
+  member pwwn 10:00:00:00:c9:00:00:01
+zone name z1 vsan 10
+  member fcalias host1_p1
+"""
+
+
+class ParseCacheTests(TestCase):
+    """A previewed parse result is reused by the import of the same payload"""
+
+    def setUp(self):
+        cache.clear()
+        self.customer = Customer.objects.create(name='Cache Customer')
+
+    def test_store_load_round_trip(self):
+        parse_result = CiscoParser().parse(CISCO_SAMPLE)
+        self.assertIsNotNone(store_parse_result(CISCO_SAMPLE, 'CiscoParser', parse_result))
+
+        parser_name, loaded = load_parse_result(CISCO_SAMPLE, consume=False)
+        self.assertEqual(parser_name, 'CiscoParser')
+        for field_name in ('fabrics', 'aliases', 'zones'):
+            self.assertEqual(getattr(loaded, field_name), getattr(parse_result, field_name))
+        self.assertEqual(loaded.import_type, parse_result.import_type)
+
+        # consume=True hands the entry out once
+        self.assertIsNotNone(load_parse_result(CISCO_SAMPLE))
+        self.assertIsNone(load_parse_result(CISCO_SAMPLE))
+
+    def test_preview_result_is_imported_without_reparsing(self):
+        response = self.client.post(
+            '/api/importer/parse-preview/', {'customer_id': self.customer.id, 'data': CISCO_SAMPLE},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+
+        with mock.patch.object(ParserFactory, 'detect') as detect, \
+                mock.patch.object(CiscoParser, 'parse') as parse:
+            result = ImportOrchestrator(self.customer).import_from_text(CISCO_SAMPLE, create_new_fabric=True)
+
+        detect.assert_not_called()
+        parse.assert_not_called()
+        self.assertEqual(result['stats']['aliases_created'], 1)
+        self.assertIsNone(load_parse_result(CISCO_SAMPLE))
+
+
+class ParserDetectionTests(TestCase):
+    """Parsers are ranked on a bounded sample, with a full-text fallback"""
+
+    def _detected(self, data):
+        parser, confidence = ParserFactory.detect(data)
+        return parser.__class__, confidence
+
+    def test_samples_pick_their_parser(self):
+        self.assertEqual(self._detected(CISCO_SAMPLE), (CiscoParser, 0.8))
+        self.assertEqual(self._detected('show zone vsan 10\n' + CISCO_SAMPLE), (CiscoParser, 0.95))
+        brocade = 'Fabric Name,Active Zone Config,Alias Name,Alias Members\nfab1,cfg1,a1,10:00:00:00:c9:00:00:01\n'
+        self.assertEqual(self._detected(brocade), (BrocadeParser, 1.0))
+        self.assertEqual(self._detected(json.dumps({'tenant_id': 't', 'api_key': 'k'})), (InsightsParser, 1.0))
+        self.assertIsNone(ParserFactory.detect('nothing to see here'))
+
+    def test_signature_past_the_sample_uses_full_text_fallback(self):
+        padding = 'x' * (ParserFactory.DETECTION_SAMPLE_SIZE + 10) + '\n'
+        self.assertEqual(ParserFactory.rank_parsers(padding + CISCO_SAMPLE), [])
+        self.assertEqual(self._detected(padding + CISCO_SAMPLE), (CiscoParser, 0.5))
+        self.assertIsNone(ParserFactory.detect(padding))
+
+    def test_ties_keep_registration_order(self):
+        def stub(name):
+            return type(name, (BaseParser,), {
+                'parse': lambda self, data: ParseResult(),
+                'detect_format': lambda self, data: 'TIE' in data,
+                'detect_confidence': lambda self, sample: 0.7 if 'TIE' in sample else 0.0,
+            })
+        first, second = stub('FirstParser'), stub('SecondParser')
+        ParserFactory.register_parser(first)
+        ParserFactory.register_parser(second)
+        try:
+            ranked = ParserFactory.rank_parsers('TIE')
+            self.assertEqual([(p.__class__, c) for p, c in ranked], [(first, 0.7), (second, 0.7)])
+            self.assertIsInstance(ParserFactory.detect('TIE')[0], first)
+        finally:
+            ParserFactory.unregister_parser(first)
+            ParserFactory.unregister_parser(second)
+
+
+class ParsedTypesTests(TestCase):
+    """Parser output types are slotted without changing their serialized form"""
+
+    def test_slotted_without_instance_dict(self):
+        for parsed_class in (ParsedFabric, ParsedAlias, ParsedZone, ParsedSwitch, ParsedStorageSystem,
+                             ParsedVolume, ParsedHost, ParsedPort):
+            self.assertIn('__slots__', vars(parsed_class), parsed_class.__name__)
+        alias = ParsedAlias(name='a1', wwpns=['10:00:00:00:c9:00:00:01'])
+        self.assertFalse(hasattr(alias, '__dict__'))
+        with self.assertRaises(AttributeError):
+            alias.typo = 'x'
+
+    def test_serialized_output_unchanged(self):
+        alias = ParsedAlias(name='a1', wwpns=['10:00:00:00:c9:00:00:01'], use='init', fabric_name='fab')
+        self.assertEqual(asdict(alias), {
+            'name': 'a1', 'wwpns': ['10:00:00:00:c9:00:00:01'], 'alias_type': 'device-alias',
+            'use': 'init', 'fabric_name': 'fab',
+        })
+        self.assertEqual(alias.wwpn, '10:00:00:00:c9:00:00:01')
+
+        host = ParsedHost(name='h1', storage_system_id='SYS1', wwpns=['c050760c392d0076'], vols_count=3)
+        port = ParsedPort(port_id='p1', storage_system_id='SYS1', wwpn='5005076800000001')
+        parse_result = ParseResult(
+            fabrics=[ParsedFabric(name='fab', vsan=10)], aliases=[alias],
+            zones=[ParsedZone(name='z1', members=['a1'], fabric_name='fab')],
+            hosts=[host], ports=[port], import_type='storage'
+        )
+        parser_name, loaded = deserialize_parse_result(serialize_parse_result('CiscoParser', parse_result))
+        self.assertEqual(parser_name, 'CiscoParser')
+        self.assertEqual(
+            [asdict(item) for item in loaded.aliases + loaded.hosts + loaded.ports],
+            [asdict(alias), asdict(host), asdict(port)]
+        )
+        self.assertEqual(loaded.zones, parse_result.zones)
 
-# Create your tests here.
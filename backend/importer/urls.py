@@ -27,6 +27,7 @@ urlpatterns = [
     path('parse-preview/', views.parse_preview, name='parse_preview'),
     path('import-san-config/', views.import_san_config, name='import_san_config'),
     path('import-progress/<int:import_id>/', views.import_progress, name='import_progress'),
+    path('import-events/<int:import_id>/', views.import_events, name='import_events'),
 
     # User-scoped import monitoring
     path('my-imports/', views.my_imports, name='my_imports'),
@@ -1,9 +1,13 @@
 from django.shortcuts import get_object_or_404
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from customers.models import Customer
 from .models import StorageImport, ImportLog
+from .progress_events import (
+    ACTIVE_IMPORTS_CACHE_KEY, ACTIVE_IMPORTS_CACHE_TTL, get_import_state, import_event_stream
+)
 # Legacy importer removed - now using unified ImportOrchestrator
 import json
 
@@ -101,6 +105,10 @@ def cancel_import(request, import_id):
         import_record.cancelled_at = timezone.now()
         import_record.save()
 
+        # Cache flag lets the running task notice without a DB read per progress tick
+        from .tasks import flag_import_cancelled
+        flag_import_cancelled(import_record.id)
+
         # Try to revoke the Celery task (will be handled gracefully by task)
         if import_record.celery_task_id:
             try:
@@ -296,6 +304,7 @@ def test_logging(request):
         logger.info('Test log entry - logging system is working!')
         logger.warning('This is a test warning message')
         logger.error('This is a test error message')
+        logger.flush()
         
         return JsonResponse({
             'message': 'Test logs added successfully',
@@ -564,6 +573,7 @@ def import_san_config(request):
         import_record.celery_task_id = task.id
         import_record.status = 'running'
         import_record.save()
+        cache.delete(ACTIVE_IMPORTS_CACHE_KEY)
 
         response_data = {
             'success': True,
@@ -617,8 +627,11 @@ def import_progress(request, import_id):
                 progress_data['volumes_imported'] = import_record.volumes_imported
                 progress_data['hosts_imported'] = import_record.hosts_imported
 
-        # If task is running, get Celery task progress
-        if import_record.status == 'running' and import_record.celery_task_id:
+        # Prefer the progress the task published over a result backend round trip
+        published = get_import_state(import_record.id) if import_record.status == 'running' else None
+        if published and published.get('progress'):
+            progress_data['progress'] = published['progress']
+        elif import_record.status == 'running' and import_record.celery_task_id:
             from celery.result import AsyncResult
             result = AsyncResult(import_record.celery_task_id)
 
@@ -641,6 +654,48 @@ def import_progress(request, import_id):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@csrf_exempt
+@require_http_methods(['GET'])
+def import_events(request, import_id):
+    """
+    Long-poll for the progress, log lines and final status of an import, in
+    Server-Sent Events format (text/event-stream).
+
+    Events: snapshot (current state), progress, log, status, done. Each
+    response ends as soon as it has events, or after a couple of seconds
+    without; EventSource reconnects and resumes from the Last-Event-ID header.
+    """
+    import_record = get_object_or_404(StorageImport, id=import_id)
+
+    resume_from = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        resume_from = int(resume_from) if resume_from is not None else None
+    except ValueError:
+        resume_from = None
+
+    snapshot = {
+        'import_id': import_record.id,
+        'status': import_record.status,
+        'error_message': import_record.error_message,
+    }
+    published = get_import_state(import_record.id)
+    if published and import_record.status == 'running':
+        snapshot.update(published)
+
+    def load_status():
+        row = StorageImport.objects.filter(id=import_id).values('status', 'error_message').first()
+        if not row:
+            return 'failed', {'error_message': 'Import record no longer exists'}
+        return row['status'], {'error_message': row['error_message']}
+
+    response = HttpResponse(
+        ''.join(import_event_stream(import_record.id, snapshot, resume_from, load_status)),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
 # ===== User-Scoped Import Monitoring Endpoints =====
 
 @csrf_exempt
@@ -759,8 +814,12 @@ def my_imports(request):
 def active_imports_count(request):
     """Get count of active/running imports across all users"""
     try:
-        # Count all running imports globally (not user-scoped)
-        count = StorageImport.objects.filter(status='running').count()
+        # Count all running imports globally (not user-scoped). Every watcher
+        # shares one cached count, cleared whenever an import changes status.
+        count = cache.get(ACTIVE_IMPORTS_CACHE_KEY)
+        if count is None:
+            count = StorageImport.objects.filter(status='running').count()
+            cache.set(ACTIVE_IMPORTS_CACHE_KEY, count, ACTIVE_IMPORTS_CACHE_TTL)
 
         return JsonResponse({
             'count': count
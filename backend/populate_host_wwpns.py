@@ -13,59 +13,34 @@ django.setup()
 
 from storage.models import HostWwpn
 from san.models import Alias
+from san.wwpn_reconciliation import sync_alias_host_wwpns
 
 def populate_host_wwpns():
     """Create HostWwpn records for all existing alias-to-host relationships."""
     
     print("🔄 Starting HostWwpn population from existing aliases...")
     
-    # Get all aliases that have both a host and a wwpn assigned
-    aliases_with_hosts = Alias.objects.filter(
-        host__isnull=False,
-        wwpn__isnull=False
-    ).exclude(wwpn='')
+    # Get all aliases that have both a host and at least one WWPN assigned
+    alias_ids = list(
+        Alias.objects.filter(host__isnull=False, alias_wwpns__isnull=False)
+        .values_list('id', flat=True).distinct()
+    )
     
-    print(f"📊 Found {aliases_with_hosts.count()} aliases with hosts and WWPNs")
+    print(f"📊 Found {len(alias_ids)} aliases with hosts and WWPNs")
     
-    created_count = 0
-    updated_count = 0
+    # Bulk create missing records and convert manual ones for the same WWPN
     error_count = 0
-    
-    for alias in aliases_with_hosts:
-        try:
-            # Try to create or update the HostWwpn record
-            host_wwpn, created = HostWwpn.objects.get_or_create(
-                host=alias.host,
-                wwpn=alias.wwpn,
-                defaults={
-                    'source_type': 'alias',
-                    'source_alias': alias
-                }
-            )
-            
-            if created:
-                created_count += 1
-                print(f"✅ Created: {alias.host.name} -> {alias.wwpn} (from alias: {alias.name})")
-            else:
-                # Update existing record to ensure it points to the correct alias
-                if host_wwpn.source_type != 'alias' or host_wwpn.source_alias != alias:
-                    host_wwpn.source_type = 'alias'
-                    host_wwpn.source_alias = alias
-                    host_wwpn.save()
-                    updated_count += 1
-                    print(f"🔄 Updated: {alias.host.name} -> {alias.wwpn} (from alias: {alias.name})")
-                else:
-                    print(f"⏭️  Skipped: {alias.host.name} -> {alias.wwpn} (already exists)")
-                    
-        except Exception as e:
-            error_count += 1
-            print(f"❌ Error processing alias {alias.name}: {e}")
+    try:
+        created_count, updated_count = sync_alias_host_wwpns(alias_ids)
+    except Exception as e:
+        created_count, updated_count, error_count = 0, 0, 1
+        print(f"❌ Error syncing host WWPNs: {e}")
     
     print(f"\n📈 Population Summary:")
     print(f"   ✅ Created: {created_count} new HostWwpn records")
     print(f"   🔄 Updated: {updated_count} existing HostWwpn records")  
     print(f"   ❌ Errors: {error_count}")
-    print(f"   📊 Total processed: {aliases_with_hosts.count()} aliases")
+    print(f"   📊 Total processed: {len(alias_ids)} aliases")
     
     # Verify the results
     total_host_wwpns = HostWwpn.objects.count()
@@ -155,7 +155,7 @@ class AliasAdmin(admin.ModelAdmin):
     actions = ["mark_as_committed", "mark_as_deployed"]
 
     def mark_as_committed(self, request, queryset):
-        updated = queryset.update(committed=True)
+        updated = queryset.update(committed=True, customer_visible=True)
         self.message_user(request, f"{updated} aliases marked as committed.")
     mark_as_committed.short_description = "Mark selected aliases as committed"
 
@@ -222,7 +222,7 @@ class ZoneAdmin(admin.ModelAdmin):
     actions = ["mark_as_committed", "mark_as_deployed", "mark_as_existing", "mark_as_not_existing"]
 
     def mark_as_committed(self, request, queryset):
-        updated = queryset.update(committed=True)
+        updated = queryset.update(committed=True, customer_visible=True)
         self.message_user(request, f"{updated} zones marked as committed.")
     mark_as_committed.short_description = "Mark selected zones as committed"
 
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:45
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('san', '0013_remove_alias_create_remove_alias_delete_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aliaswwpn',
+            index=models.Index(django.db.models.functions.text.Lower(django.db.models.functions.text.Replace(django.db.models.functions.text.Replace(django.db.models.functions.text.Replace(models.F('wwpn'), models.Value(':'), models.Value('')), models.Value('-'), models.Value('')), models.Value(' '), models.Value(''))), name='san_aliaswwpn_wwpn_key_idx'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:45
+
+import re
+from collections import defaultdict
+
+from django.db import migrations, models
+
+# Frozen copy of the core.search_index document format at this migration
+_WWPN_SEPARATORS = re.compile(r'[:\- ]')
+
+
+def _document(*values):
+    return '\n'.join(str(value).lower() for value in values if value not in (None, ''))
+
+
+def populate_search_text(apps, schema_editor):
+    """Build search_text for existing rows"""
+    Alias = apps.get_model('san', 'Alias')
+    AliasWWPN = apps.get_model('san', 'AliasWWPN')
+    Zone = apps.get_model('san', 'Zone')
+
+    wwpns = defaultdict(list)
+    for alias_id, wwpn in AliasWWPN.objects.values_list('alias_id', 'wwpn'):
+        wwpns[alias_id] += [wwpn, _WWPN_SEPARATORS.sub('', wwpn or '')]
+    aliases = [
+        Alias(pk=row[0], search_text=_document(*row[1:], *wwpns[row[0]]))
+        for row in Alias.objects.values_list('id', 'name', 'notes', 'fabric__name', 'use', 'cisco_alias')
+    ]
+    Alias.objects.bulk_update(aliases, ['search_text'], batch_size=500)
+
+    members = defaultdict(list)
+    for zone_id, alias_name in Zone.members.through.objects.values_list('zone_id', 'alias__name'):
+        members[zone_id].append(alias_name)
+    zones = [
+        Zone(pk=row[0], search_text=_document(*row[1:], *members[row[0]]))
+        for row in Zone.objects.values_list('id', 'name', 'fabric__name', 'zone_type', 'notes')
+    ]
+    Zone.objects.bulk_update(zones, ['search_text'], batch_size=500)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """GIN trigram indexes serve '%term%' searches; PostgreSQL only"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in ('san_alias', 'san_zone'):
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_search_trgm ON {table} USING gin (search_text gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in ('san_alias', 'san_zone'):
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('san', '0014_wwpn_key_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alias',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='zone',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(populate_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
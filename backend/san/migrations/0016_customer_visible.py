@@ -0,0 +1,44 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:08
+
+from django.db import migrations, models
+from django.db.models import Case, Exists, OuterRef, Value, When
+
+# Frozen copy of core.customer_visibility.refresh_customer_visible at this
+# migration: (app, model, junction model in core, junction FK to the model)
+_VISIBILITY_MODELS = [
+    ('san', 'Alias', 'ProjectAlias', 'alias'),
+    ('san', 'Zone', 'ProjectZone', 'zone'),
+]
+
+
+def populate_customer_visible(apps, schema_editor):
+    """Compute customer_visible for existing rows"""
+    for app_label, model_name, junction_name, field in _VISIBILITY_MODELS:
+        memberships = apps.get_model('core', junction_name).objects.filter(**{field: OuterRef('pk')})
+        apps.get_model(app_label, model_name).objects.update(customer_visible=Case(
+            When(committed=True, then=Value(True)),
+            When(Exists(memberships), then=Value(False)),
+            default=Value(True),
+        ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_dashboardsummary'),
+        ('san', '0015_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alias',
+            name='customer_visible',
+            field=models.BooleanField(db_index=True, default=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='zone',
+            name='customer_visible',
+            field=models.BooleanField(db_index=True, default=True, editable=False),
+        ),
+        migrations.RunPython(populate_customer_visible, migrations.RunPython.noop),
+    ]
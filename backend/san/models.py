@@ -4,6 +4,7 @@ from storage.models import Storage, Host
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth.models import User
+from .san_tools import wwpn_key_expression
 
 # Create your models here.
 class Switch(models.Model):
@@ -199,6 +200,8 @@ class Alias(models.Model):
         default=False,
         help_text="Actually deployed to infrastructure"
     )
+    # Shown in Customer View (committed or in no project), maintained by core.customer_visibility
+    customer_visible = models.BooleanField(default=True, db_index=True, editable=False)
     created_by_project = models.ForeignKey(
         Project,
         on_delete=models.SET_NULL,
@@ -220,6 +223,9 @@ class Alias(models.Model):
     last_modified_at = models.DateTimeField(auto_now=True, null=True)
     version = models.IntegerField(default=0, help_text="Version number for optimistic locking")
 
+    # Lowercased searchable text, maintained by core.search_index
+    search_text = models.TextField(blank=True, default='', editable=False)
+
     class Meta:
         ordering = ['name']
         unique_together = [
@@ -259,6 +265,10 @@ class AliasWWPN(models.Model):
             ('alias', 'wwpn'),  # Each WWPN can appear only once per alias
             ('alias', 'order'),  # Each order position must be unique per alias
         ]
+        indexes = [
+            # Lookups by normalized WWPN (any stored format)
+            models.Index(wwpn_key_expression(), name='san_aliaswwpn_wwpn_key_idx'),
+        ]
         verbose_name = "Alias WWPN"
         verbose_name_plural = "Alias WWPNs"
 
@@ -366,6 +376,8 @@ class Zone(models.Model):
         default=False,
         help_text="Actually deployed to infrastructure"
     )
+    # Shown in Customer View (committed or in no project), maintained by core.customer_visibility
+    customer_visible = models.BooleanField(default=True, db_index=True, editable=False)
     created_by_project = models.ForeignKey(
         Project,
         on_delete=models.SET_NULL,
@@ -387,5 +399,8 @@ class Zone(models.Model):
     last_modified_at = models.DateTimeField(auto_now=True, null=True)
     version = models.IntegerField(default=0, help_text="Version number for optimistic locking")
 
+    # Lowercased searchable text, maintained by core.search_index
+    search_text = models.TextField(blank=True, default='', editable=False)
+
     def __str__(self):
         return f'{self.fabric.customer}: {self.name}'
\ No newline at end of file
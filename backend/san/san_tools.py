@@ -1,5 +1,20 @@
 import re
 
+from django.db.models import F, Value
+from django.db.models.functions import Lower, Replace
+
+
+def wwpn_key_expression(field='wwpn'):
+    """
+    Database expression for the normalized key of a WWPN column (16
+    lowercase hex digits). The WWPN tables have an index on exactly this
+    expression, so lookups on it stay indexed.
+    """
+    expression = F(field)
+    for separator in (':', '-', ' '):
+        expression = Replace(expression, Value(separator), Value(''))
+    return Lower(expression)
+
 
 def wwpn_colonizer(wwpn, notation=':'):
     notation_set = set([':', '-', ' ', ''])
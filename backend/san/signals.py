@@ -1,14 +1,16 @@
 """
-Django signals for SAN models to trigger audit logging
+Django signals for SAN models to trigger audit logging and filter facet invalidation
 """
 
-from django.db.models.signals import post_save, post_delete, pre_delete
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
 from django.dispatch import receiver
-from .models import Fabric, Zone, Alias, Switch
-from core.audit import log_create, log_update, log_delete
+from .models import Fabric, Zone, Alias, AliasWWPN, Switch
+from core.audit import audit_batchable, log_create, log_update, log_delete
+from core.filter_facets import invalidate_filter_facets_for
 
 
 @receiver(post_save, sender=Fabric)
+@audit_batchable('FABRIC')
 def fabric_post_save(sender, instance, created, **kwargs):
     """Log fabric creation and updates"""
     from core.middleware import get_current_user
@@ -39,6 +41,7 @@ def fabric_post_save(sender, instance, created, **kwargs):
 
 
 @receiver(pre_delete, sender=Fabric)
+@audit_batchable('FABRIC')
 def fabric_pre_delete(sender, instance, **kwargs):
     """Log fabric deletion (using pre_delete to access related data)"""
     from core.middleware import get_current_user
@@ -57,6 +60,7 @@ def fabric_pre_delete(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=Zone)
+@audit_batchable('ZONE')
 def zone_post_save(sender, instance, created, **kwargs):
     """Log zone creation (updates not logged to avoid log spam)"""
     from core.middleware import get_current_user
@@ -78,6 +82,7 @@ def zone_post_save(sender, instance, created, **kwargs):
 
 
 @receiver(pre_delete, sender=Zone)
+@audit_batchable('ZONE')
 def zone_pre_delete(sender, instance, **kwargs):
     """Log zone deletion"""
     from core.middleware import get_current_user
@@ -96,6 +101,7 @@ def zone_pre_delete(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=Alias)
+@audit_batchable('ALIAS')
 def alias_post_save(sender, instance, created, **kwargs):
     """Log alias creation (updates not logged to avoid log spam)"""
     from core.middleware import get_current_user
@@ -116,6 +122,7 @@ def alias_post_save(sender, instance, created, **kwargs):
 
 
 @receiver(pre_delete, sender=Alias)
+@audit_batchable('ALIAS')
 def alias_pre_delete(sender, instance, **kwargs):
     """Log alias deletion"""
     from core.middleware import get_current_user
@@ -133,6 +140,7 @@ def alias_pre_delete(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=Switch)
+@audit_batchable('SWITCH')
 def switch_post_save(sender, instance, created, **kwargs):
     """Log switch creation and updates"""
     from core.middleware import get_current_user
@@ -163,6 +171,7 @@ def switch_post_save(sender, instance, created, **kwargs):
 
 
 @receiver(pre_delete, sender=Switch)
+@audit_batchable('SWITCH')
 def switch_pre_delete(sender, instance, **kwargs):
     """Log switch deletion"""
     from core.middleware import get_current_user
@@ -178,3 +187,39 @@ def switch_pre_delete(sender, instance, **kwargs):
         customer=instance.customer,
         details={'fabrics_affected': fabric_count}
     )
+
+
+# Filter facets (core.filter_facets) of the tables each change affects
+
+@receiver(post_save, sender=Fabric)
+@receiver(post_delete, sender=Fabric)
+def fabric_filter_facets_changed(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_filter_facets_for(instance, '', 'zones', 'aliases')
+
+
+@receiver(post_save, sender=Zone)
+@receiver(post_delete, sender=Zone)
+def zone_filter_facets_changed(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_filter_facets_for(instance, 'fabric', 'zones', 'aliases')
+
+
+@receiver(m2m_changed, sender=Zone.members.through)
+def zone_members_filter_facets_changed(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_filter_facets_for(instance, 'fabric', 'zones', 'aliases')
+
+
+@receiver(post_save, sender=Alias)
+@receiver(post_delete, sender=Alias)
+def alias_filter_facets_changed(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_filter_facets_for(instance, 'fabric', 'aliases', 'zones', 'hosts')
+
+
+@receiver(post_save, sender=AliasWWPN)
+@receiver(post_delete, sender=AliasWWPN)
+def alias_wwpn_filter_facets_changed(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_filter_facets_for(instance, 'alias.fabric', 'aliases')
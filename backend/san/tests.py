@@ -1,3 +1,152 @@
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Project, ProjectZone
+from core.search_index import search_filter
+from customers.models import Customer
+from storage.models import Host, HostWwpn, Port, Storage
+from .models import Alias, AliasWWPN, Fabric, Zone
+from .wwpn_reconciliation import (
+    CONFLICT, LINKABLE, MATCHED, ORPHANED, apply_alias_host_links, normalize_wwpn, reconcile_customer_wwpns,
+)
+
+
+class WwpnReconciliationTests(TestCase):
+    """Alias, host and port WWPNs are reconciled for a whole customer at once"""
+
+    def setUp(self):
+        # Run the search refresh callbacks so each test starts from a committed state
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer = Customer.objects.create(name='Recon Customer')
+            self.fabric = Fabric.objects.create(customer=self.customer, name='fab-a', san_vendor='BR')
+            self.storage = Storage.objects.create(customer=self.customer, name='fs1', storage_type='FlashSystem')
+            self.host_a = Host.objects.create(storage=self.storage, name='host-a')
+            self.host_b = Host.objects.create(storage=self.storage, name='host-b')
+
+    def _alias(self, name, wwpn, host=None, use='init'):
+        alias = Alias.objects.create(fabric=self.fabric, name=name, host=host, use=use)
+        AliasWWPN.objects.create(alias=alias, wwpn=wwpn)
+        return alias
+
+    def _statuses(self):
+        report = reconcile_customer_wwpns(self.customer.id)
+        return {normalize_wwpn(entry['wwpn']): (entry['status'], entry['reason']) for entry in report['entries']}
+
+    def test_classification_ignores_wwpn_format(self):
+        # Manual host WWPN stored with colons, alias WWPN without: linkable
+        HostWwpn.objects.create(host=self.host_a, wwpn='10:00:00:00:C9:00:00:01')
+        unlinked = self._alias('host_a_p1', '10000000c9000001', use=None)
+        # Claimed by two hosts
+        self._alias('host_b_p1', '10:00:00:00:c9:00:00:02', host=self.host_b)
+        HostWwpn.objects.create(host=self.host_a, wwpn='10:00:00:00:C9:00:00:02')
+        # Storage port with its alias, and a port nobody zoned
+        port_alias = self._alias('fs1_p1', '50:05:07:68:00:00:00:01', use='target')
+        Port.objects.create(storage=self.storage, name='p1', type='fc', wwpn='5005076800000001', alias=port_alias)
+        Port.objects.create(storage=self.storage, name='p2', type='fc', wwpn='50:05:07:68:00:00:00:02')
+
+        statuses = self._statuses()
+        self.assertEqual(statuses['10000000c9000001'], (LINKABLE, None))
+        self.assertEqual(statuses['10000000c9000002'], (CONFLICT, 'multiple_hosts'))
+        self.assertEqual(statuses['5005076800000001'], (MATCHED, None))
+        self.assertEqual(statuses['5005076800000002'], (ORPHANED, 'port_only'))
+
+        with self.assertNumQueries(3):
+            reconcile_customer_wwpns(self.customer.id)
+        filtered = reconcile_customer_wwpns(self.customer.id, wwpns=['10-00-00-00-c9-00-00-01'])
+        self.assertEqual([entry['aliases'][0]['alias_id'] for entry in filtered['entries']], [unlinked.id])
+
+    def test_apply_links_aliases_and_converts_host_wwpns(self):
+        HostWwpn.objects.create(host=self.host_a, wwpn='10:00:00:00:C9:00:00:01')
+        first = self._alias('host_a_p1', '10000000c9000001', use=None)
+        # Linked already, but the host has no WWPN row for it yet
+        second = self._alias('host_b_p1', '10:00:00:00:c9:00:00:03', host=self.host_b)
+
+        result = apply_alias_host_links(self.customer.id)
+
+        self.assertEqual((result['aliases_linked'], result['host_wwpns_created'], result['host_wwpns_converted']), (1, 1, 1))
+        self.assertEqual(result['summary'][MATCHED], 2)
+        first.refresh_from_db()
+        self.assertEqual((first.host_id, first.use, first.version), (self.host_a.id, 'init', 1))
+        self.assertEqual(
+            set(HostWwpn.objects.values_list('host_id', 'wwpn', 'source_type', 'source_alias_id')),
+            {
+                (self.host_a.id, '10:00:00:00:C9:00:00:01', 'alias', first.id),
+                (self.host_b.id, '10:00:00:00:C9:00:00:03', 'alias', second.id),
+            }
+        )
+
+        # Nothing left to do on a second run
+        self.assertEqual(apply_alias_host_links(self.customer.id)['aliases_linked'], 0)
+
+    def test_apply_links_refreshes_search_text(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            alias = self._alias('host_a_p1', '10:00:00:00:c9:00:00:02', host=self.host_a, use=None)
+        self.assertFalse(Host.objects.filter(search_filter('c9:00:00:02')).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_alias_host_links(self.customer.id)
+
+        self.assertEqual(list(Host.objects.filter(search_filter('c9:00:00:02'))), [self.host_a])
+        self.assertEqual(list(Alias.objects.filter(search_filter('init'))), [alias])
+
+    def test_endpoints(self):
+        manual = HostWwpn.objects.create(host=self.host_a, wwpn='10:00:00:00:C9:00:00:01')
+        alias = self._alias('host_a_p1', '10000000c9000001', use=None)
+
+        host_view = self.client.get(f'/api/san/hosts/{self.host_a.id}/wwpn-reconciliation/').json()
+        self.assertEqual(host_view['status'], 'matches_available')
+        self.assertEqual(host_view['matches'][0]['host_wwpn_id'], manual.id)
+
+        url = f'/api/san/wwpn-reconciliation/{self.customer.id}/'
+        self.assertEqual(self.client.get(url).json()['summary'][LINKABLE], 1)
+        response = self.client.post(url, {'alias_ids': [alias.id]}, content_type='application/json')
+        self.assertEqual(response.json()['aliases_linked'], 1)
+        self.assertEqual(self.client.get(url, {'status': MATCHED}).json()['entries'][0]['host_id'], self.host_a.id)
+
+    @override_settings(DEFAULT_PAGE_SIZE=50, MAX_PAGE_SIZE=500)
+    def test_hosts_by_project_table_status(self):
+        project = Project.objects.create(name='Recon Project')
+        self.customer.projects.add(project)
+        HostWwpn.objects.create(host=self.host_a, wwpn='10:00:00:00:C9:00:00:01')
+        self._alias('host_a_p1', '10000000c9000001', use=None)
+        linked = self._alias('host_b_p1', '10000000c9000002', host=self.host_b)
+        HostWwpn.objects.create(host=self.host_b, wwpn='10:00:00:00:C9:00:00:02', source_type='alias', source_alias=linked)
+
+        url = f'/api/san/hosts/project/{project.id}/'
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'format': 'table'})
+        self.assertEqual(response.status_code, 200)
+        statuses = {host['name']: (host['wwpn_status_level'], host['wwpn_status']) for host in response.json()['results']}
+        self.assertEqual(statuses, {
+            'host-a': ('matches_available', '1 match available'),
+            'host-b': ('all_matched', 'All 1 WWPN matched'),
+        })
+
+        # The query count does not grow with the hosts on the page
+        for i in range(3):
+            host = Host.objects.create(storage=self.storage, name=f'host-{i}')
+            HostWwpn.objects.create(host=host, wwpn=f'10:00:00:00:C9:00:01:0{i}')
+        with self.assertNumQueries(len(queries)):
+            self.client.get(url, {'format': 'table'})
+
+
+class ZoneMaxMembersTests(TestCase):
+    """The largest zone of a project is found with one aggregate query"""
+
+    def test_max_members(self):
+        customer = Customer.objects.create(name='Zone Customer')
+        fabric = Fabric.objects.create(customer=customer, name='fab-a', san_vendor='BR')
+        project = Project.objects.create(name='Zone Project')
+        aliases = [Alias.objects.create(fabric=fabric, name=f'alias_{i}') for i in range(3)]
+        for name, members in (('zone_small', aliases[:1]), ('zone_large', aliases), ('zone_other', aliases)):
+            zone = Zone.objects.create(fabric=fabric, name=name)
+            zone.members.set(members)
+            if name != 'zone_other':
+                ProjectZone.objects.create(project=project, zone=zone)
+
+        response = self.client.get(f'/api/san/zones/project/{project.id}/max-members/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'max_members': 3, 'max_zone_name': 'zone_large', 'total_zones': 2})
 
-# Create your tests here.
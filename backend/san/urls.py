@@ -17,6 +17,7 @@ from .views import (
     host_delete_view,
     assign_host_to_alias_view,
     host_wwpn_reconciliation_view,
+    customer_wwpn_reconciliation_view,
     zones_by_project_view,
     zone_project_view,
     zone_customer_list_view,
@@ -57,6 +58,7 @@ urlpatterns = [
     path("hosts/save/", host_save_view, name="save-host"),
     path("hosts/delete/<int:pk>/", host_delete_view, name="delete-host"),
     path("hosts/<int:host_id>/wwpn-reconciliation/", host_wwpn_reconciliation_view, name="host-wwpn-reconciliation"),
+    path("wwpn-reconciliation/<int:customer_id>/", customer_wwpn_reconciliation_view, name="customer-wwpn-reconciliation"),
     path("assign-host-to-alias/", assign_host_to_alias_view, name="assign-host-to-alias"),
     path("aliases/fabric/<int:fabric_id>/", alias_by_fabric_view, name="aliases-by-fabric"),
     path("aliases/copy-to-project/", alias_copy_to_project_view, name="copy-aliases-to-project"),
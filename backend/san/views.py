@@ -9,21 +9,32 @@ from django.conf import settings
 from .models import Alias, Zone, Fabric, WwpnPrefix, Switch, AliasWWPN
 from customers.models import Customer
 from core.models import Config, Project, UserConfig, ProjectAlias, ProjectZone, ProjectHost, ProjectSwitch, ProjectFabric
-from storage.models import Host
+from storage.models import Host, HostWwpn
 from .serializers import AliasSerializer, ZoneSerializer, FabricSerializer, WwpnPrefixSerializer, SwitchSerializer
 from django.db import IntegrityError
 from collections import defaultdict
+from .wwpn_reconciliation import (
+    LINKABLE, MATCHED, STATUSES as WWPN_STATUSES, apply_alias_host_links, link_aliases_to_hosts,
+    normalize_wwpn, reconcile_customer_wwpns,
+)
 from .san_utils import generate_alias_commands, generate_zone_commands, generate_alias_deletion_only_commands, generate_zone_deletion_commands, generate_zone_creation_commands
 from django.utils import timezone
 from core.dashboard_views import clear_dashboard_cache_for_customer
-from core.audit import log_create, log_update, log_delete
+from core.audit import audit_batched_view, current_audit_batch, log_create, log_update, log_delete
+from core.filter_facets import FacetError, get_filter_facet
+from core.project_view_cache import cached_project_view
+from core.search_index import search_filter
+from core.table_filters import FilterError, shown_calculated, table_filters
+from core.debug_log import view_logger
+
+debug_log = view_logger(__name__)
 
 
 @csrf_exempt
 @require_http_methods(["GET", "POST", "PUT", "PATCH", "DELETE"])
 def fabric_management(request, pk=None):
     """Handle fabric CRUD operations with pagination and filtering."""
-    print(f"🔥🔥🔥 FABRIC MANAGEMENT CALLED - Method: {request.method}, PK: {pk} 🔥🔥🔥")
+    debug_log.debug('fabric management request', method=request.method, pk=pk)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -84,18 +95,18 @@ def fabric_management(request, pk=None):
                 # Customer View filtering: Show fabrics that are either:
                 # 1. Committed (committed=True), OR
                 # 2. Not referenced by any project (no junction table entries)
-                print(f"DEBUG: Before filter - count: {fabrics.count()}")
+                debug_log.debug('fabrics before committed filter', count=fabrics.count)
                 fabrics = fabrics.annotate(
                     project_count=Count('project_memberships')
                 ).filter(
                     Q(committed=True) | Q(project_count=0)
                 )
-                print(f"DEBUG: After filter - count: {fabrics.count()}")
+                debug_log.debug('fabrics after committed filter', count=fabrics.count)
 
                 # Filter by customer if provided
                 if customer_id:
                     fabrics = fabrics.filter(customer=customer_id)
-                    print(f"DEBUG: After customer filter - count: {fabrics.count()}")
+                    debug_log.debug('fabrics after customer filter', customer_id=customer_id, count=fabrics.count)
                 
                 # Apply search if provided
                 if search:
@@ -153,14 +164,12 @@ def fabric_management(request, pk=None):
     
     elif request.method == "POST":
         # Create new fabric - requires admin role
-        print("🔥 POST handler started")
         if not user or not user.is_authenticated:
             return JsonResponse({"error": "Authentication required"}, status=401)
 
         try:
-            print("🔥 Loading request body")
             data = json.loads(request.body)
-            print(f"🔥 Request data: {data}")
+            debug_log.debug('create fabric data', data=data)
 
             # Check if user can modify infrastructure for this customer
             customer_id = data.get('customer')
@@ -168,7 +177,6 @@ def fabric_management(request, pk=None):
                 from customers.models import Customer
                 from core.permissions import can_edit_customer_infrastructure
                 try:
-                    print(f"🔥 Checking permissions for customer {customer_id}")
                     customer = Customer.objects.get(id=customer_id)
                     if not can_edit_customer_infrastructure(user, customer):
                         return JsonResponse({
@@ -177,28 +185,19 @@ def fabric_management(request, pk=None):
                 except Customer.DoesNotExist:
                     return JsonResponse({"error": "Customer not found"}, status=404)
 
-            print("🔥 Creating serializer")
             serializer = FabricSerializer(data=data)
-            print("🔥 Validating serializer")
             if serializer.is_valid():
-                print("🔥 Serializer is valid!")
                 try:
-                    print("✅ Step 1: Saving fabric...")
                     fabric = serializer.save(last_modified_by=user)
-                    print(f"✅ Step 2: Fabric saved with ID: {fabric.pk}")
+                    debug_log.debug('fabric created', fabric_id=fabric.pk)
 
                     # Clear dashboard cache when fabric is created
                     if fabric.customer_id:
-                        print(f"✅ Step 3: Clearing cache for customer {fabric.customer_id}...")
                         clear_dashboard_cache_for_customer(fabric.customer_id)
-                        print("✅ Step 4: Cache cleared")
 
                     # Reload fabric from database to get all related fields
-                    print("✅ Step 5: Reloading fabric from database...")
                     fabric = Fabric.objects.select_related('customer', 'last_modified_by').get(pk=fabric.pk)
-                    print("✅ Step 6: Fabric reloaded")
 
-                    print("✅ Step 7: Serializing response...")
                     response_data = {
                         'message': f'Fabric "{fabric.name}" created successfully',
                         'fabric': FabricSerializer(fabric).data
@@ -217,7 +216,6 @@ def fabric_management(request, pk=None):
                         }
                     )
 
-                    print("✅ Step 8: Response data created, returning...")
                     return JsonResponse(response_data, status=201)
                 except Exception as inner_e:
                     import traceback
@@ -354,7 +352,7 @@ def fabric_management(request, pk=None):
 @require_http_methods(["POST"])
 def fabric_delete_view(request, pk):
     """Delete a specific fabric."""
-    print(f"🔥 Fabric Delete - PK: {pk}")
+    debug_log.debug('fabric delete request', pk=pk)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -391,185 +389,78 @@ def fabric_delete_view(request, pk):
 
 
 def get_unique_values_for_zones(request, project, field_name):
-    """Get unique values for a specific field from zones in a project."""
-    print(f"🔍 Getting unique values for zone field: {field_name} in project {project.id}")
-    
+    """Get unique values for a specific field from zones of the project's customer."""
+
     try:
-        # Handle calculated field - member_count
-        if field_name == 'member_count':
-            # Calculate member_count for all zones and get unique values
-            zones_queryset = Zone.objects.select_related('fabric').filter(projects=project).annotate(
-                _member_count=Count('members', distinct=True)
-            )
-            unique_values = zones_queryset.values_list('_member_count', flat=True).distinct().order_by('_member_count')
-            actual_field = '_member_count'  # Set actual_field for consistency
-        else:
-            # Base queryset for zones in the project
-            zones_queryset = Zone.objects.select_related('fabric').filter(projects=project)
-            
-            # Map field names to actual model fields
-            field_mapping = {
-                'create': 'create',
-                'delete': 'delete', 
-                'exists': 'exists',
-                'fabric__name': 'fabric__name',
-                'zone_type': 'zone_type',
-                'notes': 'notes'
-            }
-            
-            # Get the actual field name
-            actual_field = field_mapping.get(field_name, field_name)
-            
-            # Get unique values for the field
-            unique_values = zones_queryset.values_list(actual_field, flat=True).distinct().order_by(actual_field)
-        
-        # Convert to list and handle different field types
-        unique_values = list(unique_values)
-        
-        # Handle boolean fields specially (only for non-calculated fields)
-        if field_name != 'member_count' and actual_field in ['create', 'delete', 'exists']:
-            # For boolean fields, we need to handle True, False, and potentially None
-            boolean_values = set(unique_values)  # Get unique boolean values including None
-            # Convert to consistent string representation, including None values
-            processed_booleans = []
-            for value in boolean_values:
-                if value is True:
-                    processed_booleans.append('True')
-                elif value is False:
-                    processed_booleans.append('False')
-                # Skip None values for boolean fields as they're not meaningful for filtering
-            unique_values = sorted(processed_booleans)  # Sort to ensure consistent order
-        else:
-            # For non-boolean fields, filter out None/null values
-            unique_values = [value for value in unique_values if value is not None and str(value).strip() != '']
-        
-        print(f"✅ Found {len(unique_values)} unique values for zone {field_name}: {unique_values}")
-        
+        # Served from the cached facet of the customer's zones
+        customer = project.customers.first()
+        value_counts = get_filter_facet(
+            customer.id if customer else None, 'zones', field_name,
+            prefix=request.GET.get('prefix', '').strip() or None
+        )
+
+        debug_log.debug('zone unique values', project_id=project.id, field=field_name, count=len(value_counts))
+
         return JsonResponse({
-            'unique_values': unique_values
+            'unique_values': [item['value'] for item in value_counts],
+            'value_counts': value_counts
         })
-        
+
+    except FacetError as e:
+        return JsonResponse({"error": str(e)}, status=400)
     except Exception as e:
         print(f"❌ Error getting unique values for zone {field_name}: {str(e)}")
         return JsonResponse({"error": f"Failed to get unique values: {str(e)}"}, status=500)
 
 
 def get_unique_values_for_aliases(request, project, field_name):
-    """Get unique values for a specific field from aliases in a project."""
-    print(f"🔍 Getting unique values for field: {field_name} in project {project.id}")
+    """Get unique values for a specific field from aliases of the project's customer."""
 
     try:
-        # Handle calculated field - zoned_count
-        if field_name == 'zoned_count':
-            # Calculate zoned_count for all aliases and get unique values
-            aliases_queryset = Alias.objects.select_related('fabric').filter(projects=project).annotate(
-                _zoned_count=Count('zone', filter=Q_models(zone__projects=project), distinct=True)
-            )
-            unique_values = aliases_queryset.values_list('_zoned_count', flat=True).distinct().order_by('_zoned_count')
-            actual_field = '_zoned_count'  # Set actual_field for consistency
-        # Handle storage_details.name - looked up via Port.wwpn
-        elif field_name in ['storage_details.name', 'storage__name']:
-            from storage.models import Port
-
-            # Get customer_id from project
-            customer_id = project.customers.first().id if project.customers.exists() else None
-
-            # Get all aliases in this project with WWPNs (normalized for comparison)
-            project_alias_ids = ProjectAlias.objects.filter(project=project).values_list('alias_id', flat=True)
-            aliases = Alias.objects.filter(id__in=project_alias_ids, wwpn__isnull=False).exclude(wwpn='')
-            alias_wwpns = set()
-            for alias in aliases:
-                if alias.wwpn:
-                    # Normalize WWPN (remove colons, uppercase)
-                    normalized = alias.wwpn.replace(':', '').upper()
-                    alias_wwpns.add(normalized)
-
-            # Get all ports for the customer with WWPNs
-            ports_query = Port.objects.select_related('storage').filter(
-                wwpn__isnull=False,
-                storage__isnull=False
-            )
-
-            # Filter by customer if available
-            if customer_id:
-                ports_query = ports_query.filter(storage__customer_id=customer_id)
-
-            # Collect unique storage names from matching ports
-            storage_names = set()
-            for port in ports_query:
-                if port.wwpn:
-                    # Normalize port WWPN
-                    port_wwpn_normalized = port.wwpn.replace(':', '').upper()
-                    # Check if this port's WWPN matches any alias WWPN
-                    if port_wwpn_normalized in alias_wwpns:
-                        if port.storage and port.storage.name:
-                            storage_names.add(port.storage.name)
-
-            unique_values = sorted(list(storage_names))
-            actual_field = 'storage_details.name'
-        else:
-            # Base queryset for aliases in the project
-            aliases_queryset = Alias.objects.select_related('fabric').filter(projects=project)
-
-            # Map field names to actual model fields
-            field_mapping = {
-                'create': 'create',
-                'include_in_zoning': 'include_in_zoning',
-                'fabric__name': 'fabric__name',
-                'use': 'use',
-                'cisco_alias': 'cisco_alias',
-                'notes': 'notes'
-            }
+        # Served from the cached facet of the customer's aliases
+        customer = project.customers.first()
+        value_counts = get_filter_facet(
+            customer.id if customer else None, 'aliases', field_name,
+            prefix=request.GET.get('prefix', '').strip() or None
+        )
 
-            # Get the actual field name
-            actual_field = field_mapping.get(field_name, field_name)
+        debug_log.debug('alias unique values', project_id=project.id, field=field_name, count=len(value_counts))
 
-            # Get unique values for the field
-            unique_values = aliases_queryset.values_list(actual_field, flat=True).distinct().order_by(actual_field)
-        
-        # Convert to list and handle different field types
-        unique_values = list(unique_values)
-        
-        # Handle boolean fields specially
-        if actual_field in ['create', 'delete', 'include_in_zoning', 'logged_in']:
-            # For boolean fields, we need to handle True, False, and potentially None
-            boolean_values = set(unique_values)  # Get unique boolean values including None
-            # Convert to consistent string representation, including None values
-            processed_booleans = []
-            for value in boolean_values:
-                if value is True:
-                    processed_booleans.append('True')
-                elif value is False:
-                    processed_booleans.append('False')
-                # Skip None values for boolean fields as they're not meaningful for filtering
-            unique_values = sorted(processed_booleans)  # Sort to ensure consistent order
-        else:
-            # For non-boolean fields, filter out None/null values
-            unique_values = [value for value in unique_values if value is not None and str(value).strip() != '']
-        
-        print(f"✅ Found {len(unique_values)} unique values for {field_name}: {unique_values}")
-        
         return JsonResponse({
-            'unique_values': unique_values
+            'unique_values': [item['value'] for item in value_counts],
+            'value_counts': value_counts
         })
-        
+
+    except FacetError as e:
+        return JsonResponse({"error": str(e)}, status=400)
     except Exception as e:
         print(f"❌ Error getting unique values for {field_name}: {str(e)}")
         return JsonResponse({"error": f"Failed to get unique values: {str(e)}"}, status=500)
 
 
+# Alias storage columns: matched through port WWPNs, not Alias.storage
+ALIAS_STORAGE_COLUMNS = ('storage', 'storage__name', 'storage_name', 'storage_details.name')
+
+
+def alias_storage_filter(params):
+    """(param, value) of the storage column filter of an alias table request, if any"""
+    prefixes = tuple(f'{column}__' for column in ALIAS_STORAGE_COLUMNS)
+    for param, value in params.items():
+        if param.startswith(prefixes):
+            return param, value
+    return None
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 def alias_list_view(request, project_id):
     """Fetch aliases belonging to a specific project."""
-    print(f"🔥 Alias List - Project ID: {project_id}")
-    print(f"🔍 Query params: {dict(request.GET)}")
+    debug_log.debug('alias list request', project_id=project_id, params=lambda: dict(request.GET))
 
     try:
         project = Project.objects.get(id=project_id)
     except Project.DoesNotExist:
         print(f"❌ Project {project_id} not found - likely deleted. Request from {request.META.get('HTTP_REFERER', 'unknown')}")
-        print(f"🔄 Suggesting config refresh to prevent repeated requests...")
         return JsonResponse({
             "error": f"Project {project_id} not found. This project may have been deleted.",
             "project_id": project_id,
@@ -613,14 +504,8 @@ def alias_list_view(request, project_id):
                 fabric_id__in=customer_fabric_ids
             )
 
-            # Customer View filtering: Show aliases that are either:
-            # 1. Committed (committed=True), OR
-            # 2. Not referenced by any project (no junction table entries)
-            aliases_queryset = aliases_queryset.annotate(
-                project_count=Count('project_memberships')  # Correct relationship name
-            ).filter(
-                Q(committed=True) | Q(project_count=0)
-            )
+            # Customer View: committed, or not in any project (core.customer_visibility)
+            aliases_queryset = aliases_queryset.filter(customer_visible=True)
         else:
             # Fallback if no customer (shouldn't happen but handle gracefully)
             project_alias_ids = ProjectAlias.objects.filter(project=project).values_list('alias_id', flat=True)
@@ -666,94 +551,24 @@ def alias_list_view(request, project_id):
         if exclude_alias_ids:
             aliases_queryset = aliases_queryset.exclude(id__in=exclude_alias_ids)
 
-    # Annotate with zoned_count
-    aliases_queryset = aliases_queryset.annotate(
-        _zoned_count=Count('zone', filter=Q_models(zone__id__in=project_zone_ids), distinct=True)
-    )
-    
     # Apply general search if provided
     if search:
-        print(f"🔍 alias_list_view: Applying search filter: '{search}'")
-        aliases_queryset = aliases_queryset.filter(
-            Q(name__icontains=search) |
-            Q(alias_wwpns__wwpn__icontains=search) |
-            Q(notes__icontains=search) |
-            Q(fabric__name__icontains=search) |
-            Q(use__icontains=search) |
-            Q(cisco_alias__icontains=search)
-        ).distinct()
-        print(f"🔍 alias_list_view: Count after search = {aliases_queryset.count()}")
-    else:
-        print(f"🔍 alias_list_view: No search parameter provided")
+        aliases_queryset = aliases_queryset.filter(search_filter(search))
+        debug_log.debug('alias_list_view search applied', search=search, count=aliases_queryset.count)
 
-    # Apply field-specific filters
-    filter_params = {}
-    storage_filter_value = None  # Track storage filtering separately
+    # Apply column filters and ordering
+    try:
+        compiled = table_filters('aliases').compile(
+            request.GET, context={'zone_ids': project_zone_ids}, ordering=ordering,
+            skip=ALIAS_STORAGE_COLUMNS
+        )
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    aliases_queryset = compiled.apply(aliases_queryset)
+    debug_log.debug('alias_list_view filters applied', count=aliases_queryset.count)
 
-    for param, value in request.GET.items():
-        # Handle storage_details.name filtering (computed field via Port.wwpn lookup)
-        if param.startswith(('storage_details.name__', 'storage__name__')) or param in ['storage_details.name', 'storage__name']:
-            storage_filter_value = (param, value)
-            continue  # Skip adding to filter_params, will handle separately
-
-        if param.startswith(('name__', 'wwpn__', 'use__', 'fabric__name__', 'host__name__', 'cisco_alias__', 'notes__', 'logged_in__', 'committed__', 'deployed__', 'zoned_count__')) or param in ['zoned_count', 'fabric__name', 'host__name', 'use', 'cisco_alias', 'logged_in', 'committed', 'deployed']:
-            # Handle boolean field filtering - convert string representations back to actual booleans
-            if any(param.startswith(f'{bool_field}__') for bool_field in ['logged_in', 'committed', 'deployed']):
-                if param.endswith('__in'):
-                    # Handle multi-select boolean filters (e.g., create__in=True,False)
-                    boolean_values = []
-                    for str_val in value.split(','):
-                        str_val = str_val.strip()
-                        if str_val.lower() == 'true':
-                            boolean_values.append(True)
-                        elif str_val.lower() == 'false':
-                            boolean_values.append(False)
-                    filter_params[param] = boolean_values
-                else:
-                    # Handle single boolean filters (e.g., create__exact=True)
-                    if value.lower() == 'true':
-                        filter_params[param] = True
-                    elif value.lower() == 'false':
-                        filter_params[param] = False
-            else:
-                # Handle calculated fields - map to annotated field names
-                if param.startswith('zoned_count__'):
-                    # Map zoned_count__ to _zoned_count__
-                    mapped_param = param.replace('zoned_count__', '_zoned_count__')
-                    # Handle multi-select values (comma-separated)
-                    if param.endswith('__in') and isinstance(value, str) and ',' in value:
-                        # Convert comma-separated string to list of integers
-                        try:
-                            filter_params[mapped_param] = [int(v.strip()) for v in value.split(',')]
-                        except ValueError:
-                            filter_params[mapped_param] = value.split(',')
-                    elif param.endswith('__in') and isinstance(value, str):
-                        # Handle single value in __in parameter
-                        try:
-                            filter_params[mapped_param] = [int(value.strip())]
-                        except ValueError:
-                            filter_params[mapped_param] = [value.strip()]
-                    else:
-                        # Handle single values - try to convert to int if possible
-                        try:
-                            filter_params[mapped_param] = int(value) if str(value).isdigit() else value
-                        except (ValueError, AttributeError):
-                            filter_params[mapped_param] = value
-                elif param == 'zoned_count':
-                    # Handle direct zoned_count equals filter
-                    try:
-                        filter_params['_zoned_count'] = int(value)
-                    except ValueError:
-                        filter_params['_zoned_count'] = value
-                else:
-                    # Handle non-boolean fields normally
-                    filter_params[param] = value
-    
-    # Apply the filters
-    if filter_params:
-        print(f"🔍 Applying filters: {filter_params}")
-        aliases_queryset = aliases_queryset.filter(**filter_params)
-        print(f"📊 Filter result count: {aliases_queryset.count()}")
+    # The storage column is matched through port WWPNs
+    storage_filter_value = alias_storage_filter(request.GET)
 
     # Apply storage filter if present (must be done via Port.wwpn lookup)
     if storage_filter_value:
@@ -761,7 +576,7 @@ def alias_list_view(request, project_id):
         from san.models import AliasWWPN
 
         param, value = storage_filter_value
-        print(f"🔍 Applying storage filter: {param} = {value}")
+        debug_log.debug('alias storage filter', param=param, value=value)
 
         # Get customer_id from project
         customer_id = project.customers.first().id if project.customers.exists() else None
@@ -803,7 +618,7 @@ def alias_list_view(request, project_id):
             if port:
                 port_wwpns.add(port.replace(':', '').upper())
 
-        print(f"🔍 Found {len(port_wwpns)} WWPNs matching storage filter")
+        debug_log.debug('storage filter port wwpns', count=len(port_wwpns))
 
         # Find aliases with matching WWPNs using database query on AliasWWPN table
         # This is much faster than iterating through all aliases in Python
@@ -821,12 +636,8 @@ def alias_list_view(request, project_id):
 
         # Apply the filter
         aliases_queryset = aliases_queryset.filter(id__in=matching_alias_ids)
-        print(f"📊 Storage filter result count: {len(matching_alias_ids)} aliases")
+        debug_log.debug('storage filter aliases', count=len(matching_alias_ids))
 
-    # Apply ordering
-    if ordering:
-        aliases_queryset = aliases_queryset.order_by(ordering)
-    
     # Add pagination for performance with large datasets
     from django.core.paginator import Paginator
 
@@ -852,6 +663,11 @@ def alias_list_view(request, project_id):
     # Get customer_id from project
     customer_id = project.customers.first().id if project.customers.exists() else None
 
+    # Calculated columns the table shows, for this page only
+    page_obj.object_list = table_filters('aliases').annotate_page(
+        page_obj.object_list, shown_calculated(request, 'aliases'), {'zone_ids': project_zone_ids}
+    )
+
     # Build WWPN→Storage map for bulk lookup (performance optimization)
     # This prevents N+1 queries when serializing storage_details
     wwpn_storage_map = {}
@@ -876,7 +692,7 @@ def alias_list_view(request, project_id):
                     "name": port.storage.name
                 }
 
-        print(f"🔧 Built WWPN→Storage map with {len(wwpn_storage_map)} entries for performance")
+        debug_log.debug('wwpn storage map built', entries=len(wwpn_storage_map))
     except Exception as e:
         print(f"⚠️ Failed to build WWPN→Storage map: {e}")
         # Continue without the map - serializer will fall back to individual queries
@@ -906,6 +722,7 @@ def alias_list_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('aliases')
 def alias_project_view(request, project_id):
     """
     Get aliases in project with field_overrides applied (merged view).
@@ -915,8 +732,7 @@ def alias_project_view(request, project_id):
     Performance optimized: Builds WWPN→Storage map and ProjectZone cache
     to avoid N+1 queries during serialization.
     """
-    print(f"🔥 Alias Project View - Project ID: {project_id}")
-    print(f"🔍 Query params: {dict(request.GET)}")
+    debug_log.debug('project aliases request', project_id=project_id, params=lambda: dict(request.GET))
 
     try:
         project = Project.objects.get(id=project_id)
@@ -946,82 +762,21 @@ def alias_project_view(request, project_id):
 
     # Apply search filter if provided
     if search:
-        print(f"🔍 Applying search filter: '{search}'")
-        project_aliases = project_aliases.filter(
-            Q(alias__name__icontains=search) |
-            Q(alias__notes__icontains=search) |
-            Q(alias__fabric__name__icontains=search) |
-            Q(alias__use__icontains=search) |
-            Q(alias__cisco_alias__icontains=search) |
-            Q(alias__alias_wwpns__wwpn__icontains=search)
-        ).distinct()
-    else:
-        print(f"🔍 No search parameter provided")
+        project_aliases = project_aliases.filter(search_filter(search, 'alias__'))
 
-    print(f"🔍 Project {project_id}: ProjectAlias count after search = {project_aliases.count()}")
-
-    # Apply field-specific advanced filters
-    # Frontend sends params like 'name__icontains', we need to map to 'alias__name__icontains'
-    filter_params = {}
-    for param, value in request.GET.items():
-        # Skip pagination and search params
-        if param in ['page', 'page_size', 'search', 'ordering', 'customer_id']:
-            continue
-
-        # Map frontend parameter to Django ORM lookup through junction table
-        mapped_param = None
-
-        # Special handling for project_action - this is on the junction table itself, not the entity
-        if param.startswith('project_action__'):
-            # Map project_action to action (the field name on ProjectAlias)
-            mapped_param = param.replace('project_action', 'action')
-            # __in lookup requires a list, even for single values
-            if mapped_param.endswith('__in'):
-                filter_params[mapped_param] = [v.strip() for v in value.split(',')] if isinstance(value, str) else value
-            else:
-                filter_params[mapped_param] = value
-        elif param.startswith(('name__', 'use__', 'fabric_name__', 'fabric_details.name__', 'host_name__', 'host_details.name__', 'storage_details.name__', 'cisco_alias__', 'notes__', 'logged_in__', 'committed__', 'deployed__', 'include_in_zoning__', 'do_not_include_in_zoning__')):
-            # Map special field names
-            if param.startswith('fabric_details.name'):
-                mapped_param = param.replace('fabric_details.name', 'alias__fabric__name')
-            elif param.startswith('fabric_name'):
-                mapped_param = param.replace('fabric_name', 'alias__fabric__name')
-            elif param.startswith('host_details.name'):
-                mapped_param = param.replace('host_details.name', 'alias__host__name')
-            elif param.startswith('host_name'):
-                mapped_param = param.replace('host_name', 'alias__host__name')
-            elif param.startswith('storage_details.name'):
-                mapped_param = param.replace('storage_details.name', 'alias__storage__name')
-            else:
-                mapped_param = f'alias__{param}'
-
-            # Handle boolean fields
-            if any(param.startswith(f'{bool_field}__') for bool_field in ['logged_in', 'committed', 'deployed', 'include_in_zoning', 'do_not_include_in_zoning']):
-                if mapped_param.endswith('__in'):
-                    boolean_values = []
-                    for str_val in value.split(','):
-                        str_val = str_val.strip()
-                        if str_val.lower() == 'true':
-                            boolean_values.append(True)
-                        elif str_val.lower() == 'false':
-                            boolean_values.append(False)
-                    filter_params[mapped_param] = boolean_values
-                else:
-                    if value.lower() == 'true':
-                        filter_params[mapped_param] = True
-                    elif value.lower() == 'false':
-                        filter_params[mapped_param] = False
-            else:
-                # Handle regular string filters
-                if mapped_param.endswith('__in') and isinstance(value, str) and ',' in value:
-                    filter_params[mapped_param] = value.split(',')
-                else:
-                    filter_params[mapped_param] = value
+    debug_log.debug('project aliases after search', project_id=project_id, count=project_aliases.count)
 
-    # Apply filters to queryset
-    if filter_params:
-        project_aliases = project_aliases.filter(**filter_params)
-        print(f"🔍 Project {project_id}: ProjectAlias count after advanced filters = {project_aliases.count()}")
+    # Apply column filters through the junction rows
+    try:
+        compiled = table_filters('aliases').compile(
+            request.GET, prefix='alias__', ordering=request.GET.get('ordering'),
+            context={'zone_ids': ProjectZone.objects.filter(project=project).values('zone_id')}
+        )
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if compiled.condition or compiled.ordering:
+        project_aliases = compiled.apply(project_aliases)
+        debug_log.debug('project aliases after advanced filters', project_id=project_id, count=project_aliases.count)
 
     # ===== PAGINATION =====
     from django.core.paginator import Paginator
@@ -1042,7 +797,7 @@ def alias_project_view(request, project_id):
 
     paginator = Paginator(project_aliases, page_size)
     total_count = paginator.count
-    print(f"📊 Project {project_id}: Total ProjectAlias count = {total_count}, page_size = {page_size}")
+    debug_log.debug('project aliases paginated', project_id=project_id, count=total_count, page_size=page_size)
 
     try:
         page_obj = paginator.get_page(page)
@@ -1073,34 +828,18 @@ def alias_project_view(request, project_id):
                     'name': port.storage.name
                 }
 
-    # Build ProjectZone IDs for this project (used by get_zoned_count())
-    project_zone_ids = set(
-        ProjectZone.objects.filter(project_id=project_id).values_list('zone_id', flat=True)
+    # Calculated columns the table shows, for this page only
+    table_filters('aliases').annotate_page(
+        [pa.alias for pa in project_aliases_page], shown_calculated(request, 'aliases'),
+        {'zone_ids': ProjectZone.objects.filter(project_id=project_id).values('zone_id')}
     )
 
-    # Build alias→zones map to avoid N+1 queries in get_zoned_count()
-    # Query the Zone.members through-table once to get all alias-zone relationships
-    alias_zones_map = {}
-    if project_zone_ids:
-        # Get all zone membership pairs for zones in this project
-        zone_alias_pairs = Zone.members.through.objects.filter(
-            zone_id__in=project_zone_ids
-        ).values_list('alias_id', 'zone_id')
-
-        # Build map: alias_id → set of zone_ids
-        for alias_id, zone_id in zone_alias_pairs:
-            if alias_id not in alias_zones_map:
-                alias_zones_map[alias_id] = set()
-            alias_zones_map[alias_id].add(zone_id)
-
     # Build serializer context with optimization data
     serializer_context = {
         'project_id': project_id,
         'active_project_id': project_id,
         'customer_id': customer_id,
         'wwpn_storage_map': wwpn_storage_map,
-        'project_zone_ids': project_zone_ids,
-        'alias_zones_map': alias_zones_map,  # New: pre-built alias→zones mapping
     }
     # ===== END PERFORMANCE OPTIMIZATION =====
 
@@ -1192,7 +931,7 @@ def alias_customer_list_view(request):
     Fetch all aliases for a customer (without requiring a project).
     Use this endpoint when viewing customer-level data without an active project.
     """
-    print(f"🔥 Alias Customer List - Customer ID from query params")
+    debug_log.debug('customer aliases request', params=lambda: dict(request.GET))
 
     # Get customer_id from query parameters (accept both 'customer' and 'customer_id')
     customer_id = request.GET.get('customer') or request.GET.get('customer_id')
@@ -1224,94 +963,31 @@ def alias_customer_list_view(request):
         fabric_id__in=customer_fabric_ids
     )
 
-    # Customer View filtering: Show aliases that are either:
-    # 1. Committed (committed=True), OR
-    # 2. Not referenced by any project (no junction table entries)
-    aliases_queryset = aliases_queryset.annotate(
-        project_count=Count('project_memberships')  # Correct relationship name
-    ).filter(
-        Q(committed=True) | Q(project_count=0)
-    )
+    # Customer View: committed, or not in any project (core.customer_visibility)
+    aliases_queryset = aliases_queryset.filter(customer_visible=True)
 
     # Prefetch project memberships for badge display
     aliases_queryset = aliases_queryset.prefetch_related(
         Prefetch('project_memberships', queryset=ProjectAlias.objects.select_related('project'))
     )
 
-    # Annotate with zoned_count (across all customer zones)
-    from django.db.models import Count, Q as Q_models
+    # zoned_count counts the zones of all customer fabrics
     customer_zone_ids = Zone.objects.filter(fabric_id__in=customer_fabric_ids).values_list('id', flat=True)
-    aliases_queryset = aliases_queryset.annotate(
-        _zoned_count=Count('zone', filter=Q_models(zone__id__in=customer_zone_ids), distinct=True)
-    )
 
     # Apply general search if provided
     if search:
-        aliases_queryset = aliases_queryset.filter(
-            Q(name__icontains=search) |
-            Q(alias_wwpns__wwpn__icontains=search) |
-            Q(notes__icontains=search) |
-            Q(fabric__name__icontains=search) |
-            Q(use__icontains=search) |
-            Q(cisco_alias__icontains=search)
-        ).distinct()
+        aliases_queryset = aliases_queryset.filter(search_filter(search))
 
-    # Apply field-specific filters (same logic as project endpoint)
-    filter_params = {}
-    storage_filter_value = None
-
-    for param, value in request.GET.items():
-        if param.startswith(('storage_details.name__', 'storage__name__')) or param in ['storage_details.name', 'storage__name']:
-            storage_filter_value = (param, value)
-            continue
-
-        if param.startswith(('name__', 'wwpn__', 'use__', 'fabric__name__', 'host__name__', 'cisco_alias__', 'notes__', 'logged_in__', 'committed__', 'deployed__', 'zoned_count__')) or param in ['zoned_count', 'fabric__name', 'host__name', 'use', 'cisco_alias', 'logged_in', 'committed', 'deployed']:
-            # Handle boolean fields
-            if any(param.startswith(f'{bool_field}__') for bool_field in ['logged_in', 'committed', 'deployed']):
-                if param.endswith('__in'):
-                    boolean_values = []
-                    for str_val in value.split(','):
-                        str_val = str_val.strip()
-                        if str_val.lower() == 'true':
-                            boolean_values.append(True)
-                        elif str_val.lower() == 'false':
-                            boolean_values.append(False)
-                    filter_params[param] = boolean_values
-                else:
-                    if value.lower() == 'true':
-                        filter_params[param] = True
-                    elif value.lower() == 'false':
-                        filter_params[param] = False
-            else:
-                # Handle calculated fields
-                if param.startswith('zoned_count__'):
-                    mapped_param = param.replace('zoned_count__', '_zoned_count__')
-                    if param.endswith('__in') and isinstance(value, str) and ',' in value:
-                        try:
-                            filter_params[mapped_param] = [int(v.strip()) for v in value.split(',')]
-                        except ValueError:
-                            filter_params[mapped_param] = value.split(',')
-                    elif param.endswith('__in') and isinstance(value, str):
-                        try:
-                            filter_params[mapped_param] = [int(value.strip())]
-                        except ValueError:
-                            filter_params[mapped_param] = [value.strip()]
-                    else:
-                        try:
-                            filter_params[mapped_param] = int(value) if str(value).isdigit() else value
-                        except (ValueError, AttributeError):
-                            filter_params[mapped_param] = value
-                elif param == 'zoned_count':
-                    try:
-                        filter_params['_zoned_count'] = int(value)
-                    except ValueError:
-                        filter_params['_zoned_count'] = value
-                else:
-                    filter_params[param] = value
-
-    if filter_params:
-        print(f"🔍 Applying filters: {filter_params}")
-        aliases_queryset = aliases_queryset.filter(**filter_params)
+    # Apply column filters and ordering
+    try:
+        compiled = table_filters('aliases').compile(
+            request.GET, context={'zone_ids': customer_zone_ids}, ordering=ordering,
+            skip=ALIAS_STORAGE_COLUMNS
+        )
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    aliases_queryset = compiled.apply(aliases_queryset)
+    storage_filter_value = alias_storage_filter(request.GET)
 
     # Apply storage filter if present
     if storage_filter_value:
@@ -1319,7 +995,7 @@ def alias_customer_list_view(request):
         from san.models import AliasWWPN
 
         param, value = storage_filter_value
-        print(f"🔍 Applying storage filter: {param} = {value}")
+        debug_log.debug('alias storage filter', param=param, value=value)
 
         if param.endswith('__icontains'):
             storage_names = Port.objects.filter(
@@ -1358,10 +1034,6 @@ def alias_customer_list_view(request):
 
         aliases_queryset = aliases_queryset.filter(id__in=matching_alias_ids)
 
-    # Apply ordering
-    if ordering:
-        aliases_queryset = aliases_queryset.order_by(ordering)
-
     # Pagination
     from django.core.paginator import Paginator
     page = int(request.GET.get('page', 1))
@@ -1379,6 +1051,9 @@ def alias_customer_list_view(request):
 
     paginator = Paginator(aliases_queryset, page_size)
     page_obj = paginator.get_page(page)
+    page_obj.object_list = table_filters('aliases').annotate_page(
+        page_obj.object_list, shown_calculated(request, 'aliases'), {'zone_ids': customer_zone_ids}
+    )
 
     # Build WWPN→Storage map
     wwpn_storage_map = {}
@@ -1427,88 +1102,25 @@ def alias_customer_list_view(request):
 @csrf_exempt
 @require_http_methods(["GET"])
 def get_unique_values_for_hosts(request, project, field_name):
-    """Get unique values for a specific field from hosts in a project."""
-    print(f"🔍 Getting unique values for host field: {field_name} in project {project.id}")
-    
-    from django.db.models import Q
-    
+    """Get unique values for a specific field from hosts of the project's customer."""
+
     try:
-        # Handle calculated fields
-        if field_name == 'aliases_count':
-            # Calculate aliases_count for all hosts and get unique values
-            hosts_queryset = Host.objects.filter(project=project).annotate(
-                _aliases_count=Count('alias_host', distinct=True)
-            )
-            unique_values = hosts_queryset.values_list('_aliases_count', flat=True).distinct().order_by('_aliases_count')
-        elif field_name == 'storage_system':
-            # For storage_system, we need to get values from both storage ForeignKey and storage_system CharField
-            hosts_queryset = Host.objects.filter(project=project)
-            
-            # Get storage names from ForeignKey relationship
-            storage_values = hosts_queryset.select_related('storage').exclude(storage=None).values_list('storage__name', flat=True).distinct()
-            # Get storage_system values from CharField
-            storage_system_values = hosts_queryset.exclude(storage_system__isnull=True).exclude(storage_system='').values_list('storage_system', flat=True).distinct()
-            
-            # Combine and deduplicate
-            all_values = set(list(storage_values) + list(storage_system_values))
-            unique_values = sorted([value for value in all_values if value])
-            
-            # Check if there are any hosts with no storage assigned
-            hosts_without_storage = hosts_queryset.filter(
-                Q(storage__isnull=True) | Q(storage__name__isnull=True) | Q(storage__name='')
-            ).filter(
-                Q(storage_system__isnull=True) | Q(storage_system='')
-            ).exists()
-            
-            if hosts_without_storage:
-                unique_values.append('Blank')
-        else:
-            # Base queryset for hosts in the project
-            hosts_queryset = Host.objects.filter(project=project)
-            
-            # Map field names to actual model fields
-            field_mapping = {
-                'create': 'create',
-                'name': 'name',
-                'status': 'status',
-                'host_type': 'host_type',
-                'associated_resource': 'associated_resource',
-                'volume_group': 'volume_group',
-                'acknowledged': 'acknowledged',
-                'natural_key': 'natural_key'
-            }
-            
-            # Get the actual field name
-            actual_field = field_mapping.get(field_name, field_name)
-            
-            # Get unique values for the field
-            unique_values = hosts_queryset.values_list(actual_field, flat=True).distinct().order_by(actual_field)
-        
-        # Convert to list and handle different field types
-        if field_name not in ['storage_system']:  # storage_system is already handled above
-            unique_values = list(unique_values)
-        
-        # Handle boolean fields specially
-        if field_name in ['create']:
-            # For boolean fields, convert to consistent string representation
-            boolean_values = set(unique_values)
-            processed_booleans = []
-            for value in boolean_values:
-                if value is True:
-                    processed_booleans.append('True')
-                elif value is False:
-                    processed_booleans.append('False')
-            unique_values = sorted(processed_booleans)
-        else:
-            # For non-boolean fields, filter out None/null values
-            unique_values = [value for value in unique_values if value is not None and str(value).strip() != '']
-        
-        print(f"✅ Found {len(unique_values)} unique values for host {field_name}: {unique_values}")
-        
+        # Served from the cached facet of the customer's hosts
+        customer = project.customers.first()
+        value_counts = get_filter_facet(
+            customer.id if customer else None, 'hosts', field_name,
+            prefix=request.GET.get('prefix', '').strip() or None
+        )
+
+        debug_log.debug('host unique values', project_id=project.id, field=field_name, count=len(value_counts))
+
         return JsonResponse({
-            'unique_values': unique_values
+            'unique_values': [item['value'] for item in value_counts],
+            'value_counts': value_counts
         })
-        
+
+    except FacetError as e:
+        return JsonResponse({"error": str(e)}, status=400)
     except Exception as e:
         print(f"❌ Error getting unique values for host {field_name}: {str(e)}")
         return JsonResponse({"error": f"Failed to get unique values: {str(e)}"}, status=500)
@@ -1516,7 +1128,6 @@ def get_unique_values_for_hosts(request, project, field_name):
 
 def hosts_by_project_view(request, project_id):
     """Fetch hosts belonging to a specific project."""
-    print(f"🔥 Hosts by Project - Project ID: {project_id}")
     
     try:
         project = Project.objects.get(id=project_id)
@@ -1530,7 +1141,7 @@ def hosts_by_project_view(request, project_id):
     page_size = request.GET.get('page_size', settings.DEFAULT_PAGE_SIZE)
     format_type = request.GET.get('format', 'dropdown')
     
-    print(f"🔍 Hosts API - Project: {project_id}, Search: '{search}', Page: {page}, PageSize: {page_size}, Format: {format_type}")
+    debug_log.debug('hosts by project request', project_id=project_id, search=search, page=page, page_size=page_size, format=format_type)
     
     # Check for unique values request
     unique_values_field = request.GET.get('unique_values')
@@ -1542,183 +1153,33 @@ def hosts_by_project_view(request, project_id):
     # Project has many-to-many relationship with customers
     # So filter hosts by storage's customer being in project's customers
     hosts_queryset = Host.objects.filter(storage__customer__in=project.customers.all())
-    print(f"🔍 Found {hosts_queryset.count()} hosts for project {project_id}")
+    debug_log.debug('hosts_by_project_view hosts', project_id=project_id, count=hosts_queryset.count)
     
     # Apply storage filtering if provided
     storage_id = request.GET.get('storage')
     if storage_id:
         try:
             hosts_queryset = hosts_queryset.filter(storage_id=int(storage_id))
-            print(f"🔍 After storage ID filter (storage={storage_id}): {hosts_queryset.count()} hosts")
+            debug_log.debug('hosts after storage filter', storage_id=storage_id, count=hosts_queryset.count)
         except ValueError:
             # Invalid storage ID format, skip filtering
             print(f"❌ Invalid storage ID format: {storage_id}")
     
     # Apply search if provided
     if search:
-        hosts_queryset = hosts_queryset.filter(
-            Q(name__icontains=search) |
-            Q(status__icontains=search) |
-            Q(host_type__icontains=search) |
-            Q(storage_system__icontains=search)
-        )
-        print(f"🔍 After search filter: {hosts_queryset.count()} hosts")
-    
-    # Apply count field filtering for table format
-    if format_type == 'table':
-        # Get count filter parameters
-        aliases_count = request.GET.get('aliases_count')
-        aliases_count__gte = request.GET.get('aliases_count__gte')
-        aliases_count__lte = request.GET.get('aliases_count__lte')
-        aliases_count__gt = request.GET.get('aliases_count__gt')
-        aliases_count__lt = request.GET.get('aliases_count__lt')
-        
-        vols_count = request.GET.get('vols_count')
-        vols_count__gte = request.GET.get('vols_count__gte')
-        vols_count__lte = request.GET.get('vols_count__lte')
-        vols_count__gt = request.GET.get('vols_count__gt')
-        vols_count__lt = request.GET.get('vols_count__lt')
-        
-        fc_ports_count = request.GET.get('fc_ports_count')
-        fc_ports_count__gte = request.GET.get('fc_ports_count__gte')
-        fc_ports_count__lte = request.GET.get('fc_ports_count__lte')
-        fc_ports_count__gt = request.GET.get('fc_ports_count__gt')
-        fc_ports_count__lt = request.GET.get('fc_ports_count__lt')
-        
-        # Apply aliases_count filtering (using annotation since it's calculated)
-        if any([aliases_count, aliases_count__gte, aliases_count__lte, aliases_count__gt, aliases_count__lt]):
-            hosts_queryset = hosts_queryset.annotate(
-                computed_aliases_count=Count('alias_host', distinct=True)
-            )
-            
-            if aliases_count is not None:
-                hosts_queryset = hosts_queryset.filter(computed_aliases_count=int(aliases_count))
-                print(f"🔍 After aliases_count={aliases_count} filter: {hosts_queryset.count()} hosts")
-            if aliases_count__gte is not None:
-                hosts_queryset = hosts_queryset.filter(computed_aliases_count__gte=int(aliases_count__gte))
-                print(f"🔍 After aliases_count__gte={aliases_count__gte} filter: {hosts_queryset.count()} hosts")
-            if aliases_count__lte is not None:
-                hosts_queryset = hosts_queryset.filter(computed_aliases_count__lte=int(aliases_count__lte))
-                print(f"🔍 After aliases_count__lte={aliases_count__lte} filter: {hosts_queryset.count()} hosts")
-            if aliases_count__gt is not None:
-                hosts_queryset = hosts_queryset.filter(computed_aliases_count__gt=int(aliases_count__gt))
-                print(f"🔍 After aliases_count__gt={aliases_count__gt} filter: {hosts_queryset.count()} hosts")
-            if aliases_count__lt is not None:
-                hosts_queryset = hosts_queryset.filter(computed_aliases_count__lt=int(aliases_count__lt))
-                print(f"🔍 After aliases_count__lt={aliases_count__lt} filter: {hosts_queryset.count()} hosts")
-        
-        # Apply vols_count filtering (direct field filtering)
-        if vols_count is not None:
-            hosts_queryset = hosts_queryset.filter(vols_count=int(vols_count))
-            print(f"🔍 After vols_count={vols_count} filter: {hosts_queryset.count()} hosts")
-        if vols_count__gte is not None:
-            hosts_queryset = hosts_queryset.filter(vols_count__gte=int(vols_count__gte))
-        if vols_count__lte is not None:
-            hosts_queryset = hosts_queryset.filter(vols_count__lte=int(vols_count__lte))
-        if vols_count__gt is not None:
-            hosts_queryset = hosts_queryset.filter(vols_count__gt=int(vols_count__gt))
-        if vols_count__lt is not None:
-            hosts_queryset = hosts_queryset.filter(vols_count__lt=int(vols_count__lt))
-        
-        # Apply fc_ports_count filtering (direct field filtering)
-        if fc_ports_count is not None:
-            hosts_queryset = hosts_queryset.filter(fc_ports_count=int(fc_ports_count))
-            print(f"🔍 After fc_ports_count={fc_ports_count} filter: {hosts_queryset.count()} hosts")
-        if fc_ports_count__gte is not None:
-            hosts_queryset = hosts_queryset.filter(fc_ports_count__gte=int(fc_ports_count__gte))
-        if fc_ports_count__lte is not None:
-            hosts_queryset = hosts_queryset.filter(fc_ports_count__lte=int(fc_ports_count__lte))
-        if fc_ports_count__gt is not None:
-            hosts_queryset = hosts_queryset.filter(fc_ports_count__gt=int(fc_ports_count__gt))
-        if fc_ports_count__lt is not None:
-            hosts_queryset = hosts_queryset.filter(fc_ports_count__lt=int(fc_ports_count__lt))
-    
-    # Apply field-specific filters (similar to AliasTable and ZoneTable)
-    from django.db.models import Q
-    filter_params = {}
-    for param, value in request.GET.items():
-        if param.startswith(('name__', 'storage_system__', 'storage__name__', 'wwpns__', 'status__', 'host_type__', 'associated_resource__', 'volume_group__', 'acknowledged__', 'natural_key__', 'create__')) or param in ['name', 'storage_system', 'storage__name', 'wwpns', 'status', 'host_type', 'associated_resource', 'volume_group', 'acknowledged', 'natural_key', 'create']:
-            # Handle boolean field filtering
-            if any(param.startswith(f'{bool_field}__') for bool_field in ['create']):
-                if param.endswith('__in'):
-                    # Handle multi-select boolean filters
-                    boolean_values = []
-                    for str_val in value.split(','):
-                        str_val = str_val.strip()
-                        if str_val.lower() == 'true':
-                            boolean_values.append(True)
-                        elif str_val.lower() == 'false':
-                            boolean_values.append(False)
-                    filter_params[param] = boolean_values
-                else:
-                    # Handle single boolean filters
-                    if value.lower() == 'true':
-                        filter_params[param] = True
-                    elif value.lower() == 'false':
-                        filter_params[param] = False
-            else:
-                # Handle special field mappings
-                if param == 'storage_system':
-                    if value == 'Blank':
-                        # Filter for hosts with no storage assigned (both ForeignKey and CharField are null/empty)
-                        hosts_queryset = hosts_queryset.filter(
-                            (Q(storage__isnull=True) | Q(storage__name__isnull=True) | Q(storage__name='')) &
-                            (Q(storage_system__isnull=True) | Q(storage_system=''))
-                        )
-                        # Don't add to filter_params since we already applied the filter
-                        continue
-                    else:
-                        # storage_system in the API comes from storage.name, so filter on the ForeignKey
-                        filter_params['storage__name'] = value
-                elif param.startswith('storage_system__'):
-                    if param == 'storage_system__regex' and 'Blank' in value:
-                        # Handle multi-select that includes "Blank" - need special logic
-                        # Extract non-Blank values for regex, handle Blank separately
-                        import re
-                        # Parse the regex pattern to extract values
-                        match = re.match(r'^\^?\(([^)]+)\)\$?$', value)
-                        if match:
-                            values = match.group(1).split('|')
-                            non_blank_values = [v for v in values if v != 'Blank']
-                            has_blank = 'Blank' in values
-                            
-                            if non_blank_values and has_blank:
-                                # Include both non-blank storage systems AND blank ones
-                                blank_filter = (Q(storage__isnull=True) | Q(storage__name__isnull=True) | Q(storage__name='')) & (Q(storage_system__isnull=True) | Q(storage_system=''))
-                                if len(non_blank_values) == 1:
-                                    non_blank_filter = Q(storage__name=non_blank_values[0])
-                                else:
-                                    non_blank_filter = Q(storage__name__regex=f"^({'|'.join(non_blank_values)})$")
-                                hosts_queryset = hosts_queryset.filter(blank_filter | non_blank_filter)
-                                continue
-                            elif has_blank and not non_blank_values:
-                                # Only "Blank" is selected
-                                hosts_queryset = hosts_queryset.filter(
-                                    (Q(storage__isnull=True) | Q(storage__name__isnull=True) | Q(storage__name='')) &
-                                    (Q(storage_system__isnull=True) | Q(storage_system=''))
-                                )
-                                continue
-                    
-                    # Map storage_system__ lookups to storage__name__ lookups
-                    mapped_param = param.replace('storage_system__', 'storage__name__')
-                    filter_params[mapped_param] = value
-                else:
-                    # Handle non-boolean fields normally
-                    filter_params[param] = value
-    
-    # Apply the filters
-    if filter_params:
-        print(f"🔍 Applying host filters: {filter_params}")
-        hosts_queryset = hosts_queryset.filter(**filter_params)
-        print(f"📊 Host filter result count: {hosts_queryset.count()}")
+        hosts_queryset = hosts_queryset.filter(search_filter(search))
+        debug_log.debug('hosts after search filter', search=search, count=hosts_queryset.count)
     
-    # Apply ordering
-    if ordering:
-        hosts_queryset = hosts_queryset.order_by(ordering)
+    # Apply column filters (including the calculated aliases_count) and ordering
+    try:
+        compiled = table_filters('hosts').compile(request.GET, ordering=ordering)
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    hosts_queryset = compiled.apply(hosts_queryset)
+    debug_log.debug('hosts filters applied', count=hosts_queryset.count)
     
     # Get total count before pagination
     total_count = hosts_queryset.count()
-    print(f"🔍 Total hosts after filters: {total_count}")
     
     if format_type == 'table':
         # Implement pagination for table format
@@ -1735,27 +1196,45 @@ def hosts_by_project_view(request, project_id):
         if page_size > settings.MAX_PAGE_SIZE:
             return JsonResponse({'error': f'Maximum page size is {settings.MAX_PAGE_SIZE}. Requested: {page_size}'}, status=400)
 
-        paginator = Paginator(hosts_queryset, page_size)
+        # Storage and WWPN rows (with their source alias) for the page in two queries
+        paginator = Paginator(hosts_queryset.select_related('storage').prefetch_related(
+            Prefetch('host_wwpns', queryset=HostWwpn.objects.select_related('source_alias__fabric'))
+        ), page_size)
         page_obj = paginator.get_page(page)
         
+        # Calculated columns the table shows, for this page only
+        customer = project.customers.first()
+        page_hosts = table_filters('hosts').annotate_page(
+            page_obj.object_list, shown_calculated(request, 'hosts')
+        )
+
+        # Reconcile the page's manual WWPNs once per customer instead of per host
+        manual_by_customer = defaultdict(list)
+        for host in page_hosts:
+            if host.storage:
+                manual_by_customer[host.storage.customer_id].extend(
+                    hw.wwpn for hw in host.host_wwpns.all() if hw.source_type == 'manual'
+                )
+        wwpn_entries = {}
+        for customer_id, wwpns in manual_by_customer.items():
+            for entry in reconcile_customer_wwpns(customer_id, wwpns=wwpns)['entries']:
+                wwpn_entries[normalize_wwpn(entry['wwpn'])] = entry
+
         # Return full host data for table display with pagination
         hosts_data = []
-        for host in page_obj:
-            # Get aliases that reference this host
-            from .models import Alias
-            aliases_for_host = Alias.objects.filter(host=host)
-            aliases_count = aliases_for_host.count()
+        for host in page_hosts:
+            aliases_count = host._aliases_count
             
             # Get WWPN details using the new HostWwpn model
             wwpn_details = host.get_all_wwpns()
-            wwpns_string = host.get_wwpn_display_string()
+            wwpns_string = ', '.join(w['wwpn'] for w in wwpn_details)
             
             # Calculate WWPN reconciliation status
-            manual_wwpns = host.host_wwpns.filter(source_type='manual')
-            alias_wwpns = host.host_wwpns.filter(source_type='alias')
-            total_wwpns = host.host_wwpns.count()
+            manual_wwpns = [hw for hw in host.host_wwpns.all() if hw.source_type == 'manual']
+            manual_count = len(manual_wwpns)
+            alias_count = len(wwpn_details) - manual_count
             
-            if total_wwpns == 0:
+            if not wwpn_details:
                 wwpn_status = "No WWPNs assigned"
                 wwpn_status_level = "no_wwpns"
                 wwpn_status_components = [{
@@ -1763,17 +1242,13 @@ def hosts_by_project_view(request, project_id):
                     "type": "no_wwpns",
                     "color": "light"
                 }]
-            elif manual_wwpns.exists():
-                # Host has manual WWPNs - check for matches
-                manual_wwpn_values = [hw.wwpn for hw in manual_wwpns]
-                matching_aliases_count = Alias.objects.filter(
-                    projects=project,
-                    host__isnull=True,  # Only unassigned aliases
-                    wwpn__in=manual_wwpn_values
-                ).count()
-                
-                manual_count = manual_wwpns.count()
-                alias_count = alias_wwpns.count()
+            elif manual_wwpns:
+                # Host has manual WWPNs - count the unassigned aliases sharing them
+                matching_aliases_count = 0
+                for manual_wwpn in manual_wwpns:
+                    entry = wwpn_entries.get(normalize_wwpn(manual_wwpn.wwpn))
+                    if entry and entry['status'] == LINKABLE and entry['host_id'] == host.id:
+                        matching_aliases_count += sum(1 for alias in entry['aliases'] if alias['host_id'] is None)
                 
                 if matching_aliases_count > 0:
                     # Build status message and components for mixed state
@@ -1788,13 +1263,12 @@ def hosts_by_project_view(request, project_id):
                             "color": "success"
                         })
                     
-                    if matching_aliases_count > 0:
-                        status_parts.append(f"{matching_aliases_count} match{'es' if matching_aliases_count != 1 else ''} available")
-                        status_components.append({
-                            "text": f"{matching_aliases_count} match{'es' if matching_aliases_count != 1 else ''} available",
-                            "type": "matches_available", 
-                            "color": "warning"
-                        })
+                    status_parts.append(f"{matching_aliases_count} match{'es' if matching_aliases_count != 1 else ''} available")
+                    status_components.append({
+                        "text": f"{matching_aliases_count} match{'es' if matching_aliases_count != 1 else ''} available",
+                        "type": "matches_available", 
+                        "color": "warning"
+                    })
                     
                     wwpn_status = ", ".join(status_parts)
                     wwpn_status_level = "matches_available"
@@ -1828,7 +1302,6 @@ def hosts_by_project_view(request, project_id):
                     wwpn_status_components = status_components
             else:
                 # Only alias-sourced WWPNs (all matched)
-                alias_count = alias_wwpns.count()
                 wwpn_status = f"All {alias_count} WWPN{'s' if alias_count != 1 else ''} matched"
                 wwpn_status_level = "all_matched"
                 wwpn_status_components = [{
@@ -1867,17 +1340,12 @@ def hosts_by_project_view(request, project_id):
                 "acknowledged": host.acknowledged or "",
                 "last_data_collection": host.last_data_collection,
                 "natural_key": host.natural_key or "",
-                "create": host.create or False,  # Include the create field
                 "imported": host.imported.isoformat() if host.imported else None,
                 "updated": host.updated.isoformat() if host.updated else None,
             }
             hosts_data.append(host_data)
-            
-            # Debug logging
-            if wwpn_details:
-                print(f"🔍 Host '{host.name}' has {len(wwpn_details)} WWPNs: {wwpns_string[:50]}{'...' if len(wwpns_string) > 50 else ''}")
         
-        print(f"🔍 Returning {len(hosts_data)} hosts for page {page}")
+        debug_log.debug('hosts by project page', project_id=project_id, page=page, count=len(hosts_data), total=total_count)
         
         # Return paginated response in the format GenericTable expects
         response_data = {
@@ -1899,7 +1367,7 @@ def hosts_by_project_view(request, project_id):
 @require_http_methods(["POST"])
 def host_save_view(request):
     """Save or update multiple hosts."""
-    print(f"🔥 Host Save - Method: {request.method}")
+    debug_log.debug('host save request', method=request.method)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -1936,7 +1404,7 @@ def host_save_view(request):
             
             # Create new host
             new_host = Host.objects.create(project=project, name=host_name)
-            print(f"✅ Created new host: {host_name} (ID: {new_host.id})")
+            debug_log.debug('host created', host=host_name, host_id=new_host.id)
             
             return JsonResponse({
                 "message": "Host created successfully!", 
@@ -1993,7 +1461,6 @@ def host_save_view(request):
                                 from storage.models import Storage
                                 storage = Storage.objects.get(id=storage_id)
                                 host.storage = storage
-                                print(f"✅ Assigned storage {storage.name} to host {host.name}")
                             except Storage.DoesNotExist:
                                 print(f"❌ Storage with ID {storage_id} not found")
                                 host.storage = None
@@ -2005,7 +1472,7 @@ def host_save_view(request):
                         host.save()
                         
                         saved_hosts.append({"id": host.id, "name": host.name})
-                        print(f"✅ Updated host: {host.name} (ID: {host.id})")
+                        debug_log.debug('host updated', host=host.name, host_id=host.id, storage_id=host.storage_id)
                     else:
                         errors.append({"host": host_data.get("name", "Unknown"), "error": "Host not found"})
                 except Exception as e:
@@ -2031,7 +1498,6 @@ def host_save_view(request):
                         try:
                             from storage.models import Storage
                             storage_obj = Storage.objects.get(id=storage_id)
-                            print(f"✅ Found storage {storage_obj.name} for new host {host_name}")
                         except Storage.DoesNotExist:
                             print(f"❌ Storage with ID {storage_id} not found for new host")
                     
@@ -2055,7 +1521,7 @@ def host_save_view(request):
                     new_host.save()
                     
                     saved_hosts.append({"id": new_host.id, "name": new_host.name})
-                    print(f"✅ Created new host: {host_name} (ID: {new_host.id})")
+                    debug_log.debug('host created', host=host_name, host_id=new_host.id)
                     
                 except Exception as e:
                     errors.append({"host": host_data.get("name", "Unknown"), "error": str(e)})
@@ -2074,15 +1540,12 @@ def host_save_view(request):
 @require_http_methods(["DELETE"])
 def host_delete_view(request, pk):
     """Delete a host."""
-    print(f"🔥 Host Delete - PK: {pk}, Method: {request.method}")
-    print(f"🔍 Request path: {request.path}")
-    print(f"🔍 Request headers: {dict(request.headers)}")
+    debug_log.debug('host delete request', pk=pk, force=lambda: request.GET.get('force'))
 
     user = request.user if request.user.is_authenticated else None
 
     # Check for force parameter
     force_delete = request.GET.get('force', 'false').lower() == 'true'
-    print(f"🔍 Force delete: {force_delete}")
 
     try:
         host = Host.objects.get(pk=pk)
@@ -2097,15 +1560,13 @@ def host_delete_view(request, pk):
         host_name = host.name
         project_id = host.project.id
         
-        print(f"🔍 Found host: {host_name} (ID: {pk}) in project: {project_id}")
-        
         # Check if host is being used by any aliases
         from .models import Alias
         aliases_using_host = Alias.objects.filter(host=host)
         
         if aliases_using_host.exists():
             alias_list = [{"id": alias.id, "name": alias.name} for alias in aliases_using_host]
-            print(f"🔍 Host {host_name} is being used by {aliases_using_host.count()} aliases: {[a['name'] for a in alias_list]}")
+            debug_log.debug('host used by aliases', host=host_name, aliases=[a['name'] for a in alias_list])
             
             if not force_delete:
                 # Return list of aliases for confirmation modal
@@ -2117,13 +1578,12 @@ def host_delete_view(request, pk):
                 }, status=409)  # 409 Conflict - requires user decision
             else:
                 # Force delete - remove host references from aliases first
-                print(f"🔄 Removing host references from {aliases_using_host.count()} aliases")
                 aliases_using_host.update(host=None)
-                print(f"✅ Cleared host references from aliases: {[a['name'] for a in alias_list]}")
+                debug_log.debug('host references cleared', host=host_name, aliases=len(alias_list))
         
         # Delete the host
         host.delete()
-        print(f"✅ Successfully deleted host: {host_name} (ID: {pk})")
+        debug_log.debug('host deleted', host=host_name, host_id=pk)
         
         return JsonResponse({
             "message": f"Host '{host_name}' deleted successfully!",
@@ -2154,7 +1614,6 @@ def assign_host_to_alias_view(request):
         
         try:
             alias = Alias.objects.get(id=alias_id)
-            from storage.models import Host
             host = Host.objects.get(id=host_id)
         except Alias.DoesNotExist:
             return JsonResponse({"error": "Alias not found."}, status=404)
@@ -2173,15 +1632,10 @@ def assign_host_to_alias_view(request):
                 "error": f"Only initiator aliases (use=init) can be assigned to hosts. This alias has use='{alias.use}'."
             }, status=400)
         
-        # Assign the host to the alias
-        alias.host = host
-        if not alias.use:
-            alias.use = 'init'  # Set to initiator if not already set
-        
-        # Update the timestamp
-        from django.utils import timezone
-        alias.updated = timezone.now()
-        alias.save()
+        # Assign the host to the alias and copy its WWPNs to the host
+        user = request.user if request.user.is_authenticated else None
+        link_aliases_to_hosts({alias.id: host.id}, user=user)
+        alias.refresh_from_db()
         
         return JsonResponse({
             "success": True,
@@ -2211,43 +1665,40 @@ def assign_host_to_alias_view(request):
 def host_wwpn_reconciliation_view(request, host_id):
     """Get WWPN reconciliation data for a specific host."""
     try:
-        from storage.models import Host
-        host = Host.objects.get(id=host_id)
-        project = host.project
-        
+        host = Host.objects.select_related('storage').get(id=host_id)
+
         # Get all manual WWPNs for this host
-        manual_wwpns = host.host_wwpns.filter(source_type='manual')
-        
-        # Get all unassigned aliases in the same project with matching WWPNs
-        unassigned_aliases = Alias.objects.filter(
-            projects=project,
-            host__isnull=True,  # Only unassigned aliases
-            wwpn__in=[hw.wwpn for hw in manual_wwpns]
-        ).select_related('fabric')
-        
-        # Build match data
+        manual_wwpns = list(host.host_wwpns.filter(source_type='manual'))
+
+        # Reconcile only this host's manual WWPNs across the customer
+        report = reconcile_customer_wwpns(host.storage.customer_id, wwpns=[hw.wwpn for hw in manual_wwpns])
+        entries = {normalize_wwpn(entry['wwpn']): entry for entry in report['entries']}
+
+        # Build match data from the unassigned aliases sharing each WWPN
         matches = []
         for manual_wwpn in manual_wwpns:
-            matching_aliases = [alias for alias in unassigned_aliases if alias.wwpn == manual_wwpn.wwpn]
+            entry = entries.get(normalize_wwpn(manual_wwpn.wwpn))
+            if not entry or entry['status'] != LINKABLE or entry['host_id'] != host.id:
+                continue
+            matching_aliases = [alias for alias in entry['aliases'] if alias['host_id'] is None]
             if matching_aliases:
                 matches.append({
                     'wwpn': manual_wwpn.wwpn,
                     'host_wwpn_id': manual_wwpn.id,
                     'matching_aliases': [{
-                        'id': alias.id,
-                        'name': alias.name,
-                        'fabric_name': alias.fabric.name,
-                        'fabric_id': alias.fabric.id,
-                        'use': alias.use,
-                        'created': alias.imported.isoformat() if alias.imported else None
+                        'id': alias['alias_id'],
+                        'name': alias['alias_name'],
+                        'fabric_name': alias['fabric_name'],
+                        'fabric_id': alias['fabric_id'],
+                        'use': alias['use'],
                     } for alias in matching_aliases]
                 })
-        
+
         # Calculate status
-        total_manual_wwpns = manual_wwpns.count()
+        total_manual_wwpns = len(manual_wwpns)
         wwpns_with_matches = len(matches)
         total_potential_matches = sum(len(match['matching_aliases']) for match in matches)
-        
+
         if total_manual_wwpns == 0:
             status = 'no_manual_wwpns'
             status_text = 'No Manual WWPNs'
@@ -2257,12 +1708,11 @@ def host_wwpn_reconciliation_view(request, host_id):
         else:
             status = 'matches_available'
             status_text = f'{total_potential_matches} Match{"es" if total_potential_matches != 1 else ""} Found'
-        
+
         return JsonResponse({
             'host_id': host.id,
             'host_name': host.name,
-            'project_id': project.id,
-            'project_name': project.name,
+            'customer_id': host.storage.customer_id,
             'status': status,
             'status_text': status_text,
             'total_manual_wwpns': total_manual_wwpns,
@@ -2270,7 +1720,7 @@ def host_wwpn_reconciliation_view(request, host_id):
             'total_potential_matches': total_potential_matches,
             'matches': matches
         })
-        
+
     except Host.DoesNotExist:
         return JsonResponse({"error": "Host not found."}, status=404)
     except Exception as e:
@@ -2278,8 +1728,58 @@ def host_wwpn_reconciliation_view(request, host_id):
         return JsonResponse({"error": f"Error getting reconciliation data: {str(e)}"}, status=500)
 
 
+@csrf_exempt
+@require_http_methods(["GET", "POST"])
+def customer_wwpn_reconciliation_view(request, customer_id):
+    """
+    Reconcile every alias, host and port WWPN of a customer.
+
+    GET returns the summary counts and the entries, by default all but the
+    matched ones; ?status=matched,conflict selects statuses explicitly.
+    POST links the linkable aliases to their hosts in bulk; an optional
+    "alias_ids" list limits which aliases are linked.
+    """
+    try:
+        customer = Customer.objects.get(id=customer_id)
+    except Customer.DoesNotExist:
+        return JsonResponse({"error": "Customer not found."}, status=404)
+
+    try:
+        if request.method == "GET":
+            report = reconcile_customer_wwpns(customer.id)
+            statuses = request.GET.get('status')
+            statuses = set(statuses.split(',')) if statuses else set(WWPN_STATUSES) - {MATCHED}
+            return JsonResponse({
+                'customer_id': customer.id,
+                'summary': report['summary'],
+                'entries': [entry for entry in report['entries'] if entry['status'] in statuses],
+            })
+
+        data = json.loads(request.body or '{}')
+        alias_ids = data.get('alias_ids')
+        user = request.user if request.user.is_authenticated else None
+        result = apply_alias_host_links(customer.id, alias_ids=alias_ids, user=user)
+
+        if result['aliases_linked'] or result['host_wwpns_created'] or result['host_wwpns_converted']:
+            log_update(
+                user=user,
+                entity_type='ALIAS',
+                entity_name=f"{result['aliases_linked']} aliases linked to hosts",
+                customer=customer,
+                details={key: value for key, value in result.items() if key != 'summary'}
+            )
+        return JsonResponse({'success': True, 'customer_id': customer.id, **result})
+
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON data."}, status=400)
+    except Exception as e:
+        print(f"❌ Error reconciling WWPNs: {e}")
+        return JsonResponse({"error": f"Error reconciling WWPNs: {str(e)}"}, status=500)
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
+@audit_batched_view("ALIAS", "Bulk saved aliases", rows_key="aliases")
 def alias_save_view(request):
     """Save or update aliases for multiple projects."""
     user = request.user if request.user.is_authenticated else None
@@ -2349,7 +1849,7 @@ def alias_save_view(request):
                             action='new',
                             added_by=user
                         )
-                        print(f"✅ Created new host: {host_name} (ID: {new_host.id})")
+                        debug_log.debug('host created', host=host_name, host_id=new_host.id)
 
                 # Remove host_name from alias_data as it's not a model field
                 alias_data.pop("host_name", None)
@@ -2452,12 +1952,12 @@ def alias_save_view(request):
                                     if field_name not in current_overrides or current_overrides[field_name] != new_id:
                                         current_overrides[field_name] = new_id
                                         overrides_modified = True
-                                        print(f"🔍 Alias '{alias.name}': Added override {field_name}={new_id} (base={base_id})")
+                                        debug_log.debug('alias override added', alias=alias.name, field=field_name, value=new_id, base=base_id)
                                 elif field_name in current_overrides:
                                     # Value matches base but we have an override - remove it
                                     del current_overrides[field_name]
                                     overrides_modified = True
-                                    print(f"🔍 Alias '{alias.name}': Removed override for {field_name} (reverted to base={base_id})")
+                                    debug_log.debug('alias override removed', alias=alias.name, field=field_name, base=base_id)
                             else:
                                 # Regular field comparison
                                 # Handle None comparisons carefully
@@ -2474,12 +1974,12 @@ def alias_save_view(request):
                                     if field_name not in current_overrides or current_overrides[field_name] != new_value:
                                         current_overrides[field_name] = new_value
                                         overrides_modified = True
-                                        print(f"🔍 Alias '{alias.name}': Added override {field_name}={new_value} (base={base_value})")
+                                        debug_log.debug('alias override added', alias=alias.name, field=field_name, value=new_value, base=base_value)
                                 elif field_name in current_overrides:
                                     # Value matches base but we have an override - remove it
                                     del current_overrides[field_name]
                                     overrides_modified = True
-                                    print(f"🔍 Alias '{alias.name}': Removed override for {field_name} (reverted to base={base_value})")
+                                    debug_log.debug('alias override removed', alias=alias.name, field=field_name, base=base_value)
 
                         # Handle WWPN updates - store as override, don't modify base alias
                         if wwpns_changed:
@@ -2492,12 +1992,12 @@ def alias_save_view(request):
                                 # Store WWPNs as override (as array)
                                 current_overrides['wwpns'] = wwpns_data
                                 overrides_modified = True
-                                print(f"🔍 Alias '{alias.name}': Added WWPN override (count={len(wwpns_data)})")
+                                debug_log.debug('alias override added', alias=alias.name, field='wwpns', count=len(wwpns_data))
                             elif 'wwpns' in current_overrides:
                                 # WWPNs match base but we have an override - remove it
                                 del current_overrides['wwpns']
                                 overrides_modified = True
-                                print(f"🔍 Alias '{alias.name}': Removed WWPN override (reverted to base)")
+                                debug_log.debug('alias override removed', alias=alias.name, field='wwpns')
 
                         # Update ProjectAlias if overrides changed
                         if overrides_modified:
@@ -2520,10 +2020,10 @@ def alias_save_view(request):
                             project_alias.added_by = user
                             project_alias.save()
 
-                            print(f"✏️ Updated field overrides for alias '{alias.name}' in project '{project.name}': {current_overrides}")
+                            debug_log.debug('alias overrides stored', alias=alias.name, project=project.name, overrides=current_overrides)
                         else:
                             # No changes detected - skip update
-                            print(f"✅ Skipped alias '{alias.name}' (ID: {alias.id}) - no changes detected")
+                            debug_log.debug('alias unchanged', alias=alias.name, alias_id=alias.id)
 
                         # Return the base alias data (not modified)
                         saved_aliases.append(AliasSerializer(alias).data)
@@ -2576,7 +2076,6 @@ def alias_save_view(request):
 @require_http_methods(["DELETE"])
 def alias_delete_view(request, pk):
     """Delete an alias."""
-    print(f"🔥 Alias Delete - PK: {pk}")
 
     user = request.user if request.user.is_authenticated else None
 
@@ -2595,7 +2094,7 @@ def alias_delete_view(request, pk):
         # Get customer ID from fabric (aliases are customer-scoped via fabric)
         if alias.fabric and alias.fabric.customer:
             customer_id = alias.fabric.customer.id
-        print(f'Deleting Alias: {alias.name}')
+        debug_log.debug('alias delete', pk=pk, alias=alias.name)
         Alias.objects.filter(pk=alias.pk).delete()
         
         # Clear dashboard cache when alias is deleted
@@ -2613,7 +2112,7 @@ def alias_delete_view(request, pk):
 @require_http_methods(["GET"])
 def zones_by_project_view(request, project_id):
     """Fetch zones belonging to a specific project."""
-    print(f"🔥 Zones by Project - Project ID: {project_id}")
+    debug_log.debug('zones by project request', project_id=project_id, params=lambda: dict(request.GET))
     
     try:
         # Verify project exists
@@ -2653,14 +2152,8 @@ def zones_by_project_view(request, project_id):
                 customer_fabric_ids = Fabric.objects.filter(customer=customer).values_list('id', flat=True)
                 zones = Zone.objects.select_related('fabric', 'created_by_project').filter(fabric_id__in=customer_fabric_ids)
 
-                # Customer View filtering: Show zones that are either:
-                # 1. Committed (committed=True), OR
-                # 2. Not referenced by any project (no junction table entries)
-                zones = zones.annotate(
-                    project_count=Count('project_memberships')  # Correct relationship name
-                ).filter(
-                    Q(committed=True) | Q(project_count=0)
-                )
+                # Customer View: committed, or not in any project (core.customer_visibility)
+                zones = zones.filter(customer_visible=True)
             else:
                 # Fallback if no customer (shouldn't happen but handle gracefully)
                 project_zone_ids = ProjectZone.objects.filter(project=project).values_list('zone_id', flat=True)
@@ -2672,83 +2165,18 @@ def zones_by_project_view(request, project_id):
         )
 
         # Build optimized query with prefetch_related to eliminate N+1 queries
-        zones = zones.prefetch_related(optimized_members_prefetch).annotate(
-            _member_count=Count('members', distinct=True)
-        )
+        zones = zones.prefetch_related(optimized_members_prefetch)
         
         # Apply general search if provided
         if search:
-            zones = zones.filter(
-                Q(name__icontains=search) | 
-                Q(fabric__name__icontains=search) |
-                Q(zone_type__icontains=search) |
-                Q(notes__icontains=search) |
-                Q(members__name__icontains=search)
-            ).distinct()  # distinct() because of the members join
-        
-        # Apply field-specific filters
-        filter_params = {}
-        for param, value in request.GET.items():
-            if param.startswith(('name__', 'fabric__name__', 'zone_type__', 'notes__', 'exists__', 'committed__', 'deployed__', 'member_count__')) or param in ['fabric__name', 'zone_type', 'exists', 'committed', 'deployed', 'member_count']:
-                # Handle boolean field filtering - convert string representations back to actual booleans
-                if any(param.startswith(f'{bool_field}__') for bool_field in ['exists', 'committed', 'deployed']):
-                    if param.endswith('__in'):
-                        # Handle multi-select boolean filters (e.g., create__in=True,False)
-                        boolean_values = []
-                        for str_val in value.split(','):
-                            str_val = str_val.strip()
-                            if str_val.lower() == 'true':
-                                boolean_values.append(True)
-                            elif str_val.lower() == 'false':
-                                boolean_values.append(False)
-                        filter_params[param] = boolean_values
-                    else:
-                        # Handle single boolean filters (e.g., create__exact=True)
-                        if value.lower() == 'true':
-                            filter_params[param] = True
-                        elif value.lower() == 'false':
-                            filter_params[param] = False
-                else:
-                    # Handle calculated fields - map to annotated field names
-                    if param.startswith('member_count__'):
-                        # Map member_count__ to _member_count__
-                        mapped_param = param.replace('member_count__', '_member_count__')
-                        # Handle multi-select values (comma-separated)
-                        if param.endswith('__in') and isinstance(value, str) and ',' in value:
-                            # Convert comma-separated string to list of integers
-                            try:
-                                filter_params[mapped_param] = [int(v.strip()) for v in value.split(',')]
-                            except ValueError:
-                                filter_params[mapped_param] = value.split(',')
-                        elif param.endswith('__in') and isinstance(value, str):
-                            # Handle single value in __in parameter
-                            try:
-                                filter_params[mapped_param] = [int(value.strip())]
-                            except ValueError:
-                                filter_params[mapped_param] = [value.strip()]
-                        else:
-                            # Handle single values - try to convert to int if possible
-                            try:
-                                filter_params[mapped_param] = int(value) if str(value).isdigit() else value
-                            except (ValueError, AttributeError):
-                                filter_params[mapped_param] = value
-                    elif param == 'member_count':
-                        # Handle direct member_count equals filter
-                        try:
-                            filter_params['_member_count'] = int(value)
-                        except ValueError:
-                            filter_params['_member_count'] = value
-                    else:
-                        # Handle non-boolean fields normally
-                        filter_params[param] = value
+            zones = zones.filter(search_filter(search))
         
-        # Apply the filters
-        if filter_params:
-            zones = zones.filter(**filter_params)
-        
-        # Apply ordering
-        if ordering:
-            zones = zones.order_by(ordering)
+        # Apply column filters and ordering
+        try:
+            compiled = table_filters('zones').compile(request.GET, ordering=ordering)
+        except FilterError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        zones = compiled.apply(zones)
         
         # Add pagination for performance with large datasets
         from django.core.paginator import Paginator
@@ -2799,6 +2227,7 @@ def zones_by_project_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('zones')
 def zone_project_view(request, project_id):
     """
     Get zones in project with field_overrides applied (merged view).
@@ -2833,68 +2262,14 @@ def zone_project_view(request, project_id):
 
     # Apply search filter if provided
     if search:
-        from django.db.models import Q
-        project_zones = project_zones.filter(
-            Q(zone__name__icontains=search) |
-            Q(zone__fabric__name__icontains=search) |
-            Q(zone__zone_type__icontains=search) |
-            Q(zone__notes__icontains=search) |
-            Q(zone__members__name__icontains=search)
-        ).distinct()
-
-    # Apply field-specific advanced filters
-    # Frontend sends params like 'name__icontains', we need to map to 'zone__name__icontains'
-    filter_params = {}
-    for param, value in request.GET.items():
-        # Skip pagination and search params
-        if param in ['page', 'page_size', 'search', 'ordering', 'customer_id']:
-            continue
+        project_zones = project_zones.filter(search_filter(search, 'zone__'))
 
-        # Map frontend parameter to Django ORM lookup through junction table
-        mapped_param = None
-
-        # Special handling for project_action - this is on the junction table itself, not the entity
-        if param.startswith('project_action__'):
-            # Map project_action to action (the field name on ProjectZone)
-            mapped_param = param.replace('project_action', 'action')
-            # __in lookup requires a list, even for single values
-            if mapped_param.endswith('__in'):
-                filter_params[mapped_param] = [v.strip() for v in value.split(',')] if isinstance(value, str) else value
-            else:
-                filter_params[mapped_param] = value
-        elif param.startswith(('name__', 'fabric_name__', 'zone_type__', 'notes__', 'exists__', 'committed__', 'deployed__')):
-            # Map fabric_name to fabric__name for Django ORM
-            if param.startswith('fabric_name'):
-                mapped_param = param.replace('fabric_name', 'zone__fabric__name')
-            else:
-                mapped_param = f'zone__{param}'
-
-            # Handle boolean fields
-            if any(param.startswith(f'{bool_field}__') for bool_field in ['exists', 'committed', 'deployed']):
-                if mapped_param.endswith('__in'):
-                    boolean_values = []
-                    for str_val in value.split(','):
-                        str_val = str_val.strip()
-                        if str_val.lower() == 'true':
-                            boolean_values.append(True)
-                        elif str_val.lower() == 'false':
-                            boolean_values.append(False)
-                    filter_params[mapped_param] = boolean_values
-                else:
-                    if value.lower() == 'true':
-                        filter_params[mapped_param] = True
-                    elif value.lower() == 'false':
-                        filter_params[mapped_param] = False
-            else:
-                # Handle regular string filters
-                if mapped_param.endswith('__in') and isinstance(value, str) and ',' in value:
-                    filter_params[mapped_param] = value.split(',')
-                else:
-                    filter_params[mapped_param] = value
-
-    # Apply filters to queryset
-    if filter_params:
-        project_zones = project_zones.filter(**filter_params)
+    # Apply column filters through the junction rows
+    try:
+        compiled = table_filters('zones').compile(request.GET, prefix='zone__', ordering=request.GET.get('ordering'))
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    project_zones = compiled.apply(project_zones)
 
     # ===== PAGINATION =====
     from django.core.paginator import Paginator
@@ -2995,7 +2370,7 @@ def zone_customer_list_view(request):
     Fetch all zones for a customer (without requiring a project).
     Use this endpoint when viewing customer-level data without an active project.
     """
-    print(f"🔥 Zone Customer List - Customer ID from query params")
+    debug_log.debug('customer zones request', params=lambda: dict(request.GET))
 
     # Get customer_id from query parameters (accept both 'customer' and 'customer_id')
     customer_id = request.GET.get('customer') or request.GET.get('customer_id')
@@ -3031,14 +2406,8 @@ def zone_customer_list_view(request):
     customer_fabric_ids = Fabric.objects.filter(customer=customer).values_list('id', flat=True)
     zones = Zone.objects.select_related('fabric', 'created_by_project').filter(fabric_id__in=customer_fabric_ids)
 
-    # Customer View filtering: Show zones that are either:
-    # 1. Committed (committed=True), OR
-    # 2. Not referenced by any project (no junction table entries)
-    zones = zones.annotate(
-        project_count=Count('project_memberships')  # Correct relationship name (was 'project_zones')
-    ).filter(
-        Q(committed=True) | Q(project_count=0)
-    )
+    # Customer View: committed, or not in any project (core.customer_visibility)
+    zones = zones.filter(customer_visible=True)
 
     # Prefetch project memberships for badge display
     zones = zones.prefetch_related(
@@ -3046,73 +2415,18 @@ def zone_customer_list_view(request):
     )
 
     # Build optimized query with prefetch_related
-    zones = zones.prefetch_related(optimized_members_prefetch).annotate(
-        _member_count=Count('members', distinct=True)
-    )
+    zones = zones.prefetch_related(optimized_members_prefetch)
 
     # Apply general search if provided
     if search:
-        zones = zones.filter(
-            Q(name__icontains=search) |
-            Q(fabric__name__icontains=search) |
-            Q(zone_type__icontains=search) |
-            Q(notes__icontains=search) |
-            Q(members__name__icontains=search)
-        ).distinct()
+        zones = zones.filter(search_filter(search))
 
-    # Apply field-specific filters
-    filter_params = {}
-    for param, value in request.GET.items():
-        if param.startswith(('name__', 'fabric__name__', 'zone_type__', 'notes__', 'exists__', 'committed__', 'deployed__', 'member_count__')) or param in ['fabric__name', 'zone_type', 'exists', 'committed', 'deployed', 'member_count']:
-            # Handle boolean fields
-            if any(param.startswith(f'{bool_field}__') for bool_field in ['exists', 'committed', 'deployed']):
-                if param.endswith('__in'):
-                    boolean_values = []
-                    for str_val in value.split(','):
-                        str_val = str_val.strip()
-                        if str_val.lower() == 'true':
-                            boolean_values.append(True)
-                        elif str_val.lower() == 'false':
-                            boolean_values.append(False)
-                    filter_params[param] = boolean_values
-                else:
-                    if value.lower() == 'true':
-                        filter_params[param] = True
-                    elif value.lower() == 'false':
-                        filter_params[param] = False
-            else:
-                # Handle calculated fields
-                if param.startswith('member_count__'):
-                    mapped_param = param.replace('member_count__', '_member_count__')
-                    if param.endswith('__in') and isinstance(value, str) and ',' in value:
-                        try:
-                            filter_params[mapped_param] = [int(v.strip()) for v in value.split(',')]
-                        except ValueError:
-                            filter_params[mapped_param] = value.split(',')
-                    elif param.endswith('__in') and isinstance(value, str):
-                        try:
-                            filter_params[mapped_param] = [int(value.strip())]
-                        except ValueError:
-                            filter_params[mapped_param] = [value.strip()]
-                    else:
-                        try:
-                            filter_params[mapped_param] = int(value) if str(value).isdigit() else value
-                        except (ValueError, AttributeError):
-                            filter_params[mapped_param] = value
-                elif param == 'member_count':
-                    try:
-                        filter_params['_member_count'] = int(value)
-                    except ValueError:
-                        filter_params['_member_count'] = value
-                else:
-                    filter_params[param] = value
-
-    if filter_params:
-        zones = zones.filter(**filter_params)
-
-    # Apply ordering
-    if ordering:
-        zones = zones.order_by(ordering)
+    # Apply column filters and ordering
+    try:
+        compiled = table_filters('zones').compile(request.GET, ordering=ordering)
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    zones = compiled.apply(zones)
 
     # Pagination
     from django.core.paginator import Paginator
@@ -3160,30 +2474,24 @@ def zone_customer_list_view(request):
 @require_http_methods(["GET"])
 def zone_max_members_view(request, project_id):
     """Get the maximum number of members across all zones in a project."""
-    print(f"🔥 Zone Max Members - Project ID: {project_id}")
+    debug_log.debug('zone max members request', project_id=project_id)
     
     try:
         # Verify project exists
         project = Project.objects.get(id=project_id)
-        print(f"  ✅ Project found: {project.name}")
         
-        # Get all zones for this project with their members
-        zones = Zone.objects.prefetch_related('members').filter(projects=project)
+        # Member count of every zone in the project, counted in the database
+        zones = Zone.objects.filter(project_memberships__project=project).annotate(member_count=Count('members'))
         total_zones = zones.count()
-        print(f"  📊 Total zones in project: {total_zones}")
         
         max_members = 0
         max_zone_name = None
+        largest = zones.order_by('-member_count', 'id').values('name', 'member_count').first()
+        if largest and largest['member_count'] > 0:
+            max_members = largest['member_count']
+            max_zone_name = largest['name']
         
-        for zone in zones:
-            member_count = zone.members.count()
-            print(f"  🔍 Zone {zone.name} has {member_count} members")
-            if member_count > max_members:
-                max_members = member_count
-                max_zone_name = zone.name
-                print(f"    📊 New max: {member_count} members in zone {zone.name}")
-        
-        print(f"✅ Maximum members across all zones: {max_members} (zone: {max_zone_name})")
+        debug_log.debug('zone max members', project_id=project_id, zones=total_zones, max_members=max_members, zone=max_zone_name)
         return JsonResponse({
             "max_members": max_members, 
             "max_zone_name": max_zone_name,
@@ -3247,12 +2555,8 @@ def zone_customer_column_requirements(request):
         customer_fabric_ids = Fabric.objects.filter(customer=customer).values_list('id', flat=True)
         zones = Zone.objects.filter(fabric_id__in=customer_fabric_ids)
 
-        # Customer View filtering: Show zones that are either committed OR not in any project
-        zones = zones.annotate(
-            project_count=Count('project_memberships')
-        ).filter(
-            Q(committed=True) | Q(project_count=0)
-        )
+        # Customer View: committed, or not in any project (core.customer_visibility)
+        zones = zones.filter(customer_visible=True)
 
         # Prefetch members with use type
         zones = zones.prefetch_related('members')
@@ -3295,9 +2599,10 @@ def zone_customer_column_requirements(request):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@audit_batched_view("ZONE", "Bulk saved zones", rows_key="zones")
 def zone_save_view(request):
     """Save or update zones for multiple projects."""
-    print(f"🔥 Zone Save - Method: {request.method}")
+    debug_log.debug('zone save request', method=request.method)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -3328,28 +2633,15 @@ def zone_save_view(request):
             zone_id = zone_data.get("id")
             zone_name = zone_data.get("name", "Unknown")
             
-            print(f"🔍 Processing zone: {zone_name}")
-            print(f"📋 Zone data: {zone_data}")
+            debug_log.debug('zone save data', zone=zone_name, data=zone_data)
 
             # Ensure projects is a list (since it's many-to-many)
             projects_list = zone_data.pop("projects", [project_id])  # Defaults to the current project
             members_list = zone_data.pop("members", [])  # Handle members
             
-            print(f"👥 Members list for {zone_name}: {members_list}")
-            print(f"📊 Members count: {len(members_list)}")
-            
-            # Debug member processing
-            if members_list:
-                print(f"🔍 Processing members for {zone_name}:")
-                for i, member in enumerate(members_list):
-                    print(f"  Member {i}: {member} (type: {type(member)})")
-                    if isinstance(member, dict) and 'alias' in member:
-                        print(f"    Alias ID: {member['alias']} (type: {type(member['alias'])})")
-            
             # Extract member IDs
             member_ids = [member.get('alias') for member in members_list if member.get('alias')]
-            print(f"🎯 Extracted member IDs for {zone_name}: {member_ids}")
-            print(f"🎯 Member IDs count: {len(member_ids)}")
+            debug_log.debug('zone member ids', zone=zone_name, member_ids=member_ids, members=len(members_list))
 
             if zone_id:
                 zone = Zone.objects.filter(id=zone_id).first()
@@ -3417,11 +2709,10 @@ def zone_save_view(request):
 
                             # Handle member updates (these still need to update the actual zone for now)
                             # TODO: In future, members could also be stored in overrides only
-                            print(f"🎯 [UPDATE] Setting members for {zone_name}: {member_ids}")
                             zone.members.set(member_ids)
-                            print(f"✅ [UPDATE] Members set for {zone_name}. Final count: {zone.members.count()}")
+                            debug_log.debug('zone members updated', zone=zone_name, count=zone.members.count)
 
-                            print(f"✏️ Stored field overrides for zone '{zone.name}' in project '{project.name}': {changed_fields}")
+                            debug_log.debug('zone overrides stored', zone=zone.name, project=project.name, overrides=changed_fields)
 
                         # Return the base zone data (not modified)
                         saved_zones.append(ZoneSerializer(zone).data)
@@ -3450,9 +2741,8 @@ def zone_save_view(request):
                     )
 
                     member_ids = [member.get('alias') for member in members_list if member.get('alias')]
-                    print(f"🎯 [CREATE] Setting members for {zone_name}: {member_ids}")
                     zone.members.set(member_ids)
-                    print(f"✅ [CREATE] Members set for {zone_name}. Final count: {zone.members.count()}")
+                    debug_log.debug('zone members set', zone=zone_name, count=zone.members.count)
                     saved_zones.append(ZoneSerializer(zone).data)
                 else:
                     errors.append({"zone": zone_data["name"], "errors": serializer.errors})
@@ -3476,7 +2766,6 @@ def zone_save_view(request):
 @require_http_methods(["DELETE"])
 def zone_delete_view(request, pk):
     """Delete a zone."""
-    print(f"🔥 Zone Delete - PK: {pk}")
 
     user = request.user if request.user.is_authenticated else None
 
@@ -3495,7 +2784,7 @@ def zone_delete_view(request, pk):
         # Get customer ID from fabric (zones are customer-scoped via fabric)
         if zone.fabric and zone.fabric.customer:
             customer_id = zone.fabric.customer.id
-        print(f'Deleting Zone: {zone.name}')
+        debug_log.debug('zone delete', pk=pk, zone=zone.name)
         Zone.objects.filter(pk=zone.pk).delete()
         
         # Clear dashboard cache when zone is deleted
@@ -3677,12 +2966,12 @@ def fabric_management(request, pk=None):
 @require_http_methods(["DELETE"])
 def fabric_delete_view(request, pk):
     """Delete a fabric."""
-    print(f"🔥 Fabric Delete - PK: {pk}")
+    debug_log.debug('fabric delete request', pk=pk)
     
     try:
         fabric = Fabric.objects.get(pk=pk)
         customer_id = fabric.customer_id
-        print(f'Deleting Fabric: {fabric.name}')
+        debug_log.debug('fabric delete', pk=pk, fabric=fabric.name)
         fabric.delete()
         
         # Clear dashboard cache when fabric is deleted
@@ -3700,7 +2989,6 @@ def fabric_delete_view(request, pk):
 @require_http_methods(["GET"])
 def generate_alias_scripts(request, project_id):
     """Generate alias scripts for a project."""
-    print(f"🔥 Generate Alias Scripts - Project ID: {project_id}")
 
     if not project_id:
         return JsonResponse({"error": "Missing project_id in query parameters."}, status=400)
@@ -3722,8 +3010,8 @@ def generate_alias_scripts(request, project_id):
         delete_alias_ids = ProjectAlias.objects.filter(project=project, delete_me=True).values_list('alias_id', flat=True)
         delete_aliases = Alias.objects.filter(id__in=delete_alias_ids)
 
-        print(f"🔍 Found {create_aliases.count()} aliases (delete_me=False) for CREATE scripts in project {project_id}")
-        print(f"🔍 Found {delete_aliases.count()} aliases (delete_me=True) for DELETE scripts in project {project_id}")
+        debug_log.debug('aliases for CREATE scripts', project_id=project_id, count=create_aliases.count)
+        debug_log.debug('aliases for DELETE scripts', project_id=project_id, count=delete_aliases.count)
     except Exception as e:
         return JsonResponse({"error": "Error fetching alias records.", "details": str(e)}, status=500)
 
@@ -3737,7 +3025,7 @@ def generate_alias_scripts(request, project_id):
             "fabric_info": fabric_data["fabric_info"]
         }
 
-    print(f"🔍 Generated alias scripts for {len(result)} fabrics")
+    debug_log.debug('alias scripts generated', project_id=project_id, fabrics=len(result))
     return JsonResponse({"alias_scripts": result}, safe=False)
 
 
@@ -3746,7 +3034,6 @@ def generate_alias_scripts(request, project_id):
 @require_http_methods(["GET"])
 def generate_zone_scripts(request, project_id):
     """Generate zone scripts for a project."""
-    print(f"🔥 Generate Zone Scripts - Project ID: {project_id}")
 
     if not project_id:
         return JsonResponse({"error": "Missing project_id in query parameters."}, status=400)
@@ -3768,8 +3055,8 @@ def generate_zone_scripts(request, project_id):
         delete_zone_ids = ProjectZone.objects.filter(project=project, delete_me=True).values_list('zone_id', flat=True)
         delete_zones = Zone.objects.filter(id__in=delete_zone_ids)
 
-        print(f"🔍 Found {create_zones.count()} zones (delete_me=False) for CREATE scripts in project {project_id}")
-        print(f"🔍 Found {delete_zones.count()} zones (delete_me=True) for DELETE scripts in project {project_id}")
+        debug_log.debug('zones for CREATE scripts', project_id=project_id, count=create_zones.count)
+        debug_log.debug('zones for DELETE scripts', project_id=project_id, count=delete_zones.count)
     except Exception as e:
         return JsonResponse({"error": "Error fetching zone records.", "details": str(e)}, status=500)
 
@@ -3805,7 +3092,7 @@ def generate_zone_scripts(request, project_id):
 
             warning_message += "; ".join(fabric_details)
             warnings.append(warning_message)
-            print(f"⚠️  Found {len(invalid_cisco_aliases)} Cisco aliases missing cisco_alias field")
+            debug_log.debug('cisco aliases missing cisco_alias', project_id=project_id, count=len(invalid_cisco_aliases))
 
         # Check for aliases without WWPNs (placeholder aliases)
         aliases_without_wwpn = [alias for alias in create_aliases if not alias.wwpns]
@@ -3829,13 +3116,13 @@ def generate_zone_scripts(request, project_id):
 
             warning_message += "; ".join(fabric_details)
             warnings.append(warning_message)
-            print(f"⚠️  Found {len(aliases_without_wwpn)} aliases missing WWPNs")
+            debug_log.debug('aliases missing wwpns', project_id=project_id, count=len(aliases_without_wwpn))
     except Exception as e:
         print(f"⚠️  Error checking for invalid aliases: {e}")
 
     # Pass project instead of config to the command generation
     command_data = generate_zone_commands(create_zones, delete_zones, project)
-    print(f"🔍 Generated scripts for {len(command_data)} fabrics")
+    debug_log.debug('zone scripts generated', project_id=project_id, fabrics=len(command_data))
 
     response_data = {
         "zone_scripts": command_data,
@@ -3848,7 +3135,6 @@ def generate_zone_scripts(request, project_id):
 @require_http_methods(["GET"])
 def generate_alias_deletion_scripts(request, project_id):
     """Generate alias deletion scripts for a project."""
-    print(f"🔥 Generate Alias Deletion Scripts - Project ID: {project_id}")
 
     if not project_id:
         return JsonResponse({"error": "Missing project_id in query parameters."}, status=400)
@@ -3863,7 +3149,7 @@ def generate_alias_deletion_scripts(request, project_id):
     try:
         delete_alias_ids = ProjectAlias.objects.filter(project=project, delete_me=True).values_list('alias_id', flat=True)
         delete_aliases = Alias.objects.filter(id__in=delete_alias_ids)
-        print(f"🔍 Found {delete_aliases.count()} aliases (delete_me=True) for DELETE scripts in project {project_id}")
+        debug_log.debug('aliases for DELETE scripts', project_id=project_id, count=delete_aliases.count)
     except Exception as e:
         return JsonResponse({"error": "Error fetching alias records.", "details": str(e)}, status=500)
 
@@ -3877,7 +3163,7 @@ def generate_alias_deletion_scripts(request, project_id):
             "fabric_info": fabric_data["fabric_info"]
         }
 
-    print(f"🔍 Generated alias deletion scripts for {len(result)} fabrics")
+    debug_log.debug('alias deletion scripts generated', project_id=project_id, fabrics=len(result))
     return JsonResponse({"alias_scripts": result}, safe=False)
 
 
@@ -3885,7 +3171,6 @@ def generate_alias_deletion_scripts(request, project_id):
 @require_http_methods(["GET"])
 def generate_zone_deletion_scripts(request, project_id):
     """Generate zone deletion scripts for a project."""
-    print(f"🔥 Generate Zone Deletion Scripts - Project ID: {project_id}")
 
     if not project_id:
         return JsonResponse({"error": "Missing project_id in query parameters."}, status=400)
@@ -3900,12 +3185,12 @@ def generate_zone_deletion_scripts(request, project_id):
     try:
         delete_zone_ids = ProjectZone.objects.filter(project=project, delete_me=True).values_list('zone_id', flat=True)
         delete_zones = Zone.objects.filter(id__in=delete_zone_ids)
-        print(f"🔍 Found {delete_zones.count()} zones (delete_me=True) for DELETE scripts in project {project_id}")
+        debug_log.debug('zones for DELETE scripts', project_id=project_id, count=delete_zones.count)
     except Exception as e:
         return JsonResponse({"error": "Error fetching zone records.", "details": str(e)}, status=500)
 
     command_data = generate_zone_deletion_commands(delete_zones, project)
-    print(f"🔍 Generated zone deletion scripts for {len(command_data)} fabrics")
+    debug_log.debug('zone deletion scripts generated', project_id=project_id, fabrics=len(command_data))
     return JsonResponse({"zone_scripts": command_data}, safe=False)
 
 
@@ -3913,7 +3198,7 @@ def generate_zone_deletion_scripts(request, project_id):
 @require_http_methods(["GET"])
 def alias_by_fabric_view(request, fabric_id):
     """Fetch aliases belonging to a specific fabric."""
-    print(f"🔥 Alias by Fabric - Fabric ID: {fabric_id}")
+    debug_log.debug('aliases by fabric request', fabric_id=fabric_id)
     
     try:
         fabric = Fabric.objects.get(id=fabric_id)
@@ -3929,7 +3214,7 @@ def alias_by_fabric_view(request, fabric_id):
 @require_http_methods(["POST"])
 def alias_copy_to_project_view(request):
     """Copy existing aliases to a project by adding the project to their many-to-many relationship."""
-    print(f"🔥 Alias Copy to Project - Method: {request.method}")
+    debug_log.debug('alias copy to project request', method=request.method)
     
     try:
         data = json.loads(request.body)
@@ -3985,7 +3270,7 @@ def wwpn_prefix_list_view(request):
     GET /wwpn-prefixes/  -> List all WWPN prefixes
     POST /wwpn-prefixes/ -> Create a new WWPN prefix
     """
-    print(f"🔥 WWPN Prefix List - Method: {request.method}")
+    debug_log.debug('wwpn prefix list request', method=request.method)
     
     if request.method == "GET":
         search = request.GET.get('search', '')
@@ -4033,7 +3318,7 @@ def wwpn_prefix_detail_view(request, pk):
     PUT /wwpn-prefixes/{pk}/    -> Update an existing WWPN prefix
     DELETE /wwpn-prefixes/{pk}/ -> Delete a WWPN prefix
     """
-    print(f"🔥 WWPN Prefix Detail - Method: {request.method}, PK: {pk}")
+    debug_log.debug('wwpn prefix detail request', method=request.method, pk=pk)
     
     try:
         wwpn_prefix = WwpnPrefix.objects.get(pk=pk)
@@ -4060,7 +3345,7 @@ def wwpn_prefix_detail_view(request, pk):
     
     elif request.method == "DELETE":
         try:
-            print(f'Deleting WWPN Prefix: {wwpn_prefix.prefix}')
+            debug_log.debug('wwpn prefix delete', pk=pk, prefix=wwpn_prefix.prefix)
             wwpn_prefix.delete()
             return JsonResponse({"message": "WWPN prefix deleted successfully."})
         except Exception as e:
@@ -4075,7 +3360,6 @@ def wwpn_detect_type_view(request):
     Detect WWPN type (initiator/target) based on global prefix rules
     Body: {"wwpn": "<wwpn>"}
     """
-    print(f"🔥 WWPN Detect Type - Method: {request.method}")
     
     try:
         data = json.loads(request.body)
@@ -4100,7 +3384,6 @@ def wwpn_detect_type_view(request):
 @require_http_methods(["GET"])
 def generate_zone_creation_scripts(request, project_id):
     """Generate combined zone creation scripts with aliases in the specified format."""
-    print(f"🔥 Generate Zone Creation Scripts - Project ID: {project_id}")
 
     if not project_id:
         return JsonResponse({"error": "Missing project_id in query parameters."}, status=400)
@@ -4116,14 +3399,14 @@ def generate_zone_creation_scripts(request, project_id):
         # Get zones with delete_me=False (CREATE scripts)
         create_zone_ids = ProjectZone.objects.filter(project=project, delete_me=False).values_list('zone_id', flat=True)
         create_zones = Zone.objects.filter(id__in=create_zone_ids)
-        print(f"🔍 Found {create_zones.count()} zones (delete_me=False) for CREATE scripts in project {project_id}")
+        debug_log.debug('zones for CREATE scripts', project_id=project_id, count=create_zones.count)
     except Exception as e:
         print(f"❌ Error fetching zones: {e}")
         return JsonResponse({"error": "Error fetching zone records.", "details": str(e)}, status=500)
 
     try:
         command_data = generate_zone_creation_commands(create_zones, project)
-        print(f"✅ Generated zone creation scripts for {len(command_data)} fabrics")
+        debug_log.debug('zone creation scripts generated', project_id=project_id, fabrics=len(command_data))
     except Exception as e:
         print(f"❌ Error generating scripts: {e}")
         import traceback
@@ -4137,7 +3420,6 @@ def generate_zone_creation_scripts(request, project_id):
 @require_http_methods(["POST"])
 def bulk_update_alias_boolean(request, project_id):
     """Bulk update boolean fields for aliases in a project via junction table."""
-    print(f"🔥 Bulk Update Alias Boolean - Project ID: {project_id}")
 
     try:
         data = json.loads(request.body)
@@ -4145,7 +3427,7 @@ def bulk_update_alias_boolean(request, project_id):
         value = data.get('value')
         filters = data.get('filters', {})
 
-        print(f"📝 Bulk update request: field={field}, value={value}, filters={filters}")
+        debug_log.debug('bulk boolean update', project_id=project_id, field=field, value=value, filters=filters)
 
         if not field or value is None:
             return JsonResponse({"error": "Field and value are required"}, status=400)
@@ -4165,29 +3447,18 @@ def bulk_update_alias_boolean(request, project_id):
         alias_ids = ProjectAlias.objects.filter(project=project).values_list('alias_id', flat=True)
         queryset = Alias.objects.filter(id__in=alias_ids)
 
-        # Apply server-side filters if provided
+        # Apply server-side filters if provided (same parameters as the table)
         if filters:
-            for filter_key, filter_value in filters.items():
-                if filter_key == 'quick_search' and filter_value:
-                    # Quick search across main fields
-                    queryset = queryset.filter(
-                        Q(name__icontains=filter_value) |
-                        Q(wwpn__icontains=filter_value) |
-                        Q(use__icontains=filter_value)
-                    )
-                elif '__' in filter_key:
-                    # Handle complex filters
-                    if filter_key.endswith('__in') and isinstance(filter_value, list):
-                        queryset = queryset.filter(**{filter_key: filter_value})
-                    elif filter_key.endswith('__in') and isinstance(filter_value, str):
-                        # Handle single value passed as __in
-                        values = [v.strip() for v in filter_value.split(',')]
-                        queryset = queryset.filter(**{filter_key: values})
-                    else:
-                        queryset = queryset.filter(**{filter_key: filter_value})
-                else:
-                    # Simple field filter
-                    queryset = queryset.filter(**{filter_key: filter_value})
+            if filters.get('quick_search'):
+                queryset = queryset.filter(search_filter(filters['quick_search']))
+            try:
+                compiled = table_filters('aliases').compile(
+                    filters, context={'zone_ids': ProjectZone.objects.filter(project=project).values('zone_id')},
+                    skip=ALIAS_STORAGE_COLUMNS
+                )
+            except FilterError as e:
+                return JsonResponse({'error': str(e)}, status=400)
+            queryset = compiled.apply(queryset)
 
         # Get the final list of alias IDs after filtering
         filtered_alias_ids = list(queryset.values_list('id', flat=True))
@@ -4225,7 +3496,7 @@ def bulk_update_alias_boolean(request, project_id):
         except:
             pass
 
-        print(f"✅ Updated {updated_count} alias records")
+        debug_log.debug('alias booleans updated', project_id=project_id, field=field, count=updated_count)
 
         return JsonResponse({
             "message": f"Successfully updated {updated_count} aliases",
@@ -4245,7 +3516,6 @@ def bulk_update_alias_boolean(request, project_id):
 @require_http_methods(["POST"])
 def bulk_update_zone_boolean(request, project_id):
     """Bulk update boolean fields for zones in a project via junction table."""
-    print(f"🔥 Bulk Update Zone Boolean - Project ID: {project_id}")
 
     try:
         data = json.loads(request.body)
@@ -4253,7 +3523,7 @@ def bulk_update_zone_boolean(request, project_id):
         value = data.get('value')
         filters = data.get('filters', {})
 
-        print(f"📝 Bulk update request: field={field}, value={value}, filters={filters}")
+        debug_log.debug('bulk boolean update', project_id=project_id, field=field, value=value, filters=filters)
 
         if not field or value is None:
             return JsonResponse({"error": "Field and value are required"}, status=400)
@@ -4273,43 +3543,15 @@ def bulk_update_zone_boolean(request, project_id):
         zone_ids = ProjectZone.objects.filter(project=project).values_list('zone_id', flat=True)
         queryset = Zone.objects.filter(id__in=zone_ids)
         
-        # Apply server-side filters if provided
+        # Apply server-side filters if provided (same parameters as the table)
         if filters:
-            for filter_key, filter_value in filters.items():
-                if filter_key == 'quick_search' and filter_value:
-                    # Quick search across main fields
-                    queryset = queryset.filter(
-                        Q(name__icontains=filter_value) | 
-                        Q(zone_type__icontains=filter_value) | 
-                        Q(notes__icontains=filter_value)
-                    )
-                elif filter_key.startswith('member_count__'):
-                    # Handle member count filters
-                    mapped_key = filter_key.replace('member_count__', '_member_count__')
-                    if filter_key.endswith('__in') and isinstance(filter_value, list):
-                        queryset = queryset.annotate(_member_count=Count('members')).filter(**{mapped_key: filter_value})
-                    elif filter_key.endswith('__in') and isinstance(filter_value, str):
-                        # Handle single value or comma-separated values
-                        if ',' in filter_value:
-                            values = [int(v.strip()) for v in filter_value.split(',')]
-                        else:
-                            values = [int(filter_value.strip())]
-                        queryset = queryset.annotate(_member_count=Count('members')).filter(**{mapped_key: values})
-                    else:
-                        queryset = queryset.annotate(_member_count=Count('members')).filter(**{mapped_key: int(filter_value)})
-                elif '__' in filter_key:
-                    # Handle other complex filters
-                    if filter_key.endswith('__in') and isinstance(filter_value, list):
-                        queryset = queryset.filter(**{filter_key: filter_value})
-                    elif filter_key.endswith('__in') and isinstance(filter_value, str):
-                        # Handle single value passed as __in
-                        values = [v.strip() for v in filter_value.split(',')]
-                        queryset = queryset.filter(**{filter_key: values})
-                    else:
-                        queryset = queryset.filter(**{filter_key: filter_value})
-                else:
-                    # Simple field filter
-                    queryset = queryset.filter(**{filter_key: filter_value})
+            if filters.get('quick_search'):
+                queryset = queryset.filter(search_filter(filters['quick_search']))
+            try:
+                compiled = table_filters('zones').compile(filters)
+            except FilterError as e:
+                return JsonResponse({'error': str(e)}, status=400)
+            queryset = compiled.apply(queryset)
 
         # Get the final list of zone IDs after filtering
         filtered_zone_ids = list(queryset.values_list('id', flat=True))
@@ -4340,7 +3582,7 @@ def bulk_update_zone_boolean(request, project_id):
         except:
             pass
 
-        print(f"✅ Updated {updated_count} zone records")
+        debug_log.debug('zone booleans updated', project_id=project_id, field=field, count=updated_count)
 
         return JsonResponse({
             "message": f"Successfully updated {updated_count} zones",
@@ -4358,9 +3600,9 @@ def bulk_update_zone_boolean(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@audit_batched_view("ZONE", "Bulk updated zone create flags", rows_key="zones")
 def bulk_update_zones_create(request):
     """Bulk update create action for specific zones via junction table."""
-    print("🔥 Bulk Update Zones Create")
 
     try:
         data = json.loads(request.body)
@@ -4407,7 +3649,7 @@ def bulk_update_zones_create(request):
                 print(f"❌ Zone with ID {zone_id} not found")
                 continue
 
-        print(f"✅ Updated {updated_count} zones")
+        debug_log.debug('zones create flag updated', count=updated_count)
         return JsonResponse({
             "message": f"Successfully updated {updated_count} zones",
             "updated_count": updated_count
@@ -4422,9 +3664,9 @@ def bulk_update_zones_create(request):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@audit_batched_view("ALIAS", "Bulk updated alias create flags", rows_key="aliases")
 def bulk_update_aliases_create(request):
     """Bulk update create action for specific aliases via junction table."""
-    print("🔥 Bulk Update Aliases Create")
 
     try:
         data = json.loads(request.body)
@@ -4469,7 +3711,7 @@ def bulk_update_aliases_create(request):
                 print(f"❌ Alias with ID {alias_id} not found")
                 continue
 
-        print(f"✅ Updated {updated_count} aliases")
+        debug_log.debug('aliases create flag updated', count=updated_count)
         return JsonResponse({
             "message": f"Successfully updated {updated_count} aliases",
             "updated_count": updated_count
@@ -4484,9 +3726,9 @@ def bulk_update_aliases_create(request):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@audit_batched_view("HOST", "Bulk updated host create flags", rows_key="hosts")
 def bulk_update_hosts_create(request):
     """Bulk update create field for specific hosts by ID."""
-    print("🔥 Bulk Update Hosts Create")
 
     try:
         data = json.loads(request.body)
@@ -4509,7 +3751,14 @@ def bulk_update_hosts_create(request):
                 print(f"❌ Host with ID {host_id} not found")
                 continue
 
-        print(f"✅ Updated {updated_count} hosts")
+        # Hosts carry no project_id, so name their customer for the audit summary
+        audit_batch = current_audit_batch()
+        if audit_batch and updated_count:
+            audit_batch.customer = Host.objects.filter(
+                id__in=[host_data.get('id') for host_data in hosts]
+            ).values_list('storage__customer', flat=True).first()
+
+        debug_log.debug('hosts create flag updated', count=updated_count)
         return JsonResponse({
             "message": f"Successfully updated {updated_count} hosts",
             "updated_count": updated_count
@@ -4684,11 +3933,10 @@ def switch_management(request, pk=None):
 @require_http_methods(["DELETE"])
 def switch_delete_view(request, pk):
     """Delete a switch."""
-    print(f"🔥 Switch Delete - PK: {pk}")
 
     try:
         switch = Switch.objects.get(pk=pk)
-        print(f'Deleting Switch: {switch.name}')
+        debug_log.debug('switch delete', pk=pk, switch=switch.name)
         switch.delete()
 
         return JsonResponse({"message": "Switch deleted successfully."})
@@ -4702,7 +3950,7 @@ def switch_delete_view(request, pk):
 @require_http_methods(["GET"])
 def switches_by_customer_view(request, customer_id):
     """Fetch switches belonging to a specific customer (for dropdown population)."""
-    print(f"🔥 Switches by Customer - Customer ID: {customer_id}")
+    debug_log.debug('switches by customer request', customer_id=customer_id)
 
     try:
         from django.db.models import Q, Count
@@ -4725,6 +3973,7 @@ def switches_by_customer_view(request, customer_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('switches')
 def switch_project_view(request, project_id):
     """
     Get switches in project with field_overrides applied (merged view).
@@ -4998,6 +4247,7 @@ def switch_project_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('fabrics')
 def fabric_project_view(request, project_id):
     """
     Get fabrics in project with field_overrides applied (merged view).
@@ -5325,7 +4575,7 @@ def switch_save_view(request):
                             # Compare
                             if current_fabric_domains != normalized_new:
                                 changed_fields['fabric_domains'] = fabric_domains_new
-                                print(f"🔧 Fabric domains changed for switch '{switch.name}': {current_fabric_domains} -> {normalized_new}")
+                                debug_log.debug('switch fabric domains changed', switch=switch.name, old=current_fabric_domains, new=normalized_new)
 
                         if changed_fields:
                             # Get or create ProjectSwitch for this project
@@ -5351,7 +4601,7 @@ def switch_save_view(request):
                             project_switch.added_by = user
                             project_switch.save()
 
-                            print(f"✏️ Stored field overrides for switch '{switch.name}' in project '{project.name}': {changed_fields}")
+                            debug_log.debug('switch overrides stored', switch=switch.name, project=project.name, overrides=changed_fields)
 
                         # Return the base switch data (not modified)
                         saved_switches.append(SwitchSerializer(switch).data)
@@ -5480,7 +4730,7 @@ def fabric_save_view(request):
                             project_fabric.added_by = user
                             project_fabric.save()
 
-                            print(f"✏️ Stored field overrides for fabric '{fabric.name}' in project '{project.name}': {changed_fields}")
+                            debug_log.debug('fabric overrides stored', fabric=fabric.name, project=project.name, overrides=changed_fields)
 
                         # Return the base fabric data (not modified)
                         saved_fabrics.append(FabricSerializer(fabric).data)
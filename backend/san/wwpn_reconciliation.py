@@ -0,0 +1,396 @@
+"""
+Customer-wide WWPN reconciliation between aliases, hosts and storage ports.
+
+A WWPN can be recorded in three places: on an alias (AliasWWPN), on a host
+(HostWwpn, manual or derived from an alias) and on a storage port (Port).
+Each table stores it in its own format, so every WWPN is compared by its
+normalized key (16 lowercase hex digits).
+
+reconcile_customer_wwpns() loads all three tables for a customer in one
+values() query each and classifies every WWPN:
+
+    matched    aliases, hosts and ports agree
+    linkable   aliases and exactly one host agree, but the alias is not yet
+               linked to the host or the host's WWPN row is not alias-sourced
+    conflict   the WWPN is claimed by more than one host, or by both a host
+               and a storage port
+    orphaned   the WWPN is only known to aliases, only to a host or only to
+               a storage port
+
+apply_alias_host_links() links every linkable alias to its host with
+bulk_update/bulk_create. Bulk writes skip model signals, so the dashboard
+summary of the affected customers is marked stale and the search text of the
+changed aliases and hosts is queued for a rebuild explicitly.
+"""
+
+import re
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.dashboard_summary import mark_dashboard_summary_stale
+from core.search_index import queue_search_refresh
+from storage.models import HostWwpn, Port
+from .models import Alias, AliasWWPN
+from .san_tools import wwpn_key_expression
+
+MATCHED = 'matched'
+LINKABLE = 'linkable'
+CONFLICT = 'conflict'
+ORPHANED = 'orphaned'
+
+STATUSES = (MATCHED, LINKABLE, CONFLICT, ORPHANED)
+
+# Rows written per bulk query
+BULK_BATCH_SIZE = 500
+
+_WWPN_SEPARATORS = re.compile(r'[:\- ]')
+_WWPN_KEY = re.compile(r'^[0-9a-f]{16}$')
+
+
+def normalize_wwpn(value):
+    """16 lowercase hex digits, or None if `value` is not a WWPN"""
+    if not value:
+        return None
+    key = _WWPN_SEPARATORS.sub('', str(value)).lower()
+    return key if _WWPN_KEY.match(key) else None
+
+
+def format_wwpn(value):
+    """Colon-separated uppercase form used for HostWwpn rows, or None"""
+    key = normalize_wwpn(value)
+    if key is None:
+        return None
+    return ':'.join(key[i:i + 2] for i in range(0, 16, 2)).upper()
+
+
+def _filter_wwpns(queryset, wwpn_keys):
+    if wwpn_keys is None:
+        return queryset
+    return queryset.annotate(wwpn_key=wwpn_key_expression()).filter(wwpn_key__in=wwpn_keys)
+
+
+def _group_by_wwpn(rows, groups, kind):
+    for row in rows:
+        key = normalize_wwpn(row.pop('wwpn'))
+        if key is not None:
+            groups[key][kind].append(row)
+
+
+def load_customer_wwpns(customer_id, wwpns=None):
+    """
+    Every alias, host and port occurrence of a customer's WWPNs, three queries.
+
+    Args:
+        customer_id: Customer id
+        wwpns: Optional iterable of WWPNs (any format) to restrict the load to
+
+    Returns:
+        dict: {wwpn_key: {'aliases': [...], 'host_wwpns': [...], 'ports': [...]}}
+    """
+    wwpn_keys = None
+    if wwpns is not None:
+        wwpn_keys = {key for key in map(normalize_wwpn, wwpns) if key}
+        if not wwpn_keys:
+            return {}
+
+    groups = defaultdict(lambda: {'aliases': [], 'host_wwpns': [], 'ports': []})
+
+    aliases = _filter_wwpns(AliasWWPN.objects.filter(alias__fabric__customer_id=customer_id), wwpn_keys)
+    _group_by_wwpn(aliases.values(
+        'wwpn', 'alias_id',
+        alias_name=F('alias__name'), use=F('alias__use'), host_id=F('alias__host_id'),
+        fabric_id=F('alias__fabric_id'), fabric_name=F('alias__fabric__name'),
+    ), groups, 'aliases')
+
+    host_wwpns = _filter_wwpns(HostWwpn.objects.filter(host__storage__customer_id=customer_id), wwpn_keys)
+    _group_by_wwpn(host_wwpns.values(
+        'wwpn', 'id', 'host_id', 'source_type', 'source_alias_id', host_name=F('host__name'),
+    ), groups, 'host_wwpns')
+
+    ports = _filter_wwpns(Port.objects.filter(storage__customer_id=customer_id, wwpn__isnull=False), wwpn_keys)
+    _group_by_wwpn(ports.values(
+        'wwpn', 'id', 'name', 'storage_id', 'alias_id', storage_name=F('storage__name'),
+    ), groups, 'ports')
+
+    return groups
+
+
+def classify_wwpn(occurrences):
+    """
+    Classify one WWPN from its occurrences (see load_customer_wwpns).
+
+    Returns:
+        (status, reason, host_id): host_id is the single host the WWPN
+        belongs to, or None
+    """
+    aliases = occurrences['aliases']
+    host_wwpns = occurrences['host_wwpns']
+    ports = occurrences['ports']
+    host_ids = {a['host_id'] for a in aliases if a['host_id']} | {hw['host_id'] for hw in host_wwpns}
+
+    if len(host_ids) > 1:
+        return CONFLICT, 'multiple_hosts', None
+    if host_ids and ports:
+        return CONFLICT, 'host_and_port', None
+
+    if host_ids:
+        host_id = host_ids.pop()
+        if not aliases:
+            return ORPHANED, 'host_only', host_id
+        if any(a['use'] == 'target' for a in aliases):
+            return CONFLICT, 'target_alias_on_host', host_id
+        alias_ids = {a['alias_id'] for a in aliases}
+        in_sync = (
+            all(a['host_id'] == host_id for a in aliases)
+            and bool(host_wwpns)
+            and all(hw['source_type'] == 'alias' and hw['source_alias_id'] in alias_ids for hw in host_wwpns)
+        )
+        return (MATCHED, None, host_id) if in_sync else (LINKABLE, None, host_id)
+
+    if ports:
+        return (MATCHED, None, None) if aliases else (ORPHANED, 'port_only', None)
+    return ORPHANED, 'alias_only', None
+
+
+def reconcile_customer_wwpns(customer_id, wwpns=None):
+    """
+    Reconcile every WWPN of a customer.
+
+    Returns:
+        dict: 'summary' ({status: count}) and 'entries', one per WWPN with
+        'wwpn', 'status', 'reason', 'host_id', 'aliases', 'host_wwpns', 'ports'
+    """
+    entries = []
+    summary = dict.fromkeys(STATUSES, 0)
+    for key, occurrences in load_customer_wwpns(customer_id, wwpns).items():
+        status, reason, host_id = classify_wwpn(occurrences)
+        summary[status] += 1
+        entries.append({
+            'wwpn': format_wwpn(key),
+            'status': status,
+            'reason': reason,
+            'host_id': host_id,
+            **occurrences,
+        })
+    entries.sort(key=lambda entry: entry['wwpn'])
+    return {'summary': summary, 'entries': entries}
+
+
+def linkable_aliases(entries, alias_ids=None):
+    """
+    {alias_id: host_id} for the linkable entries of a reconciliation.
+
+    An alias whose WWPNs point at different hosts is left out.
+    """
+    links = {}
+    ambiguous = set()
+    for entry in entries:
+        if entry['status'] != LINKABLE:
+            continue
+        for alias in entry['aliases']:
+            alias_id = alias['alias_id']
+            if alias_ids is not None and alias_id not in alias_ids:
+                continue
+            if links.setdefault(alias_id, entry['host_id']) != entry['host_id']:
+                ambiguous.add(alias_id)
+    for alias_id in ambiguous:
+        del links[alias_id]
+    return links
+
+
+def sync_alias_host_wwpns(alias_ids):
+    """
+    Give each host an alias-sourced HostWwpn for every WWPN of its aliases.
+
+    Existing rows for the same WWPN (in any format) are converted instead of
+    duplicated. Two queries to read, then batched writes.
+
+    Returns:
+        (created, converted)
+    """
+    rows = list(
+        AliasWWPN.objects.filter(alias_id__in=alias_ids, alias__host__isnull=False)
+        .values_list('alias_id', 'alias__host_id', 'wwpn')
+    )
+    if not rows:
+        return 0, 0
+
+    existing = {}
+    for host_wwpn in HostWwpn.objects.filter(host_id__in={host_id for _, host_id, _ in rows}):
+        existing.setdefault((host_wwpn.host_id, normalize_wwpn(host_wwpn.wwpn)), host_wwpn)
+
+    now = timezone.now()
+    to_create = {}
+    to_convert = {}
+    for alias_id, host_id, wwpn in rows:
+        key = (host_id, normalize_wwpn(wwpn))
+        if key[1] is None:
+            continue
+        host_wwpn = existing.get(key)
+        if host_wwpn is None:
+            to_create.setdefault(key, HostWwpn(
+                host_id=host_id, wwpn=format_wwpn(wwpn), source_type='alias', source_alias_id=alias_id
+            ))
+        elif host_wwpn.source_type != 'alias' or host_wwpn.source_alias_id is None:
+            host_wwpn.source_type = 'alias'
+            host_wwpn.source_alias_id = alias_id
+            host_wwpn.updated_at = now
+            to_convert[host_wwpn.pk] = host_wwpn
+
+    HostWwpn.objects.bulk_create(to_create.values(), batch_size=BULK_BATCH_SIZE)
+    HostWwpn.objects.bulk_update(
+        to_convert.values(), ['source_type', 'source_alias', 'updated_at'], batch_size=BULK_BATCH_SIZE
+    )
+    # Converted rows keep their WWPN; only new rows change the hosts' search text
+    queue_search_refresh('storage.Host', {host_wwpn.host_id for host_wwpn in to_create.values()})
+    return len(to_create), len(to_convert)
+
+
+def link_aliases_to_hosts(links, user=None):
+    """
+    Set alias.host for many aliases and sync their host WWPNs.
+
+    Args:
+        links: {alias_id: host_id}; aliases already linked to a different
+            host are skipped
+        user: Recorded as last_modified_by
+
+    Returns:
+        dict: aliases_linked, aliases_skipped, host_wwpns_created,
+        host_wwpns_converted
+    """
+    result = {'aliases_linked': 0, 'aliases_skipped': 0, 'host_wwpns_created': 0, 'host_wwpns_converted': 0}
+    if not links:
+        return result
+
+    now = timezone.now()
+    with transaction.atomic():
+        changed = []
+        linked_ids = []
+        customer_ids = set()
+        for alias in Alias.objects.filter(id__in=links).select_related('fabric').select_for_update(of=('self',)):
+            host_id = links[alias.id]
+            if alias.host_id not in (None, host_id):
+                result['aliases_skipped'] += 1
+                continue
+            linked_ids.append(alias.id)
+            customer_ids.add(alias.fabric.customer_id)
+            if alias.host_id == host_id and alias.use:
+                continue
+            alias.host_id = host_id
+            alias.use = alias.use or 'init'
+            alias.updated = now
+            alias.last_modified_at = now
+            alias.last_modified_by = user
+            alias.version += 1
+            changed.append(alias)
+
+        Alias.objects.bulk_update(
+            changed, ['host', 'use', 'updated', 'last_modified_at', 'last_modified_by', 'version'],
+            batch_size=BULK_BATCH_SIZE
+        )
+        queue_search_refresh('san.Alias', [alias.id for alias in changed])
+        result['aliases_linked'] = len(changed)
+        result['host_wwpns_created'], result['host_wwpns_converted'] = sync_alias_host_wwpns(linked_ids)
+
+        for customer_id in customer_ids:
+            mark_dashboard_summary_stale(customer_id)
+    return result
+
+
+def apply_alias_host_links(customer_id, alias_ids=None, user=None):
+    """
+    Link every linkable alias of a customer to its host, in bulk.
+
+    Args:
+        customer_id: Customer id
+        alias_ids: Optional subset of alias ids to apply
+        user: Recorded as last_modified_by
+
+    Returns:
+        dict: link counts (see link_aliases_to_hosts) and 'summary', the
+        reconciliation counts after applying
+    """
+    report = reconcile_customer_wwpns(customer_id)
+    links = linkable_aliases(report['entries'], set(alias_ids) if alias_ids is not None else None)
+    result = link_aliases_to_hosts(links, user=user)
+    result['summary'] = reconcile_customer_wwpns(customer_id)['summary']
+    return result
+
+
+def find_wwpn_conflicts(wwpns, host_id=None):
+    """
+    Alias and manual host assignments of many WWPNs, two queries.
+
+    Used by host editors to validate the WWPNs of `host_id` before saving.
+    Each alias match is "matched" (alias already on this host), "conflict"
+    (alias on another host) or "available" (unassigned alias); a manual
+    assignment to another host is always a conflict.
+
+    Returns:
+        dict: {input value: {'wwpn', 'conflicts', 'has_conflicts'}}, or
+        {input value: {'error'}} for values that are not WWPNs
+    """
+    keys = {value: normalize_wwpn(value) for value in wwpns}
+    valid_keys = {key for key in keys.values() if key}
+    conflicts = defaultdict(list)
+
+    if valid_keys:
+        alias_wwpns = (
+            AliasWWPN.objects.annotate(wwpn_key=wwpn_key_expression())
+            .filter(wwpn_key__in=valid_keys)
+            .select_related('alias__fabric', 'alias__host')
+            .order_by('alias__name')
+        )
+        for alias_wwpn in alias_wwpns:
+            alias = alias_wwpn.alias
+            conflict_info = {
+                "type": "alias",
+                "alias_name": alias.name,
+                "alias_id": alias.id,
+                "fabric_name": alias.fabric.name,
+                "host_name": alias.host.name if alias.host else None,
+                "host_id": alias.host_id,
+                "use": alias.use
+            }
+            if alias.host and str(alias.host_id) == str(host_id):
+                conflict_info["alignment"] = "matched"
+                conflict_info["message"] = f"This WWPN matches alias '{alias.name}' already assigned to this host."
+            elif alias.host:
+                conflict_info["alignment"] = "conflict"
+                conflict_info["message"] = f"This WWPN matches alias '{alias.name}' assigned to different host '{alias.host.name}'."
+            else:
+                conflict_info["alignment"] = "available"
+                conflict_info["message"] = f"This WWPN matches unassigned alias '{alias.name}'. You can assign this alias to the host instead."
+            conflicts[alias_wwpn.wwpn_key].append(conflict_info)
+
+        manual_assignments = (
+            HostWwpn.objects.annotate(wwpn_key=wwpn_key_expression())
+            .filter(wwpn_key__in=valid_keys, source_type='manual')
+            .select_related('host')
+        )
+        if host_id:
+            manual_assignments = manual_assignments.exclude(host_id=host_id)
+        for assignment in manual_assignments:
+            conflicts[assignment.wwpn_key].append({
+                "type": "manual",
+                "host_name": assignment.host.name,
+                "host_id": assignment.host_id,
+                "alignment": "conflict",
+                "message": f"This WWPN is already manually assigned to host '{assignment.host.name}'."
+            })
+
+    results = {}
+    for value, key in keys.items():
+        if key is None:
+            results[value] = {"error": "Invalid WWPN format. Must be 16 hex characters."}
+            continue
+        results[value] = {
+            "wwpn": format_wwpn(key),
+            "conflicts": conflicts[key],
+            "has_conflicts": bool(conflicts[key]),
+        }
+    return results
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -55,6 +56,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.RequestMetricsMiddleware',  # Per-request timing (core.request_metrics)
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -173,6 +175,26 @@ CELERY_TASK_TIME_LIMIT = 7200  # 2 hours
 # Result expiration
 CELERY_RESULT_EXPIRES = 86400  # 24 hours
 
+# Audit log writer (see core.audit)
+# 'buffered' - queue entries per request/task, bulk_create them after commit
+# 'celery'   - same batching, but the batch is written by a Celery worker
+# 'sync'     - write each entry immediately (tests, shell scripts)
+AUDIT_LOG_MODE = 'buffered'
+
+# Request metrics (see core.request_metrics)
+REQUEST_METRICS_SAMPLE_RATE = 1.0  # Share of requests kept for the slow endpoint report
+REQUEST_METRICS_SLOW_MS = 1000  # Requests slower than this are logged as warnings
+REQUEST_METRICS_SERVER_TIMING = True  # Add a Server-Timing response header
+
+# Project table view response cache (see core.project_view_cache)
+PROJECT_VIEW_CACHE_FRESH_SECONDS = 30  # Older pages are served, then refreshed in the background
+PROJECT_VIEW_CACHE_TTL = 600  # Pages expire after this long
+
+# Storage Insights API client (see importer.parsers.insights_api_client_v2)
+INSIGHTS_REQUESTS_PER_SECOND = 10  # Shared request budget across all worker threads
+INSIGHTS_REQUEST_BURST = 10
+INSIGHTS_MAX_RETRY_AFTER = 60  # Longest pause honoured from a 429 Retry-After header
+
 # Session Configuration
 SESSION_COOKIE_SAMESITE = 'Lax'
 SESSION_COOKIE_HTTPONLY = True
@@ -183,4 +205,24 @@ SESSION_COOKIE_AGE = 86400  # 24 hours
 CSRF_COOKIE_SAMESITE = 'Lax'
 CSRF_COOKIE_HTTPONLY = False  # Must be False for JavaScript to read it
 CSRF_COOKIE_SECURE = False  # Set to True in production with HTTPS
-CSRF_TRUSTED_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000']
\ No newline at end of file
+CSRF_TRUSTED_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000']
+
+# View debug lines (core.debug_log) are only built when their logger is at
+# DEBUG; set VIEW_DEBUG_LOG_LEVEL=DEBUG to see them
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        name: {
+            'handlers': ['console'],
+            'level': os.environ.get('VIEW_DEBUG_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        }
+        for name in ('san.views', 'storage.views', 'core.views')
+    },
+}
@@ -39,6 +39,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.RequestMetricsMiddleware',  # Per-request timing (core.request_metrics)
     'core.middleware.AuditLogMiddleware',  # Audit logging middleware
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -75,6 +76,12 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'America/Chicago'  # Set to your timezone
 
+# Audit log writer: buffered, celery or sync
+AUDIT_LOG_MODE = os.environ.get('AUDIT_LOG_MODE', AUDIT_LOG_MODE)
+# Request metrics: share of requests kept for the slow endpoint report
+REQUEST_METRICS_SAMPLE_RATE = float(os.environ.get('REQUEST_METRICS_SAMPLE_RATE', '0.2'))
+REQUEST_METRICS_SLOW_MS = int(os.environ.get('REQUEST_METRICS_SLOW_MS', REQUEST_METRICS_SLOW_MS))
+
 # Celery Beat schedule for periodic tasks
 from celery.schedules import crontab
 
@@ -87,6 +94,10 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'core.auto_purge_audit_logs',
         'schedule': crontab(hour='2', minute='0'),  # Run daily at 2 AM
     },
+    'refresh-dashboard-summaries': {
+        'task': 'core.refresh_dashboard_summaries',
+        'schedule': crontab(minute='*/5'),  # Recompute stale dashboard counts
+    },
 }
 
 # Static and media files
@@ -167,6 +178,15 @@ LOGGING = {
             'level': os.environ.get('CELERY_LOG_LEVEL', 'INFO'),
             'propagate': False,
         },
+        # Debug lines of the view modules (core.debug_log)
+        **{
+            name: {
+                'handlers': ['console', 'file'],
+                'level': os.environ.get('VIEW_DEBUG_LOG_LEVEL', 'INFO'),
+                'propagate': False,
+            }
+            for name in ('san.views', 'storage.views', 'core.views')
+        },
     },
 }
 
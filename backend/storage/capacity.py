@@ -0,0 +1,129 @@
+"""
+Capacity rollups computed in the database.
+
+Dashboard capacity widgets used to load every Storage row and add up the
+byte columns in Python. These helpers push the sums and groupings into a
+single aggregate()/values().annotate() query each and fetch only the
+columns they need, which also makes per-pool and per-tier rollups over
+Volume affordable.
+
+All byte totals are ints (0 when nothing is known); the *_tb helpers
+convert for display.
+"""
+
+from django.db.models import Count, F, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import Storage, Volume
+
+TB = 1024 ** 4
+
+# Volume tier columns, keyed by the name used in API responses
+VOLUME_TIER_FIELDS = {
+    'tier0_flash': 'tier0_flash_capacity_bytes',
+    'tier1_flash': 'tier1_flash_capacity_bytes',
+    'scm': 'scm_capacity_bytes',
+    'enterprise_hdd': 'enterprise_hdd_capacity_bytes',
+    'nearline_hdd': 'nearline_hdd_capacity_bytes',
+}
+
+
+def bytes_to_tb(bytes_val):
+    return round(bytes_val / TB, 2) if bytes_val else 0
+
+
+def utilization_percent(used_bytes, capacity_bytes):
+    return round(used_bytes / capacity_bytes * 100, 1) if capacity_bytes else 0
+
+
+def _sum(field):
+    return Coalesce(Sum(field), Value(0))
+
+
+def storage_capacity_totals(customer_id):
+    """Fleet totals for a customer's storage systems, one query"""
+    return Storage.objects.filter(customer_id=customer_id).aggregate(
+        system_count=Count('id'),
+        capacity_bytes=_sum('capacity_bytes'),
+        used_bytes=_sum('used_capacity_bytes'),
+        savings_bytes=_sum('capacity_savings_bytes'),
+    )
+
+
+def storage_capacity_by_system(customer_id):
+    """Per-system capacity columns only, largest first"""
+    return list(
+        Storage.objects.filter(customer_id=customer_id)
+        .order_by(F('capacity_bytes').desc(nulls_last=True), 'name')
+        .values('id', 'name', 'storage_type', 'capacity_bytes', 'used_capacity_bytes')
+    )
+
+
+def storage_capacity_by_type(customer_id):
+    """{storage_type: {count, capacity_bytes, used_bytes}}, one grouped query"""
+    rows = (
+        Storage.objects.filter(customer_id=customer_id)
+        .values('storage_type')
+        .annotate(
+            count=Count('id'),
+            capacity_bytes=_sum('capacity_bytes'),
+            used_bytes=_sum('used_capacity_bytes'),
+        )
+        .order_by()
+    )
+    return {
+        (row['storage_type'] or 'Unknown'): {
+            'count': row['count'],
+            'capacity_bytes': row['capacity_bytes'],
+            'used_bytes': row['used_bytes'],
+        }
+        for row in rows
+    }
+
+
+def volume_capacity_by_pool(customer_id, limit=None):
+    """
+    Volume capacity grouped by storage system and pool, largest first.
+
+    Returns:
+        list of dicts: storage_id, storage_name, pool_name, volume_count,
+        capacity_bytes, used_bytes and one <tier>_bytes key per tier
+    """
+    tier_sums = {f'{tier}_bytes': _sum(field) for tier, field in VOLUME_TIER_FIELDS.items()}
+    rows = (
+        Volume.objects.filter(storage__customer_id=customer_id)
+        .values('storage_id', 'storage__name', 'pool_name')
+        .annotate(
+            volume_count=Count('id'),
+            capacity_bytes=_sum('capacity_bytes'),
+            used_bytes=_sum('used_capacity_bytes'),
+            **tier_sums
+        )
+        .order_by('-capacity_bytes', 'storage__name', 'pool_name')
+    )
+    if limit:
+        rows = rows[:limit]
+
+    pools = []
+    for row in rows:
+        row['storage_name'] = row.pop('storage__name')
+        row['pool_name'] = row['pool_name'] or 'Unknown'
+        pools.append(row)
+    return pools
+
+
+def volume_capacity_by_tier(customer_id):
+    """Total volume capacity held on each tier, one query"""
+    totals = Volume.objects.filter(storage__customer_id=customer_id).aggregate(
+        **{tier: _sum(field) for tier, field in VOLUME_TIER_FIELDS.items()}
+    )
+    return {tier: totals[tier] for tier in VOLUME_TIER_FIELDS}
+
+
+def top_volumes_by_capacity(customer_id, limit=10):
+    """Largest volumes with their storage system name, one query"""
+    return list(
+        Volume.objects.filter(storage__customer_id=customer_id, capacity_bytes__isnull=False)
+        .order_by('-capacity_bytes')
+        .values('id', 'name', 'capacity_bytes', storage_name=F('storage__name'))[:limit]
+    )
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:45
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0010_remove_create_field_from_host'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='hostwwpn',
+            index=models.Index(django.db.models.functions.text.Lower(django.db.models.functions.text.Replace(django.db.models.functions.text.Replace(django.db.models.functions.text.Replace(models.F('wwpn'), models.Value(':'), models.Value('')), models.Value('-'), models.Value('')), models.Value(' '), models.Value(''))), name='storage_hostwwpn_wwpn_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='port',
+            index=models.Index(django.db.models.functions.text.Lower(django.db.models.functions.text.Replace(django.db.models.functions.text.Replace(django.db.models.functions.text.Replace(models.F('wwpn'), models.Value(':'), models.Value('')), models.Value('-'), models.Value('')), models.Value(' '), models.Value(''))), name='storage_port_wwpn_key_idx'),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.1.6 on 2026-10-18 21:45
+
+import re
+from collections import defaultdict
+
+from django.db import migrations, models
+
+# Frozen copy of the core.search_index document format at this migration
+_WWPN_SEPARATORS = re.compile(r'[:\- ]')
+
+# Fields of each model in its search_text, after the id
+SEARCH_FIELDS = {
+    'Host': (
+        'name', 'storage__name', 'wwpns', 'status', 'associated_resource', 'host_type',
+        'volume_group', 'natural_key', 'storage_system',
+    ),
+    'Volume': (
+        'name', 'storage__name', 'volume_id', 'volser', 'format', 'natural_key', 'pool_name',
+        'unique_id', 'status_label',
+    ),
+    'Storage': (
+        'name', 'storage_type', 'location', 'model', 'serial_number', 'system_id', 'primary_ip',
+        'vendor',
+    ),
+}
+
+
+def _document(*values):
+    return '\n'.join(str(value).lower() for value in values if value not in (None, ''))
+
+
+def populate_search_text(apps, schema_editor):
+    """Build search_text for existing rows"""
+    HostWwpn = apps.get_model('storage', 'HostWwpn')
+    host_wwpns = defaultdict(list)
+    for host_id, wwpn in HostWwpn.objects.values_list('host_id', 'wwpn'):
+        host_wwpns[host_id] += [wwpn, _WWPN_SEPARATORS.sub('', wwpn or '')]
+
+    for model_name, fields in SEARCH_FIELDS.items():
+        model = apps.get_model('storage', model_name)
+        related = host_wwpns if model_name == 'Host' else {}
+        rows = [
+            model(pk=row[0], search_text=_document(*row[1:], *related.get(row[0], ())))
+            for row in model.objects.values_list('id', *fields)
+        ]
+        model.objects.bulk_update(rows, ['search_text'], batch_size=500)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """GIN trigram indexes serve '%term%' searches; PostgreSQL only"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in ('storage_host', 'storage_volume', 'storage_storage'):
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_search_trgm ON {table} USING gin (search_text gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in ('storage_host', 'storage_volume', 'storage_storage'):
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0011_wwpn_key_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='host',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='storage',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='volume',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(populate_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:08
+
+from django.db import migrations, models
+from django.db.models import Case, Exists, OuterRef, Value, When
+
+# Frozen copy of core.customer_visibility.refresh_customer_visible at this
+# migration: (app, model, junction model in core, junction FK to the model)
+_VISIBILITY_MODELS = [
+    ('storage', 'Storage', 'ProjectStorage', 'storage'),
+    ('storage', 'Host', 'ProjectHost', 'host'),
+    ('storage', 'Volume', 'ProjectVolume', 'volume'),
+    ('storage', 'Port', 'ProjectPort', 'port'),
+]
+
+
+def populate_customer_visible(apps, schema_editor):
+    """Compute customer_visible for existing rows"""
+    for app_label, model_name, junction_name, field in _VISIBILITY_MODELS:
+        memberships = apps.get_model('core', junction_name).objects.filter(**{field: OuterRef('pk')})
+        apps.get_model(app_label, model_name).objects.update(customer_visible=Case(
+            When(committed=True, then=Value(True)),
+            When(Exists(memberships), then=Value(False)),
+            default=Value(True),
+        ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_dashboardsummary'),
+        ('storage', '0012_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='host',
+            name='customer_visible',
+            field=models.BooleanField(db_index=True, default=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='port',
+            name='customer_visible',
+            field=models.BooleanField(db_index=True, default=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='storage',
+            name='customer_visible',
+            field=models.BooleanField(db_index=True, default=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='volume',
+            name='customer_visible',
+            field=models.BooleanField(db_index=True, default=True, editable=False),
+        ),
+        migrations.RunPython(populate_customer_visible, migrations.RunPython.noop),
+    ]
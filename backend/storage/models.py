@@ -2,6 +2,7 @@ from django.db import models
 from core.models import Project
 from customers.models import Customer
 from django.contrib.auth.models import User 
+from san.san_tools import wwpn_key_expression
 
 
 class Storage(models.Model):
@@ -127,6 +128,8 @@ class Storage(models.Model):
         default=False,
         help_text="Actually deployed to infrastructure"
     )
+    # Shown in Customer View (committed or in no project), maintained by core.customer_visibility
+    customer_visible = models.BooleanField(default=True, db_index=True, editable=False)
     created_by_project = models.ForeignKey(
         Project,
         on_delete=models.SET_NULL,
@@ -148,6 +151,9 @@ class Storage(models.Model):
     last_modified_at = models.DateTimeField(auto_now=True, null=True)
     version = models.IntegerField(default=0, help_text="Version number for optimistic locking")
 
+    # Lowercased searchable text, maintained by core.search_index
+    search_text = models.TextField(blank=True, default='', editable=False)
+
     @property
     def db_volumes_count(self):
         """
@@ -218,6 +224,8 @@ class Host(models.Model):
         default=False,
         help_text="Actually deployed to infrastructure"
     )
+    # Shown in Customer View (committed or in no project), maintained by core.customer_visibility
+    customer_visible = models.BooleanField(default=True, db_index=True, editable=False)
     created_by_project = models.ForeignKey(
         Project,
         on_delete=models.SET_NULL,
@@ -239,13 +247,19 @@ class Host(models.Model):
     last_modified_at = models.DateTimeField(auto_now=True, null=True)
     version = models.IntegerField(default=0, help_text="Version number for optimistic locking")
 
+    # Lowercased searchable text, maintained by core.search_index
+    search_text = models.TextField(blank=True, default='', editable=False)
+
     class Meta:
         unique_together = ['storage', 'name']
 
     def get_all_wwpns(self):
         """Returns list of all WWPNs (manual + from aliases) with source info"""
         wwpns = []
-        for host_wwpn in self.host_wwpns.select_related('source_alias__fabric').all():
+        host_wwpns = self.host_wwpns.all()
+        if 'host_wwpns' not in getattr(self, '_prefetched_objects_cache', {}):
+            host_wwpns = host_wwpns.select_related('source_alias__fabric')
+        for host_wwpn in host_wwpns:
             wwpn_info = {
                 'wwpn': host_wwpn.wwpn,
                 'source_type': host_wwpn.source_type,
@@ -297,6 +311,10 @@ class HostWwpn(models.Model):
     class Meta:
         unique_together = ['host', 'wwpn']
         ordering = ['created_at']
+        indexes = [
+            # Lookups by normalized WWPN (any stored format)
+            models.Index(wwpn_key_expression(), name='storage_hostwwpn_wwpn_key_idx'),
+        ]
     
     def __str__(self):
         source = f" (from {self.source_alias.name})" if self.source_alias else ""
@@ -358,6 +376,8 @@ class Port(models.Model):
         default=False,
         help_text="Actually deployed to infrastructure"
     )
+    # Shown in Customer View (committed or in no project), maintained by core.customer_visibility
+    customer_visible = models.BooleanField(default=True, db_index=True, editable=False)
     created_by_project = models.ForeignKey(
         'core.Project',
         on_delete=models.SET_NULL,
@@ -384,6 +404,10 @@ class Port(models.Model):
 
     class Meta:
         ordering = ['storage', 'name']
+        indexes = [
+            # Lookups by normalized WWPN (any stored format)
+            models.Index(wwpn_key_expression(), name='storage_port_wwpn_key_idx'),
+        ]
 
     def __str__(self):
         return f'{self.storage.name}: {self.name} ({self.wwpn})'
@@ -472,6 +496,8 @@ class Volume(models.Model):
         default=False,
         help_text="Actually deployed to infrastructure"
     )
+    # Shown in Customer View (committed or in no project), maintained by core.customer_visibility
+    customer_visible = models.BooleanField(default=True, db_index=True, editable=False)
     created_by_project = models.ForeignKey(
         Project,
         on_delete=models.SET_NULL,
@@ -493,5 +519,8 @@ class Volume(models.Model):
     last_modified_at = models.DateTimeField(auto_now=True, null=True)
     version = models.IntegerField(default=0, help_text="Version number for optimistic locking")
 
+    # Lowercased searchable text, maintained by core.search_index
+    search_text = models.TextField(blank=True, default='', editable=False)
+
     def __str__(self):
         return self.name
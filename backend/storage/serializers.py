@@ -16,7 +16,7 @@ class StorageSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Storage
-        fields = '__all__'
+        exclude = ['search_text', 'customer_visible']
 
     def get_project_memberships(self, obj):
         """Return list of projects this storage system belongs to"""
@@ -53,7 +53,7 @@ class VolumeSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Volume
-        fields = '__all__'
+        exclude = ['search_text', 'customer_visible']
 
     def get_project_memberships(self, obj):
         """Return list of projects this volume belongs to"""
@@ -101,7 +101,7 @@ class HostSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Host
-        fields = '__all__'
+        exclude = ['search_text', 'customer_visible']
 
     def get_wwpn_details(self, obj):
         """Return detailed WWPN information with source tracking"""
@@ -155,7 +155,7 @@ class PortSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Port
-        fields = '__all__'
+        exclude = ['customer_visible']
 
     def get_storage_details(self, obj):
         """Return storage name and type for display"""
@@ -1,14 +1,16 @@
 """
-Django signals for Storage models to trigger audit logging
+Django signals for Storage models to trigger audit logging and filter facet invalidation
 """
 
 from django.db.models.signals import post_save, post_delete, pre_delete
 from django.dispatch import receiver
-from .models import Storage, Volume, Host
-from core.audit import log_create, log_update, log_delete
+from .models import Storage, Volume, Host, Port
+from core.audit import audit_batchable, log_create, log_update, log_delete
+from core.filter_facets import invalidate_filter_facets_for
 
 
 @receiver(post_save, sender=Storage)
+@audit_batchable('STORAGE_SYSTEM')
 def storage_post_save(sender, instance, created, **kwargs):
     """Log storage system creation and updates"""
     from core.middleware import get_current_user
@@ -45,6 +47,7 @@ def storage_post_save(sender, instance, created, **kwargs):
 
 
 @receiver(pre_delete, sender=Storage)
+@audit_batchable('STORAGE_SYSTEM')
 def storage_pre_delete(sender, instance, **kwargs):
     """Log storage system deletion"""
     from core.middleware import get_current_user
@@ -67,6 +70,7 @@ def storage_pre_delete(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=Volume)
+@audit_batchable('VOLUME')
 def volume_post_save(sender, instance, created, **kwargs):
     """Log volume creation and updates"""
     from core.middleware import get_current_user
@@ -95,6 +99,7 @@ def volume_post_save(sender, instance, created, **kwargs):
 
 
 @receiver(pre_delete, sender=Volume)
+@audit_batchable('VOLUME')
 def volume_pre_delete(sender, instance, **kwargs):
     """Log volume deletion"""
     from core.middleware import get_current_user
@@ -118,6 +123,7 @@ def volume_pre_delete(sender, instance, **kwargs):
 
 
 @receiver(post_save, sender=Host)
+@audit_batchable('HOST')
 def host_post_save(sender, instance, created, **kwargs):
     """Log host creation (updates not logged to avoid log spam)"""
     from core.middleware import get_current_user
@@ -139,6 +145,7 @@ def host_post_save(sender, instance, created, **kwargs):
 
 
 @receiver(pre_delete, sender=Host)
+@audit_batchable('HOST')
 def host_pre_delete(sender, instance, **kwargs):
     """Log host deletion"""
     from core.middleware import get_current_user
@@ -153,3 +160,26 @@ def host_pre_delete(sender, instance, **kwargs):
             'storage': instance.storage.name if instance.storage else None
         }
     )
+
+
+# Filter facets (core.filter_facets) of the tables each change affects
+
+@receiver(post_save, sender=Storage)
+@receiver(post_delete, sender=Storage)
+def storage_filter_facets_changed(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_filter_facets_for(instance, '', 'hosts', 'aliases')
+
+
+@receiver(post_save, sender=Host)
+@receiver(post_delete, sender=Host)
+def host_filter_facets_changed(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_filter_facets_for(instance, 'storage', 'hosts')
+
+
+@receiver(post_save, sender=Port)
+@receiver(post_delete, sender=Port)
+def port_filter_facets_changed(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_filter_facets_for(instance, 'storage', 'aliases')
@@ -1,3 +1,107 @@
 from django.test import TestCase
 
-# Create your tests here.
+from customers.models import Customer
+from .capacity import (
+    TB, storage_capacity_by_type, storage_capacity_totals, volume_capacity_by_pool,
+    volume_capacity_by_tier
+)
+from san.models import Alias, AliasWWPN, Fabric
+from .models import Host, HostWwpn, Storage, Volume
+
+
+class CapacityRollupTests(TestCase):
+    """Capacity totals and rollups come from single aggregate queries"""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(name='Capacity Customer')
+        fs = Storage.objects.create(
+            customer=self.customer, name='fs1', storage_type='FlashSystem',
+            capacity_bytes=10 * TB, used_capacity_bytes=int(9.5 * TB), capacity_savings_bytes=TB
+        )
+        Storage.objects.create(customer=self.customer, name='ds1', storage_type='DS8000', capacity_bytes=4 * TB)
+        Storage.objects.create(customer=self.customer, name='new', storage_type='FlashSystem')
+        for i, (pool, capacity) in enumerate([('pool_a', 2), ('pool_a', 1), ('pool_b', 3)]):
+            Volume.objects.create(
+                storage=fs, name=f'vol{i}', volume_id=str(i), unique_id=f'uid-{i}', pool_name=pool,
+                capacity_bytes=capacity * TB, tier0_flash_capacity_bytes=capacity * TB
+            )
+
+    def test_totals_and_type_breakdown(self):
+        with self.assertNumQueries(1):
+            totals = storage_capacity_totals(self.customer.id)
+        self.assertEqual(totals['system_count'], 3)
+        self.assertEqual(totals['capacity_bytes'], 14 * TB)
+        self.assertEqual(totals['savings_bytes'], TB)
+
+        with self.assertNumQueries(1):
+            by_type = storage_capacity_by_type(self.customer.id)
+        self.assertEqual(by_type['FlashSystem']['count'], 2)
+        self.assertEqual(by_type['DS8000']['used_bytes'], 0)
+
+    def test_pool_and_tier_rollups(self):
+        with self.assertNumQueries(1):
+            pools = volume_capacity_by_pool(self.customer.id)
+        self.assertEqual(
+            [(p['pool_name'], p['volume_count'], p['capacity_bytes']) for p in pools],
+            [('pool_a', 2, 3 * TB), ('pool_b', 1, 3 * TB)]
+        )
+        self.assertEqual(pools[0]['tier0_flash_bytes'], 3 * TB)
+
+        with self.assertNumQueries(1):
+            tiers = volume_capacity_by_tier(self.customer.id)
+        self.assertEqual(tiers['tier0_flash'], 6 * TB)
+        self.assertEqual(tiers['nearline_hdd'], 0)
+
+    def test_capacity_analytics_endpoint(self):
+        body = self.client.get('/api/core/dashboard/capacity/', {'customer_id': self.customer.id}).json()
+
+        self.assertEqual(body['total_capacity_tb'], 14)
+        self.assertEqual([s['name'] for s in body['storage_systems']], ['fs1', 'ds1', 'new'])
+        self.assertEqual(body['alerts'][0]['type'], 'critical')
+        self.assertEqual(body['capacity_by_tier']['tier0_flash'], 6)
+        self.assertEqual(body['top_consumers'][0]['storage_name'], 'fs1')
+
+
+class WwpnConflictBatchTests(TestCase):
+    """Many WWPNs are checked against aliases and hosts in a fixed number of queries"""
+
+    def setUp(self):
+        customer = Customer.objects.create(name='Conflict Customer')
+        fabric = Fabric.objects.create(customer=customer, name='fab-a', san_vendor='BR')
+        storage = Storage.objects.create(customer=customer, name='fs1', storage_type='FlashSystem')
+        self.host = Host.objects.create(storage=storage, name='host-a')
+        self.other = Host.objects.create(storage=storage, name='host-b')
+        for i, host in enumerate([self.host, self.other, None]):
+            alias = Alias.objects.create(fabric=fabric, name=f'alias_{i}', host=host, use='init')
+            AliasWWPN.objects.create(alias=alias, wwpn=f'10:00:00:00:c9:00:00:0{i}')
+        HostWwpn.objects.create(host=self.other, wwpn='10:00:00:00:C9:00:00:09')
+
+    def test_batch_conflict_map(self):
+        wwpns = ['1000-0000-c900-0000', '10000000C9000001', '10:00:00:00:c9:00:00:02',
+                 '10:00:00:00:c9:00:00:09', '10:00:00:00:c9:00:00:0a', 'bogus']
+        with self.assertNumQueries(2):
+            response = self.client.post('/api/storage/check-wwpn-conflicts/batch/', {
+                'wwpns': wwpns, 'host_id': self.host.id
+            }, content_type='application/json')
+        body = response.json()
+        alignments = {
+            wwpn: [c['alignment'] for c in result.get('conflicts', [])]
+            for wwpn, result in body['results'].items()
+        }
+        self.assertEqual(alignments, {
+            '1000-0000-c900-0000': ['matched'],
+            '10000000C9000001': ['conflict'],
+            '10:00:00:00:c9:00:00:02': ['available'],
+            '10:00:00:00:c9:00:00:09': ['conflict'],
+            '10:00:00:00:c9:00:00:0a': [],
+            'bogus': [],
+        })
+        self.assertIn('error', body['results']['bogus'])
+        self.assertEqual(body['results']['10000000C9000001']['wwpn'], '10:00:00:00:C9:00:00:01')
+        self.assertTrue(body['has_conflicts'])
+
+    def test_single_check_uses_the_same_lookup(self):
+        response = self.client.post('/api/storage/check-wwpn-conflicts/', {
+            'wwpn': '10:00:00:00:C9:00:00:01', 'host_id': self.other.id
+        }, content_type='application/json')
+        self.assertEqual([c['alignment'] for c in response.json()['conflicts']], ['matched'])
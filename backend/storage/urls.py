@@ -17,6 +17,7 @@ from .views import (
     mkhost_scripts_project_view,
     host_wwpns_view,
     check_wwpn_conflicts_view,
+    check_wwpn_conflicts_batch_view,
     port_list,
     port_detail,
     port_project_view
@@ -38,6 +39,7 @@ urlpatterns = [
     path("hosts/<int:host_id>/wwpns/", host_wwpns_view, name="host-wwpns"),
     path("project/<int:project_id>/view/hosts/", host_project_view, name="host-project-view"),
     path("check-wwpn-conflicts/", check_wwpn_conflicts_view, name="check-wwpn-conflicts"),
+    path("check-wwpn-conflicts/batch/", check_wwpn_conflicts_batch_view, name="check-wwpn-conflicts-batch"),
     path("mkhost-scripts/<int:customer_id>/", mkhost_scripts_view, name="mkhost-scripts"),
     path("mkhost-scripts/project/<int:project_id>/", mkhost_scripts_project_view, name="mkhost-scripts-project"),
     path("ports/", port_list, name="port-list"),
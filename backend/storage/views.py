@@ -15,13 +15,22 @@ from django.db.models import Q, Prefetch
 from urllib.parse import urlencode
 from core.dashboard_views import clear_dashboard_cache_for_customer
 from core.models import Project, ProjectStorage, ProjectVolume, ProjectHost, ProjectPort
+from san.wwpn_reconciliation import find_wwpn_conflicts
+from core.project_view_cache import cached_project_view
+from core.search_index import search_filter
+from core.table_filters import FilterError, table_filters
+from core.debug_log import view_logger
 
 logger = logging.getLogger(__name__)
+debug_log = view_logger(__name__)
 
 # File to store API token
 TOKEN_CACHE_DIR = os.path.join(settings.BASE_DIR, 'token_cache')
 os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
 
+# Largest WWPN list accepted by check_wwpn_conflicts_batch_view
+MAX_WWPN_CONFLICT_BATCH = 500
+
 
 
 
@@ -29,7 +38,7 @@ os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
 @require_http_methods(["GET", "POST"])
 def storage_list(request):
     """Handle storage list operations with pagination"""
-    print(f"🔥 Storage List - Method: {request.method}")
+    debug_log.debug('storage list request', method=request.method)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -73,46 +82,19 @@ def storage_list(request):
             if customer_id:
                 storages = storages.filter(customer=customer_id)
 
-            # Customer View filtering: Show storage systems that are either:
-            # 1. Committed (committed=True), OR
-            # 2. Not referenced by any project (no junction table entries)
-            storages = storages.annotate(
-                project_count=Count('project_memberships')  # Correct relationship name
-            ).filter(
-                Q(committed=True) | Q(project_count=0)
-            )
+            # Customer View: committed, or not in any project (core.customer_visibility)
+            storages = storages.filter(customer_visible=True)
             
             # Apply search if provided
             if search:
-                storages = storages.filter(
-                    Q(name__icontains=search) | 
-                    Q(storage_type__icontains=search) |
-                    Q(location__icontains=search) |
-                    Q(model__icontains=search) |
-                    Q(serial_number__icontains=search) |
-                    Q(system_id__icontains=search) |
-                    Q(primary_ip__icontains=search)
-                )
-            
-            # Apply field-specific filters
-            filter_params = {}
-            for param, value in request.GET.items():
-                if param.startswith((
-                    'name__', 'storage_type__', 'location__', 'storage_system_id__', 'machine_type__',
-                    'model__', 'serial_number__', 'system_id__', 'wwnn__', 'firmware_level__',
-                    'primary_ip__', 'secondary_ip__', 'uuid__', 'probe_status__', 'condition__',
-                    'customer_number__', 'vendor__', 'time_zone__', 'data_collection__',
-                    'data_collection_type__', 'notes__', 'imported__', 'updated__'
-                )):
-                    filter_params[param] = value
-            
-            # Apply the filters
-            if filter_params:
-                storages = storages.filter(**filter_params)
+                storages = storages.filter(search_filter(search))
             
-            # Apply ordering
-            if ordering:
-                storages = storages.order_by(ordering)
+            # Apply column filters and ordering
+            try:
+                compiled = table_filters('storage').compile(request.GET, ordering=ordering)
+            except FilterError as e:
+                return JsonResponse({'error': str(e)}, status=400)
+            storages = compiled.apply(storages)
             
             # Get total count before pagination
             total_count = storages.count()
@@ -271,7 +253,7 @@ def storage_list(request):
 @require_http_methods(["GET", "PUT", "PATCH", "DELETE"])
 def storage_detail(request, pk):
     """Handle storage detail operations"""
-    print(f"🔥 Storage Detail - Method: {request.method}, PK: {pk}")
+    debug_log.debug('storage detail request', method=request.method, pk=pk)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -371,7 +353,7 @@ def storage_detail(request, pk):
 @require_http_methods(["GET", "POST"])
 def storage_field_preferences(request, pk):
     """Handle storage detail field preferences for a specific storage system"""
-    print(f"🔥 Storage Field Preferences - Method: {request.method}, Storage PK: {pk}")
+    debug_log.debug('storage field preferences request', method=request.method, storage_pk=pk)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -419,7 +401,7 @@ def storage_field_preferences(request, pk):
 @require_http_methods(['POST'])
 def storage_insights_auth(request):
     """Authenticate with IBM Storage Insights and get a token."""
-    print(f"🔥 Storage Insights Auth - Method: {request.method}")
+    debug_log.debug('storage insights auth request', method=request.method)
     
     try:
         data = json.loads(request.body)
@@ -507,7 +489,7 @@ def fetch_new_token(tenant, api_key):
 @require_http_methods(['POST'])
 def storage_insights_systems(request):
     """Fetch storage systems from IBM Storage Insights."""
-    print(f"🔥 Storage Insights Systems - Method: {request.method}")
+    debug_log.debug('storage insights systems request', method=request.method)
     
     try:
         data = json.loads(request.body)
@@ -556,7 +538,7 @@ def storage_insights_systems(request):
 @require_http_methods(['POST'])
 def storage_insights_volumes(request):
     """Fetch all volumes from IBM Storage Insights for a given storage system."""
-    print(f"🔥 Storage Insights Volumes - Method: {request.method}")
+    debug_log.debug('storage insights volumes request', method=request.method)
     
     try:
         data = json.loads(request.body)
@@ -623,7 +605,7 @@ def storage_insights_volumes(request):
 @require_http_methods(['POST'])
 def storage_insights_host_connections(request):
     """Fetch all host connections from IBM Storage Insights for a given storage system."""
-    print(f"🔥 Storage Insights Host Connections - Method: {request.method}")
+    debug_log.debug('storage insights host connections request', method=request.method)
     
     try:
         data = json.loads(request.body)
@@ -679,7 +661,7 @@ def storage_insights_host_connections(request):
 @require_http_methods(["GET"])
 def volume_list(request):
     """Return volumes filtered by storage system ID (optional) or customer with pagination and filtering."""
-    print(f"🔥 Volume List - Method: {request.method}")
+    debug_log.debug('volume list request', method=request.method)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -720,50 +702,19 @@ def volume_list(request):
         if customer_id:
             volumes = volumes.filter(storage__customer_id=customer_id)
 
-        # Customer View filtering: Show volumes that are either:
-        # 1. Committed (committed=True), OR
-        # 2. Not referenced by any project (no junction table entries)
-        volumes = volumes.annotate(
-            project_count=Count('project_memberships')  # Correct relationship name
-        ).filter(
-            Q(committed=True) | Q(project_count=0)
-        )
+        # Customer View: committed, or not in any project (core.customer_visibility)
+        volumes = volumes.filter(customer_visible=True)
         
         # Apply general search if provided
         if search:
-            volumes = volumes.filter(
-                Q(name__icontains=search) |
-                Q(storage__name__icontains=search) |
-                Q(volume_id__icontains=search) |
-                Q(volser__icontains=search) |
-                Q(format__icontains=search) |
-                Q(natural_key__icontains=search) |
-                Q(pool_name__icontains=search) |
-                Q(unique_id__icontains=search) |
-                Q(status_label__icontains=search)
-            )
-        
-        # Apply field-specific filters
-        filter_params = {}
-        for param, value in request.GET.items():
-            if param.startswith((
-                'name__', 'storage__', 'volume_id__', 'volume_number__', 'volser__', 'format__',
-                'natural_key__', 'pool_name__', 'pool_id__', 'lss_lcu__', 'node__', 'block_size__',
-                'unique_id__', 'acknowledged__', 'status_label__', 'raid_level__', 'copy_id__',
-                'safeguarded__', 'io_group__', 'formatted__', 'virtual_disk_type__', 'fast_write_state__',
-                'vdisk_mirror_copies__', 'vdisk_mirror_role__', 'compressed__', 'thin_provisioned__',
-                'encryption__', 'flashcopy__', 'auto_expand__', 'easy_tier__', 'easy_tier_status__',
-                'deduplicated__'
-            )):
-                filter_params[param] = value
-        
-        # Apply the filters
-        if filter_params:
-            volumes = volumes.filter(**filter_params)
+            volumes = volumes.filter(search_filter(search))
         
-        # Apply ordering
-        if ordering:
-            volumes = volumes.order_by(ordering)
+        # Apply column filters and ordering
+        try:
+            compiled = table_filters('volumes').compile(request.GET, ordering=ordering)
+        except FilterError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        volumes = compiled.apply(volumes)
         
         # Add pagination for performance with large datasets
         # Get pagination parameters
@@ -812,7 +763,7 @@ def volume_list(request):
 @require_http_methods(["GET", "POST"])
 def host_list(request):
     """Handle host list and creation operations."""
-    print(f"🔥 Host List - Method: {request.method}")
+    debug_log.debug('host list request', method=request.method)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -856,45 +807,19 @@ def _handle_host_list_get(request, user):
         if storage_id:
             hosts = hosts.filter(storage_id=storage_id)
 
-        # Customer View filtering: Show hosts that are either:
-        # 1. Committed (committed=True), OR
-        # 2. Not referenced by any project (no junction table entries)
-        hosts = hosts.annotate(
-            project_count=Count('project_memberships')  # Correct relationship name
-        ).filter(
-            Q(committed=True) | Q(project_count=0)
-        )
+        # Customer View: committed, or not in any project (core.customer_visibility)
+        hosts = hosts.filter(customer_visible=True)
 
         # Apply general search if provided
         if search:
-            hosts = hosts.filter(
-                Q(name__icontains=search) |
-                Q(storage__name__icontains=search) |
-                Q(wwpns__icontains=search) |
-                Q(status__icontains=search) |
-                Q(associated_resource__icontains=search) |
-                Q(host_type__icontains=search) |
-                Q(volume_group__icontains=search) |
-                Q(natural_key__icontains=search)
-            )
-
-        # Apply field-specific filters
-        filter_params = {}
-        for param, value in request.GET.items():
-            if param.startswith((
-                'name__', 'storage__', 'wwpns__', 'status__', 'acknowledged__',
-                'associated_resource__', 'host_type__', 'vols_count__', 'fc_ports_count__',
-                'last_data_collection__', 'volume_group__', 'natural_key__'
-            )):
-                filter_params[param] = value
-
-        # Apply the filters
-        if filter_params:
-            hosts = hosts.filter(**filter_params)
-
-        # Apply ordering
-        if ordering:
-            hosts = hosts.order_by(ordering)
+            hosts = hosts.filter(search_filter(search))
+
+        # Apply column filters and ordering
+        try:
+            compiled = table_filters('hosts').compile(request.GET, ordering=ordering)
+        except FilterError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        hosts = compiled.apply(hosts)
 
         # Add pagination for performance with large datasets
         # Get pagination parameters
@@ -1032,7 +957,7 @@ def _handle_host_create(request, user):
 @require_http_methods(["GET", "PUT", "PATCH", "DELETE"])
 def host_detail(request, pk):
     """Handle host detail operations."""
-    print(f"🔥 Host Detail - Method: {request.method}, PK: {pk}")
+    debug_log.debug('host detail request', method=request.method, pk=pk)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -1116,7 +1041,7 @@ def host_detail(request, pk):
 @require_http_methods(["GET"])
 def mkhost_scripts_view(request, customer_id):
     """Generate mkhost scripts for all storage systems for a customer."""
-    print(f"🔥 MkHost Scripts - Method: {request.method}, Customer ID: {customer_id}")
+    debug_log.debug('mkhost scripts request', method=request.method, customer_id=customer_id)
     
     try:
         from customers.models import Customer
@@ -1154,7 +1079,7 @@ def mkhost_scripts_view(request, customer_id):
 @require_http_methods(["GET"])
 def mkhost_scripts_project_view(request, project_id):
     """Generate mkhost scripts for storage systems in a project."""
-    print(f"🔥 MkHost Scripts (Project) - Method: {request.method}, Project ID: {project_id}")
+    debug_log.debug('mkhost scripts (project) request', method=request.method, project_id=project_id)
 
     try:
         from core.models import Project, ProjectStorage
@@ -1299,86 +1224,53 @@ def check_wwpn_conflicts_view(request):
         if not wwpn:
             return JsonResponse({"error": "WWPN is required."}, status=400)
         
-        # Format WWPN using same logic as above
-        def format_wwpn(value):
-            if not value:
-                return ""
-            clean_value = ''.join(c for c in value.upper() if c in '0123456789ABCDEF')
-            if len(clean_value) != 16:
-                return None
-            return ':'.join([clean_value[i:i+2] for i in range(0, 16, 2)])
-        
-        formatted_wwpn = format_wwpn(wwpn)
-        if not formatted_wwpn:
-            return JsonResponse({"error": "Invalid WWPN format. Must be 16 hex characters."}, status=400)
-        
-        conflicts = []
-        
-        # Check if this WWPN exists in any aliases
-        from san.models import Alias
-        aliases_with_wwpn = Alias.objects.filter(wwpn=formatted_wwpn)
-        
-        for alias in aliases_with_wwpn:
-            conflict_info = {
-                "type": "alias",
-                "alias_name": alias.name,
-                "alias_id": alias.id,
-                "fabric_name": alias.fabric.name,
-                "host_name": alias.host.name if alias.host else None,
-                "host_id": alias.host.id if alias.host else None,
-                "use": alias.use
-            }
-            
-            if alias.host and str(alias.host.id) == str(host_id):
-                conflict_info["alignment"] = "matched"
-                conflict_info["message"] = f"This WWPN matches alias '{alias.name}' already assigned to this host."
-            elif alias.host:
-                conflict_info["alignment"] = "conflict"
-                conflict_info["message"] = f"This WWPN matches alias '{alias.name}' assigned to different host '{alias.host.name}'."
-            else:
-                conflict_info["alignment"] = "available"
-                conflict_info["message"] = f"This WWPN matches unassigned alias '{alias.name}'. You can assign this alias to the host instead."
-            
-            conflicts.append(conflict_info)
-        
-        # Check if this WWPN is already manually assigned to other hosts
-        if host_id:
-            manual_assignments = HostWwpn.objects.filter(
-                wwpn=formatted_wwpn,
-                source_type='manual'
-            ).exclude(host_id=host_id)
-        else:
-            manual_assignments = HostWwpn.objects.filter(
-                wwpn=formatted_wwpn,
-                source_type='manual'
-            )
-        
-        for assignment in manual_assignments:
-            conflicts.append({
-                "type": "manual",
-                "host_name": assignment.host.name,
-                "host_id": assignment.host.id,
-                "alignment": "conflict",
-                "message": f"This WWPN is already manually assigned to host '{assignment.host.name}'."
-            })
+        result = find_wwpn_conflicts([wwpn], host_id=host_id)[wwpn]
+        if "error" in result:
+            return JsonResponse(result, status=400)
+        return JsonResponse(result)
         
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON data."}, status=400)
+    except Exception as e:
+        return JsonResponse({"error": f"Error checking conflicts: {str(e)}"}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def check_wwpn_conflicts_batch_view(request):
+    """
+    Check many WWPNs at once (host editors validating pasted WWPN lists).
+
+    Body: {"wwpns": [...], "host_id": optional}
+    Returns a conflict map keyed by each WWPN as sent; invalid values map
+    to {"error": ...} instead of failing the request.
+    """
+    try:
+        data = json.loads(request.body)
+        wwpns = data.get('wwpns')
+        host_id = data.get('host_id')
+
+        if not isinstance(wwpns, list) or not wwpns:
+            return JsonResponse({"error": "wwpns must be a non-empty list."}, status=400)
+        if len(wwpns) > MAX_WWPN_CONFLICT_BATCH:
+            return JsonResponse({"error": f"At most {MAX_WWPN_CONFLICT_BATCH} WWPNs per request."}, status=400)
+
+        results = find_wwpn_conflicts([str(wwpn).strip() for wwpn in wwpns], host_id=host_id)
         return JsonResponse({
-            "wwpn": formatted_wwpn,
-            "conflicts": conflicts,
-            "has_conflicts": len(conflicts) > 0
+            "results": results,
+            "has_conflicts": any(result.get("has_conflicts") for result in results.values()),
         })
-        
+
     except json.JSONDecodeError:
         return JsonResponse({"error": "Invalid JSON data."}, status=400)
     except Exception as e:
         return JsonResponse({"error": f"Error checking conflicts: {str(e)}"}, status=500)
 
-
 @csrf_exempt
 @require_http_methods(["GET", "POST"])
 def port_list(request):
     """Handle port list operations with pagination and filtering"""
-    print(f"🔥 Port List - Method: {request.method}")
+    debug_log.debug('port list request', method=request.method)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -1431,14 +1323,8 @@ def port_list(request):
             if project_id:
                 ports = ports.filter(project_id=project_id)
 
-            # Customer View filtering: Show ports that are either:
-            # 1. Committed (committed=True), OR
-            # 2. Not referenced by any project (no junction table entries)
-            ports = ports.annotate(
-                project_count=Count('project_ports')  # Correct relationship name
-            ).filter(
-                Q(committed=True) | Q(project_count=0)
-            )
+            # Customer View: committed, or not in any project (core.customer_visibility)
+            ports = ports.filter(customer_visible=True)
 
             # Apply search if provided
             if search:
@@ -1451,22 +1337,12 @@ def port_list(request):
                     Q(protocol__icontains=search)
                 )
 
-            # Apply field-specific filters
-            filter_params = {}
-            for param, value in request.GET.items():
-                if param.startswith((
-                    'name__', 'storage__', 'type__', 'speed_gbps__', 'location__',
-                    'frame__', 'io_enclosure__', 'fabric__', 'alias__', 'protocol__', 'use__'
-                )):
-                    filter_params[param] = value
-
-            # Apply the filters
-            if filter_params:
-                ports = ports.filter(**filter_params)
-
-            # Apply ordering
-            if ordering:
-                ports = ports.order_by(ordering)
+            # Apply column filters and ordering
+            try:
+                compiled = table_filters('ports').compile(request.GET, ordering=ordering)
+            except FilterError as e:
+                return JsonResponse({'error': str(e)}, status=400)
+            ports = compiled.apply(ports)
 
             # Get total count before pagination
             total_count = ports.count()
@@ -1588,7 +1464,7 @@ def port_list(request):
 @require_http_methods(["GET", "PUT", "PATCH", "DELETE"])
 def port_detail(request, pk):
     """Handle port detail operations"""
-    print(f"🔥 Port Detail - Method: {request.method}, PK: {pk}")
+    debug_log.debug('port detail request', method=request.method, pk=pk)
 
     user = request.user if request.user.is_authenticated else None
 
@@ -1672,6 +1548,7 @@ def port_detail(request, pk):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('storage')
 def storage_project_view(request, project_id):
     """
     Get storage systems in project with field_overrides applied (merged view).
@@ -1789,46 +1666,14 @@ def storage_project_view(request, project_id):
 
     # Apply search filter if provided
     if search:
-        from django.db.models import Q
-        project_storages = project_storages.filter(
-            Q(storage__name__icontains=search) |
-            Q(storage__storage_type__icontains=search) |
-            Q(storage__manufacturer__icontains=search) |
-            Q(storage__model__icontains=search)
-        ).distinct()
+        project_storages = project_storages.filter(search_filter(search, 'storage__'))
 
-    # Apply field-specific advanced filters
-    # Frontend sends params like 'name__icontains', we need to map to 'storage__name__icontains'
-    filter_params = {}
-    for param, value in request.GET.items():
-        # Skip pagination and search params
-        if param in ['page', 'page_size', 'search', 'ordering', 'customer_id', 'project_filter']:
-            continue
-
-        # Map frontend parameter to Django ORM lookup through junction table
-        mapped_param = None
-
-        # Special handling for project_action - this is on the junction table itself, not the entity
-        if param.startswith('project_action__'):
-            # Map project_action to action (the field name on ProjectStorage)
-            mapped_param = param.replace('project_action', 'action')
-            # __in lookup requires a list, even for single values
-            if mapped_param.endswith('__in'):
-                filter_params[mapped_param] = [v.strip() for v in value.split(',')] if isinstance(value, str) else value
-            else:
-                filter_params[mapped_param] = value
-        elif param.startswith(('name__', 'storage_type__', 'manufacturer__', 'model__')):
-            mapped_param = f'storage__{param}'
-
-            # Handle filters
-            if mapped_param.endswith('__in') and isinstance(value, str) and ',' in value:
-                filter_params[mapped_param] = value.split(',')
-            else:
-                filter_params[mapped_param] = value
-
-    # Apply filters to queryset
-    if filter_params:
-        project_storages = project_storages.filter(**filter_params)
+    # Apply column filters through the junction rows
+    try:
+        compiled = table_filters('storage').compile(request.GET, prefix='storage__', ordering=request.GET.get('ordering'))
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    project_storages = compiled.apply(project_storages)
 
     # ===== PAGINATION =====
     page = int(request.GET.get('page', 1))
@@ -1901,6 +1746,7 @@ def storage_project_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('volumes')
 def volume_project_view(request, project_id):
     """
     Get volumes in project with field_overrides applied (merged view).
@@ -2023,51 +1869,14 @@ def volume_project_view(request, project_id):
 
     # Apply search filter if provided
     if search:
-        from django.db.models import Q
-        project_volumes = project_volumes.filter(
-            Q(volume__name__icontains=search) |
-            Q(volume__storage__name__icontains=search) |
-            Q(volume__volume_type__icontains=search)
-        ).distinct()
-
-    # Apply field-specific advanced filters
-    # Frontend sends params like 'name__icontains', we need to map to 'volume__name__icontains'
-    filter_params = {}
-    for param, value in request.GET.items():
-        # Skip pagination and search params
-        if param in ['page', 'page_size', 'search', 'ordering', 'customer_id', 'project_filter']:
-            continue
-
-        # Map frontend parameter to Django ORM lookup through junction table
-        mapped_param = None
-
-        # Special handling for project_action - this is on the junction table itself, not the entity
-        if param.startswith('project_action__'):
-            # Map project_action to action (the field name on ProjectVolume)
-            mapped_param = param.replace('project_action', 'action')
-            # __in lookup requires a list, even for single values
-            if mapped_param.endswith('__in'):
-                filter_params[mapped_param] = [v.strip() for v in value.split(',')] if isinstance(value, str) else value
-            else:
-                filter_params[mapped_param] = value
-        elif param.startswith(('name__', 'volume_type__')):
-            mapped_param = f'volume__{param}'
-        elif param.startswith('storage_name__'):
-            # Map storage_name to storage__name for Django ORM
-            mapped_param = param.replace('storage_name', 'volume__storage__name')
-        elif param.startswith('storage__name__'):
-            mapped_param = param.replace('storage__name', 'volume__storage__name')
-
-        if mapped_param:
-            # Handle filters
-            if mapped_param.endswith('__in') and isinstance(value, str) and ',' in value:
-                filter_params[mapped_param] = value.split(',')
-            else:
-                filter_params[mapped_param] = value
+        project_volumes = project_volumes.filter(search_filter(search, 'volume__'))
 
-    # Apply filters to queryset
-    if filter_params:
-        project_volumes = project_volumes.filter(**filter_params)
+    # Apply column filters through the junction rows
+    try:
+        compiled = table_filters('volumes').compile(request.GET, prefix='volume__', ordering=request.GET.get('ordering'))
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    project_volumes = compiled.apply(project_volumes)
 
     # ===== PAGINATION =====
     page = int(request.GET.get('page', 1))
@@ -2140,6 +1949,7 @@ def volume_project_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('hosts')
 def host_project_view(request, project_id):
     """
     Get hosts in project with field_overrides applied (merged view).
@@ -2264,52 +2074,14 @@ def host_project_view(request, project_id):
 
     # Apply search filter if provided
     if search:
-        from django.db.models import Q
-        project_hosts = project_hosts.filter(
-            Q(host__name__icontains=search) |
-            Q(host__status__icontains=search) |
-            Q(host__host_type__icontains=search) |
-            Q(host__storage__name__icontains=search)
-        ).distinct()
-
-    # Apply field-specific advanced filters
-    # Frontend sends params like 'name__icontains', we need to map to 'host__name__icontains'
-    filter_params = {}
-    for param, value in request.GET.items():
-        # Skip pagination and search params
-        if param in ['page', 'page_size', 'search', 'ordering', 'customer_id', 'project_filter']:
-            continue
-
-        # Map frontend parameter to Django ORM lookup through junction table
-        mapped_param = None
-
-        # Special handling for project_action - this is on the junction table itself, not the entity
-        if param.startswith('project_action__'):
-            # Map project_action to action (the field name on ProjectHost)
-            mapped_param = param.replace('project_action', 'action')
-            # __in lookup requires a list, even for single values
-            if mapped_param.endswith('__in'):
-                filter_params[mapped_param] = [v.strip() for v in value.split(',')] if isinstance(value, str) else value
-            else:
-                filter_params[mapped_param] = value
-        elif param.startswith(('name__', 'status__', 'host_type__', 'storage_name__', 'storage__name__')):
-            # Map storage_name to storage__name for Django ORM
-            if param.startswith('storage_name'):
-                mapped_param = param.replace('storage_name', 'host__storage__name')
-            elif param.startswith('storage__name'):
-                mapped_param = param.replace('storage__name', 'host__storage__name')
-            else:
-                mapped_param = f'host__{param}'
+        project_hosts = project_hosts.filter(search_filter(search, 'host__'))
 
-            # Handle regular string filters
-            if mapped_param.endswith('__in') and isinstance(value, str) and ',' in value:
-                filter_params[mapped_param] = value.split(',')
-            else:
-                filter_params[mapped_param] = value
-
-    # Apply filters to queryset
-    if filter_params:
-        project_hosts = project_hosts.filter(**filter_params)
+    # Apply column filters through the junction rows
+    try:
+        compiled = table_filters('hosts').compile(request.GET, prefix='host__', ordering=request.GET.get('ordering'))
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    project_hosts = compiled.apply(project_hosts)
 
     # ===== PAGINATION =====
     page = int(request.GET.get('page', 1))
@@ -2382,6 +2154,7 @@ def host_project_view(request, project_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cached_project_view('ports')
 def port_project_view(request, project_id):
     """
     Get ports in project with field_overrides applied (merged view).
@@ -2515,44 +2288,12 @@ def port_project_view(request, project_id):
             Q(port__port_type__icontains=search)
         ).distinct()
 
-    # Apply field-specific advanced filters
-    # Frontend sends params like 'wwpn__icontains', we need to map to 'port__wwpn__icontains'
-    filter_params = {}
-    for param, value in request.GET.items():
-        # Skip pagination and search params
-        if param in ['page', 'page_size', 'search', 'ordering', 'customer_id', 'project_filter']:
-            continue
-
-        # Map frontend parameter to Django ORM lookup through junction table
-        mapped_param = None
-
-        # Special handling for project_action - this is on the junction table itself, not the entity
-        if param.startswith('project_action__'):
-            # Map project_action to action (the field name on ProjectPort)
-            mapped_param = param.replace('project_action', 'action')
-            # __in lookup requires a list, even for single values
-            if mapped_param.endswith('__in'):
-                filter_params[mapped_param] = [v.strip() for v in value.split(',')] if isinstance(value, str) else value
-            else:
-                filter_params[mapped_param] = value
-        elif param.startswith(('wwpn__', 'port_type__')):
-            mapped_param = f'port__{param}'
-        elif param.startswith('storage_name__'):
-            # Map storage_name to storage__name for Django ORM
-            mapped_param = param.replace('storage_name', 'port__storage__name')
-        elif param.startswith('storage__name__'):
-            mapped_param = param.replace('storage__name', 'port__storage__name')
-
-        if mapped_param:
-            # Handle filters
-            if mapped_param.endswith('__in') and isinstance(value, str) and ',' in value:
-                filter_params[mapped_param] = value.split(',')
-            else:
-                filter_params[mapped_param] = value
-
-    # Apply filters to queryset
-    if filter_params:
-        project_ports = project_ports.filter(**filter_params)
+    # Apply column filters through the junction rows
+    try:
+        compiled = table_filters('ports').compile(request.GET, prefix='port__', ordering=request.GET.get('ordering'))
+    except FilterError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    project_ports = compiled.apply(project_ports)
 
     # ===== PAGINATION =====
     page = int(request.GET.get('page', 1))
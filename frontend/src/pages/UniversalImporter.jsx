@@ -1,4 +1,4 @@
-import React, { useState, useContext, useEffect, useCallback } from 'react';
+import React, { useState, useContext, useEffect, useCallback, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import axios from 'axios';
 import { CheckCircle, AlertTriangle } from 'lucide-react';
@@ -83,6 +83,7 @@ const UniversalImporter = () => {
   const [showCompletionModal, setShowCompletionModal] = useState(false);
   const [completionStats, setCompletionStats] = useState(null);
   const [concurrentWarning, setConcurrentWarning] = useState(null);
+  const eventSourceRef = useRef(null);
 
   // Fetch existing fabrics for dropdown
   const fetchExistingFabrics = async (vendorFilter = null) => {
@@ -113,6 +114,11 @@ const UniversalImporter = () => {
     }
   };
 
+  // Stop following import events when leaving the page
+  useEffect(() => {
+    return () => eventSourceRef.current?.close();
+  }, []);
+
   // Load fabrics when component mounts
   useEffect(() => {
     if (config && config.customer) {
@@ -447,8 +453,8 @@ const UniversalImporter = () => {
       setImportRunning(true);
       setStep(4);
 
-      // Start polling for progress
-      startProgressPolling(response.data.import_id);
+      // Follow progress as it is published
+      watchImportEvents(response.data.import_id);
     } catch (err) {
       setError(err.response?.data?.error || err.message || 'Failed to start import');
       setImportStatus('FAILED');
@@ -461,7 +467,168 @@ const UniversalImporter = () => {
     }
   };
 
-  // Poll for import progress
+  // Fetch the import's progress once and apply it; returns true once the import has finished
+  const applyImportProgress = async (importId) => {
+    const response = await axios.get(`/api/importer/import-progress/${importId}/`);
+
+    // Check for various completion status strings
+    const status = response.data.status?.toLowerCase();
+    const hasCompletedAt = response.data.completed_at !== null;
+    const progressIs100 = response.data.progress === 100 ||
+                         (response.data.progress?.current === response.data.progress?.total);
+
+    console.log('Poll response:', {
+      status,
+      hasCompletedAt,
+      progressIs100,
+      fullResponse: response.data
+    });
+
+    // Check multiple conditions for completion
+    if (status === 'completed' || status === 'complete' || status === 'success' ||
+        (hasCompletedAt && progressIs100)) {
+      console.log('IMPORT COMPLETED DETECTED!');
+      console.log('Full response data:', response.data);
+      // Check multiple possible locations for stats
+      const extractStats = (data) => {
+        // Log the ENTIRE response to debug
+        console.log('=== FULL IMPORT RESPONSE DATA ===');
+        console.log('Full data object:', JSON.stringify(data, null, 2));
+        console.log('Keys in data:', Object.keys(data));
+
+        // Log what we're working with
+        console.log('Extracting stats from:', {
+          direct: {
+            aliases_imported: data.aliases_imported,
+            zones_imported: data.zones_imported,
+            fabrics_created: data.fabrics_created,
+            aliases_count: data.aliases_count,
+            zones_count: data.zones_count,
+            fabrics_count: data.fabrics_count
+          },
+          stats: data.stats,
+          result: data.result,
+          summary: data.summary,
+          metadata: data.metadata
+        });
+
+        const extractedStats = {
+          // SAN stats - check ALL possible locations
+          aliases: data.aliases_imported || data.aliases_count ||
+                  data.stats?.aliases || data.stats?.aliases_imported ||
+                  data.stats?.aliases_created || data.result?.aliases_imported ||
+                  data.summary?.aliases || data.metadata?.aliases_imported ||
+                  data.metadata?.aliases_created || 0,
+          zones: data.zones_imported || data.zones_count ||
+                data.stats?.zones || data.stats?.zones_imported ||
+                data.stats?.zones_created || data.result?.zones_imported ||
+                data.summary?.zones || data.metadata?.zones_imported ||
+                data.metadata?.zones_created || 0,
+          fabrics: data.fabrics_created || data.fabrics_count ||
+                  data.stats?.fabrics || data.stats?.fabrics_created ||
+                  data.stats?.fabrics_updated || data.result?.fabrics_created ||
+                  data.summary?.fabrics || data.metadata?.fabrics_created || 0,
+          switches: data.switches_imported || data.switches_count ||
+                   data.stats?.switches || data.stats?.switches_imported ||
+                   data.stats?.switches_created || data.result?.switches_imported ||
+                   data.summary?.switches || data.metadata?.switches_imported ||
+                   data.metadata?.switches_created || 0,
+          // Storage stats
+          storage_systems_created: data.storage_systems_imported ||
+                                   data.stats?.storage_systems_created ||
+                                   data.metadata?.storage_systems_created || 0,
+          storage_systems_updated: data.stats?.storage_systems_updated ||
+                                   data.metadata?.storage_systems_updated || 0,
+          volumes_created: data.volumes_imported ||
+                          data.stats?.volumes_created ||
+                          data.metadata?.volumes_created || 0,
+          volumes_updated: data.stats?.volumes_updated ||
+                          data.metadata?.volumes_updated || 0,
+          hosts_created: data.hosts_imported ||
+                        data.stats?.hosts_created ||
+                        data.metadata?.hosts_created || 0,
+          hosts_updated: data.stats?.hosts_updated ||
+                        data.metadata?.hosts_updated || 0,
+          // Auto-created placeholder aliases (from zone members)
+          aliases_auto_created: data.aliases_auto_created ||
+                               data.stats?.aliases_auto_created ||
+                               data.metadata?.aliases_auto_created || 0,
+          duration: (() => {
+            if (!data.duration) return 0;
+            if (typeof data.duration === 'number') return Math.round(data.duration);
+            if (typeof data.duration === 'string') {
+              // Handle format like "0:00:03.123456" or just "3.123456"
+              const parts = data.duration.split(':');
+              if (parts.length === 3) {
+                // HH:MM:SS.ms format
+                const hours = parseInt(parts[0]) || 0;
+                const minutes = parseInt(parts[1]) || 0;
+                const seconds = parseFloat(parts[2]) || 0;
+                return Math.round(hours * 3600 + minutes * 60 + seconds);
+              } else if (parts.length === 2) {
+                // MM:SS.ms format
+                const minutes = parseInt(parts[0]) || 0;
+                const seconds = parseFloat(parts[1]) || 0;
+                return Math.round(minutes * 60 + seconds);
+              } else {
+                // Just seconds
+                return Math.round(parseFloat(data.duration) || 0);
+              }
+            }
+            return 0;
+          })()
+        };
+
+        console.log('=== EXTRACTED STATS ===', extractedStats);
+        return extractedStats;
+      };
+
+      const stats = extractStats(response.data);
+      console.log('Final stats to be used:', stats);
+
+      // Create a proper success progress object
+      const successProgress = {
+        ...response.data,
+        status: 'success',  // This is critical for the UI
+        progress: 100,
+        stats: stats
+      };
+
+      // Set both states together to ensure they're in sync
+      console.log('Setting COMPLETED state with success progress:', successProgress);
+      setImportProgress(successProgress);
+      setImportStatus('COMPLETED');
+      setImportRunning(false);
+
+      // Show completion modal with stats
+      setCompletionStats(successProgress.stats);
+      setShowCompletionModal(true);
+      console.log('States set to COMPLETED - showing completion modal');
+      return true;
+    } else if (status === 'failed' || status === 'error') {
+      // Set error status in progress for the UI
+      setImportProgress({
+        ...response.data,
+        status: 'error',
+        error: response.data.error_message || response.data.error || 'Import failed'
+      });
+      setImportStatus('FAILED');
+      setImportRunning(false);
+      return true;
+    } else {
+      // Still running - update progress but don't overwrite if we already set success
+      setImportProgress(prev => {
+        // Don't overwrite success status
+        if (prev?.status === 'success') {
+          return prev;
+        }
+        return response.data;
+      });
+    }
+    return false;
+  };
+
+  // Fallback when the event stream is unavailable: poll for import progress
   const startProgressPolling = (importId) => {
     let intervalCleared = false;
 
@@ -469,172 +636,74 @@ const UniversalImporter = () => {
       if (intervalCleared) return;
 
       try {
-        const response = await axios.get(`/api/importer/import-progress/${importId}/`);
-
-        // Check for various completion status strings
-        const status = response.data.status?.toLowerCase();
-        const hasCompletedAt = response.data.completed_at !== null;
-        const progressIs100 = response.data.progress === 100 ||
-                             (response.data.progress?.current === response.data.progress?.total);
-
-        console.log('Poll response:', {
-          status,
-          hasCompletedAt,
-          progressIs100,
-          fullResponse: response.data
-        });
-
-        // Check multiple conditions for completion
-        if (status === 'completed' || status === 'complete' || status === 'success' ||
-            (hasCompletedAt && progressIs100)) {
-          console.log('IMPORT COMPLETED DETECTED!');
-          console.log('Full response data:', response.data);
+        if (await applyImportProgress(importId)) {
           intervalCleared = true;
           clearInterval(interval);
+        }
+      } catch (err) {
+        console.error('Failed to fetch progress:', err);
+      }
+    }, 2000);
 
-          // Check multiple possible locations for stats
-          const extractStats = (data) => {
-            // Log the ENTIRE response to debug
-            console.log('=== FULL IMPORT RESPONSE DATA ===');
-            console.log('Full data object:', JSON.stringify(data, null, 2));
-            console.log('Keys in data:', Object.keys(data));
-
-            // Log what we're working with
-            console.log('Extracting stats from:', {
-              direct: {
-                aliases_imported: data.aliases_imported,
-                zones_imported: data.zones_imported,
-                fabrics_created: data.fabrics_created,
-                aliases_count: data.aliases_count,
-                zones_count: data.zones_count,
-                fabrics_count: data.fabrics_count
-              },
-              stats: data.stats,
-              result: data.result,
-              summary: data.summary,
-              metadata: data.metadata
-            });
-
-            const extractedStats = {
-              // SAN stats - check ALL possible locations
-              aliases: data.aliases_imported || data.aliases_count ||
-                      data.stats?.aliases || data.stats?.aliases_imported ||
-                      data.stats?.aliases_created || data.result?.aliases_imported ||
-                      data.summary?.aliases || data.metadata?.aliases_imported ||
-                      data.metadata?.aliases_created || 0,
-              zones: data.zones_imported || data.zones_count ||
-                    data.stats?.zones || data.stats?.zones_imported ||
-                    data.stats?.zones_created || data.result?.zones_imported ||
-                    data.summary?.zones || data.metadata?.zones_imported ||
-                    data.metadata?.zones_created || 0,
-              fabrics: data.fabrics_created || data.fabrics_count ||
-                      data.stats?.fabrics || data.stats?.fabrics_created ||
-                      data.stats?.fabrics_updated || data.result?.fabrics_created ||
-                      data.summary?.fabrics || data.metadata?.fabrics_created || 0,
-              switches: data.switches_imported || data.switches_count ||
-                       data.stats?.switches || data.stats?.switches_imported ||
-                       data.stats?.switches_created || data.result?.switches_imported ||
-                       data.summary?.switches || data.metadata?.switches_imported ||
-                       data.metadata?.switches_created || 0,
-              // Storage stats
-              storage_systems_created: data.storage_systems_imported ||
-                                       data.stats?.storage_systems_created ||
-                                       data.metadata?.storage_systems_created || 0,
-              storage_systems_updated: data.stats?.storage_systems_updated ||
-                                       data.metadata?.storage_systems_updated || 0,
-              volumes_created: data.volumes_imported ||
-                              data.stats?.volumes_created ||
-                              data.metadata?.volumes_created || 0,
-              volumes_updated: data.stats?.volumes_updated ||
-                              data.metadata?.volumes_updated || 0,
-              hosts_created: data.hosts_imported ||
-                            data.stats?.hosts_created ||
-                            data.metadata?.hosts_created || 0,
-              hosts_updated: data.stats?.hosts_updated ||
-                            data.metadata?.hosts_updated || 0,
-              // Auto-created placeholder aliases (from zone members)
-              aliases_auto_created: data.aliases_auto_created ||
-                                   data.stats?.aliases_auto_created ||
-                                   data.metadata?.aliases_auto_created || 0,
-              duration: (() => {
-                if (!data.duration) return 0;
-                if (typeof data.duration === 'number') return Math.round(data.duration);
-                if (typeof data.duration === 'string') {
-                  // Handle format like "0:00:03.123456" or just "3.123456"
-                  const parts = data.duration.split(':');
-                  if (parts.length === 3) {
-                    // HH:MM:SS.ms format
-                    const hours = parseInt(parts[0]) || 0;
-                    const minutes = parseInt(parts[1]) || 0;
-                    const seconds = parseFloat(parts[2]) || 0;
-                    return Math.round(hours * 3600 + minutes * 60 + seconds);
-                  } else if (parts.length === 2) {
-                    // MM:SS.ms format
-                    const minutes = parseInt(parts[0]) || 0;
-                    const seconds = parseFloat(parts[1]) || 0;
-                    return Math.round(minutes * 60 + seconds);
-                  } else {
-                    // Just seconds
-                    return Math.round(parseFloat(data.duration) || 0);
-                  }
-                }
-                return 0;
-              })()
-            };
+    return interval;
+  };
 
-            console.log('=== EXTRACTED STATS ===', extractedStats);
-            return extractedStats;
-          };
-
-          const stats = extractStats(response.data);
-          console.log('Final stats to be used:', stats);
-
-          // Create a proper success progress object
-          const successProgress = {
-            ...response.data,
-            status: 'success',  // This is critical for the UI
-            progress: 100,
-            stats: stats
-          };
-
-          // Set both states together to ensure they're in sync
-          console.log('Setting COMPLETED state with success progress:', successProgress);
-          setImportProgress(successProgress);
-          setImportStatus('COMPLETED');
-          setImportRunning(false);
+  // Follow the import through its Server-Sent Events stream. Each response is
+  // a short long-poll; EventSource reconnects on its own and resumes after the
+  // Last-Event-ID it saw, so no progress events are lost between responses.
+  const watchImportEvents = (importId) => {
+    if (typeof window.EventSource === 'undefined') {
+      startProgressPolling(importId);
+      return;
+    }
 
-          // Show completion modal with stats
-          setCompletionStats(successProgress.stats);
-          setShowCompletionModal(true);
-          console.log('States set to COMPLETED - showing completion modal');
-        } else if (status === 'failed' || status === 'error') {
-          intervalCleared = true;
-          clearInterval(interval);
+    const source = new EventSource(`/api/importer/import-events/${importId}/`);
+    eventSourceRef.current = source;
 
-          // Set error status in progress for the UI
-          setImportProgress({
-            ...response.data,
-            status: 'error',
-            error: response.data.error_message || response.data.error || 'Import failed'
-          });
-          setImportStatus('FAILED');
+    const stopWatching = () => {
+      source.close();
+      if (eventSourceRef.current === source) {
+        eventSourceRef.current = null;
+      }
+    };
+
+    const mergeProgress = (changes) => {
+      setImportProgress(prev => {
+        // Don't overwrite a final status
+        if (prev?.status === 'success' || prev?.status === 'error') {
+          return prev;
+        }
+        return { ...prev, ...changes };
+      });
+    };
+
+    source.addEventListener('snapshot', (event) => mergeProgress(JSON.parse(event.data)));
+    source.addEventListener('status', (event) => mergeProgress(JSON.parse(event.data)));
+    source.addEventListener('progress', (event) => mergeProgress({ progress: JSON.parse(event.data) }));
+
+    source.addEventListener('done', async (event) => {
+      stopWatching();
+      // The final stats come from import-progress
+      try {
+        if (!(await applyImportProgress(importId))) {
+          // Cancelled imports finish here as well
+          mergeProgress(JSON.parse(event.data));
           setImportRunning(false);
-        } else {
-          // Still running - update progress but don't overwrite if we already set success
-          setImportProgress(prev => {
-            // Don't overwrite success status
-            if (prev?.status === 'success') {
-              return prev;
-            }
-            return response.data;
-          });
         }
       } catch (err) {
         console.error('Failed to fetch progress:', err);
+        startProgressPolling(importId);
       }
-    }, 2000);
+    });
 
-    return interval;
+    source.onerror = () => {
+      // A closed source means the endpoint answered with an error, not just
+      // the end of one long-poll; carry on by polling instead
+      if (source.readyState === EventSource.CLOSED) {
+        stopWatching();
+        startProgressPolling(importId);
+      }
+    };
   };
 
   // Navigation handlers
@@ -658,6 +727,8 @@ const UniversalImporter = () => {
   };
 
   const handleReset = () => {
+    eventSourceRef.current?.close();
+    eventSourceRef.current = null;
     setStep(1);
     setImportType('san');
     setSourceType('file');